@@ -6,6 +6,7 @@
 from dagster._core.definitions.events import AssetKey
 from dagster._core.definitions.selector import RepositorySelector
 from dagster._core.instance import DagsterInstance
+from dagster._core.loader import LoadingContext
 from dagster._core.remote_representation.code_location import CodeLocation
 from dagster._core.remote_representation.external import ExternalRepository
 from dagster._core.remote_representation.external_data import ExternalAssetCheck
@@ -14,7 +15,7 @@
     AssetCheckExecutionResolvedStatus,
     AssetCheckInstanceSupport,
 )
-from dagster._core.storage.event_log.base import AssetRecord
+from dagster._core.storage.event_log.base import AssetCheckSummaryRecord, AssetRecord
 from dagster._core.workspace.context import WorkspaceRequestContext
 from packaging import version
 
@@ -111,15 +112,6 @@ def _fetch_checks(
                     :limit_per_asset
                 ]
 
-        all_check_keys = [
-            external_check.key
-            for external_checks in external_checks_by_asset_key.values()
-            for external_check in external_checks
-        ]
-        execution_loader = AssetChecksExecutionForLatestMaterializationLoader(
-            self._context.instance, check_keys=all_check_keys
-        )
-
         asset_graph = self._context.asset_graph
         graphene_checks: Mapping[AssetKey, AssetChecksOrErrorUnion] = {}
         for asset_key in self._asset_keys:
@@ -142,7 +134,6 @@ def _fetch_checks(
                         GrapheneAssetCheck(
                             asset_check=external_check,
                             can_execute_individually=can_execute_individually,
-                            execution_loader=execution_loader,
                         )
                     )
                 graphene_checks[asset_key] = GrapheneAssetChecks(checks=graphene_checks_for_asset)
@@ -235,61 +226,29 @@ def _execution_targets_latest_materialization(
         check.failed(f"Unexpected check status {resolved_status}")
 
 
-class AssetChecksExecutionForLatestMaterializationLoader:
-    def __init__(self, instance: DagsterInstance, check_keys: List[AssetCheckKey]):
-        self._instance = instance
-        self._check_keys = check_keys
-        self._executions: Optional[
-            Mapping[AssetCheckKey, Optional[GrapheneAssetCheckExecution]]
-        ] = None
-
-    def _fetch_executions(self) -> Mapping[AssetCheckKey, Optional[GrapheneAssetCheckExecution]]:
-        from .fetch_asset_checks import get_asset_check_execution_statuses_by_id
-
-        latest_executions_by_check_key = (
-            self._instance.event_log_storage.get_latest_asset_check_execution_by_key(
-                self._check_keys
-            )
-        )
-        statuses_by_execution_id = get_asset_check_execution_statuses_by_id(
-            self._instance, list(latest_executions_by_check_key.values())
-        )
-        asset_records_by_asset_key = {
-            record.asset_entry.asset_key: record
-            for record in self._instance.get_asset_records(
-                list({ck.asset_key for ck in self._check_keys})
-            )
-        }
-
-        self._executions = {}
-        for check_key in self._check_keys:
-            execution = latest_executions_by_check_key.get(check_key)
-            if not execution:
-                self._executions[check_key] = None
-            else:
-                resolved_status = statuses_by_execution_id[execution.id]
-                self._executions[check_key] = (
-                    GrapheneAssetCheckExecution(execution, resolved_status)
-                    if _execution_targets_latest_materialization(
-                        instance=self._instance,
-                        asset_record=asset_records_by_asset_key.get(check_key.asset_key),
-                        execution=execution,
-                        resolved_status=resolved_status,
-                    )
-                    else None
-                )
-
-        return self._executions
-
-    def get_execution_for_latest_materialization(
-        self, check_key: AssetCheckKey
-    ) -> Optional[GrapheneAssetCheckExecution]:
-        if self._executions is None:
-            self._executions = self._fetch_executions()
-
-        check.invariant(
-            check_key in self._executions,
-            f"Check key {check_key} not included in this loader.",
+async def gen_execution_for_latest_materialization(
+    loading_context: LoadingContext, check_key: AssetCheckKey
+) -> Optional[GrapheneAssetCheckExecution]:
+    """Returns the latest execution of the check, if it targets the latest materialization of its
+    asset. The check summary, asset and run records are loaded through the loading context, so
+    that they are fetched together for all the checks resolved in the same request.
+    """
+    from .fetch_asset_checks import gen_asset_check_execution_resolved_status
+
+    summary_record = await AssetCheckSummaryRecord.gen(loading_context, check_key)
+    execution = summary_record.last_check_execution_record if summary_record else None
+    if not execution:
+        return None
+
+    resolved_status = await gen_asset_check_execution_resolved_status(loading_context, execution)
+    asset_record = await AssetRecord.gen(loading_context, check_key.asset_key)
+    return (
+        GrapheneAssetCheckExecution(execution, resolved_status)
+        if _execution_targets_latest_materialization(
+            instance=loading_context.instance,
+            asset_record=asset_record,
+            execution=execution,
+            resolved_status=resolved_status,
         )
-
-        return self._executions[check_key]
+        else None
+    )
@@ -365,6 +365,12 @@ def wipe_assets(
 
     instance.wipe_assets(whole_assets_to_wipe)
 
+    # wipes are not recorded as events, so the staleness cached by the workspace would not be
+    # invalidated otherwise
+    stale_status_cache = graphene_info.context.stale_status_cache
+    if whole_assets_to_wipe and stale_status_cache is not None:
+        stale_status_cache.clear()
+
     result_ranges = [
         GrapheneAssetPartitionRange(asset_key=apr.asset_key, partition_range=apr.partition_range)
         for apr in asset_partition_ranges
@@ -79,6 +79,7 @@ def ensure_valid_config(external_job: ExternalJob, run_config: object) -> object
         config_schema_snapshot=external_job.config_schema_snapshot,
         config_type_key=check.not_none(external_job.root_config_key),
         config_value=run_config,
+        snapshot_id=external_job.identifying_job_snapshot_id,
     )
 
     if not validated_config.success:
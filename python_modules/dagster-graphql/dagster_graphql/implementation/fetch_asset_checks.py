@@ -4,6 +4,7 @@
 from dagster import AssetKey
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
 from dagster._core.instance import DagsterInstance
+from dagster._core.loader import LoadingContext
 from dagster._core.remote_representation.code_location import CodeLocation
 from dagster._core.remote_representation.external import ExternalRepository
 from dagster._core.remote_representation.external_data import ExternalAssetCheck
@@ -12,7 +13,7 @@
     AssetCheckExecutionRecordStatus,
     AssetCheckExecutionResolvedStatus,
 )
-from dagster._core.storage.dagster_run import DagsterRunStatus, RunsFilter
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunRecord, RunsFilter
 from dagster._core.workspace.context import WorkspaceRequestContext
 
 from ..schema.asset_checks import GrapheneAssetCheckExecution
@@ -41,6 +42,33 @@ def has_asset_checks(
 
 
 # fetch all statuses at once in order to batch the run query
+def _get_asset_check_execution_resolved_status(
+    execution: AssetCheckExecutionRecord, run: Optional[DagsterRun]
+) -> AssetCheckExecutionResolvedStatus:
+    record_status = execution.status
+
+    if record_status == AssetCheckExecutionRecordStatus.SUCCEEDED:
+        return AssetCheckExecutionResolvedStatus.SUCCEEDED
+    elif record_status == AssetCheckExecutionRecordStatus.FAILED:
+        return AssetCheckExecutionResolvedStatus.FAILED
+    # Asset checks stay in PLANNED status until the evaluation event arrives. Check if the run is
+    # still active, and if not, return the actual status.
+    elif record_status == AssetCheckExecutionRecordStatus.PLANNED:
+        if not run:
+            # The run was deleted before it finished
+            return AssetCheckExecutionResolvedStatus.SKIPPED
+        elif run.is_finished:
+            if run.status == DagsterRunStatus.FAILURE:
+                return AssetCheckExecutionResolvedStatus.EXECUTION_FAILED
+            else:
+                return AssetCheckExecutionResolvedStatus.SKIPPED
+        else:
+            return AssetCheckExecutionResolvedStatus.IN_PROGRESS
+
+    else:
+        check.failed(f"Unexpected status {record_status}")
+
+
 def get_asset_check_execution_statuses_by_id(
     instance: DagsterInstance, executions: Sequence[AssetCheckExecutionRecord]
 ) -> Mapping[int, AssetCheckExecutionResolvedStatus]:
@@ -56,35 +84,28 @@ def get_asset_check_execution_statuses_by_id(
     else:
         planned_execution_runs_by_run_id = {}
 
-    def _status_for_execution(
-        execution: AssetCheckExecutionRecord,
-    ) -> AssetCheckExecutionResolvedStatus:
-        record_status = execution.status
-
-        if record_status == AssetCheckExecutionRecordStatus.SUCCEEDED:
-            return AssetCheckExecutionResolvedStatus.SUCCEEDED
-        elif record_status == AssetCheckExecutionRecordStatus.FAILED:
-            return AssetCheckExecutionResolvedStatus.FAILED
-        # Asset checks stay in PLANNED status until the evaluation event arrives. Check if the run is
-        # still active, and if not, return the actual status.
-        elif record_status == AssetCheckExecutionRecordStatus.PLANNED:
-            run = planned_execution_runs_by_run_id.get(execution.run_id)
-
-            if not run:
-                # The run was deleted before it finished
-                return AssetCheckExecutionResolvedStatus.SKIPPED
-            elif run.is_finished:
-                if run.status == DagsterRunStatus.FAILURE:
-                    return AssetCheckExecutionResolvedStatus.EXECUTION_FAILED
-                else:
-                    return AssetCheckExecutionResolvedStatus.SKIPPED
-            else:
-                return AssetCheckExecutionResolvedStatus.IN_PROGRESS
-
-        else:
-            check.failed(f"Unexpected status {record_status}")
-
-    return {e.id: _status_for_execution(e) for e in executions}
+    return {
+        e.id: _get_asset_check_execution_resolved_status(
+            e, planned_execution_runs_by_run_id.get(e.run_id)
+        )
+        for e in executions
+    }
+
+
+async def gen_asset_check_execution_resolved_status(
+    loading_context: LoadingContext, execution: AssetCheckExecutionRecord
+) -> AssetCheckExecutionResolvedStatus:
+    """Resolves the status of an execution, loading its run through the loading context if it is
+    still planned, so that the runs of several executions are fetched together.
+    """
+    run_record = (
+        await RunRecord.gen(loading_context, execution.run_id)
+        if execution.status == AssetCheckExecutionRecordStatus.PLANNED
+        else None
+    )
+    return _get_asset_check_execution_resolved_status(
+        execution, run_record.dagster_run if run_record else None
+    )
 
 
 def fetch_asset_check_executions(
@@ -44,9 +44,12 @@
 from dagster._core.remote_representation.external import ExternalRepository
 from dagster._core.remote_representation.external_data import ExternalAssetNode
 from dagster._core.storage.batch_asset_record_loader import BatchAssetRecordLoader
+from dagster._core.storage.event_log.base import AssetRecord
 from dagster._core.storage.event_log.sql_event_log import get_max_event_records_limit
 from dagster._core.storage.partition_status_cache import (
+    MultiPartitionStatusRollup,
     build_failed_and_in_progress_partition_subset,
+    build_multi_partition_status_rollup,
     get_and_update_asset_status_cache_value,
     get_last_planned_storage_id,
     get_materialized_multipartitions,
@@ -221,6 +224,7 @@ def get_asset_nodes_by_asset_key(
     stale_status_loader = StaleStatusLoader(
         instance=graphene_info.context.instance,
         asset_graph=lambda: graphene_info.context.asset_graph,
+        stale_status_cache=graphene_info.context.stale_status_cache,
     )
 
     dynamic_partitions_loader = CachingDynamicPartitionsLoader(graphene_info.context.instance)
@@ -248,6 +252,7 @@ def get_asset_nodes_by_asset_key(
         context=graphene_info.context,
         asset_keys=asset_nodes_by_asset_key.keys(),
     )
+    stale_status_loader.add_asset_keys(asset_nodes_by_asset_key.keys())
     base_deployment_context = graphene_info.context.get_base_deployment_context()
 
     return {
@@ -307,6 +312,30 @@ def get_asset(
     return GrapheneAsset(key=asset_key, definition=asset_node)
 
 
+async def gen_latest_materialization_event(
+    graphene_info: "ResolveInfo", asset_key: AssetKey
+) -> Optional[EventLogEntry]:
+    """Loads the latest materialization of an asset from its asset record, which is fetched in a
+    batch with the asset records loaded by other resolvers of the same request.
+    """
+    asset_record = await AssetRecord.gen(graphene_info.context, asset_key)
+    return asset_record.asset_entry.last_materialization if asset_record else None
+
+
+async def gen_latest_observation_event(
+    graphene_info: "ResolveInfo", asset_key: AssetKey
+) -> Optional[EventLogEntry]:
+    """Loads the latest observation of an asset from its asset record, which is fetched in a batch
+    with the asset records loaded by other resolvers of the same request.
+    """
+    check.invariant(
+        graphene_info.context.instance.event_log_storage.asset_records_have_last_observation,
+        "Event log storage must support fetching the last observation from asset records",
+    )
+    asset_record = await AssetRecord.gen(graphene_info.context, asset_key)
+    return asset_record.asset_entry.last_observation if asset_record else None
+
+
 def get_asset_materializations(
     graphene_info: "ResolveInfo",
     asset_key: AssetKey,
@@ -591,6 +620,36 @@ def build_partition_statuses(
         check.failed("Should not reach this point")
 
 
+def get_multi_partition_status_rollup(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    dynamic_partitions_loader: DynamicPartitionsStore,
+    batch_asset_record_loader: Optional[BatchAssetRecordLoader],
+    partitions_def: MultiPartitionsDefinition,
+) -> Optional[MultiPartitionStatusRollup]:
+    """Returns the partition statuses of a multi-partitioned asset, run-length encoded over the
+    primary dimension, from the asset status cache. Returns None if the statuses cannot be read
+    from the cache.
+    """
+    if not instance.can_read_asset_status_cache() or not is_cacheable_partition_type(
+        partitions_def
+    ):
+        return None
+
+    updated_cache_value = get_and_update_asset_status_cache_value(
+        instance,
+        asset_key,
+        partitions_def,
+        dynamic_partitions_loader,
+        batch_asset_record_loader,
+    )
+    if updated_cache_value is None:
+        # the asset has not been materialized or planned for materialization
+        return MultiPartitionStatusRollup(ranges=[])
+
+    return updated_cache_value.multi_partition_status_rollup
+
+
 def get_2d_run_length_encoded_partitions(
     dynamic_partitions_store: DynamicPartitionsStore,
     materialized_partitions_subset: PartitionsSubset,
@@ -598,120 +657,71 @@ def get_2d_run_length_encoded_partitions(
     in_progress_partitions_subset: PartitionsSubset,
     partitions_def: MultiPartitionsDefinition,
 ) -> "GrapheneMultiPartitionStatuses":
-    from ..schema.pipelines.pipeline import (
-        GrapheneMultiPartitionRangeStatuses,
-        GrapheneMultiPartitionStatuses,
-    )
-
     check.invariant(
         isinstance(partitions_def, MultiPartitionsDefinition),
         "Partitions definition should be multipartitioned",
     )
 
-    primary_dim = partitions_def.primary_dimension
-    secondary_dim = partitions_def.secondary_dimension
-
-    dim2_materialized_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
-    )
-    for partition_key in materialized_partitions_subset.get_partition_keys():
-        multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
-        dim2_materialized_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_materialized_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys([multipartition_key.keys_by_dimension[secondary_dim.name]])
-
-    dim2_failed_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
+    return build_multi_partition_statuses_from_rollup(
+        dynamic_partitions_store,
+        build_multi_partition_status_rollup(
+            partitions_def,
+            dynamic_partitions_store,
+            materialized_partitions_subset,
+            failed_partitions_subset,
+            in_progress_partitions_subset,
+        ),
+        partitions_def,
     )
-    for partition_key in failed_partitions_subset.get_partition_keys():
-        multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
-        dim2_failed_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_failed_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys([multipartition_key.keys_by_dimension[secondary_dim.name]])
-
-    dim2_in_progress_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
+
+
+def build_multi_partition_statuses_from_rollup(
+    dynamic_partitions_store: DynamicPartitionsStore,
+    rollup: MultiPartitionStatusRollup,
+    partitions_def: MultiPartitionsDefinition,
+) -> "GrapheneMultiPartitionStatuses":
+    from ..schema.pipelines.pipeline import (
+        GrapheneMultiPartitionRangeStatuses,
+        GrapheneMultiPartitionStatuses,
     )
-    for partition_key in in_progress_partitions_subset.get_partition_keys():
-        multipartition_key = partitions_def.get_partition_key_from_str(partition_key)
-        dim2_in_progress_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_in_progress_partition_subset_by_dim1[
-            multipartition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys([multipartition_key.keys_by_dimension[secondary_dim.name]])
+
+    primary_dim = partitions_def.primary_dimension
+    secondary_dim = partitions_def.secondary_dimension
+    primary_partitions_def = primary_dim.partitions_def
 
     materialized_2d_ranges = []
+    for status_range in rollup.ranges:
+        start_key = status_range.primary_start_key
+        end_key = status_range.primary_end_key
 
-    dim1_keys = primary_dim.partitions_def.get_partition_keys(
-        dynamic_partitions_store=dynamic_partitions_store
-    )
-    unevaluated_idx = 0
-    range_start_idx = 0  # pointer to first dim1 partition with same dim2 materialization status
+        if isinstance(primary_partitions_def, TimeWindowPartitionsDefinition):
+            time_windows = primary_partitions_def.time_windows_for_partition_keys(
+                frozenset([start_key, end_key])
+            )
+            start_time = time_windows[0].start.timestamp()
+            end_time = time_windows[-1].end.timestamp()
+        else:
+            start_time = None
+            end_time = None
 
-    if (
-        len(dim1_keys) == 0
-        or len(
-            secondary_dim.partitions_def.get_partition_keys(
-                dynamic_partitions_store=dynamic_partitions_store
+        materialized_subset, failed_subset, in_progress_subset = (
+            status_range.deserialize_secondary_subsets(partitions_def)
+        )
+        materialized_2d_ranges.append(
+            GrapheneMultiPartitionRangeStatuses(
+                primaryDimStartKey=start_key,
+                primaryDimEndKey=end_key,
+                primaryDimStartTime=start_time,
+                primaryDimEndTime=end_time,
+                secondaryDim=build_partition_statuses(
+                    dynamic_partitions_store,
+                    materialized_subset,
+                    failed_subset,
+                    in_progress_subset,
+                    secondary_dim.partitions_def,
+                ),
             )
         )
-        == 0
-    ):
-        return GrapheneMultiPartitionStatuses(ranges=[], primaryDimensionName=primary_dim.name)
-
-    while unevaluated_idx <= len(dim1_keys):
-        if (
-            unevaluated_idx == len(dim1_keys)
-            or dim2_materialized_partition_subset_by_dim1[dim1_keys[unevaluated_idx]]
-            != dim2_materialized_partition_subset_by_dim1[dim1_keys[range_start_idx]]
-            or dim2_failed_partition_subset_by_dim1[dim1_keys[unevaluated_idx]]
-            != dim2_failed_partition_subset_by_dim1[dim1_keys[range_start_idx]]
-            or dim2_in_progress_partition_subset_by_dim1[dim1_keys[unevaluated_idx]]
-            != dim2_in_progress_partition_subset_by_dim1[dim1_keys[range_start_idx]]
-        ):
-            # Add new multipartition range if we've reached the end of the dim1 keys or if the
-            # second dimension subsets are different than for the previous dim1 key
-            if (
-                len(dim2_materialized_partition_subset_by_dim1[dim1_keys[range_start_idx]]) > 0
-                or len(dim2_failed_partition_subset_by_dim1[dim1_keys[range_start_idx]]) > 0
-                or len(dim2_in_progress_partition_subset_by_dim1[dim1_keys[range_start_idx]]) > 0
-            ):
-                # Do not add to materialized_2d_ranges if the dim2 partition subset is empty
-                start_key = dim1_keys[range_start_idx]
-                end_key = dim1_keys[unevaluated_idx - 1]
-
-                primary_partitions_def = primary_dim.partitions_def
-                if isinstance(primary_partitions_def, TimeWindowPartitionsDefinition):
-                    time_windows = cast(
-                        TimeWindowPartitionsDefinition, primary_partitions_def
-                    ).time_windows_for_partition_keys(frozenset([start_key, end_key]))
-                    start_time = time_windows[0].start.timestamp()
-                    end_time = time_windows[-1].end.timestamp()
-                else:
-                    start_time = None
-                    end_time = None
-
-                materialized_2d_ranges.append(
-                    GrapheneMultiPartitionRangeStatuses(
-                        primaryDimStartKey=start_key,
-                        primaryDimEndKey=end_key,
-                        primaryDimStartTime=start_time,
-                        primaryDimEndTime=end_time,
-                        secondaryDim=build_partition_statuses(
-                            dynamic_partitions_store,
-                            dim2_materialized_partition_subset_by_dim1[start_key],
-                            dim2_failed_partition_subset_by_dim1[start_key],
-                            dim2_in_progress_partition_subset_by_dim1[start_key],
-                            secondary_dim.partitions_def,
-                        ),
-                    )
-                )
-            range_start_idx = unevaluated_idx
-        unevaluated_idx += 1
 
     return GrapheneMultiPartitionStatuses(
         ranges=materialized_2d_ranges, primaryDimensionName=primary_dim.name
@@ -60,7 +60,10 @@ def resolve_is_run_config_valid(
         return GraphenePipelineConfigValidationValid(represented_pipeline.name)
 
     validated_config = validate_config_from_snap(
-        represented_pipeline.config_schema_snapshot, mode_def_snap.root_config_key, run_config
+        represented_pipeline.config_schema_snapshot,
+        mode_def_snap.root_config_key,
+        run_config,
+        snapshot_id=represented_pipeline.identifying_job_snapshot_id,
     )
 
     if not validated_config.success:
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional, Sequence, Union, cast
+from typing import Optional, Sequence, Union, cast
 
 import dagster._check as check
 import graphene
@@ -23,11 +23,6 @@
 from .asset_key import GrapheneAssetKey
 from .util import ResolveInfo
 
-if TYPE_CHECKING:
-    from ..implementation.asset_checks_loader import (
-        AssetChecksExecutionForLatestMaterializationLoader,
-    )
-
 GrapheneAssetCheckExecutionResolvedStatus = graphene.Enum.from_enum(
     AssetCheckExecutionResolvedStatus
 )
@@ -147,11 +142,9 @@ def __init__(
         self,
         asset_check: ExternalAssetCheck,
         can_execute_individually,
-        execution_loader: "AssetChecksExecutionForLatestMaterializationLoader",
     ):
         self._asset_check = asset_check
         self._can_execute_individually = can_execute_individually
-        self._execution_loader = execution_loader
 
     def resolve_assetKey(self, _):
         return self._asset_check.asset_key
@@ -165,11 +158,13 @@ def resolve_description(self, _) -> Optional[str]:
     def resolve_jobNames(self, _) -> Sequence[str]:
         return self._asset_check.job_names
 
-    def resolve_executionForLatestMaterialization(
-        self, _graphene_info: ResolveInfo
+    async def resolve_executionForLatestMaterialization(
+        self, graphene_info: ResolveInfo
     ) -> Optional[GrapheneAssetCheckExecution]:
-        return self._execution_loader.get_execution_for_latest_materialization(
-            self._asset_check.key
+        from ..implementation.asset_checks_loader import gen_execution_for_latest_materialization
+
+        return await gen_execution_for_latest_materialization(
+            graphene_info.context, self._asset_check.key
         )
 
     def resolve_canExecuteIndividually(self, _) -> GrapheneAssetCheckCanExecuteIndividually:
@@ -4,6 +4,7 @@
 from dagster import (
     AssetKey,
     DagsterError,
+    MultiPartitionsDefinition,
     _check as check,
 )
 from dagster._core.definitions.asset_graph_differ import AssetDefinitionChangeType, AssetGraphDiffer
@@ -33,6 +34,7 @@
 )
 from dagster._core.snap.node import GraphDefSnap, OpDefSnap
 from dagster._core.storage.batch_asset_record_loader import BatchAssetRecordLoader
+from dagster._core.storage.dagster_run import RunRecord
 from dagster._core.utils import is_valid_email
 from dagster._core.workspace.permissions import Permissions
 from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
@@ -41,6 +43,8 @@
 from dagster_graphql.implementation.events import iterate_metadata_entries
 from dagster_graphql.implementation.fetch_asset_checks import has_asset_checks
 from dagster_graphql.implementation.fetch_assets import (
+    gen_latest_materialization_event,
+    gen_latest_observation_event,
     get_asset_materializations,
     get_asset_observations,
 )
@@ -63,8 +67,10 @@
 from dagster_graphql.schema.tags import GrapheneDefinitionTag
 
 from ..implementation.fetch_assets import (
+    build_multi_partition_statuses_from_rollup,
     build_partition_statuses,
     get_freshness_info,
+    get_multi_partition_status_rollup,
     get_partition_subsets,
 )
 from ..implementation.loader import CrossRepoAssetDependedByLoader, StaleStatusLoader
@@ -605,7 +611,7 @@ def resolve_assetMaterializationUsedData(
             if materialization_time
         ]
 
-    def resolve_assetMaterializations(
+    async def resolve_assetMaterializations(
         self,
         graphene_info: ResolveInfo,
         partitions: Optional[Sequence[str]] = None,
@@ -619,11 +625,15 @@ def resolve_assetMaterializations(
         except ValueError:
             before_timestamp = None
 
-        if self._asset_record_loader and limit == 1 and not partitions and not before_timestamp:
+        if limit == 1 and not partitions and not before_timestamp:
             latest_materialization_event = (
                 self._asset_record_loader.get_latest_materialization_for_asset_key(
                     self._external_asset_node.asset_key
                 )
+                if self._asset_record_loader
+                else await gen_latest_materialization_event(
+                    graphene_info, self._external_asset_node.asset_key
+                )
             )
 
             if not latest_materialization_event:
@@ -642,7 +652,7 @@ def resolve_assetMaterializations(
             )
         ]
 
-    def resolve_assetObservations(
+    async def resolve_assetObservations(
         self,
         graphene_info: ResolveInfo,
         partitions: Optional[Sequence[str]] = None,
@@ -658,7 +668,6 @@ def resolve_assetObservations(
 
         if (
             graphene_info.context.instance.event_log_storage.asset_records_have_last_observation
-            and self._asset_record_loader
             and limit == 1
             and not partitions
             and not before_timestamp
@@ -667,6 +676,10 @@ def resolve_assetObservations(
                 self._asset_record_loader.get_latest_observation_for_asset_key(
                     self._external_asset_node.asset_key
                 )
+                if self._asset_record_loader
+                else await gen_latest_observation_event(
+                    graphene_info, self._external_asset_node.asset_key
+                )
             )
 
             if not latest_observation_event:
@@ -1098,7 +1111,7 @@ def resolve_latestMaterializationByPartition(
             for event in ordered_materializations
         ]
 
-    def resolve_latestRunForPartition(
+    async def resolve_latestRunForPartition(
         self,
         graphene_info: ResolveInfo,
         partition: str,
@@ -1108,7 +1121,7 @@ def resolve_latestRunForPartition(
         )
         if not planned_info:
             return None
-        run_record = graphene_info.context.instance.get_run_record_by_id(planned_info.run_id)
+        run_record = await RunRecord.gen(graphene_info.context, planned_info.run_id)
         return GrapheneRun(run_record) if run_record else None
 
     def resolve_assetPartitionStatuses(
@@ -1129,6 +1142,23 @@ def resolve_assetPartitionStatuses(
             else None
         )
 
+        if isinstance(partitions_def, MultiPartitionsDefinition):
+            # serve the statuses from the rollup kept in the asset status cache, so that the
+            # partition keys of the asset are not visited on every request
+            multi_partition_status_rollup = get_multi_partition_status_rollup(
+                graphene_info.context.instance,
+                asset_key,
+                self._dynamic_partitions_loader,
+                self._asset_record_loader,
+                partitions_def,
+            )
+            if multi_partition_status_rollup is not None:
+                return build_multi_partition_statuses_from_rollup(
+                    self._dynamic_partitions_loader,
+                    multi_partition_status_rollup,
+                    partitions_def,
+                )
+
         (
             materialized_partition_subset,
             failed_partition_subset,
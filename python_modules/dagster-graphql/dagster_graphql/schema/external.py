@@ -270,6 +270,8 @@ def __init__(
         self._stale_status_loader = StaleStatusLoader(
             instance=instance,
             asset_graph=lambda: repository.asset_graph,
+            stale_status_cache=workspace_context.stale_status_cache,
+            stale_status_cache_scope=(repository_location.name, repository.name),
         )
         self._dynamic_partitions_loader = CachingDynamicPartitionsLoader(instance)
 
@@ -209,7 +209,7 @@ def resolve_id(self, _):
             )
         return get_unique_asset_id(self.key)
 
-    def resolve_assetMaterializations(
+    async def resolve_assetMaterializations(
         self,
         graphene_info: ResolveInfo,
         partitions: Optional[Sequence[str]] = None,
@@ -218,13 +218,21 @@ def resolve_assetMaterializations(
         afterTimestampMillis: Optional[str] = None,
         limit: Optional[int] = None,
     ) -> Sequence[GrapheneMaterializationEvent]:
-        from ...implementation.fetch_assets import get_asset_materializations
+        from ...implementation.fetch_assets import (
+            gen_latest_materialization_event,
+            get_asset_materializations,
+        )
 
         before_timestamp = parse_timestamp(beforeTimestampMillis)
         after_timestamp = parse_timestamp(afterTimestampMillis)
         if partitionInLast and self._definition:
             partitions = self._definition.get_partition_keys()[-int(partitionInLast) :]
 
+        if limit == 1 and not partitions and not before_timestamp and not after_timestamp:
+            # batched with the latest materializations of the other assets in the request
+            event = await gen_latest_materialization_event(graphene_info, self.key)
+            return [GrapheneMaterializationEvent(event=event)] if event else []
+
         events = get_asset_materializations(
             graphene_info,
             self.key,
@@ -235,7 +243,7 @@ def resolve_assetMaterializations(
         )
         return [GrapheneMaterializationEvent(event=event) for event in events]
 
-    def resolve_assetObservations(
+    async def resolve_assetObservations(
         self,
         graphene_info: ResolveInfo,
         partitions: Optional[Sequence[str]] = None,
@@ -244,13 +252,26 @@ def resolve_assetObservations(
         afterTimestampMillis: Optional[str] = None,
         limit: Optional[int] = None,
     ) -> Sequence[GrapheneObservationEvent]:
-        from ...implementation.fetch_assets import get_asset_observations
+        from ...implementation.fetch_assets import (
+            gen_latest_observation_event,
+            get_asset_observations,
+        )
 
         before_timestamp = parse_timestamp(beforeTimestampMillis)
         after_timestamp = parse_timestamp(afterTimestampMillis)
         if partitionInLast and self._definition:
             partitions = self._definition.get_partition_keys()[-int(partitionInLast) :]
 
+        if (
+            graphene_info.context.instance.event_log_storage.asset_records_have_last_observation
+            and limit == 1
+            and not partitions
+            and not before_timestamp
+            and not after_timestamp
+        ):
+            event = await gen_latest_observation_event(graphene_info, self.key)
+            return [GrapheneObservationEvent(event=event)] if event else []
+
         return [
             GrapheneObservationEvent(event=event)
             for event in get_asset_observations(
@@ -1000,7 +1000,12 @@ def load_asset_graph() -> RemoteAssetGraph:
         stale_status_loader = StaleStatusLoader(
             instance=graphene_info.context.instance,
             asset_graph=load_asset_graph,
+            stale_status_cache=graphene_info.context.stale_status_cache,
+            stale_status_cache_scope=(
+                (repo.handle.location_name, repo.name) if repo is not None else None
+            ),
         )
+        stale_status_loader.add_asset_keys([node.assetKey for node in results])
 
         base_deployment_context = graphene_info.context.get_base_deployment_context()
 
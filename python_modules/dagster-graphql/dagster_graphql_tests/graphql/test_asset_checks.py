@@ -1,4 +1,5 @@
 import time
+from unittest import mock
 
 from dagster import AssetKey, DagsterEvent, DagsterEventType
 from dagster._core.definitions.asset_check_evaluation import (
@@ -113,6 +114,24 @@
 }
 """
 
+GET_LATEST_EXECUTIONS = """
+query GetLatestExecutions {
+    assetNodes {
+        assetChecksOrError {
+            ... on AssetChecks {
+                checks {
+                    name
+                    executionForLatestMaterialization {
+                        runId
+                        status
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
 GET_ASSET_CHECK_HISTORY_WITH_STEP_KEY = """
 query GetAssetChecksQuery($assetKey: AssetKeyInput!, $checkName: String!) {
     assetCheckExecutions(assetKey: $assetKey, checkName: $checkName, limit: 10) {
@@ -823,6 +842,37 @@ def new_materialization() -> EventLogRecord:
 
         new_materialization()
 
+    def test_latest_executions_are_batched(self, graphql_context: WorkspaceRequestContext):
+        instance = graphql_context.instance
+        instance.wipe()
+
+        run = create_run_for_test(instance)
+        instance.event_log_storage.store_event(
+            _planned_event(
+                run.run_id,
+                AssetCheckEvaluationPlanned(asset_key=AssetKey(["asset_1"]), check_name="my_check"),
+            )
+        )
+
+        with mock.patch.object(
+            instance.event_log_storage,
+            "get_asset_check_summary_records",
+            wraps=instance.event_log_storage.get_asset_check_summary_records,
+        ) as get_asset_check_summary_records:
+            res = execute_dagster_graphql(graphql_context, GET_LATEST_EXECUTIONS)
+
+        checks = [
+            check
+            for node in res.data["assetNodes"]
+            for check in node["assetChecksOrError"].get("checks", [])
+        ]
+        assert len(checks) > 1
+        assert {"runId": run.run_id, "status": "IN_PROGRESS"} in [
+            check["executionForLatestMaterialization"] for check in checks
+        ]
+        # the latest executions of all checks are fetched together
+        assert get_asset_check_summary_records.call_count == 1
+
     def test_launch_subset_with_only_check(self, graphql_context: WorkspaceRequestContext):
         # materialize the asset and run the check first
         selector = infer_job_selector(
@@ -701,6 +701,23 @@
     }
 """
 
+BATCH_LOAD_CATALOG_ASSETS = """
+    query BatchLoadCatalogQuery {
+        assetsOrError {
+            ...on AssetConnection {
+                nodes {
+                    key {
+                        path
+                    }
+                    assetMaterializations(limit: 1) {
+                        runId
+                    }
+                }
+            }
+        }
+    }
+"""
+
 GET_ASSET_BACKFILL_POLICY = """
     query AssetNodeQuery($assetKey: AssetKeyInput!) {
         assetNodeOrError(assetKey: $assetKey) {
@@ -2124,6 +2141,26 @@ def test_batch_fetch_only_once(self, graphql_context: WorkspaceRequestContext):
         assert len(counts) == 1
         assert counts.get("DagsterInstance.get_asset_records") == 1
 
+    def test_batch_fetch_catalog_latest_materializations(
+        self, graphql_context: WorkspaceRequestContext
+    ):
+        run_id = _create_run(graphql_context, "multi_asset_job")
+
+        counter = Counter()
+        traced_counter.set(counter)
+        result = execute_dagster_graphql(graphql_context, BATCH_LOAD_CATALOG_ASSETS)
+        assert result.data
+        nodes = result.data["assetsOrError"]["nodes"]
+        materialized_nodes = [node for node in nodes if node["assetMaterializations"]]
+        assert len(materialized_nodes) > 1
+        assert all(
+            node["assetMaterializations"][0]["runId"] == run_id for node in materialized_nodes
+        )
+
+        counts = counter.counts()
+        assert counts.get("DagsterInstance.get_asset_records") == 1
+        assert "DagsterInstance.fetch_materializations" not in counts
+
     def test_batch_empty_list(self, graphql_context: WorkspaceRequestContext):
         traced_counter.set(Counter())
         result = execute_dagster_graphql(
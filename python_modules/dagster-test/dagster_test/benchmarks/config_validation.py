@@ -0,0 +1,173 @@
+# ruff: noqa: T201
+import argparse
+from typing import Any, Mapping
+
+from dagster import Config, ConfigurableResource, In, Nothing, job, op
+from dagster._config.compiled_validate import (
+    CompiledConfigValidator,
+    clear_compiled_config_validator_cache,
+)
+from dagster._config.validate import validate_config_from_snap
+from dagster._core.definitions.job_definition import JobDefinition
+from dagster._core.snap import build_config_schema_snapshot
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the execution time of run config validation against a job's config schema snapshot with
+the compiled validator (`CompiledConfigValidator`): the first call, which includes compilation,
+repeated calls on the same validator, and `validate_config_from_snap` on snapshots that are equal
+but distinct objects, as when each request deserializes its own snapshot. The latter reuses the
+cached validator, looked up either by hashing the snapshot or by a given snapshot id.
+
+The job is a chain of `--num-ops` ops, each with a config class of several fields, plus
+`--num-resources` configurable resources. The run config provides config for every op and
+resource, and is validated `--num-iterations` times in each experiment.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="config_validation",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-ops",
+    type=int,
+    default=200,
+    help="Set the number of configured ops in the job.",
+)
+
+parser.add_argument(
+    "--num-resources",
+    type=int,
+    default=20,
+    help="Set the number of configured resources in the job.",
+)
+
+parser.add_argument(
+    "--num-iterations",
+    type=int,
+    default=100,
+    help="Set the number of times the run config is validated in each experiment.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+class OpConfig(Config):
+    name: str
+    batch_size: int = 100
+    threshold: float = 0.5
+    enabled: bool = True
+    tags: Mapping[str, str] = {}
+
+
+class BenchmarkResource(ConfigurableResource):
+    host: str
+    port: int = 5432
+    options: Mapping[str, str] = {}
+
+
+def build_job(num_ops: int, num_resources: int) -> JobDefinition:
+    ops = []
+    for i in range(num_ops):
+
+        @op(name=f"op_{i}", ins={"start": In(Nothing)})
+        def _op(config: OpConfig) -> None: ...
+
+        ops.append(_op)
+
+    @job(
+        resource_defs={
+            f"resource_{i}": BenchmarkResource(host="localhost") for i in range(num_resources)
+        }
+    )
+    def benchmark_job():
+        result = None
+        for configured_op in ops:
+            result = configured_op(start=result) if result is not None else configured_op()
+
+    return benchmark_job
+
+
+def build_run_config(num_ops: int, num_resources: int) -> Mapping[str, Any]:
+    return {
+        "ops": {
+            f"op_{i}": {
+                "config": {
+                    "name": f"op_{i}",
+                    "batch_size": i,
+                    "threshold": 0.1,
+                    "tags": {"team": "data", "tier": str(i % 3)},
+                }
+            }
+            for i in range(num_ops)
+        },
+        "resources": {
+            f"resource_{i}": {"config": {"host": f"host-{i}", "options": {"sslmode": "require"}}}
+            for i in range(num_resources)
+        },
+        "execution": {"config": {"multiprocess": {"max_concurrent": 4}}},
+    }
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_ops: int, num_resources: int, num_iterations: int) -> None:
+    session = ProfilingSession(
+        name="Config validation",
+        experiment_settings={
+            "num_ops": num_ops,
+            "num_resources": num_resources,
+            "num_iterations": num_iterations,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    with session.logged_execution_time("Build job and config schema snapshot"):
+        benchmark_job = build_job(num_ops, num_resources)
+        snapshot = build_config_schema_snapshot(benchmark_job)
+        config_type_key = benchmark_job.run_config_schema.config_type.key
+        run_config = build_run_config(num_ops, num_resources)
+
+    validator = CompiledConfigValidator(snapshot)
+    with session.logged_execution_time("Compiled validation (first call, includes compilation)"):
+        assert validator.validate(config_type_key, run_config).success
+
+    with session.logged_execution_time(f"Compiled validation x {num_iterations}"):
+        for _ in range(num_iterations):
+            result = validator.validate(config_type_key, run_config)
+            assert result.success, result.errors
+
+    snapshots = [build_config_schema_snapshot(benchmark_job) for _ in range(num_iterations)]
+
+    clear_compiled_config_validator_cache()
+    with session.logged_execution_time(
+        f"Validation of equal snapshots, keyed by content hash x {num_iterations}"
+    ):
+        for equal_snapshot in snapshots:
+            result = validate_config_from_snap(equal_snapshot, config_type_key, run_config)
+            assert result.success, result.errors
+
+    clear_compiled_config_validator_cache()
+    with session.logged_execution_time(
+        f"Validation of equal snapshots, keyed by snapshot id x {num_iterations}"
+    ):
+        for equal_snapshot in snapshots:
+            result = validate_config_from_snap(
+                equal_snapshot, config_type_key, run_config, snapshot_id="benchmark_job"
+            )
+            assert result.success, result.errors
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_ops, args.num_resources, args.num_iterations)
@@ -0,0 +1,159 @@
+# ruff: noqa: T201
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from typing import List, NamedTuple, Optional, Sequence
+
+from rich.table import Table
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the time it takes to `import dagster` in a fresh interpreter. The import is run
+`--num-iterations` times in subprocesses with `-X importtime`, and the median, minimum and maximum
+import times are reported along with the `--num-modules` modules with the highest self time in the
+median run.
+
+If `--max-seconds` is set, the script exits with a non-zero status when the median import time
+exceeds it, so that it can be used to catch import time regressions.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="import_time",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--module",
+    type=str,
+    default="dagster",
+    help="Set the module whose import is measured.",
+)
+
+parser.add_argument(
+    "--num-iterations",
+    type=int,
+    default=10,
+    help="Set the number of times the module is imported.",
+)
+
+parser.add_argument(
+    "--num-modules",
+    type=int,
+    default=20,
+    help="Set the number of modules with the highest self time that are reported.",
+)
+
+parser.add_argument(
+    "--max-seconds",
+    type=float,
+    default=None,
+    help="Fail if the median import time exceeds this number of seconds.",
+)
+
+_IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+class ModuleImportTime(NamedTuple):
+    name: str
+    self_seconds: float
+    cumulative_seconds: float
+
+
+class ImportProfile(NamedTuple):
+    seconds: float
+    modules: Sequence[ModuleImportTime]
+
+
+def profile_import(module: str) -> ImportProfile:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+    )
+    modules: List[ModuleImportTime] = []
+    seconds: Optional[float] = None
+    for line in result.stderr.decode("utf-8").splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules.append(ModuleImportTime(name, int(self_us) / 1e6, int(cumulative_us) / 1e6))
+        if name == module and not indent:
+            seconds = int(cumulative_us) / 1e6
+
+    if seconds is None:
+        raise Exception(f"Module {module} was already imported when the interpreter started.")
+
+    return ImportProfile(seconds, modules)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(module: str, num_iterations: int, num_modules: int, max_seconds: Optional[float]) -> None:
+    session = ProfilingSession(
+        name="Import time",
+        experiment_settings={
+            "module": module,
+            "num_iterations": num_iterations,
+            "max_seconds": max_seconds,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    # warm up the bytecode cache so that compilation is not measured
+    profile_import(module)
+
+    with session.logged_execution_time(f"import {module} x {num_iterations}"):
+        profiles = sorted(
+            (profile_import(module) for _ in range(num_iterations)),
+            key=lambda profile: profile.seconds,
+        )
+
+    session.log_result_summary()
+
+    median_seconds = statistics.median(profile.seconds for profile in profiles)
+    summary = Table(title="Import times", title_justify="left")
+    summary.add_column("Median", justify="right")
+    summary.add_column("Min", justify="right")
+    summary.add_column("Max", justify="right")
+    summary.add_row(
+        f"{median_seconds:.4f}", f"{profiles[0].seconds:.4f}", f"{profiles[-1].seconds:.4f}"
+    )
+    session.output.print(summary)
+
+    median_profile = profiles[len(profiles) // 2]
+    slowest = Table(
+        title=f"Slowest modules by self time (of {len(median_profile.modules)} imported)",
+        title_justify="left",
+    )
+    slowest.add_column("Module", justify="left")
+    slowest.add_column("Self", justify="right")
+    slowest.add_column("Cumulative", justify="right")
+    for module_time in sorted(
+        median_profile.modules, key=lambda module_time: module_time.self_seconds, reverse=True
+    )[:num_modules]:
+        slowest.add_row(
+            module_time.name,
+            f"{module_time.self_seconds:.4f}",
+            f"{module_time.cumulative_seconds:.4f}",
+        )
+    session.output.print(slowest)
+
+    if max_seconds is not None and median_seconds > max_seconds:
+        print(
+            f"Median import time of {module} ({median_seconds:.4f}s) exceeds the maximum of"
+            f" {max_seconds:.4f}s."
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.module, args.num_iterations, args.num_modules, args.max_seconds)
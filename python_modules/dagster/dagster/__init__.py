@@ -495,10 +495,6 @@
     InputContext as InputContext,
     build_input_context as build_input_context,
 )
-from dagster._core.execution.context.invocation import (
-    build_asset_context as build_asset_context,
-    build_op_context as build_op_context,
-)
 from dagster._core.execution.context.logger import InitLoggerContext as InitLoggerContext
 from dagster._core.execution.context.output import (
     OutputContext as OutputContext,
@@ -509,65 +505,18 @@
     StepExecutionContext as StepExecutionContext,
     TypeCheckContext as TypeCheckContext,
 )
-from dagster._core.execution.execute_in_process_result import (
-    ExecuteInProcessResult as ExecuteInProcessResult,
-)
 from dagster._core.execution.job_execution_result import JobExecutionResult as JobExecutionResult
-from dagster._core.execution.plan.external_step import (
-    external_instance_from_step_run_ref as external_instance_from_step_run_ref,
-    run_step_from_ref as run_step_from_ref,
-    step_context_to_step_run_ref as step_context_to_step_run_ref,
-    step_run_ref_to_step_context as step_run_ref_to_step_context,
-)
-from dagster._core.execution.validate_run_config import validate_run_config as validate_run_config
 from dagster._core.execution.with_resources import with_resources as with_resources
 from dagster._core.executor.base import Executor as Executor
 from dagster._core.executor.init import InitExecutorContext as InitExecutorContext
 from dagster._core.instance import DagsterInstance as DagsterInstance
-from dagster._core.instance_for_test import instance_for_test as instance_for_test
-from dagster._core.launcher.default_run_launcher import DefaultRunLauncher as DefaultRunLauncher
 from dagster._core.log_manager import DagsterLogManager as DagsterLogManager
-from dagster._core.pipes.client import (
-    PipesClient as PipesClient,
-    PipesContextInjector as PipesContextInjector,
-    PipesMessageReader as PipesMessageReader,
-)
-from dagster._core.pipes.context import (
-    PipesMessageHandler as PipesMessageHandler,
-    PipesSession as PipesSession,
-)
-from dagster._core.pipes.subprocess import PipesSubprocessClient as PipesSubprocessClient
-from dagster._core.pipes.utils import (
-    PipesBlobStoreMessageReader as PipesBlobStoreMessageReader,
-    PipesEnvContextInjector as PipesEnvContextInjector,
-    PipesFileContextInjector as PipesFileContextInjector,
-    PipesFileMessageReader as PipesFileMessageReader,
-    PipesLogReader as PipesLogReader,
-    PipesTempFileContextInjector as PipesTempFileContextInjector,
-    PipesTempFileMessageReader as PipesTempFileMessageReader,
-    open_pipes_session as open_pipes_session,
-)
-from dagster._core.run_coordinator.queued_run_coordinator import (
-    QueuedRunCoordinator as QueuedRunCoordinator,
-    SubmitRunContext as SubmitRunContext,
-)
-from dagster._core.storage.asset_value_loader import AssetValueLoader as AssetValueLoader
 from dagster._core.storage.dagster_run import (
     DagsterRun as DagsterRun,
     DagsterRunStatus as DagsterRunStatus,
     RunRecord as RunRecord,
     RunsFilter as RunsFilter,
 )
-from dagster._core.storage.file_manager import (
-    FileHandle as FileHandle,
-    LocalFileHandle as LocalFileHandle,
-    local_file_manager as local_file_manager,
-)
-from dagster._core.storage.fs_io_manager import (
-    FilesystemIOManager as FilesystemIOManager,
-    custom_path_fs_io_manager as custom_path_fs_io_manager,
-    fs_io_manager as fs_io_manager,
-)
 from dagster._core.storage.input_manager import (
     InputManager as InputManager,
     InputManagerDefinition as InputManagerDefinition,
@@ -582,11 +531,7 @@
     InMemoryIOManager as InMemoryIOManager,
     mem_io_manager as mem_io_manager,
 )
-from dagster._core.storage.partition_status_cache import (
-    AssetPartitionStatus as AssetPartitionStatus,
-)
 from dagster._core.storage.tags import MAX_RUNTIME_SECONDS_TAG as MAX_RUNTIME_SECONDS_TAG
-from dagster._core.storage.upath_io_manager import UPathIOManager as UPathIOManager
 from dagster._core.types.config_schema import (
     DagsterTypeLoader as DagsterTypeLoader,
     dagster_type_loader as dagster_type_loader,
@@ -644,6 +589,114 @@
 
 from dagster._utils.warnings import deprecation_warning
 
+# NOTE: Public symbols whose defining modules pull in storage, execution or process management
+# machinery that is not needed to construct definitions are imported lazily, on first attribute
+# access, to keep `import dagster` fast. Like deprecated aliases, they have to be declared twice--
+# the TYPE_CHECKING declaration satisfies linters and type checkers, and the entry in
+# `_LAZY_IMPORTS` names the module that the symbol is loaded from.
+
+if TYPE_CHECKING:
+    from dagster._core.execution.context.invocation import (
+        build_asset_context as build_asset_context,
+        build_op_context as build_op_context,
+    )
+    from dagster._core.execution.execute_in_process_result import (
+        ExecuteInProcessResult as ExecuteInProcessResult,
+    )
+    from dagster._core.execution.plan.external_step import (
+        external_instance_from_step_run_ref as external_instance_from_step_run_ref,
+        run_step_from_ref as run_step_from_ref,
+        step_context_to_step_run_ref as step_context_to_step_run_ref,
+        step_run_ref_to_step_context as step_run_ref_to_step_context,
+    )
+    from dagster._core.execution.validate_run_config import (
+        validate_run_config as validate_run_config,
+    )
+    from dagster._core.instance_for_test import instance_for_test as instance_for_test
+    from dagster._core.launcher.default_run_launcher import DefaultRunLauncher as DefaultRunLauncher
+    from dagster._core.pipes.client import (
+        PipesClient as PipesClient,
+        PipesContextInjector as PipesContextInjector,
+        PipesMessageReader as PipesMessageReader,
+    )
+    from dagster._core.pipes.context import (
+        PipesMessageHandler as PipesMessageHandler,
+        PipesSession as PipesSession,
+    )
+    from dagster._core.pipes.subprocess import PipesSubprocessClient as PipesSubprocessClient
+    from dagster._core.pipes.utils import (
+        PipesBlobStoreMessageReader as PipesBlobStoreMessageReader,
+        PipesEnvContextInjector as PipesEnvContextInjector,
+        PipesFileContextInjector as PipesFileContextInjector,
+        PipesFileMessageReader as PipesFileMessageReader,
+        PipesLogReader as PipesLogReader,
+        PipesTempFileContextInjector as PipesTempFileContextInjector,
+        PipesTempFileMessageReader as PipesTempFileMessageReader,
+        open_pipes_session as open_pipes_session,
+    )
+    from dagster._core.run_coordinator.queued_run_coordinator import (
+        QueuedRunCoordinator as QueuedRunCoordinator,
+        SubmitRunContext as SubmitRunContext,
+    )
+    from dagster._core.storage.asset_value_loader import AssetValueLoader as AssetValueLoader
+    from dagster._core.storage.file_manager import (
+        FileHandle as FileHandle,
+        LocalFileHandle as LocalFileHandle,
+        local_file_manager as local_file_manager,
+    )
+    from dagster._core.storage.fs_io_manager import (
+        FilesystemIOManager as FilesystemIOManager,
+        custom_path_fs_io_manager as custom_path_fs_io_manager,
+        fs_io_manager as fs_io_manager,
+    )
+    from dagster._core.storage.partition_status_cache import (
+        AssetPartitionStatus as AssetPartitionStatus,
+    )
+    from dagster._core.storage.shared_memory_io_manager import (
+        SharedMemoryIOManager as SharedMemoryIOManager,
+    )
+    from dagster._core.storage.upath_io_manager import UPathIOManager as UPathIOManager
+
+
+_LAZY_IMPORTS: Final[Mapping[str, str]] = {
+    "build_asset_context": "dagster._core.execution.context.invocation",
+    "build_op_context": "dagster._core.execution.context.invocation",
+    "ExecuteInProcessResult": "dagster._core.execution.execute_in_process_result",
+    "external_instance_from_step_run_ref": "dagster._core.execution.plan.external_step",
+    "run_step_from_ref": "dagster._core.execution.plan.external_step",
+    "step_context_to_step_run_ref": "dagster._core.execution.plan.external_step",
+    "step_run_ref_to_step_context": "dagster._core.execution.plan.external_step",
+    "validate_run_config": "dagster._core.execution.validate_run_config",
+    "instance_for_test": "dagster._core.instance_for_test",
+    "DefaultRunLauncher": "dagster._core.launcher.default_run_launcher",
+    "PipesClient": "dagster._core.pipes.client",
+    "PipesContextInjector": "dagster._core.pipes.client",
+    "PipesMessageReader": "dagster._core.pipes.client",
+    "PipesMessageHandler": "dagster._core.pipes.context",
+    "PipesSession": "dagster._core.pipes.context",
+    "PipesSubprocessClient": "dagster._core.pipes.subprocess",
+    "PipesBlobStoreMessageReader": "dagster._core.pipes.utils",
+    "PipesEnvContextInjector": "dagster._core.pipes.utils",
+    "PipesFileContextInjector": "dagster._core.pipes.utils",
+    "PipesFileMessageReader": "dagster._core.pipes.utils",
+    "PipesLogReader": "dagster._core.pipes.utils",
+    "PipesTempFileContextInjector": "dagster._core.pipes.utils",
+    "PipesTempFileMessageReader": "dagster._core.pipes.utils",
+    "open_pipes_session": "dagster._core.pipes.utils",
+    "QueuedRunCoordinator": "dagster._core.run_coordinator.queued_run_coordinator",
+    "SubmitRunContext": "dagster._core.run_coordinator.queued_run_coordinator",
+    "AssetValueLoader": "dagster._core.storage.asset_value_loader",
+    "FileHandle": "dagster._core.storage.file_manager",
+    "LocalFileHandle": "dagster._core.storage.file_manager",
+    "local_file_manager": "dagster._core.storage.file_manager",
+    "FilesystemIOManager": "dagster._core.storage.fs_io_manager",
+    "custom_path_fs_io_manager": "dagster._core.storage.fs_io_manager",
+    "fs_io_manager": "dagster._core.storage.fs_io_manager",
+    "AssetPartitionStatus": "dagster._core.storage.partition_status_cache",
+    "SharedMemoryIOManager": "dagster._core.storage.shared_memory_io_manager",
+    "UPathIOManager": "dagster._core.storage.upath_io_manager",
+}
+
 # NOTE: Unfortunately we have to declare deprecated aliases twice-- the
 # TYPE_CHECKING declaration satisfies linters and type checkers, but the entry
 # in `_DEPRECATED` is required  for us to generate the deprecation warning.
@@ -672,7 +725,12 @@
 
 
 def __getattr__(name: str) -> TypingAny:
-    if name in _DEPRECATED:
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        # cache the value so that later accesses bypass this function
+        globals()[name] = value
+        return value
+    elif name in _DEPRECATED:
         module, breaking_version, additional_warn_text = _DEPRECATED[name]
         value = getattr(importlib.import_module(module), name)
         stacklevel = 3 if sys.version_info >= (3, 7) else 4
@@ -693,4 +751,9 @@ def __getattr__(name: str) -> TypingAny:
 
 
 def __dir__() -> Sequence[str]:
-    return [*globals(), *_DEPRECATED.keys(), *_DEPRECATED_RENAMED.keys()]
+    return [
+        *globals(),
+        *(name for name in _LAZY_IMPORTS.keys() if name not in globals()),
+        *_DEPRECATED.keys(),
+        *_DEPRECATED_RENAMED.keys(),
+    ]
@@ -10,6 +10,7 @@
 from dagster._serdes import deserialize_value
 
 if TYPE_CHECKING:
+    from dagster._core.definitions.run_status_sensor_definition import RunStatusChangeBatch
     from dagster._core.instance import DagsterInstance
     from dagster._grpc.client import DagsterGrpcClient
 
@@ -56,6 +57,7 @@ def sync_get_external_sensor_execution_data_grpc(
     log_key: Optional[Sequence[str]],
     last_sensor_start_time: Optional[float] = None,
     timeout: Optional[int] = None,
+    run_status_change_batch: Optional["RunStatusChangeBatch"] = None,
 ) -> SensorExecutionData:
     check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
     check.str_param(sensor_name, "sensor_name")
@@ -78,6 +80,7 @@ def sync_get_external_sensor_execution_data_grpc(
                 log_key=log_key,
                 timeout=timeout,
                 last_sensor_start_time=last_sensor_start_time,
+                run_status_change_batch=run_status_change_batch,
             ),
         ),
         (SensorExecutionData, ExternalSensorExecutionErrorData),
@@ -21,6 +21,7 @@
 from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster._core.execution.context_creation_job import create_context_free_log_manager
 from dagster._core.execution.run_cancellation_thread import start_run_cancellation_thread
+from dagster._core.execution.run_worker_startup_profiler import RunWorkerStartupProfiler
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.origin import (
     DEFAULT_DAGSTER_ENTRY_POINT,
@@ -28,6 +29,10 @@
     get_python_environment_entry_point,
 )
 from dagster._core.storage.dagster_run import DagsterRun
+from dagster._core.storage.tags import (
+    RUN_WORKER_LAZY_DEFINITIONS_TAG,
+    RUN_WORKER_STARTUP_PROFILING_TAG,
+)
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.utils import FuturesAwareThreadPoolExecutor
 from dagster._grpc import DagsterGrpcClient, DagsterGrpcServer
@@ -35,6 +40,7 @@
 from dagster._grpc.server import DagsterApiServer
 from dagster._grpc.types import ExecuteRunArgs, ExecuteStepArgs, ResumeRunArgs
 from dagster._serdes import deserialize_value, serialize_value
+from dagster._utils.env import get_boolean_env_var
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster._utils.hosted_user_process import recon_job_from_origin
 from dagster._utils.interrupts import capture_interrupts, setup_interrupt_handlers
@@ -93,6 +99,21 @@ def _enable_python_runtime_metrics(dagster_run: DagsterRun) -> bool:
     return get_boolean_tag_value(dagster_run.tags.get("dagster/python_runtime_metrics"))
 
 
+def _should_lazy_load_definitions(dagster_run: DagsterRun) -> bool:
+    return get_boolean_tag_value(
+        dagster_run.tags.get(RUN_WORKER_LAZY_DEFINITIONS_TAG),
+        default_value=get_boolean_env_var("DAGSTER_RUN_WORKER_LAZY_DEFINITIONS"),
+    )
+
+
+def _get_startup_profiler(dagster_run: DagsterRun) -> Optional[RunWorkerStartupProfiler]:
+    should_profile = get_boolean_tag_value(
+        dagster_run.tags.get(RUN_WORKER_STARTUP_PROFILING_TAG),
+        default_value=get_boolean_env_var("DAGSTER_RUN_WORKER_STARTUP_PROFILING"),
+    )
+    return RunWorkerStartupProfiler() if should_profile else None
+
+
 def _metrics_polling_interval(
     dagster_run: DagsterRun, logger: Optional[logging.Logger] = None
 ) -> float:
@@ -169,6 +190,8 @@ def _execute_run_command_body(
             dagster_run,
             instance,
             inject_env_vars=True,
+            lazy_load_definitions=_should_lazy_load_definitions(dagster_run),
+            startup_profiler=_get_startup_profiler(dagster_run),
         ):
             write_stream_fn(event)
             if event.event_type == DagsterEventType.PIPELINE_FAILURE:
@@ -285,6 +308,8 @@ def _resume_run_command_body(
             instance,
             resume_from_failure=True,
             inject_env_vars=True,
+            lazy_load_definitions=_should_lazy_load_definitions(dagster_run),
+            startup_profiler=_get_startup_profiler(dagster_run),
         ):
             write_stream_fn(event)
             if event.event_type == DagsterEventType.PIPELINE_FAILURE:
@@ -789,16 +814,29 @@ def grpc_command(
         server_threadpool_executor=threadpool_executor,
     )
 
-    server = DagsterGrpcServer(
-        server_termination_event=server_termination_event,
-        dagster_api_servicer=api_servicer,
-        port=port,
-        socket=socket,
-        host=host,
-        logger=logger,
-        enable_metrics=enable_metrics,
-        threadpool_executor=threadpool_executor,
-    )
+    if get_boolean_env_var("DAGSTER_GRPC_USE_ASYNC_SERVER"):
+        from dagster._grpc.async_server import DagsterAsyncGrpcServer
+
+        server = DagsterAsyncGrpcServer(
+            server_termination_event=server_termination_event,
+            dagster_api_servicer=api_servicer,
+            port=port,
+            socket=socket,
+            host=host,
+            logger=logger,
+            enable_metrics=enable_metrics,
+        )
+    else:
+        server = DagsterGrpcServer(
+            server_termination_event=server_termination_event,
+            dagster_api_servicer=api_servicer,
+            port=port,
+            socket=socket,
+            host=host,
+            logger=logger,
+            enable_metrics=enable_metrics,
+            threadpool_executor=threadpool_executor,
+        )
 
     logger.info("Started %s", server_desc)
 
@@ -0,0 +1,479 @@
+"""Config validation using validators compiled from config schema snapshots.
+
+Each config type snap is compiled (once, lazily) into a closure specialized to its kind, fields,
+aliases and child types, instead of interpreting the `ConfigTypeSnap` tree for every value. The
+path to the value being validated is tracked as a linked tuple, and a `ValidationContext` and an
+`EvaluationStack` are only built when an error is reported.
+"""
+
+import os
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, cast
+
+import dagster._check as check
+from dagster._serdes import create_snapshot_id
+from dagster._utils import ensure_single_item
+from dagster._utils.lru_cache import LRUCache
+
+from .config_type import ConfigScalarKind, ConfigTypeKind
+from .errors import (
+    EvaluationError,
+    create_array_error,
+    create_dict_type_mismatch_error,
+    create_enum_type_mismatch_error,
+    create_enum_value_missing_error,
+    create_field_not_defined_error,
+    create_field_substitution_collision_error,
+    create_fields_not_defined_error,
+    create_map_error,
+    create_missing_required_field_error,
+    create_missing_required_fields_error,
+    create_none_not_allowed_error,
+    create_pydantic_env_var_error,
+    create_scalar_error,
+    create_selector_multiple_fields_error,
+    create_selector_multiple_fields_no_field_selected_error,
+    create_selector_type_error,
+    create_selector_unspecified_value_error,
+)
+from .evaluate_value_result import EvaluateValueResult
+from .field_utils import EnvVar, IntEnvVar
+from .snap import ConfigSchemaSnapshot, ConfigTypeSnap
+from .stack import (
+    EvaluationStack,
+    EvaluationStackEntry,
+    EvaluationStackListItemEntry,
+    EvaluationStackMapKeyEntry,
+    EvaluationStackMapValueEntry,
+    EvaluationStackPathEntry,
+)
+from .traversal_context import ValidationContext
+
+T = TypeVar("T")
+
+# number of config schema snapshots whose compiled validators are retained by
+# `validate_config_from_snap`
+COMPILED_VALIDATOR_CACHE_SIZE = int(os.getenv("DAGSTER_COMPILED_CONFIG_VALIDATOR_CACHE_SIZE", "32"))
+
+# (parent path, stack entry class, stack entry argument), or None at the root
+_Path = Optional[Tuple[Any, Callable[[Any], EvaluationStackEntry], Any]]
+# returns the validated value and the validation errors, if any
+_Validator = Callable[[object, _Path], Tuple[Any, Optional[List[EvaluationError]]]]
+
+VALID_FLOAT_TYPES = (int, float)
+
+
+def get_scalar_validity_check(config_type_snap: ConfigTypeSnap) -> Callable[[object], bool]:
+    """Returns a function that checks whether a value is valid for a scalar config type."""
+    scalar_kind = config_type_snap.scalar_kind
+    if scalar_kind == ConfigScalarKind.INT:
+        return lambda value: not isinstance(value, bool) and isinstance(value, int)
+    elif scalar_kind == ConfigScalarKind.STRING:
+        return lambda value: isinstance(value, str)
+    elif scalar_kind == ConfigScalarKind.BOOL:
+        return lambda value: isinstance(value, bool)
+    elif scalar_kind == ConfigScalarKind.FLOAT:
+        return lambda value: isinstance(value, VALID_FLOAT_TYPES)
+    elif scalar_kind is None:
+        # historical snapshot without scalar kind. do no validation
+        return lambda _value: True
+    else:
+        check.failed(f"Not a supported scalar {config_type_snap}")
+
+
+def _stack_for_path(path: _Path) -> EvaluationStack:
+    entries: List[EvaluationStackEntry] = []
+    while path is not None:
+        path, entry_cls, entry_arg = path
+        entries.append(entry_cls(entry_arg))
+    entries.reverse()
+    return EvaluationStack(entries=entries)
+
+
+class CompiledConfigValidator:
+    """Validates config values against the config types of a single config schema snapshot,
+    compiling the validator for each config type the first time it is needed.
+    """
+
+    def __init__(self, config_schema_snapshot: ConfigSchemaSnapshot):
+        self._config_schema_snapshot = check.inst_param(
+            config_schema_snapshot, "config_schema_snapshot", ConfigSchemaSnapshot
+        )
+        self._validators: Dict[str, _Validator] = {}
+
+    @property
+    def config_schema_snapshot(self) -> ConfigSchemaSnapshot:
+        return self._config_schema_snapshot
+
+    @property
+    def compiled_type_keys(self) -> Sequence[str]:
+        """The keys of the config types that have been compiled so far."""
+        return list(self._validators.keys())
+
+    def validate(self, config_type_key: str, config_value: T) -> EvaluateValueResult[T]:
+        check.str_param(config_type_key, "config_type_key")
+        value, errors = self._get_validator(config_type_key)(config_value, None)
+        return EvaluateValueResult(not errors, value, errors)
+
+    def _get_validator(self, config_type_key: str) -> _Validator:
+        validator = self._validators.get(config_type_key)
+        if validator is None:
+            validator = self._compile(self._config_schema_snapshot.get_config_snap(config_type_key))
+            self._validators[config_type_key] = validator
+        return validator
+
+    def _context(self, config_type_snap: ConfigTypeSnap, path: _Path) -> ValidationContext:
+        return ValidationContext(
+            config_schema_snapshot=self._config_schema_snapshot,
+            config_type_snap=config_type_snap,
+            stack=_stack_for_path(path),
+        )
+
+    def _compile(self, config_type_snap: ConfigTypeSnap) -> _Validator:
+        kind = config_type_snap.kind
+
+        if kind == ConfigTypeKind.NONEABLE:
+            return self._compile_noneable(config_type_snap)
+        if kind == ConfigTypeKind.ANY:
+            return lambda config_value, _path: (config_value, None)
+
+        if kind == ConfigTypeKind.SCALAR:
+            validator = self._compile_scalar(config_type_snap)
+        elif kind == ConfigTypeKind.SELECTOR:
+            validator = self._compile_selector(config_type_snap)
+        elif kind == ConfigTypeKind.STRICT_SHAPE:
+            validator = self._compile_shape(config_type_snap, check_for_extra_incoming_fields=True)
+        elif kind == ConfigTypeKind.PERMISSIVE_SHAPE:
+            validator = self._compile_shape(config_type_snap, check_for_extra_incoming_fields=False)
+        elif kind == ConfigTypeKind.MAP:
+            validator = self._compile_map(config_type_snap)
+        elif kind == ConfigTypeKind.ARRAY:
+            validator = self._compile_array(config_type_snap)
+        elif kind == ConfigTypeKind.ENUM:
+            validator = self._compile_enum(config_type_snap)
+        elif kind == ConfigTypeKind.SCALAR_UNION:
+            validator = self._compile_scalar_union(config_type_snap)
+        else:
+            check.failed(f"Unsupported ConfigTypeKind {kind}")
+
+        def _validate_not_none(config_value: object, path: _Path):
+            if config_value is None:
+                return None, [create_none_not_allowed_error(self._context(config_type_snap, path))]
+            return validator(config_value, path)
+
+        return _validate_not_none
+
+    def _compile_noneable(self, config_type_snap: ConfigTypeSnap) -> _Validator:
+        inner_type_key = config_type_snap.inner_type_key
+        get_validator = self._get_validator
+
+        def _validate_noneable(config_value: object, path: _Path):
+            if config_value is None:
+                return None, None
+            return get_validator(inner_type_key)(config_value, path)
+
+        return _validate_noneable
+
+    def _compile_scalar(self, config_type_snap: ConfigTypeSnap) -> _Validator:
+        is_valid = get_scalar_validity_check(config_type_snap)
+        is_string = config_type_snap.scalar_kind == ConfigScalarKind.STRING
+
+        def _validate_scalar(config_value: object, path: _Path):
+            if not is_valid(config_value):
+                return None, [
+                    create_scalar_error(self._context(config_type_snap, path), config_value)
+                ]
+            # If user passes an EnvVar or IntEnvVar to a non-structured run config dictionary,
+            # throw explicit error
+            if is_string and isinstance(config_value, (EnvVar, IntEnvVar)):
+                return None, [
+                    create_pydantic_env_var_error(
+                        self._context(config_type_snap, path), config_value
+                    )
+                ]
+            return config_value, None
+
+        return _validate_scalar
+
+    def _compile_selector(self, config_type_snap: ConfigTypeSnap) -> _Validator:
+        field_snaps = check.not_none(config_type_snap.fields)
+        field_type_keys = {
+            check.not_none(field_snap.name): field_snap.type_key for field_snap in field_snaps
+        }
+        get_validator = self._get_validator
+        get_config_snap = self._config_schema_snapshot.get_config_snap
+
+        def _validate_empty_selector(path: _Path):
+            if len(field_snaps) > 1:
+                return None, [
+                    create_selector_multiple_fields_no_field_selected_error(
+                        self._context(config_type_snap, path)
+                    )
+                ]
+            if field_snaps[0].is_required:
+                return None, [
+                    create_selector_unspecified_value_error(self._context(config_type_snap, path))
+                ]
+            return {}, None
+
+        def _validate_selector(config_value: object, path: _Path):
+            # Special case the empty dictionary, meaning no values provided for the
+            # value of the selector. # E.g. {'logging': {}}
+            if config_value == {}:
+                return _validate_empty_selector(path)
+
+            if not isinstance(config_value, dict):
+                return None, [
+                    create_selector_type_error(self._context(config_type_snap, path), config_value)
+                ]
+
+            if len(config_value) > 1:
+                return None, [
+                    create_selector_multiple_fields_error(
+                        self._context(config_type_snap, path), config_value
+                    )
+                ]
+
+            field_name, field_value = ensure_single_item(config_value)
+
+            field_type_key = field_type_keys.get(field_name)
+            if field_type_key is None:
+                return None, [
+                    create_field_not_defined_error(
+                        self._context(config_type_snap, path), field_name
+                    )
+                ]
+
+            # This is a very particular special case where we want someone to be able to select
+            # a selector key *without* a value, e.g.
+            #
+            # storage:
+            #   filesystem:
+            #
+            # And we want the default values of the child elements of filesystem: to "fill in"
+            if field_value is None and ConfigTypeKind.has_fields(
+                get_config_snap(field_type_key).kind
+            ):
+                field_value = {}
+
+            value, errors = get_validator(field_type_key)(
+                field_value, (path, EvaluationStackPathEntry, field_name)
+            )
+            if errors:
+                return value, errors
+            return {field_name: value}, None
+
+        return _validate_selector
+
+    def _compile_shape(
+        self, config_type_snap: ConfigTypeSnap, check_for_extra_incoming_fields: bool
+    ) -> _Validator:
+        field_aliases = cast(Dict[str, str], config_type_snap.field_aliases or {})
+        field_snaps = check.not_none(config_type_snap.fields)
+        defined_field_names = {cast(str, fs.name) for fs in field_snaps}.union(
+            set(field_aliases.values())
+        )
+        required_fields = [
+            (cast(str, fs.name), field_aliases.get(cast(str, fs.name)))
+            for fs in field_snaps
+            if fs.is_required
+        ]
+        fields = [
+            (check.not_none(fs.name), field_aliases.get(check.not_none(fs.name)), fs.type_key)
+            for fs in field_snaps
+        ]
+        get_validator = self._get_validator
+        get_config_snap = self._config_schema_snapshot.get_config_snap
+
+        def _validate_shape(config_value: object, path: _Path):
+            if not isinstance(config_value, dict):
+                return None, [
+                    create_dict_type_mismatch_error(
+                        self._context(config_type_snap, path), config_value
+                    )
+                ]
+
+            errors: List[EvaluationError] = []
+
+            if check_for_extra_incoming_fields and not defined_field_names.issuperset(config_value):
+                extra_fields = list(set(config_value.keys()) - defined_field_names)
+                if len(extra_fields) == 1:
+                    errors.append(
+                        create_field_not_defined_error(
+                            self._context(config_type_snap, path), extra_fields[0]
+                        )
+                    )
+                else:
+                    errors.append(
+                        create_fields_not_defined_error(
+                            self._context(config_type_snap, path), extra_fields
+                        )
+                    )
+
+            missing_fields = [
+                name
+                for name, alias in required_fields
+                if name not in config_value and (alias is None or alias not in config_value)
+            ]
+            if len(missing_fields) == 1:
+                errors.append(
+                    create_missing_required_field_error(
+                        self._context(config_type_snap, path), missing_fields[0]
+                    )
+                )
+            elif missing_fields:
+                errors.append(
+                    create_missing_required_fields_error(
+                        self._context(config_type_snap, path), missing_fields
+                    )
+                )
+
+            # dict is well-formed. now recursively validate all incoming fields
+            for name, aliased_name, type_key in fields:
+                if name in config_value:
+                    if aliased_name is not None and aliased_name in config_value:
+                        errors.append(
+                            create_field_substitution_collision_error(
+                                self._context(
+                                    get_config_snap(type_key),
+                                    (path, EvaluationStackPathEntry, name),
+                                ),
+                                name=name,
+                                aliased_name=aliased_name,
+                            )
+                        )
+                        continue
+                    field_value = config_value[name]
+                elif aliased_name is not None and aliased_name in config_value:
+                    field_value = config_value[aliased_name]
+                else:
+                    continue
+
+                _, field_errors = get_validator(type_key)(
+                    field_value, (path, EvaluationStackPathEntry, name)
+                )
+                if field_errors:
+                    errors.extend(field_errors)
+
+            if errors:
+                return None, errors
+            return config_value, None
+
+        return _validate_shape
+
+    def _compile_map(self, config_type_snap: ConfigTypeSnap) -> _Validator:
+        key_type_key = config_type_snap.key_type_key
+        inner_type_key = config_type_snap.inner_type_key
+        get_validator = self._get_validator
+
+        def _validate_map(config_value: object, path: _Path):
+            if not isinstance(config_value, dict):
+                return None, [create_map_error(self._context(config_type_snap, path), config_value)]
+
+            key_validator = get_validator(key_type_key)
+            value_validator = get_validator(inner_type_key)
+            key_errors: List[EvaluationError] = []
+            value_errors: List[EvaluationError] = []
+            for key, item in config_value.items():
+                _, errors = key_validator(key, (path, EvaluationStackMapKeyEntry, key))
+                if errors:
+                    key_errors.extend(errors)
+                _, errors = value_validator(item, (path, EvaluationStackMapValueEntry, key))
+                if errors:
+                    value_errors.extend(errors)
+
+            return config_value, key_errors + value_errors
+
+        return _validate_map
+
+    def _compile_array(self, config_type_snap: ConfigTypeSnap) -> _Validator:
+        inner_type_key = config_type_snap.inner_type_key
+        get_validator = self._get_validator
+
+        def _validate_array(config_value: object, path: _Path):
+            if not isinstance(config_value, list):
+                return None, [
+                    create_array_error(self._context(config_type_snap, path), config_value)
+                ]
+
+            item_validator = get_validator(inner_type_key)
+            values: List[object] = []
+            errors: List[EvaluationError] = []
+            for index, item in enumerate(cast(List[object], config_value)):
+                value, item_errors = item_validator(
+                    item, (path, EvaluationStackListItemEntry, index)
+                )
+                if item_errors:
+                    errors.extend(item_errors)
+                else:
+                    values.append(value)
+
+            return values, errors
+
+        return _validate_array
+
+    def _compile_enum(self, config_type_snap: ConfigTypeSnap) -> _Validator:
+        enum_values = frozenset(
+            enum_value.value for enum_value in check.not_none(config_type_snap.enum_values)
+        )
+
+        def _validate_enum(config_value: object, path: _Path):
+            if not isinstance(config_value, str):
+                return None, [
+                    create_enum_type_mismatch_error(
+                        self._context(config_type_snap, path), config_value
+                    )
+                ]
+            if config_value not in enum_values:
+                return None, [
+                    create_enum_value_missing_error(
+                        self._context(config_type_snap, path), config_value
+                    )
+                ]
+            return config_value, None
+
+        return _validate_enum
+
+    def _compile_scalar_union(self, config_type_snap: ConfigTypeSnap) -> _Validator:
+        scalar_type_key = config_type_snap.scalar_type_key
+        non_scalar_type_key = config_type_snap.non_scalar_type_key
+        get_validator = self._get_validator
+
+        def _validate_scalar_union(config_value: object, path: _Path):
+            if isinstance(config_value, (dict, list)):
+                return get_validator(non_scalar_type_key)(config_value, path)
+            return get_validator(scalar_type_key)(config_value, path)
+
+        return _validate_scalar_union
+
+
+_compiled_validator_cache: LRUCache[str, CompiledConfigValidator] = LRUCache(
+    max_size=COMPILED_VALIDATOR_CACHE_SIZE
+)
+
+
+def get_compiled_config_validator(
+    config_schema_snapshot: ConfigSchemaSnapshot, snapshot_id: Optional[str] = None
+) -> CompiledConfigValidator:
+    """Returns the compiled validator for a config schema snapshot, reusing the validator compiled
+    for an equal snapshot by a previous call if it is still cached.
+
+    Snapshots are usually deserialized anew for every request, so validators are cached by the
+    content of the snapshot rather than by the snapshot object: by `snapshot_id` if it is set,
+    e.g. to the id of the job snapshot that contains the config schema, or else by a hash of the
+    snapshot.
+    """
+    check.inst_param(config_schema_snapshot, "config_schema_snapshot", ConfigSchemaSnapshot)
+    check.opt_str_param(snapshot_id, "snapshot_id")
+
+    cache_key = (
+        snapshot_id if snapshot_id is not None else create_snapshot_id(config_schema_snapshot)
+    )
+    validator = _compiled_validator_cache.get(cache_key)
+    if validator is None:
+        validator = CompiledConfigValidator(config_schema_snapshot)
+        _compiled_validator_cache.set(cache_key, validator)
+    return validator
+
+
+def clear_compiled_config_validator_cache() -> None:
+    _compiled_validator_cache.clear()
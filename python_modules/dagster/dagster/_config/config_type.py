@@ -9,6 +9,7 @@
 from dagster._serdes import whitelist_for_serdes
 
 if TYPE_CHECKING:
+    from .compiled_validate import CompiledConfigValidator
     from .snap import ConfigSchemaSnapshot, ConfigTypeSnap
 
 
@@ -78,6 +79,8 @@ def __init__(
 
         # memoized snap representation
         self._snap: Optional["ConfigTypeSnap"] = None
+        # memoized compiled validator, see compiled_validate.py
+        self._compiled_validator: Optional["CompiledConfigValidator"] = None
 
     @property
     def description(self) -> Optional[str]:
@@ -113,6 +116,14 @@ def get_schema_snapshot(self) -> "ConfigSchemaSnapshot":
 
         return ConfigSchemaSnapshot({ct.key: ct.get_snapshot() for ct in self.type_iterator()})
 
+    def get_compiled_validator(self) -> "CompiledConfigValidator":
+        from .compiled_validate import CompiledConfigValidator
+
+        if self._compiled_validator is None:
+            self._compiled_validator = CompiledConfigValidator(self.get_schema_snapshot())
+
+        return self._compiled_validator
+
 
 @whitelist_for_serdes
 class ConfigScalarKind(PythonEnum):
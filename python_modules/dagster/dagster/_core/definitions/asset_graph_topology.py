@@ -0,0 +1,302 @@
+import threading
+from array import array
+from collections import deque
+from typing import AbstractSet, Dict, Iterable, List, Mapping, Optional, Sequence, Set
+
+from toposort import CircularDependencyError
+
+from dagster._core.definitions.asset_key import AssetKey
+
+
+class AssetGraphTopology:
+    """Immutable, integer-indexed adjacency index over the asset keys of an asset graph.
+
+    Node ids are assigned in topological order (ties within a level broken by key), so that the
+    order of `keys` is the graph's canonical topological sort. Parents and children are stored in
+    compressed sparse row form: the parents of node `i` are
+    `parent_ids[parent_offsets[i]:parent_offsets[i + 1]]`, and likewise for children.
+    Self-dependencies are not included in the adjacency arrays.
+
+    Nodes that are part of, or downstream of, a dependency cycle have no level and are ordered
+    last. Traversals work on such graphs, but the ordering accessors raise a
+    `CircularDependencyError`.
+
+    Instances are cheap to query from many threads, and can be built incrementally from the
+    topology of a previous version of the graph via `AssetGraphTopology.build(..., previous=...)`,
+    in which case topological levels are only recomputed for the downstream cone of asset keys
+    whose dependencies changed.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[AssetKey],
+        levels: "array[int]",
+        parent_offsets: "array[int]",
+        parent_ids: "array[int]",
+        child_offsets: "array[int]",
+        child_ids: "array[int]",
+    ):
+        self._keys = keys
+        self._ids_by_key = {key: i for i, key in enumerate(keys)}
+        self._levels = levels
+        self._parent_offsets = parent_offsets
+        self._parent_ids = parent_ids
+        self._child_offsets = child_offsets
+        self._child_ids = child_ids
+        self._has_cycles = -1 in levels
+
+    @staticmethod
+    def build(
+        upstream: Mapping[AssetKey, AbstractSet[AssetKey]],
+        previous: Optional["AssetGraphTopology"] = None,
+    ) -> "AssetGraphTopology":
+        """Build a topology from a mapping of each asset key to the keys it depends on. Keys that
+        only appear as dependencies are included as nodes without parents.
+
+        If `previous` is provided, the topological levels of nodes whose ancestry is unchanged
+        are reused rather than recomputed.
+        """
+        parents_by_key: Dict[AssetKey, AbstractSet[AssetKey]] = {}
+        for key, parent_keys in upstream.items():
+            parents_by_key[key] = parent_keys
+            for parent_key in parent_keys:
+                if parent_key not in upstream:
+                    parents_by_key.setdefault(parent_key, set())
+
+        children_by_key: Dict[AssetKey, List[AssetKey]] = {key: [] for key in parents_by_key}
+        for key, parent_keys in parents_by_key.items():
+            for parent_key in parent_keys:
+                if parent_key != key:
+                    children_by_key[parent_key].append(key)
+
+        if previous is None or previous.has_cycles:
+            levels_by_key = _compute_levels(parents_by_key, children_by_key, parents_by_key.keys())
+        else:
+            changed_keys = [
+                key
+                for key, parent_keys in parents_by_key.items()
+                if not previous.has(key) or previous.get_parent_keys(key) != parent_keys - {key}
+            ]
+            dirty_keys = _downstream_closure(changed_keys, children_by_key)
+            levels_by_key = {
+                key: previous.get_level(key) for key in parents_by_key if key not in dirty_keys
+            }
+            levels_by_key.update(
+                _compute_levels(parents_by_key, children_by_key, dirty_keys, levels_by_key)
+            )
+
+        # nodes in or downstream of a cycle have no level, and are ordered after all other nodes
+        cycle_level = len(parents_by_key)
+        keys = sorted(parents_by_key, key=lambda k: (levels_by_key.get(k, cycle_level), k))
+        ids_by_key = {key: i for i, key in enumerate(keys)}
+
+        levels = array("l", (levels_by_key.get(key, -1) for key in keys))
+        parent_offsets, parent_ids = _to_csr(
+            [(parents_by_key[key] - {key}) for key in keys], ids_by_key
+        )
+        child_offsets, child_ids = _to_csr([children_by_key[key] for key in keys], ids_by_key)
+        return AssetGraphTopology(
+            keys, levels, parent_offsets, parent_ids, child_offsets, child_ids
+        )
+
+    ##### KEY <-> ID
+
+    @property
+    def keys(self) -> Sequence[AssetKey]:
+        """All asset keys, ordered by id."""
+        return self._keys
+
+    @property
+    def has_cycles(self) -> bool:
+        return self._has_cycles
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def has(self, key: AssetKey) -> bool:
+        return key in self._ids_by_key
+
+    def get_id(self, key: AssetKey) -> int:
+        return self._ids_by_key[key]
+
+    def get_key(self, node_id: int) -> AssetKey:
+        return self._keys[node_id]
+
+    def ids_for_keys(self, keys: Iterable[AssetKey]) -> Set[int]:
+        ids_by_key = self._ids_by_key
+        return {ids_by_key[key] for key in keys if key in ids_by_key}
+
+    def keys_for_ids(self, node_ids: Iterable[int]) -> Set[AssetKey]:
+        keys = self._keys
+        return {keys[node_id] for node_id in node_ids}
+
+    ##### ADJACENCY
+
+    def get_level(self, key: AssetKey) -> int:
+        self._check_acyclic()
+        return self._levels[self._ids_by_key[key]]
+
+    def parent_ids(self, node_id: int) -> Sequence[int]:
+        return self._parent_ids[self._parent_offsets[node_id] : self._parent_offsets[node_id + 1]]
+
+    def child_ids(self, node_id: int) -> Sequence[int]:
+        return self._child_ids[self._child_offsets[node_id] : self._child_offsets[node_id + 1]]
+
+    def get_parent_keys(self, key: AssetKey) -> AbstractSet[AssetKey]:
+        return self.keys_for_ids(self.parent_ids(self._ids_by_key[key]))
+
+    def get_child_keys(self, key: AssetKey) -> AbstractSet[AssetKey]:
+        return self.keys_for_ids(self.child_ids(self._ids_by_key[key]))
+
+    @property
+    def toposorted_keys(self) -> Sequence[AssetKey]:
+        """All asset keys in topological order, ties within a level broken by key."""
+        self._check_acyclic()
+        return self._keys
+
+    @property
+    def toposorted_keys_by_level(self) -> Sequence[Sequence[AssetKey]]:
+        """Asset keys grouped by topological level, each level sorted by key."""
+        self._check_acyclic()
+        by_level: List[List[AssetKey]] = []
+        for key, level in zip(self._keys, self._levels):
+            if level == len(by_level):
+                by_level.append([])
+            by_level[level].append(key)
+        return by_level
+
+    def _check_acyclic(self) -> None:
+        if self._has_cycles:
+            raise CircularDependencyError(
+                {
+                    key: self.get_parent_keys(key)
+                    for key, level in zip(self._keys, self._levels)
+                    if level == -1
+                }
+            )
+
+    ##### TRAVERSAL
+
+    def ancestor_ids(self, node_ids: Iterable[int], depth: Optional[int] = None) -> Set[int]:
+        """Ids of all nodes upstream of any of the given nodes, up to `depth` hops away. The given
+        nodes are not included unless they are upstream of one another.
+        """
+        return self._traverse(node_ids, self._parent_offsets, self._parent_ids, depth)
+
+    def descendant_ids(self, node_ids: Iterable[int], depth: Optional[int] = None) -> Set[int]:
+        """Ids of all nodes downstream of any of the given nodes, up to `depth` hops away. The
+        given nodes are not included unless they are downstream of one another.
+        """
+        return self._traverse(node_ids, self._child_offsets, self._child_ids, depth)
+
+    def get_ancestor_keys(self, key: AssetKey, depth: Optional[int] = None) -> Set[AssetKey]:
+        return self.keys_for_ids(self.ancestor_ids([self._ids_by_key[key]], depth))
+
+    def get_descendant_keys(self, key: AssetKey, depth: Optional[int] = None) -> Set[AssetKey]:
+        return self.keys_for_ids(self.descendant_ids([self._ids_by_key[key]], depth))
+
+    @staticmethod
+    def _traverse(
+        node_ids: Iterable[int],
+        offsets: "array[int]",
+        adjacent_ids: "array[int]",
+        depth: Optional[int],
+    ) -> Set[int]:
+        result: Set[int] = set()
+        frontier = list(node_ids)
+        remaining_depth = depth
+        while frontier and (remaining_depth is None or remaining_depth > 0):
+            next_frontier = []
+            for node_id in frontier:
+                for adjacent_id in adjacent_ids[offsets[node_id] : offsets[node_id + 1]]:
+                    if adjacent_id not in result:
+                        result.add(adjacent_id)
+                        next_frontier.append(adjacent_id)
+            frontier = next_frontier
+            if remaining_depth is not None:
+                remaining_depth -= 1
+        return result
+
+
+class AssetGraphTopologySlot:
+    """Holds the topology of the most recently built asset graph for a long-lived workspace, so
+    that the asset graphs of successive request contexts or daemon iterations can be indexed
+    incrementally.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._topology: Optional[AssetGraphTopology] = None
+
+    def get(self) -> Optional[AssetGraphTopology]:
+        with self._lock:
+            return self._topology
+
+    def set(self, topology: AssetGraphTopology) -> None:
+        with self._lock:
+            self._topology = topology
+
+
+def _downstream_closure(
+    keys: Iterable[AssetKey], children_by_key: Mapping[AssetKey, Sequence[AssetKey]]
+) -> Set[AssetKey]:
+    result = set(keys)
+    queue = deque(result)
+    while queue:
+        for child_key in children_by_key[queue.popleft()]:
+            if child_key not in result:
+                result.add(child_key)
+                queue.append(child_key)
+    return result
+
+
+def _compute_levels(
+    parents_by_key: Mapping[AssetKey, AbstractSet[AssetKey]],
+    children_by_key: Mapping[AssetKey, Sequence[AssetKey]],
+    keys_to_compute: Iterable[AssetKey],
+    known_levels: Optional[Mapping[AssetKey, int]] = None,
+) -> Dict[AssetKey, int]:
+    """Kahn's algorithm restricted to `keys_to_compute`, whose parents outside of that set must
+    have their levels in `known_levels`. A node's level is one more than the max of its parents'.
+    Nodes that are part of, or downstream of, a cycle are omitted from the result.
+    """
+    keys_to_compute = set(keys_to_compute)
+    known_levels = known_levels or {}
+    remaining_parent_counts: Dict[AssetKey, int] = {}
+    levels: Dict[AssetKey, int] = {}
+    ready: deque[AssetKey] = deque()
+    for key in keys_to_compute:
+        parent_keys = parents_by_key[key]
+        count = sum(1 for p in parent_keys if p != key and p in keys_to_compute)
+        remaining_parent_counts[key] = count
+        levels[key] = max(
+            (known_levels[p] + 1 for p in parent_keys if p != key and p not in keys_to_compute),
+            default=0,
+        )
+        if count == 0:
+            ready.append(key)
+
+    visited: Set[AssetKey] = set()
+    while ready:
+        key = ready.popleft()
+        visited.add(key)
+        for child_key in children_by_key[key]:
+            if child_key not in keys_to_compute:
+                continue
+            levels[child_key] = max(levels[child_key], levels[key] + 1)
+            remaining_parent_counts[child_key] -= 1
+            if remaining_parent_counts[child_key] == 0:
+                ready.append(child_key)
+
+    return {key: level for key, level in levels.items() if key in visited}
+
+
+def _to_csr(
+    adjacency: Sequence[Iterable[AssetKey]], ids_by_key: Mapping[AssetKey, int]
+) -> "tuple[array[int], array[int]]":
+    offsets = array("l", [0])
+    ids = array("l")
+    for adjacent_keys in adjacency:
+        ids.extend(sorted(ids_by_key[key] for key in adjacent_keys))
+        offsets.append(len(ids))
+    return offsets, ids
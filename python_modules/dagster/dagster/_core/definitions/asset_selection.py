@@ -1,8 +1,9 @@
 import collections.abc
 import operator
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from functools import reduce
-from typing import AbstractSet, Iterable, List, Optional, Sequence, Union, cast
+from typing import AbstractSet, Dict, Iterable, List, Optional, Sequence, Tuple, Union, cast
 
 from typing_extensions import TypeAlias, TypeGuard
 
@@ -11,12 +12,7 @@
 from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.resolved_asset_deps import resolve_similar_asset_names
 from dagster._core.errors import DagsterInvalidSubsetError
-from dagster._core.selector.subset_selector import (
-    fetch_connected,
-    fetch_sinks,
-    fetch_sources,
-    parse_clause,
-)
+from dagster._core.selector.subset_selector import fetch_sinks, fetch_sources, parse_clause
 from dagster._model import DagsterModel
 from dagster._serdes.serdes import whitelist_for_serdes
 
@@ -40,6 +36,15 @@
 ]
 
 
+# Results of the sub-expressions of the selection currently being resolved, keyed on the identity of
+# the sub-expression and the asset graph. Entries hold references to both, so ids are not reused
+# while the memo is alive.
+_ResolveMemo: TypeAlias = Dict[
+    Tuple[int, int, bool], Tuple["AssetSelection", BaseAssetGraph, AbstractSet[AssetKey]]
+]
+_resolve_memo: ContextVar[Optional[_ResolveMemo]] = ContextVar("_resolve_memo", default=None)
+
+
 def is_coercible_to_asset_selection(obj: object) -> TypeGuard[CoercibleToAssetSelection]:
     return isinstance(obj, (str, AssetSelection)) or (
         isinstance(obj, Sequence)
@@ -434,7 +439,34 @@ def resolve(
             check.iterable_param(all_assets, "all_assets", (AssetsDefinition, SourceAsset))
             asset_graph = AssetGraph.from_assets(all_assets)
 
-        return self.resolve_inner(asset_graph, allow_missing=allow_missing)
+        if _resolve_memo.get() is not None:
+            return self._resolve_operand(asset_graph, allow_missing=allow_missing)
+
+        token = _resolve_memo.set({})
+        try:
+            return self._resolve_operand(asset_graph, allow_missing=allow_missing)
+        finally:
+            _resolve_memo.reset(token)
+
+    def _resolve_operand(
+        self, asset_graph: BaseAssetGraph, allow_missing: bool
+    ) -> AbstractSet[AssetKey]:
+        """Resolve this selection as part of a larger expression. Sub-expressions that are shared
+        between operands (e.g. `sel.upstream() | sel.downstream()`) are only resolved once per
+        call to `resolve`. The returned set must not be mutated.
+        """
+        memo = _resolve_memo.get()
+        if memo is None:
+            return self.resolve_inner(asset_graph, allow_missing=allow_missing)
+
+        memo_key = (id(self), id(asset_graph), allow_missing)
+        if memo_key not in memo:
+            memo[memo_key] = (
+                self,
+                asset_graph,
+                self.resolve_inner(asset_graph, allow_missing=allow_missing),
+            )
+        return memo[memo_key][2]
 
     @abstractmethod
     def resolve_inner(
@@ -635,13 +667,16 @@ class AndAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
-        return reduce(
-            operator.and_,
+        # every operand is resolved so that missing keys are reported, but the intersection is
+        # computed by probing the other operands with the members of the smallest one
+        results = sorted(
             (
-                selection.resolve_inner(asset_graph, allow_missing=allow_missing)
+                selection._resolve_operand(asset_graph, allow_missing=allow_missing)  # noqa: SLF001
                 for selection in self.operands
             ),
+            key=len,
         )
+        return set(results[0]).intersection(*results[1:])
 
     def resolve_checks_inner(
         self, asset_graph: AssetGraph, allow_missing: bool
@@ -678,13 +713,12 @@ class OrAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
-        return reduce(
-            operator.or_,
-            (
-                selection.resolve_inner(asset_graph, allow_missing=allow_missing)
-                for selection in self.operands
-            ),
-        )
+        result = set()
+        for selection in self.operands:
+            result.update(
+                selection._resolve_operand(asset_graph, allow_missing=allow_missing)  # noqa: SLF001
+            )
+        return result
 
     def resolve_checks_inner(
         self, asset_graph: AssetGraph, allow_missing: bool
@@ -722,9 +756,9 @@ class SubtractAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
-        return self.left.resolve_inner(
+        return self.left._resolve_operand(  # noqa: SLF001
             asset_graph, allow_missing=allow_missing
-        ) - self.right.resolve_inner(asset_graph, allow_missing=allow_missing)
+        ) - self.right._resolve_operand(asset_graph, allow_missing=allow_missing)  # noqa: SLF001
 
     def resolve_checks_inner(
         self, asset_graph: AssetGraph, allow_missing: bool
@@ -755,8 +789,14 @@ class SinksAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
-        selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
-        return fetch_sinks(asset_graph.asset_dep_graph, selection)
+        selection = self.child._resolve_operand(asset_graph, allow_missing=allow_missing)  # noqa: SLF001
+        topology = asset_graph.topology
+        if topology.has_cycles:
+            return fetch_sinks(asset_graph.asset_dep_graph, selection)
+        # in an acyclic graph, a selected key is a sink iff it is not upstream of any selected key
+        return selection - topology.keys_for_ids(
+            topology.ancestor_ids(topology.ids_for_keys(selection))
+        )
 
     def to_serializable_asset_selection(self, asset_graph: BaseAssetGraph) -> "AssetSelection":
         return self.model_copy(
@@ -771,7 +811,7 @@ class RequiredNeighborsAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
-        selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
+        selection = self.child._resolve_operand(asset_graph, allow_missing=allow_missing)  # noqa: SLF001
         output = set(selection)
         for asset_key in selection:
             output.update(asset_graph.get(asset_key).execution_set_asset_keys)
@@ -790,8 +830,14 @@ class RootsAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
-        selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
-        return fetch_sources(asset_graph.asset_dep_graph, selection)
+        selection = self.child._resolve_operand(asset_graph, allow_missing=allow_missing)  # noqa: SLF001
+        topology = asset_graph.topology
+        if topology.has_cycles:
+            return fetch_sources(asset_graph.asset_dep_graph, selection)
+        # in an acyclic graph, a selected key is a root iff it is not downstream of any selected key
+        return selection - topology.keys_for_ids(
+            topology.descendant_ids(topology.ids_for_keys(selection))
+        )
 
     def to_serializable_asset_selection(self, asset_graph: BaseAssetGraph) -> "AssetSelection":
         return self.model_copy(
@@ -808,23 +854,12 @@ class DownstreamAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
-        selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
-        return operator.sub(
-            reduce(
-                operator.or_,
-                [
-                    {asset_key}
-                    | fetch_connected(
-                        item=asset_key,
-                        graph=asset_graph.asset_dep_graph,
-                        direction="downstream",
-                        depth=self.depth,
-                    )
-                    for asset_key in selection
-                ],
-            ),
-            selection if not self.include_self else set(),
+        selection = self.child._resolve_operand(asset_graph, allow_missing=allow_missing)  # noqa: SLF001
+        topology = asset_graph.topology
+        downstream = topology.keys_for_ids(
+            topology.descendant_ids(topology.ids_for_keys(selection), depth=self.depth)
         )
+        return downstream | selection if self.include_self else downstream - selection
 
     def to_serializable_asset_selection(self, asset_graph: BaseAssetGraph) -> "AssetSelection":
         return self.model_copy(
@@ -1004,23 +1039,12 @@ def _fetch_all_upstream(
     depth: Optional[int] = None,
     include_self: bool = True,
 ) -> AbstractSet[AssetKey]:
-    return operator.sub(
-        reduce(
-            operator.or_,
-            [
-                {asset_key}
-                | fetch_connected(
-                    item=asset_key,
-                    graph=asset_graph.asset_dep_graph,
-                    direction="upstream",
-                    depth=depth,
-                )
-                for asset_key in selection
-            ],
-            set(),
-        ),
-        selection if not include_self else set(),
+    # a single breadth-first traversal from all selected keys at once, rather than one per key
+    topology = asset_graph.topology
+    upstream = topology.keys_for_ids(
+        topology.ancestor_ids(topology.ids_for_keys(selection), depth=depth)
     )
+    return upstream | selection if include_self else upstream - selection
 
 
 @whitelist_for_serdes
@@ -1032,7 +1056,7 @@ class UpstreamAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
-        selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
+        selection = self.child._resolve_operand(asset_graph, allow_missing=allow_missing)  # noqa: SLF001
         if len(selection) == 0:
             return selection
         all_upstream = _fetch_all_upstream(selection, asset_graph, self.depth, self.include_self)
@@ -1064,7 +1088,7 @@ class ParentSourcesAssetSelection(AssetSelection):
     def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
-        selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
+        selection = self.child._resolve_operand(asset_graph, allow_missing=allow_missing)  # noqa: SLF001
         if len(selection) == 0:
             return selection
         all_upstream = _fetch_all_upstream(selection, asset_graph)
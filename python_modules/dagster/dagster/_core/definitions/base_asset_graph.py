@@ -25,6 +25,7 @@
 
 import dagster._check as check
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
+from dagster._core.definitions.asset_graph_topology import AssetGraphTopology
 from dagster._core.definitions.asset_key import AssetKey, AssetKeyOrCheckKey
 from dagster._core.definitions.asset_subset import ValidAssetSubset
 from dagster._core.definitions.backfill_policy import BackfillPolicy
@@ -35,7 +36,6 @@
 from dagster._core.errors import DagsterInvalidInvocationError
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._core.selector.subset_selector import DependencyGraph, fetch_sources
-from dagster._core.utils import toposort
 from dagster._utils.cached_method import cached_method
 
 from .events import AssetKeyPartitionKey
@@ -169,6 +169,8 @@ def __str__(self) -> str:
 
 class BaseAssetGraph(ABC, Generic[T_AssetNode]):
     _asset_nodes_by_key: Mapping[AssetKey, T_AssetNode]
+    # topology of a previous version of this graph, used to build `topology` incrementally
+    _previous_topology: Optional[AssetGraphTopology] = None
 
     @property
     def asset_nodes(self) -> Iterable[T_AssetNode]:
@@ -187,6 +189,13 @@ def asset_dep_graph(self) -> DependencyGraph[AssetKey]:
             "downstream": {node.key: node.child_keys for node in self.asset_nodes},
         }
 
+    @cached_property
+    def topology(self) -> AssetGraphTopology:
+        """Integer-indexed adjacency index over the asset keys in the graph."""
+        return AssetGraphTopology.build(
+            self.asset_dep_graph["upstream"], previous=self._previous_topology
+        )
+
     @cached_property
     def all_asset_keys(self) -> AbstractSet[AssetKey]:
         return {node.key for node in self.asset_nodes}
@@ -216,18 +225,14 @@ def toposorted_asset_keys(self) -> Sequence[AssetKey]:
         """Return topologically sorted asset keys in graph. Keys with the same topological level are
         sorted alphabetically to provide stability.
         """
-        return [
-            item
-            for items_in_level in toposort(self.asset_dep_graph["upstream"])
-            for item in sorted(items_in_level)
-        ]
+        return list(self.topology.toposorted_keys)
 
     @cached_property
     def toposorted_asset_keys_by_level(self) -> Sequence[AbstractSet[AssetKey]]:
         """Return topologically sorted asset keys grouped into sets containing keys of the same
         topological level.
         """
-        return [set(level) for level in toposort(self.asset_dep_graph["upstream"])]
+        return [set(level) for level in self.topology.toposorted_keys_by_level]
 
     @cached_property
     def unpartitioned_asset_keys(self) -> AbstractSet[AssetKey]:
@@ -301,18 +306,7 @@ def get_ancestor_asset_keys(
         self, asset_key: AssetKey, include_self: bool = False
     ) -> AbstractSet[AssetKey]:
         """Returns all nth-order dependencies of an asset."""
-        ancestors = set()
-        next_parents = self.get(asset_key).parent_keys - {asset_key}  # remove self-dependencies
-        while next_parents:
-            pending_next_parents = set()
-            for node_key in next_parents:
-                if node_key in ancestors:
-                    continue
-                ancestors.add(node_key)
-                pending_next_parents.update(self.get(node_key).parent_keys)
-
-            next_parents = pending_next_parents
-
+        ancestors = self.topology.get_ancestor_keys(asset_key)
         if include_self:
             ancestors.add(asset_key)
         return ancestors
@@ -860,11 +854,7 @@ def __init__(
         self._asset_graph = asset_graph
         self._include_full_execution_set = include_full_execution_set
 
-        self._toposort_level_by_asset_key = {
-            asset_key: i
-            for i, asset_keys in enumerate(asset_graph.toposorted_asset_keys_by_level)
-            for asset_key in asset_keys
-        }
+        self._topology = asset_graph.topology
         self._heap = [self._queue_item(asset_partition) for asset_partition in items]
         heapify(self._heap)
 
@@ -887,9 +877,7 @@ def _queue_item(
         else:
             execution_set_keys = {asset_key}
 
-        level = max(
-            self._toposort_level_by_asset_key[asset_key] for asset_key in execution_set_keys
-        )
+        level = max(self._topology.get_level(asset_key) for asset_key in execution_set_keys)
 
         return ToposortedPriorityQueue.QueueItem(
             level,
@@ -1,15 +1,25 @@
 import functools
+import os
+import threading
+import time
 from enum import Enum
 from hashlib import sha256
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
+    Any,
     Callable,
+    Dict,
+    Hashable,
+    Iterable,
     Iterator,
     List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Set,
+    TypeVar,
     Union,
 )
 
@@ -28,11 +38,15 @@
         AssetObservation,
     )
     from dagster._core.event_api import EventLogRecord
+    from dagster._core.events import DagsterEventType
     from dagster._core.events.log import EventLogEntry
     from dagster._core.instance import DagsterInstance
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 
+T = TypeVar("T")
+
+
 class UnknownValue:
     pass
 
@@ -366,10 +380,199 @@ def dedupe_key(self) -> int:
 SKIP_PARTITION_DATA_VERSION_SELF_DEPENDENCY_THRESHOLD = 100
 
 
+def _get_stale_status_cache_max_events() -> int:
+    return int(os.getenv("DAGSTER_STALE_STATUS_CACHE_MAX_EVENTS", "1000"))
+
+
+def _get_stale_status_cache_ttl_seconds() -> float:
+    return float(os.getenv("DAGSTER_STALE_STATUS_CACHE_TTL_SECONDS", "300"))
+
+
+class _StaleStatusCacheEntry:
+    def __init__(self, created_at: float):
+        self.created_at = created_at
+        self.values: Dict[str, Any] = {}
+
+
+class _StaleStatusCacheScope:
+    def __init__(self):
+        self.watermark: Optional[int] = None
+        self.generation = 0
+        self.definition_signatures: Dict["AssetKey", Hashable] = {}
+        self.entries: Dict["AssetKey", _StaleStatusCacheEntry] = {}
+
+
+class StaleStatusCache:
+    """Shares the staleness information resolved by `CachingStaleStatusResolver`s across requests,
+    e.g. across the GraphQL requests served by a long-lived workspace process context.
+
+    Only unpartitioned assets with no partitioned ancestors are cached, since the staleness of
+    other assets can depend on the current time and on dynamic partitions. Entries are versioned by
+    event log storage id: each resolver syncs the cache once, before its first lookup, by fetching
+    the materializations and observations stored since the last sync and discarding the entries for
+    the downstream cone of the assets they target. The entries for the downstream cone of assets
+    whose definitions (code version, dependencies, partitioning) changed are discarded as well.
+    Changes that are not recorded as new events, like asset wipes, are picked up once entries
+    expire, after `DAGSTER_STALE_STATUS_CACHE_TTL_SECONDS`.
+
+    Entries are kept separately for each scope (e.g. the workspace asset graph and each
+    repository's asset graph), since staleness is resolved against a particular asset graph.
+    """
+
+    def __init__(self, max_events: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        self._max_events = check.opt_int_param(max_events, "max_events") or (
+            _get_stale_status_cache_max_events()
+        )
+        self._ttl_seconds = (
+            check.opt_numeric_param(ttl_seconds, "ttl_seconds")
+            if ttl_seconds is not None
+            else _get_stale_status_cache_ttl_seconds()
+        )
+        self._lock = threading.Lock()
+        self._scopes: Dict[Hashable, _StaleStatusCacheScope] = {}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scopes = {}
+
+    def sync(
+        self, instance: "DagsterInstance", asset_graph: "BaseAssetGraph", scope: Hashable = None
+    ) -> int:
+        """Discards the entries that may have been invalidated by events or definition changes
+        since the last sync, and returns the generation of the scope, to be passed to `set`.
+        """
+        from dagster._core.events import DagsterEventType
+
+        definition_signatures = {
+            node.key: (
+                node.code_version,
+                frozenset(node.parent_keys),
+                node.is_external,
+                node.is_observable,
+                node.is_partitioned,
+            )
+            for node in asset_graph.asset_nodes
+        }
+
+        with self._lock:
+            state = self._scopes.setdefault(scope, _StaleStatusCacheScope())
+            watermark = state.watermark
+
+        records: List["EventLogRecord"] = []
+        is_overflow = False
+        if watermark is None:
+            latest_storage_id = self._get_latest_storage_id(instance)
+        else:
+            for event_type in (
+                DagsterEventType.ASSET_MATERIALIZATION,
+                DagsterEventType.ASSET_OBSERVATION,
+            ):
+                event_type_records = self._fetch_records_after(instance, event_type, watermark)
+                is_overflow = is_overflow or len(event_type_records) >= self._max_events
+                records.extend(event_type_records)
+            latest_storage_id = max(
+                [watermark, *(record.storage_id for record in records)],
+            )
+
+        with self._lock:
+            state = self._scopes.setdefault(scope, _StaleStatusCacheScope())
+            if state.watermark is None or is_overflow:
+                state.entries = {}
+                state.generation += 1
+            else:
+                changed_keys = {
+                    record.asset_key
+                    for record in records
+                    if record.storage_id > state.watermark and record.asset_key
+                }
+                changed_keys.update(
+                    key
+                    for key in definition_signatures.keys() | state.definition_signatures.keys()
+                    if definition_signatures.get(key) != state.definition_signatures.get(key)
+                )
+                now = time.time()
+                invalidated_keys = {
+                    key
+                    for key, entry in state.entries.items()
+                    if now - entry.created_at > self._ttl_seconds
+                }
+                topology = asset_graph.topology
+                invalidated_keys.update(changed_keys)
+                invalidated_keys.update(
+                    topology.keys_for_ids(
+                        topology.descendant_ids(topology.ids_for_keys(changed_keys))
+                    )
+                )
+                invalidated_keys.intersection_update(state.entries.keys())
+                for key in invalidated_keys:
+                    del state.entries[key]
+                # values resolved by resolvers that synced before this point may have been read
+                # before the events that were just seen, so they must not be cached
+                if changed_keys or invalidated_keys:
+                    state.generation += 1
+
+            state.watermark = max(state.watermark or 0, latest_storage_id)
+            state.definition_signatures = definition_signatures
+            return state.generation
+
+    def get(self, key: "AssetKey", name: str, scope: Hashable = None) -> Any:
+        """Returns the cached value with the given name for an asset key, or UNKNOWN_VALUE."""
+        with self._lock:
+            state = self._scopes.get(scope)
+            entry = state.entries.get(key) if state else None
+            return entry.values.get(name, UNKNOWN_VALUE) if entry else UNKNOWN_VALUE
+
+    def set(
+        self, key: "AssetKey", name: str, value: Any, generation: int, scope: Hashable = None
+    ) -> None:
+        """Caches a value for an asset key. The value is dropped if the cache was synced again since
+        the given generation was returned by `sync`, since it may have been resolved from events
+        that were invalidated by that sync.
+        """
+        with self._lock:
+            state = self._scopes.get(scope)
+            if state is None or state.generation != generation:
+                return
+            entry = state.entries.get(key)
+            if entry is None:
+                entry = state.entries[key] = _StaleStatusCacheEntry(time.time())
+            entry.values[name] = value
+
+    def _fetch_records_after(
+        self, instance: "DagsterInstance", event_type: "DagsterEventType", storage_id: int
+    ) -> Sequence["EventLogRecord"]:
+        from dagster._core.event_api import EventRecordsFilter
+
+        return instance.get_event_records(
+            EventRecordsFilter(event_type=event_type, after_cursor=storage_id),
+            limit=self._max_events,
+            ascending=True,
+        )
+
+    def _get_latest_storage_id(self, instance: "DagsterInstance") -> int:
+        from dagster._core.event_api import EventRecordsFilter
+        from dagster._core.events import DagsterEventType
+
+        latest_storage_id = 0
+        for event_type in (
+            DagsterEventType.ASSET_MATERIALIZATION,
+            DagsterEventType.ASSET_OBSERVATION,
+        ):
+            records = instance.get_event_records(
+                EventRecordsFilter(event_type=event_type), limit=1, ascending=False
+            )
+            if records:
+                latest_storage_id = max(latest_storage_id, records[0].storage_id)
+        return latest_storage_id
+
+
 class CachingStaleStatusResolver:
     """Used to resolve data version information. Avoids redundant database
     calls that would otherwise occur. Intended for use within the scope of a
     single "request" (e.g. GQL request, RunRequest resolution).
+
+    If a `StaleStatusCache` is provided, the staleness of assets that it can cache is shared with
+    the resolvers of other requests for the same scope.
     """
 
     _instance: "DagsterInstance"
@@ -382,11 +585,19 @@ def __init__(
         instance: "DagsterInstance",
         asset_graph: Union["BaseAssetGraph", Callable[[], "BaseAssetGraph"]],
         instance_queryer: Optional["CachingInstanceQueryer"] = None,
+        stale_status_cache: Optional[StaleStatusCache] = None,
+        stale_status_cache_scope: Hashable = None,
     ):
         from dagster._core.definitions.base_asset_graph import BaseAssetGraph
 
         self._instance = instance
         self._instance_queryer = instance_queryer
+        self._stale_status_cache = check.opt_inst_param(
+            stale_status_cache, "stale_status_cache", StaleStatusCache
+        )
+        self._stale_status_cache_scope = stale_status_cache_scope
+        self._stale_status_cache_generation: Optional[int] = None
+        self._pending_asset_keys: Set["AssetKey"] = set()
         if isinstance(asset_graph, BaseAssetGraph):
             self._asset_graph = asset_graph
             self._asset_graph_load_fn = None
@@ -420,8 +631,18 @@ def get_current_data_version(
 
         return self._get_current_data_version(key=AssetKeyPartitionKey(key, partition_key))
 
+    def add_asset_keys(self, asset_keys: Iterable["AssetKey"]) -> None:
+        """Registers asset keys whose staleness may be resolved, so that the latest data version
+        records of all of them and their ancestors are fetched in a single batch on the first
+        lookup.
+        """
+        self._pending_asset_keys.update(asset_keys)
+
     @cached_method
     def _get_status(self, key: "AssetKeyPartitionKey") -> StaleStatus:
+        return self._get_shared_value(key, "status", lambda: self._resolve_status(key))
+
+    def _resolve_status(self, key: "AssetKeyPartitionKey") -> StaleStatus:
         # The status loader does not support querying for the stale status of a
         # partitioned asset without specifying a partition, so we return here.
         asset = self.asset_graph.get(key.asset_key)
@@ -439,6 +660,9 @@ def _get_status(self, key: "AssetKeyPartitionKey") -> StaleStatus:
 
     @cached_method
     def _get_stale_causes(self, key: "AssetKeyPartitionKey") -> Sequence[StaleCause]:
+        return self._get_shared_value(key, "stale_causes", lambda: self._resolve_stale_causes(key))
+
+    def _resolve_stale_causes(self, key: "AssetKeyPartitionKey") -> Sequence[StaleCause]:
         # Querying for the stale status of a partitioned asset without specifying a partition key
         # is strictly speaking undefined, but we return an empty list here (from which FRESH status
         # is inferred) for backcompat.
@@ -624,8 +848,81 @@ def instance_queryer(self) -> "CachingInstanceQueryer":
             self._instance_queryer = CachingInstanceQueryer(self._instance, self.asset_graph)
         return self._instance_queryer
 
+    def _get_shared_value(
+        self, key: "AssetKeyPartitionKey", name: str, resolve_fn: Callable[[], T]
+    ) -> T:
+        if (
+            self._stale_status_cache is None
+            or key.partition_key is not None
+            or not self._is_shareable(key=key.asset_key)
+        ):
+            return resolve_fn()
+
+        generation = self._sync_stale_status_cache(self._stale_status_cache)
+        value = self._stale_status_cache.get(key.asset_key, name, self._stale_status_cache_scope)
+        if value is UNKNOWN_VALUE:
+            value = resolve_fn()
+            self._stale_status_cache.set(
+                key.asset_key, name, value, generation, self._stale_status_cache_scope
+            )
+        return value
+
+    def _sync_stale_status_cache(self, stale_status_cache: StaleStatusCache) -> int:
+        # the shared cache is synced once, so that all lookups see the same version of it
+        if self._stale_status_cache_generation is None:
+            self._stale_status_cache_generation = stale_status_cache.sync(
+                self._instance, self.asset_graph, self._stale_status_cache_scope
+            )
+        return self._stale_status_cache_generation
+
+    # The staleness of partitioned assets, and of assets downstream of partitioned assets, can
+    # depend on the current time and on dynamic partitions, so it is not shared between resolvers.
+    @cached_method
+    def _is_shareable(self, *, key: "AssetKey") -> bool:
+        if not self.asset_graph.has(key):
+            return False
+        asset = self.asset_graph.get(key)
+        return not asset.is_partitioned and all(
+            self._is_shareable(key=parent_key) for parent_key in asset.parent_keys
+        )
+
+    def _prefetch_pending_asset_records(self) -> None:
+        if not self._pending_asset_keys:
+            return
+
+        stale_status_cache = self._stale_status_cache
+        if stale_status_cache is not None:
+            self._sync_stale_status_cache(stale_status_cache)
+
+        # the records of assets whose staleness is already cached are not needed
+        asset_keys: AbstractSet["AssetKey"] = {
+            key
+            for key in self._pending_asset_keys
+            if self.asset_graph.has(key)
+            and (
+                stale_status_cache is None
+                or not self._is_shareable(key=key)
+                or stale_status_cache.get(key, "status", self._stale_status_cache_scope)
+                is UNKNOWN_VALUE
+            )
+        }
+        self._pending_asset_keys = set()
+
+        topology = self.asset_graph.topology
+        node_ids = topology.ids_for_keys(asset_keys)
+        self.instance_queryer.prefetch_asset_records(
+            key
+            for key in topology.keys_for_ids(node_ids | topology.ancestor_ids(node_ids))
+            if not self.instance_queryer.has_cached_asset_record(key)
+        )
+
     @cached_method
     def _get_current_data_version(self, *, key: "AssetKeyPartitionKey") -> DataVersion:
+        return self._get_shared_value(
+            key, "current_data_version", lambda: self._resolve_current_data_version(key)
+        )
+
+    def _resolve_current_data_version(self, key: "AssetKeyPartitionKey") -> DataVersion:
         # Currently we can only use asset records, which are fetched in one shot, for non-source
         # assets. This is because the most recent AssetObservation is not stored on the AssetRecord.
         record = self._get_latest_data_version_record(key=key)
@@ -683,6 +980,7 @@ def _get_latest_data_version_event(
     def _get_latest_data_version_record(
         self, key: "AssetKeyPartitionKey"
     ) -> Optional["EventLogRecord"]:
+        self._prefetch_pending_asset_records()
         # If an asset record is cached, all of its ancestors have already been cached.
         if (
             key.partition_key is None
@@ -284,6 +284,15 @@ def __init__(
         self._initial_unconsumed_events_by_id: Dict[int, EventLogRecord] = {}
         self._fetched_initial_unconsumed_events = False
 
+        # Materializations after the cursor, indexed by asset key. Fetched for all monitored assets
+        # at once, the first time any of them is needed.
+        self._new_materialization_records_by_key: Optional[
+            Mapping[AssetKey, Sequence[EventLogRecord]]
+        ] = None
+        # The greatest storage id among the fetched materializations. Every materialization of a
+        # monitored asset up to this storage id is in the index.
+        self._new_materialization_records_max_storage_id: Optional[int] = None
+
         normalized_last_tick_completion_time = normalize_renamed_param(
             last_tick_completion_time,
             "last_tick_completion_time",
@@ -309,31 +318,183 @@ def __init__(
         )
 
     def _cache_initial_unconsumed_events(self) -> None:
-        from dagster._core.event_api import AssetRecordsFilter
+        from dagster._core.event_api import EventLogCursor
 
         # This method caches the initial unconsumed events for each asset key. To generate the
         # current unconsumed events, call get_trailing_unconsumed_events instead.
         if self._fetched_initial_unconsumed_events:
             return
 
-        for asset_key in self._monitored_asset_keys:
-            unconsumed_event_ids = list(
+        unconsumed_event_ids_by_key = {
+            asset_key: list(
                 self._get_cursor(asset_key).trailing_unconsumed_partitioned_event_ids.values()
             )
-            if unconsumed_event_ids:
-                event_records = self.instance.fetch_materializations(
-                    AssetRecordsFilter(
-                        asset_key=asset_key,
-                        storage_ids=unconsumed_event_ids,
-                    ),
-                    limit=len(unconsumed_event_ids),
-                ).records
-                self._initial_unconsumed_events_by_id.update(
-                    {event_record.storage_id: event_record for event_record in event_records}
-                )
+            for asset_key in self._monitored_asset_keys
+        }
+        asset_keys = [
+            asset_key
+            for asset_key, unconsumed_event_ids in unconsumed_event_ids_by_key.items()
+            if unconsumed_event_ids
+        ]
+        storage_ids = sorted(
+            {
+                storage_id
+                for unconsumed_event_ids in unconsumed_event_ids_by_key.values()
+                for storage_id in unconsumed_event_ids
+            }
+        )
+
+        has_more = bool(storage_ids)
+        cursor = None
+        while has_more:
+            result = self.instance.fetch_materializations_for_asset_keys(
+                asset_keys,
+                limit=FETCH_MATERIALIZATION_BATCH_SIZE,
+                cursor=cursor,
+                storage_ids=storage_ids,
+            )
+            cursor = result.cursor
+            has_more = result.has_more and EventLogCursor.parse(cursor).storage_id() < max(
+                storage_ids
+            )
+            self._initial_unconsumed_events_by_id.update(
+                {event_record.storage_id: event_record for event_record in result.records}
+            )
 
         self._fetched_initial_unconsumed_events = True
 
+    def _get_new_materialization_records_by_key(
+        self,
+    ) -> Mapping[AssetKey, Sequence["EventLogRecord"]]:
+        """Returns the materializations after the cursor of each monitored asset that has a cursor,
+        in ascending storage id order.
+
+        Rather than querying each asset separately, the materializations of these assets are read in
+        one pass over the event log, starting at the earliest of their cursors, and indexed by asset
+        key. The query only returns the materializations of each asset after its own cursor, so an
+        asset whose cursor rarely advances does not cause the materializations of the other assets
+        to be read again on every evaluation. Assets without a cursor are not included, since they would start the pass at the beginning
+        of the event log. Their materializations are fetched separately by
+        `_fetch_new_materialization_records`.
+        """
+        from dagster._core.event_api import EventLogCursor
+
+        if self._new_materialization_records_by_key is not None:
+            return self._new_materialization_records_by_key
+
+        latest_consumed_event_ids = {
+            asset_key: cast(int, latest_consumed_event_id)
+            for asset_key in self._monitored_asset_keys
+            if (latest_consumed_event_id := self._get_cursor(asset_key).latest_consumed_event_id)
+            is not None
+        }
+
+        records_by_key: Dict[AssetKey, List[EventLogRecord]] = {
+            asset_key: [] for asset_key in latest_consumed_event_ids
+        }
+        max_storage_id = None
+        has_more = bool(latest_consumed_event_ids)
+        cursor = (
+            EventLogCursor.from_storage_id(min(latest_consumed_event_ids.values())).to_string()
+            if latest_consumed_event_ids
+            else None
+        )
+        while has_more:
+            result = self.instance.fetch_materializations_for_asset_keys(
+                list(latest_consumed_event_ids.keys()),
+                limit=FETCH_MATERIALIZATION_BATCH_SIZE,
+                cursor=cursor,
+                after_storage_id_by_key=latest_consumed_event_ids,
+            )
+            cursor = result.cursor
+            has_more = result.has_more
+            for record in result.records:
+                max_storage_id = record.storage_id
+                records_by_key[record.asset_key].append(record)
+
+        self._new_materialization_records_by_key = records_by_key
+        self._new_materialization_records_max_storage_id = max_storage_id
+        return records_by_key
+
+    def _fetch_new_materialization_records(
+        self,
+        asset_key: AssetKey,
+        limit: Optional[int] = None,
+        partitions: Optional[Sequence[str]] = None,
+    ) -> Sequence["EventLogRecord"]:
+        """Queries the materializations of a single asset after its cursor, in ascending storage id
+        order. Only `limit` records are fetched from storage, if it is set.
+        """
+        from dagster._core.event_api import AssetRecordsFilter
+
+        records: List[EventLogRecord] = []
+        has_more = True
+        cursor = None
+        while has_more:
+            result = self.instance.fetch_materializations(
+                AssetRecordsFilter(
+                    asset_key=asset_key,
+                    asset_partitions=partitions,
+                    after_storage_id=self._get_cursor(asset_key).latest_consumed_event_id,
+                ),
+                ascending=True,
+                limit=(
+                    min(limit - len(records), FETCH_MATERIALIZATION_BATCH_SIZE)
+                    if limit
+                    else FETCH_MATERIALIZATION_BATCH_SIZE
+                ),
+                cursor=cursor,
+            )
+            cursor = result.cursor
+            records.extend(result.records)
+            has_more = result.has_more and (not limit or len(records) < limit)
+
+        return records
+
+    def _get_new_materialization_records(
+        self, asset_key: AssetKey, limit: Optional[int] = None
+    ) -> Sequence["EventLogRecord"]:
+        """Returns the materializations of the asset after its cursor, in ascending storage id
+        order.
+        """
+        if self._get_cursor(asset_key).latest_consumed_event_id is None or (
+            limit and self._new_materialization_records_by_key is None
+        ):
+            return self._fetch_new_materialization_records(asset_key, limit=limit)
+
+        records = self._get_new_materialization_records_by_key()[asset_key]
+        return records[:limit] if limit else records
+
+    def _get_new_materialization_records_before(
+        self, asset_key: AssetKey, before_storage_id: int
+    ) -> Sequence["EventLogRecord"]:
+        """Returns the materializations of the asset after its cursor and before the given storage
+        id, in ascending storage id order.
+        """
+        from dagster._core.events import DagsterEventType
+        from dagster._core.storage.event_log.base import EventRecordsFilter
+
+        if (
+            self._new_materialization_records_by_key is not None
+            and asset_key in self._new_materialization_records_by_key
+            and before_storage_id <= (self._new_materialization_records_max_storage_id or 0)
+        ):
+            return [
+                record
+                for record in self._new_materialization_records_by_key[asset_key]
+                if record.storage_id < before_storage_id
+            ]
+
+        return self.instance.get_event_records(
+            EventRecordsFilter(
+                event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                asset_key=asset_key,
+                after_cursor=self._get_cursor(asset_key).latest_consumed_event_id,
+                before_cursor=before_storage_id,
+            ),
+            ascending=True,
+        )
+
     def _get_unconsumed_events_with_ids(
         self, event_ids: Sequence[int]
     ) -> Sequence["EventLogRecord"]:
@@ -397,6 +558,8 @@ def update_cursor_after_evaluation(self) -> None:
             self._unpacked_cursor = MultiAssetSensorContextCursor(new_cursor, self)
             self._cursor_advance_state_mutation = MultiAssetSensorCursorAdvances()
             self._fetched_initial_unconsumed_events = False
+            self._new_materialization_records_by_key = None
+            self._new_materialization_records_max_storage_id = None
 
     @public
     def latest_materialization_records_by_key(
@@ -453,40 +616,14 @@ def materialization_records_for_key(
             asset_key (AssetKey): The asset to fetch materialization events for
             limit (Optional[int]): The number of events to fetch
         """
-        from dagster._core.event_api import AssetRecordsFilter
-
         asset_key = check.inst_param(asset_key, "asset_key", AssetKey)
         if asset_key not in self._assets_by_key:
             raise DagsterInvalidInvocationError(f"Asset key {asset_key} not monitored by sensor.")
 
         if not limit:
             deprecation_warning("Calling materialization_records_for_key without a limit", "1.8")
-            records = []
-            has_more = True
-            cursor = None
-            while has_more:
-                result = self.instance.fetch_materializations(
-                    AssetRecordsFilter(
-                        asset_key=asset_key,
-                        after_storage_id=self._get_cursor(asset_key).latest_consumed_event_id,
-                    ),
-                    ascending=True,
-                    limit=FETCH_MATERIALIZATION_BATCH_SIZE,
-                    cursor=cursor,
-                )
-                cursor = result.cursor
-                has_more = result.has_more
-                records.extend(result.records)
-            return records
 
-        return self.instance.fetch_materializations(
-            AssetRecordsFilter(
-                asset_key=asset_key,
-                after_storage_id=self._get_cursor(asset_key).latest_consumed_event_id,
-            ),
-            ascending=True,
-            limit=limit,
-        ).records
+        return list(self._get_new_materialization_records(asset_key, limit=limit))
 
     def _get_cursor(self, asset_key: AssetKey) -> MultiAssetSensorAssetCursorComponent:
         """Returns the MultiAssetSensorAssetCursorComponent for the asset key.
@@ -533,8 +670,6 @@ def my_sensor(context):
                 # returns {"2022-07-05": EventLogRecord(...)}
 
         """
-        from dagster._core.event_api import AssetRecordsFilter, EventLogRecord
-
         asset_key = check.inst_param(asset_key, "asset_key", AssetKey)
 
         if asset_key not in self._assets_by_key:
@@ -573,31 +708,25 @@ def my_sensor(context):
                 # Add partition and materialization to the end of the OrderedDict
                 materialization_by_partition[partition] = unconsumed_event
 
-        has_more = True
-        cursor = None
-        while has_more:
-            result = self.instance.fetch_materializations(
-                AssetRecordsFilter(
-                    asset_key=asset_key,
-                    asset_partitions=partitions_to_fetch,
-                    after_storage_id=self._get_cursor(asset_key).latest_consumed_event_id,
-                ),
-                ascending=True,
-                limit=FETCH_MATERIALIZATION_BATCH_SIZE,
-                cursor=cursor,
-            )
-            cursor = result.cursor
-            has_more = result.has_more
-            for materialization in result.records:
-                if not isinstance(materialization.partition_key, str):
-                    continue
-
-                if materialization.partition_key in materialization_by_partition:
-                    # Remove partition to ensure materialization_by_partition preserves
-                    # the order of materializations
-                    materialization_by_partition.pop(materialization.partition_key)
-                # Add partition and materialization to the end of the OrderedDict
-                materialization_by_partition[materialization.partition_key] = materialization
+        partitions_to_fetch_set = set(partitions_to_fetch)
+        new_materializations = (
+            self._get_new_materialization_records_by_key()[asset_key]
+            if self._get_cursor(asset_key).latest_consumed_event_id is not None
+            else self._fetch_new_materialization_records(asset_key, partitions=partitions_to_fetch)
+        )
+        for materialization in new_materializations:
+            if (
+                not isinstance(materialization.partition_key, str)
+                or materialization.partition_key not in partitions_to_fetch_set
+            ):
+                continue
+
+            if materialization.partition_key in materialization_by_partition:
+                # Remove partition to ensure materialization_by_partition preserves
+                # the order of materializations
+                materialization_by_partition.pop(materialization.partition_key)
+            # Add partition and materialization to the end of the OrderedDict
+            materialization_by_partition[materialization.partition_key] = materialization
         return materialization_by_partition
 
     @public
@@ -872,9 +1001,6 @@ def get_asset_cursor_with_advances(
         context: MultiAssetSensorEvaluationContext,
         initial_cursor: MultiAssetSensorContextCursor,
     ) -> MultiAssetSensorAssetCursorComponent:
-        from dagster._core.events import DagsterEventType
-        from dagster._core.storage.event_log.base import EventRecordsFilter
-
         advanced_records: Set[int] = self._advanced_record_ids_by_key.get(asset_key, set())
         if len(advanced_records) == 0:
             # No events marked as advanced for this asset key
@@ -895,14 +1021,8 @@ def get_asset_cursor_with_advances(
                 initial_asset_cursor.trailing_unconsumed_partitioned_event_ids
             )
             unconsumed_events = list(context.get_trailing_unconsumed_events(asset_key)) + list(
-                context.instance.get_event_records(
-                    EventRecordsFilter(
-                        event_type=DagsterEventType.ASSET_MATERIALIZATION,
-                        asset_key=asset_key,
-                        after_cursor=latest_consumed_event_id_at_tick_start,
-                        before_cursor=greatest_consumed_event_id_in_tick,
-                    ),
-                    ascending=True,
+                context._get_new_materialization_records_before(  # noqa: SLF001
+                    asset_key, greatest_consumed_event_id_in_tick
                 )
                 if greatest_consumed_event_id_in_tick
                 > (latest_consumed_event_id_at_tick_start or 0)
@@ -962,15 +1082,15 @@ def get_cursor_from_latest_materializations(
 ) -> str:
     cursor_dict: Dict[str, MultiAssetSensorAssetCursorComponent] = {}
 
-    for asset_key in asset_keys:
-        materializations = instance.fetch_materializations(asset_key, limit=1).records
-        if materializations:
-            last_materialization = materializations[0]
-
-            cursor_dict[str(asset_key)] = MultiAssetSensorAssetCursorComponent(
-                last_materialization.partition_key,
-                last_materialization.storage_id,
-                {},
+    for asset_record in instance.get_asset_records(asset_keys):
+        last_materialization = asset_record.asset_entry.last_materialization_record
+        if last_materialization:
+            cursor_dict[str(asset_record.asset_entry.asset_key)] = (
+                MultiAssetSensorAssetCursorComponent(
+                    last_materialization.partition_key,
+                    last_materialization.storage_id,
+                    {},
+                )
             )
 
     cursor_str = json.dumps(cursor_dict)
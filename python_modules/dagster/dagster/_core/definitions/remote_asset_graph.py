@@ -27,6 +27,7 @@
 from dagster._core.definitions.utils import DEFAULT_GROUP_NAME
 from dagster._core.remote_representation.handle import RepositoryHandle
 
+from .asset_graph_topology import AssetGraphTopology
 from .backfill_policy import BackfillPolicy
 from .base_asset_graph import AssetKeyOrCheckKey, BaseAssetGraph, BaseAssetNode
 from .events import AssetKey
@@ -225,16 +226,19 @@ def __init__(
         asset_nodes_by_key: Mapping[AssetKey, RemoteAssetNode],
         asset_checks_by_key: Mapping[AssetCheckKey, "ExternalAssetCheck"],
         asset_check_execution_sets_by_key: Mapping[AssetCheckKey, AbstractSet[AssetKeyOrCheckKey]],
+        previous_topology: Optional[AssetGraphTopology] = None,
     ):
         self._asset_nodes_by_key = asset_nodes_by_key
         self._asset_checks_by_key = asset_checks_by_key
         self._asset_check_execution_sets_by_key = asset_check_execution_sets_by_key
+        self._previous_topology = previous_topology
 
     @classmethod
     def from_repository_handles_and_external_asset_nodes(
         cls,
         repo_handle_external_asset_nodes: Sequence[Tuple[RepositoryHandle, "ExternalAssetNode"]],
         external_asset_checks: Sequence["ExternalAssetCheck"],
+        previous_topology: Optional[AssetGraphTopology] = None,
     ) -> "RemoteAssetGraph":
         _warn_on_duplicate_nodes(repo_handle_external_asset_nodes)
 
@@ -298,6 +302,7 @@ def from_repository_handles_and_external_asset_nodes(
             asset_nodes_by_key,
             asset_checks_by_key,
             asset_check_execution_sets_by_key,
+            previous_topology=previous_topology,
         )
 
     ##### COMMON ASSET GRAPH INTERFACE
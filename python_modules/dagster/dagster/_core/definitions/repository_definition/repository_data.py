@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from types import FunctionType
 from typing import (
     TYPE_CHECKING,
@@ -6,6 +8,7 @@
     Any,
     Callable,
     Dict,
+    Iterator,
     Mapping,
     Optional,
     Sequence,
@@ -40,6 +43,30 @@
 T = TypeVar("T")
 Resolvable = Callable[[], T]
 
+# Whether repositories are being built to execute a single job, in which case the definitions are
+# only constructed and validated when they are accessed
+_lazy_definition_loading: ContextVar[bool] = ContextVar("_lazy_definition_loading", default=False)
+
+
+@contextmanager
+def lazy_definition_loading() -> Iterator[None]:
+    """Defers the construction and validation of the jobs, schedules and sensors of the
+    repositories that are built within the context until they are accessed.
+
+    Definition errors in jobs, schedules and sensors that are never accessed are not raised, so this
+    is only meant for processes that load a code location to execute a single job, like run
+    workers.
+    """
+    token = _lazy_definition_loading.set(True)
+    try:
+        yield
+    finally:
+        _lazy_definition_loading.reset(token)
+
+
+def is_loading_definitions_lazily() -> bool:
+    return _lazy_definition_loading.get()
+
 
 class RepositoryData(ABC):
     """Users should usually rely on the :py:func:`@repository <repository>` decorator to create new
@@ -306,8 +333,9 @@ def __init__(
             schedules,
             self._validate_schedule,
         )
-        # load all schedules to force validation
-        self._schedules.get_all_definitions()
+        if not is_loading_definitions_lazily():
+            # load all schedules to force validation
+            self._schedules.get_all_definitions()
 
         self._source_assets_by_key = source_assets_by_key
         self._assets_defs_by_key = assets_defs_by_key
@@ -322,8 +350,9 @@ def __init__(
             sensors,
             self._validate_sensor,
         )
-        # load all sensors to force validation
-        self._sensors.get_all_definitions()
+        if not is_loading_definitions_lazily():
+            # load all sensors to force validation
+            self._sensors.get_all_definitions()
 
         self._all_jobs = None
 
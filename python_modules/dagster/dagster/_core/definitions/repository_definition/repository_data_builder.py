@@ -51,7 +51,7 @@
 from dagster._core.errors import DagsterInvalidDefinitionError
 from dagster._utils.warnings import deprecation_warning
 
-from .repository_data import CachingRepositoryData
+from .repository_data import CachingRepositoryData, is_loading_definitions_lazily
 from .valid_definitions import VALID_REPOSITORY_DATA_DICT_KEYS, RepositoryListDefinition
 
 if TYPE_CHECKING:
@@ -139,6 +139,17 @@ def resolve_unresolved_job_def() -> JobDefinition:
     return resolve_unresolved_job_def
 
 
+def _process_resolved_job_lambda(
+    job_def: JobDefinition,
+    default_executor_def: Optional[ExecutorDefinition],
+    default_logger_defs: Optional[Mapping[str, LoggerDefinition]],
+) -> Callable[[], JobDefinition]:
+    def process_resolved_job() -> JobDefinition:
+        return _process_resolved_job(job_def, default_executor_def, default_logger_defs)
+
+    return process_resolved_job
+
+
 def _process_resolved_job(
     job_def: JobDefinition,
     default_executor_def: Optional[ExecutorDefinition],
@@ -324,7 +335,9 @@ def build_caching_repository_data_from_list(
             logger_defs=default_logger_defs,
         )
 
-    _validate_auto_materialize_sensors(sensors.values(), asset_graph)
+    load_lazily = is_loading_definitions_lazily()
+    if not load_lazily:
+        _validate_auto_materialize_sensors(sensors.values(), asset_graph)
 
     # resolve all the UnresolvedAssetJobDefinitions using the full set of assets
     # resolving jobs is potentially time-consuming if there are many of them,
@@ -339,11 +352,14 @@ def build_caching_repository_data_from_list(
                 default_logger_defs,
             )
 
+    # when loading lazily, the jobs are only validated and bound to the default executor and
+    # loggers once they are accessed
+    process_job_fn = _process_resolved_job_lambda if load_lazily else _process_resolved_job
     jobs = {
         name: (
             job_def
             if isfunction(job_def)
-            else _process_resolved_job(
+            else process_job_fn(
                 cast(JobDefinition, job_def), default_executor_def, default_logger_defs
             )
         )
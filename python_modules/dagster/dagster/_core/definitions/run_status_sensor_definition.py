@@ -32,7 +32,11 @@
     RunStatusSensorExecutionError,
     user_code_error_boundary,
 )
-from dagster._core.event_api import RunStatusChangeEventType, RunStatusChangeRecordsFilter
+from dagster._core.event_api import (
+    EventLogRecord,
+    RunStatusChangeEventType,
+    RunStatusChangeRecordsFilter,
+)
 from dagster._core.events import PIPELINE_RUN_STATUS_TO_EVENT_TYPE, DagsterEvent, DagsterEventType
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunsFilter
@@ -95,6 +99,10 @@ def _get_run_status_sensor_process_limit() -> int:
     return int(os.getenv("DAGSTER_RUN_STATUS_SENSOR_PROCESS_LIMIT", "5"))
 
 
+def _get_run_status_change_batch_fetch_limit() -> int:
+    return int(os.getenv("DAGSTER_RUN_STATUS_SENSOR_BATCH_FETCH_LIMIT", "100"))
+
+
 @whitelist_for_serdes(old_storage_names={"PipelineSensorCursor"})
 class RunStatusSensorCursor(
     NamedTuple(
@@ -135,6 +143,90 @@ def from_json(json_str: str) -> "RunStatusSensorCursor":
         return deserialize_value(json_str, RunStatusSensorCursor)
 
 
+@whitelist_for_serdes
+class RunStatusChangeBatch(
+    NamedTuple(
+        "_RunStatusChangeBatch",
+        [
+            ("run_status", DagsterRunStatus),
+            ("after_storage_id", int),
+            ("event_records", Sequence[EventLogRecord]),
+            ("dagster_runs", Sequence[DagsterRun]),
+            ("has_more", bool),
+        ],
+    )
+):
+    """The run status change events for a run status after a given storage id, along with the runs
+    that they belong to.
+
+    The sensor daemon fetches a batch once per iteration and shares it between all of the run status
+    sensors in a code location that monitor the same run status, so that each sensor does not need
+    to query the event log and run storage separately.
+    """
+
+    def __new__(
+        cls,
+        run_status: DagsterRunStatus,
+        after_storage_id: int,
+        event_records: Sequence[EventLogRecord],
+        dagster_runs: Sequence[DagsterRun],
+        has_more: bool,
+    ):
+        return super(RunStatusChangeBatch, cls).__new__(
+            cls,
+            run_status=check.inst_param(run_status, "run_status", DagsterRunStatus),
+            after_storage_id=check.int_param(after_storage_id, "after_storage_id"),
+            event_records=check.sequence_param(
+                event_records, "event_records", of_type=EventLogRecord
+            ),
+            dagster_runs=check.sequence_param(dagster_runs, "dagster_runs", of_type=DagsterRun),
+            has_more=check.bool_param(has_more, "has_more"),
+        )
+
+    def get_event_records(
+        self, after_storage_id: int, limit: int
+    ) -> Optional[Sequence[EventLogRecord]]:
+        """Returns the first `limit` event records after the given storage id, or None if the batch
+        does not contain all of them, in which case the event log should be queried instead.
+        """
+        if after_storage_id < self.after_storage_id:
+            return None
+
+        event_records = [
+            record for record in self.event_records if record.storage_id > after_storage_id
+        ][:limit]
+        if len(event_records) < limit and self.has_more:
+            return None
+
+        return event_records
+
+
+def fetch_run_status_change_batch(
+    instance: DagsterInstance, run_status: DagsterRunStatus, after_storage_id: int
+) -> RunStatusChangeBatch:
+    """Fetches the run status change events for the given run status after the given storage id,
+    along with the runs that they belong to.
+    """
+    result = instance.fetch_run_status_changes(
+        records_filter=RunStatusChangeRecordsFilter(
+            event_type=cast(
+                RunStatusChangeEventType, PIPELINE_RUN_STATUS_TO_EVENT_TYPE[run_status]
+            ),
+            after_storage_id=after_storage_id,
+        ),
+        ascending=True,
+        limit=_get_run_status_change_batch_fetch_limit(),
+    )
+    run_ids = list(set(record.event_log_entry.run_id for record in result.records))
+    return RunStatusChangeBatch(
+        run_status=run_status,
+        after_storage_id=after_storage_id,
+        event_records=result.records,
+        dagster_runs=instance.get_runs(filters=RunsFilter(run_ids=run_ids)) if run_ids else [],
+        has_more=result.has_more,
+    )
+
+
 class RunStatusSensorContext:
     """The ``context`` object available to a decorated function of ``run_status_sensor``."""
 
@@ -731,11 +823,26 @@ def _wrapped_fn(
                 monitor_all_code_locations=cast(bool, monitor_all_code_locations)
             )
 
+            run_status_change_batch = context.run_status_change_batch
+            batch_event_records = (
+                run_status_change_batch.get_event_records(sensor_cursor.record_id, fetch_limit)
+                if run_status_change_batch
+                and run_status_change_batch.run_status == run_status
+                and not sensor_cursor.update_timestamp
+                else None
+            )
+
             # Fetch events after the cursor id
             # * we move the cursor forward to the latest visited event's id to avoid revisits
             # * when the daemon is down, bc we persist the cursor info, we can go back to where we
             #   left and backfill alerts for the qualified events during the downtime
-            if sensor_cursor.update_timestamp and context.instance.event_log_storage.is_run_sharded:
+            if batch_event_records is not None:
+                # the sensor daemon already fetched the events after the cursor, shared between the
+                # run status sensors in this code location
+                event_records = batch_event_records
+            elif (
+                sensor_cursor.update_timestamp and context.instance.event_log_storage.is_run_sharded
+            ):
                 # The run status sensor cursor has the timestamp set... and the event log storage
                 # is run sharded.  We need to query the index shard by timestamp instead of by
                 # record id (which is reindexed relative to some run sharded query).  When we update
@@ -769,16 +876,22 @@ def _wrapped_fn(
                 set(event_record.event_log_entry.run_id for event_record in event_records)
             )
 
-            run_records = (
-                {
-                    record.dagster_run.run_id: record
-                    for record in context.instance.get_run_records(
-                        filters=RunsFilter(run_ids=run_ids_to_fetch)
-                    )
+            if batch_event_records is not None:
+                dagster_runs = {
+                    dagster_run.run_id: dagster_run
+                    for dagster_run in check.not_none(run_status_change_batch).dagster_runs
                 }
-                if run_ids_to_fetch
-                else {}
-            )
+            else:
+                dagster_runs = (
+                    {
+                        dagster_run.run_id: dagster_run
+                        for dagster_run in context.instance.get_runs(
+                            filters=RunsFilter(run_ids=run_ids_to_fetch)
+                        )
+                    }
+                    if run_ids_to_fetch
+                    else {}
+                )
 
             num_processed_runs = 0
             for event_record in event_records:
@@ -787,7 +900,7 @@ def _wrapped_fn(
                 record_timestamp = datetime_from_timestamp(event_record.timestamp).isoformat()
 
                 # skip if we couldn't find the right run
-                if event_log_entry.run_id not in run_records:
+                if event_log_entry.run_id not in dagster_runs:
                     context.update_cursor(
                         RunStatusSensorCursor(
                             record_id=storage_id, record_timestamp=record_timestamp
@@ -795,7 +908,7 @@ def _wrapped_fn(
                     )
                     continue
 
-                dagster_run = run_records[event_log_entry.run_id].dagster_run
+                dagster_run = dagster_runs[event_log_entry.run_id]
                 job_match = False
 
                 # if monitor_all_code_locations is provided, then we want to run the sensor for all jobs in all code locations
@@ -946,6 +1059,8 @@ def _wrapped_fn(
                     error=serializable_error,
                 )
 
+        self._run_status = run_status
+
         super(RunStatusSensorDefinition, self).__init__(
             name=name,
             evaluation_fn=_wrapped_fn,
@@ -974,6 +1089,10 @@ def __call__(self, *args, **kwargs) -> RawSensorEvaluationFunctionReturn:
         )
         return self._run_status_sensor_fn(**context_param, **resources)
 
+    @property
+    def run_status(self) -> DagsterRunStatus:
+        return self._run_status
+
     @property
     def sensor_type(self) -> SensorType:
         return SensorType.RUN_STATUS
@@ -65,6 +65,7 @@
     from dagster._core.definitions.assets import AssetsDefinition
     from dagster._core.definitions.definitions_class import Definitions
     from dagster._core.definitions.repository_definition import RepositoryDefinition
+    from dagster._core.definitions.run_status_sensor_definition import RunStatusChangeBatch
     from dagster._core.definitions.unresolved_asset_job_definition import (
         UnresolvedAssetJobDefinition,
     )
@@ -157,11 +158,13 @@ def __init__(
         definitions: Optional["Definitions"] = None,
         last_sensor_start_time: Optional[float] = None,
         code_location_origin: Optional["CodeLocationOrigin"] = None,
+        run_status_change_batch: Optional["RunStatusChangeBatch"] = None,
         # deprecated param
         last_completion_time: Optional[float] = None,
     ):
         from dagster._core.definitions.definitions_class import Definitions
         from dagster._core.definitions.repository_definition import RepositoryDefinition
+        from dagster._core.definitions.run_status_sensor_definition import RunStatusChangeBatch
         from dagster._core.remote_representation.origin import CodeLocationOrigin
 
         self._exit_stack = ExitStack()
@@ -188,6 +191,9 @@ def __init__(
         )
         self._instance = check.opt_inst_param(instance, "instance", DagsterInstance)
         self._sensor_name = sensor_name
+        self._run_status_change_batch = check.opt_inst_param(
+            run_status_change_batch, "run_status_change_batch", RunStatusChangeBatch
+        )
 
         # Wait to set resources unless they're accessed
         self._resource_defs = resources
@@ -253,6 +259,7 @@ def merge_resources(self, resources_dict: Mapping[str, Any]) -> "SensorEvaluatio
             },
             last_sensor_start_time=self._last_sensor_start_time,
             code_location_origin=self.code_location_origin,
+            run_status_change_batch=self._run_status_change_batch,
         )
 
     @public
@@ -406,6 +413,13 @@ def code_location_origin(self) -> Optional["CodeLocationOrigin"]:
         """Optional[CodeLocationOrigin]: The CodeLocation that this sensor resides in."""
         return self._code_location_origin
 
+    @property
+    def run_status_change_batch(self) -> Optional["RunStatusChangeBatch"]:
+        """Optional[RunStatusChangeBatch]: Run status change events prefetched by the sensor daemon
+        for the run status sensors in this code location.
+        """
+        return self._run_status_change_batch
+
     @property
     def log(self) -> logging.Logger:
         if self._logger:
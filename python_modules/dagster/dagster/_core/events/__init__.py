@@ -1073,6 +1073,25 @@ def step_concurrency_blocked(
             event_specific_data=EngineEventData(metadata={"concurrency_key": concurrency_key}),
         )
 
+    @staticmethod
+    def step_concurrency_claimed(
+        step_context: IStepContext, concurrency_key: str, wait_time: float
+    ) -> "DagsterEvent":
+        return DagsterEvent.from_step(
+            event_type=DagsterEventType.ENGINE_EVENT,
+            step_context=step_context,
+            message=(
+                f"Step claimed a concurrency slot for key {concurrency_key} after waiting"
+                f" {wait_time:.2f} seconds"
+            ),
+            event_specific_data=EngineEventData(
+                metadata={
+                    "concurrency_key": concurrency_key,
+                    "wait_time_seconds": MetadataValue.float(wait_time),
+                }
+            ),
+        )
+
     @staticmethod
     def job_start(job_context: IPlanContext) -> "DagsterEvent":
         return DagsterEvent.from_job(
@@ -35,6 +35,7 @@
 from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
 from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._core.telemetry import log_dagster_event, log_repo_stats, telemetry_wrapper
+from dagster._utils.env import get_boolean_env_var
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 from dagster._utils.merger import merge_dicts
@@ -50,6 +51,11 @@
 
 if TYPE_CHECKING:
     from dagster._core.execution.plan.outputs import StepOutputHandle
+    from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
+
+# When set, run workers rehydrate the execution plan persisted at run creation time instead of
+# rebuilding it from the loaded job definition.
+REUSE_EXECUTION_PLAN_SNAPSHOT_ENV_VAR = "DAGSTER_REUSE_EXECUTION_PLAN_SNAPSHOT"
 
 ## Brief guide to the execution APIs
 # | function name               | operates over      | sync  | supports    | creates new DagsterRun  |
@@ -668,6 +674,14 @@ def _get_execution_plan_from_run(
         else None
     )
 
+    if execution_plan_snapshot and _can_reuse_execution_plan_snapshot(
+        dagster_run, execution_plan_snapshot
+    ):
+        # The plan was already built (and its config validated) when the run was created, and is
+        # stored content-addressed alongside the job snapshot in run storage. Rehydrating it is
+        # much cheaper than re-resolving run config and rebuilding every step for large jobs.
+        return ExecutionPlan.rebuild_from_snapshot(dagster_run.job_name, execution_plan_snapshot)
+
     return create_execution_plan(
         job,
         run_config=dagster_run.run_config,
@@ -683,6 +697,30 @@ def _get_execution_plan_from_run(
     )
 
 
+def _can_reuse_execution_plan_snapshot(
+    dagster_run: DagsterRun, execution_plan_snapshot: "ExecutionPlanSnapshot"
+) -> bool:
+    """Whether the run worker can rehydrate the persisted plan instead of rebuilding it from the
+    job definition. Opt-in, since a rehydrated plan reflects the code at run creation time rather
+    than the code loaded by the run worker.
+    """
+    if not get_boolean_env_var(REUSE_EXECUTION_PLAN_SNAPSHOT_ENV_VAR):
+        return False
+
+    if not execution_plan_snapshot.can_reconstruct_plan:
+        return False
+
+    if execution_plan_snapshot.job_snapshot_id != dagster_run.job_snapshot_id:
+        return False
+
+    if dagster_run.step_keys_to_execute is not None and set(
+        dagster_run.step_keys_to_execute
+    ) != set(execution_plan_snapshot.step_keys_to_execute):
+        return False
+
+    return True
+
+
 def create_execution_plan(
     job: Union[IJob, JobDefinition],
     run_config: Optional[Mapping[str, object]] = None,
@@ -32,6 +32,7 @@
 from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.execution.retries import RetryMode, RetryState
 from dagster._core.storage.tags import GLOBAL_CONCURRENCY_TAG, PRIORITY_TAG
+from dagster._utils.concurrency import ConcurrencyStepClaim
 from dagster._utils.interrupts import pop_captured_interrupt
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
@@ -332,6 +333,9 @@ def get_steps_to_execute(
                 in_flight_steps,
             )
 
+        if self._instance_concurrency_context and not run_scoped_concurrency_limits_counter:
+            self._claim_global_concurrency_slots(steps, limit)
+
         batch: List[ExecutionStep] = []
 
         for step in steps:
@@ -353,13 +357,8 @@ def get_steps_to_execute(
 
             step_concurrency_key = step.tags.get(GLOBAL_CONCURRENCY_TAG)
             if step_concurrency_key and self._instance_concurrency_context:
-                try:
-                    step_priority = int(step.tags.get(PRIORITY_TAG, 0))
-                except ValueError:
-                    step_priority = 0
-
                 if not self._instance_concurrency_context.claim(
-                    step_concurrency_key, step.key, step_priority
+                    step_concurrency_key, step.key, _get_step_priority(step)
                 ):
                     continue
 
@@ -372,6 +371,33 @@ def get_steps_to_execute(
 
         return batch
 
+    def _claim_global_concurrency_slots(
+        self, steps: Sequence[ExecutionStep], limit: Optional[int]
+    ) -> None:
+        """Claim slots in one storage call for the concurrency-limited steps among those that fit
+        within the executor's limits, so that the per-step claims when building the batch are
+        answered from the instance concurrency context instead of the database. Steps whose
+        claims are blocked are skipped when building the batch as before, making room for later
+        steps, which are then claimed one at a time.
+        """
+        instance_concurrency_context = check.not_none(self._instance_concurrency_context)
+        capacity = len(steps)
+        if limit is not None:
+            capacity = min(capacity, limit)
+        if self._max_concurrent is not None:
+            capacity = min(capacity, max(self._max_concurrent - len(self._in_flight), 0))
+
+        step_claims = []
+        for step in steps[:capacity]:
+            step_concurrency_key = step.tags.get(GLOBAL_CONCURRENCY_TAG)
+            if step_concurrency_key:
+                step_claims.append(
+                    ConcurrencyStepClaim(step_concurrency_key, step.key, _get_step_priority(step))
+                )
+
+        if len(step_claims) > 1:
+            instance_concurrency_context.claim_steps(step_claims)
+
     def get_steps_to_skip(self) -> Sequence[ExecutionStep]:
         self._update()
 
@@ -649,6 +675,21 @@ def concurrency_event_iterator(
             return
 
         pending_claims = self._instance_concurrency_context.pending_claim_steps()
+        for step_key in list(self._messaged_concurrency_slots.keys()):
+            if step_key in pending_claims:
+                continue
+            # the step was reported as blocked and has since claimed its slot
+            del self._messaged_concurrency_slots[step_key]
+            wait_time = self._instance_concurrency_context.get_claim_wait_time(step_key)
+            if wait_time is None:
+                continue
+            step = self.get_step_by_key(step_key)
+            yield DagsterEvent.step_concurrency_claimed(
+                plan_context.for_step(step),
+                cast(str, step.tags.get(GLOBAL_CONCURRENCY_TAG)),
+                wait_time,
+            )
+
         for step_key in pending_claims:
             last_messaged_timestamp = self._messaged_concurrency_slots.get(step_key)
             if (
@@ -663,3 +704,10 @@ def concurrency_event_iterator(
                 yield DagsterEvent.step_concurrency_blocked(
                     step_context, step_concurrency_key, initial=is_initial_message
                 )
+
+
+def _get_step_priority(step: ExecutionStep) -> int:
+    try:
+        return int(step.tags.get(PRIORITY_TAG, 0))
+    except ValueError:
+        return 0
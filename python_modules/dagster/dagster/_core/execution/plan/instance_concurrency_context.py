@@ -1,13 +1,14 @@
 import time
 from collections import defaultdict
 from types import TracebackType
-from typing import List, Optional, Set, Type
+from typing import Dict, List, Optional, Sequence, Set, Type
 
 from typing_extensions import Self
 
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.dagster_run import DagsterRun
 from dagster._core.storage.tags import PRIORITY_TAG
+from dagster._utils.concurrency import ConcurrencyStepClaim
 
 INITIAL_INTERVAL_VALUE = 1
 STEP_UP_BASE = 1.1
@@ -36,6 +37,8 @@ def __init__(self, instance: DagsterInstance, dagster_run: DagsterRun):
         self._pending_claim_counts = defaultdict(int)
         self._pending_claims = set()
         self._claims = set()
+        self._claim_start_times: Dict[str, float] = {}
+        self._claim_wait_times: Dict[str, float] = {}
         try:
             self._run_priority = int(dagster_run.tags.get(PRIORITY_TAG, "0"))
         except ValueError:
@@ -59,6 +62,7 @@ def __exit__(
         for step_key in to_clear:
             del self._pending_timeouts[step_key]
             del self._pending_claim_counts[step_key]
+            self._claim_start_times.pop(step_key, None)
             self._pending_claims.remove(step_key)
 
         self._context_guard = False
@@ -80,49 +84,97 @@ def global_concurrency_keys(self) -> Set[str]:
     def _sync_global_concurrency_keys(self) -> None:
         self._global_concurrency_keys = self._instance.event_log_storage.get_concurrency_keys()
 
-    def claim(self, concurrency_key: str, step_key: str, step_priority: int = 0):
+    def claim(self, concurrency_key: str, step_key: str, step_priority: int = 0) -> bool:
+        return step_key in self.claim_steps(
+            [ConcurrencyStepClaim(concurrency_key, step_key, step_priority)]
+        )
+
+    def claim_steps(self, step_claims: Sequence[ConcurrencyStepClaim]) -> Set[str]:
+        """Attempt to claim concurrency slots for several steps at once, with a single storage
+        call for all the steps that are due to be (re)checked. Returns the keys of the steps that
+        may be executed, either because they hold a slot or because their key is not limited.
+        """
         if not self._instance.event_log_storage.supports_global_concurrency_limits:
-            return True
+            return {step_claim.step_key for step_claim in step_claims}
 
-        if concurrency_key not in self.global_concurrency_keys:
-            # The initialization call will be a no-op if the limit is set by another process,
-            # mitigating any race condition concerns
-            if not self._instance.event_log_storage.initialize_concurrency_limit_to_default(
-                concurrency_key
-            ):
-                # still default open if the limit table has not been initialized
-                return True
+        allowed = set()
+        to_claim = []
+        now = time.time()
+        for step_claim in step_claims:
+            step_key = step_claim.step_key
+            if step_key in self._claims:
+                allowed.add(step_key)
+                continue
+
+            if not self._is_concurrency_limited(step_claim.concurrency_key):
+                allowed.add(step_key)
+                continue
+
+            if step_key in self._pending_claims:
+                if now > self._pending_timeouts[step_key]:
+                    del self._pending_timeouts[step_key]
+                else:
+                    continue
             else:
-                # sync the global concurrency keys to ensure we have the latest
-                self._sync_global_concurrency_keys()
+                self._pending_claims.add(step_key)
+                self._claim_start_times[step_key] = now
+
+            to_claim.append(
+                ConcurrencyStepClaim(
+                    step_claim.concurrency_key,
+                    step_key,
+                    self._run_priority + (step_claim.priority or 0),
+                )
+            )
 
-        if step_key in self._pending_claims:
-            if time.time() > self._pending_timeouts[step_key]:
-                del self._pending_timeouts[step_key]
-            else:
-                return False
-        else:
-            self._pending_claims.add(step_key)
+        if not to_claim:
+            return allowed
 
-        priority = self._run_priority + step_priority
-        claim_status = self._instance.event_log_storage.claim_concurrency_slot(
-            concurrency_key, self._run_id, step_key, priority
+        claim_statuses = self._instance.event_log_storage.claim_concurrency_slots(
+            self._run_id, to_claim
         )
+        for step_claim in to_claim:
+            step_key = step_claim.step_key
+            claim_status = claim_statuses[step_key]
+            if not claim_status.is_claimed:
+                interval = _calculate_timeout_interval(
+                    claim_status.sleep_interval, self._pending_claim_counts[step_key]
+                )
+                self._pending_timeouts[step_key] = time.time() + interval
+                self._pending_claim_counts[step_key] += 1
+                continue
 
-        if not claim_status.is_claimed:
-            interval = _calculate_timeout_interval(
-                claim_status.sleep_interval, self._pending_claim_counts[step_key]
-            )
-            self._pending_timeouts[step_key] = time.time() + interval
-            self._pending_claim_counts[step_key] += 1
-            return False
+            self._pending_claims.discard(step_key)
+            self._claims.add(step_key)
+            start_time = self._claim_start_times.pop(step_key, None)
+            if start_time is not None:
+                self._claim_wait_times[step_key] = time.time() - start_time
+            allowed.add(step_key)
 
-        if step_key in self._pending_claims:
-            self._pending_claims.remove(step_key)
+        return allowed
+
+    def _is_concurrency_limited(self, concurrency_key: str) -> bool:
+        if concurrency_key in self.global_concurrency_keys:
+            return True
+
+        # The initialization call will be a no-op if the limit is set by another process,
+        # mitigating any race condition concerns
+        if not self._instance.event_log_storage.initialize_concurrency_limit_to_default(
+            concurrency_key
+        ):
+            # still default open if the limit table has not been initialized
+            return False
 
-        self._claims.add(step_key)
+        # sync the global concurrency keys to ensure we have the latest
+        self._sync_global_concurrency_keys()
         return True
 
+    def get_claim_wait_time(self, step_key: str) -> Optional[float]:
+        """The number of seconds between the first claim attempt for a step and the claim of its
+        slot, or None if the step has not claimed a slot.
+        """
+        return self._claim_wait_times.get(step_key)
+
     def interval_to_next_pending_claim_check(self) -> float:
         if not self._pending_claims:
             return 0.0
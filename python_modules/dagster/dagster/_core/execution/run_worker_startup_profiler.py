@@ -0,0 +1,209 @@
+import importlib.abc
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import TYPE_CHECKING, Iterator, List, NamedTuple, Optional, Sequence
+
+import dagster._check as check
+from dagster._core.definitions.metadata import MetadataValue
+from dagster._core.events import EngineEventData
+
+if TYPE_CHECKING:
+    from dagster._core.definitions.reconstruct import ReconstructableJob
+
+DEFAULT_MAX_REPORTED_MODULES = 20
+
+
+class ModuleImportTiming(NamedTuple):
+    """The time spent executing a module while it was imported. The self time excludes the time
+    spent importing other modules from it, and includes any definitions that are constructed at
+    module scope.
+    """
+
+    module_name: str
+    self_seconds: float
+    cumulative_seconds: float
+
+
+class _TimedLoader(importlib.abc.Loader):
+    def __init__(self, loader: importlib.abc.Loader, profiler: "RunWorkerStartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name: str):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        # restore the wrapped loader before executing the module so that it is never exposed
+        if module.__spec__ is not None and module.__spec__.loader is self:
+            module.__spec__.loader = self._loader
+        if getattr(module, "__loader__", None) is self:
+            module.__loader__ = self._loader
+
+        with self._profiler.time_module(module.__name__):
+            self._loader.exec_module(module)
+
+
+class _TimedImportFinder(importlib.abc.MetaPathFinder):
+    """Finds modules with the other finders on the meta path, and wraps their loaders to time the
+    execution of the modules that are imported by the profiled thread.
+    """
+
+    def __init__(self, profiler: "RunWorkerStartupProfiler", thread_id: int):
+        self._profiler = profiler
+        self._thread_id = thread_id
+
+    def find_spec(self, fullname, path, target=None) -> Optional[ModuleSpec]:
+        if threading.get_ident() != self._thread_id:
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self._profiler)  # type: ignore
+            return spec
+
+        return None
+
+
+class RunWorkerStartupProfiler:
+    """Profiles the time that a run worker spends loading the definition of the job that it
+    executes, so that it can be reported as an engine event.
+
+    The load is split into the time spent importing the modules of the code location, the time
+    spent constructing the repository from the loaded definitions, and the time spent constructing
+    the job itself. Imports are timed by module.
+    """
+
+    def __init__(self, max_reported_modules: int = DEFAULT_MAX_REPORTED_MODULES):
+        self._max_reported_modules = check.int_param(max_reported_modules, "max_reported_modules")
+        self._module_timings: List[ModuleImportTiming] = []
+        self._child_seconds_stack: List[float] = []
+        self._top_level_import_seconds = 0.0
+
+        self._import_seconds = 0.0
+        self._definition_construction_seconds = 0.0
+        self._job_construction_seconds = 0.0
+
+    @property
+    def import_seconds(self) -> float:
+        return self._import_seconds
+
+    @property
+    def definition_construction_seconds(self) -> float:
+        return self._definition_construction_seconds
+
+    @property
+    def job_construction_seconds(self) -> float:
+        return self._job_construction_seconds
+
+    @property
+    def total_seconds(self) -> float:
+        return (
+            self._import_seconds
+            + self._definition_construction_seconds
+            + self._job_construction_seconds
+        )
+
+    @property
+    def module_timings(self) -> Sequence[ModuleImportTiming]:
+        return self._module_timings
+
+    def load_job_definition(self, recon_job: "ReconstructableJob") -> None:
+        """Loads the definition of the given job, recording the time spent in each part of the
+        load.
+        """
+        with self.profile_imports():
+            import_start = self._top_level_import_seconds
+            start = time.perf_counter()
+            recon_job.get_repository_definition()
+            repository_imports = self._top_level_import_seconds - import_start
+            self._definition_construction_seconds = time.perf_counter() - start - repository_imports
+
+            import_start = self._top_level_import_seconds
+            start = time.perf_counter()
+            recon_job.get_definition()
+            job_imports = self._top_level_import_seconds - import_start
+            self._job_construction_seconds = time.perf_counter() - start - job_imports
+
+            self._import_seconds = repository_imports + job_imports
+
+    @contextmanager
+    def profile_imports(self) -> Iterator[None]:
+        """Times the modules that are imported by the current thread within the context."""
+        finder = _TimedImportFinder(self, threading.get_ident())
+        sys.meta_path.insert(0, finder)
+        try:
+            yield
+        finally:
+            sys.meta_path.remove(finder)
+
+    @contextmanager
+    def time_module(self, module_name: str) -> Iterator[None]:
+        self._child_seconds_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            child_seconds = self._child_seconds_stack.pop()
+            self._module_timings.append(
+                ModuleImportTiming(
+                    module_name=module_name,
+                    self_seconds=elapsed - child_seconds,
+                    cumulative_seconds=elapsed,
+                )
+            )
+            if self._child_seconds_stack:
+                self._child_seconds_stack[-1] += elapsed
+            else:
+                self._top_level_import_seconds += elapsed
+
+    def get_slowest_modules(self) -> Sequence[ModuleImportTiming]:
+        return sorted(self._module_timings, key=lambda timing: timing.self_seconds, reverse=True)[
+            : self._max_reported_modules
+        ]
+
+    def get_engine_event_message(self) -> str:
+        return (
+            f"Loaded job definition in {self.total_seconds:.2f}s (imports:"
+            f" {self.import_seconds:.2f}s, definition construction:"
+            f" {self.definition_construction_seconds:.2f}s, job construction:"
+            f" {self.job_construction_seconds:.2f}s)."
+        )
+
+    def get_engine_event_data(self) -> EngineEventData:
+        table_rows = [
+            f"| `{timing.module_name}` | {timing.self_seconds:.3f} | {timing.cumulative_seconds:.3f} |"
+            for timing in self.get_slowest_modules()
+        ]
+        return EngineEventData(
+            metadata={
+                "total_seconds": MetadataValue.float(self.total_seconds),
+                "import_seconds": MetadataValue.float(self.import_seconds),
+                "definition_construction_seconds": MetadataValue.float(
+                    self.definition_construction_seconds
+                ),
+                "job_construction_seconds": MetadataValue.float(self.job_construction_seconds),
+                "modules_imported": MetadataValue.int(len(self._module_timings)),
+                "slowest_modules": MetadataValue.md(
+                    "\n".join(
+                        [
+                            "| Module | Self (s) | Cumulative (s) |",
+                            "| --- | --- | --- |",
+                            *table_rows,
+                        ]
+                    )
+                ),
+            }
+        )
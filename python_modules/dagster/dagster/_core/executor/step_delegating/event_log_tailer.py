@@ -0,0 +1,228 @@
+import threading
+import time
+import warnings
+from typing import List, Optional, Sequence, Set
+
+import dagster._check as check
+from dagster._core.event_api import EventLogCursor, EventLogRecord
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance import DagsterInstance
+
+DEFAULT_MAX_POLL_INTERVAL_SECONDS = 30.0
+
+
+class RunEventLogTailer:
+    """Tails the event log for the steps of a run on behalf of the StepDelegatingExecutor.
+
+    By default, the tailer polls the event log with an id cursor every time events are popped. When
+    `watch` is set, the tailer also subscribes to the event log storage's watch channel for the run
+    (a filesystem watch for sqlite, a shared polling thread for the SQL storages), which pushes new
+    records to the tailer as they are written. Popping events then only drains the records that were
+    pushed, and the event log is polled directly as a fallback, on an interval that backs off while
+    the watch channel delivers every record and resets whenever a poll finds records that the
+    channel missed.
+
+    Storage ids that have already been yielded are tracked so that a record is never yielded twice.
+    Every storage id at or below the cursor (less the tailer offset) is known to have been seen, so
+    only the ids above that floor are kept in memory.
+    """
+
+    def __init__(
+        self,
+        instance: DagsterInstance,
+        run_id: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        watch: bool = False,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL_SECONDS,
+    ):
+        self._instance = check.inst_param(instance, "instance", DagsterInstance)
+        self._run_id = check.str_param(run_id, "run_id")
+        self._offset = check.int_param(offset, "offset")
+        self._limit = check.opt_int_param(limit, "limit")
+        self._watch = check.bool_param(watch, "watch")
+        self._min_poll_interval = check.float_param(poll_interval, "poll_interval")
+        self._max_poll_interval = max(
+            check.float_param(max_poll_interval, "max_poll_interval"), self._min_poll_interval
+        )
+
+        self._cursor: Optional[str] = None
+        self._seen_floor: Optional[int] = None
+        self._seen_storage_ids: Set[int] = set()
+
+        self._is_watching = False
+        self._lock = threading.Lock()
+        self._pushed_records: List[EventLogRecord] = []
+        self._has_pushed_records = threading.Event()
+        self._poll_interval = self._min_poll_interval
+        self._last_poll_time: Optional[float] = None
+
+    @property
+    def is_watching(self) -> bool:
+        return self._is_watching
+
+    def pop_events(self) -> Sequence[DagsterEvent]:
+        """Returns the events for the run that have not been returned by a previous call."""
+        records = self._drain_pushed_records()
+        if not self._is_watching or self._should_poll():
+            polled_records = self._poll()
+            if self._is_watching:
+                # back off polling while the watch channel keeps up, and poll eagerly again as
+                # soon as a poll finds records that it did not deliver
+                pushed_storage_ids = {record.storage_id for record in records}
+                if any(
+                    not self._is_seen(record.storage_id)
+                    and record.storage_id not in pushed_storage_ids
+                    for record in polled_records
+                ):
+                    self._poll_interval = self._min_poll_interval
+                else:
+                    self._poll_interval = min(self._poll_interval * 2, self._max_poll_interval)
+            records.extend(polled_records)
+
+        dagster_events = []
+        for record in sorted(records, key=lambda record: record.storage_id):
+            if self._is_seen(record.storage_id):
+                continue
+            self._seen_storage_ids.add(record.storage_id)
+            if record.event_log_entry.dagster_event:
+                dagster_events.append(record.event_log_entry.dagster_event)
+
+        self._advance_seen_floor()
+
+        if self._watch and not self._is_watching:
+            self._start_watch()
+
+        return dagster_events
+
+    def wait(self, timeout: float) -> None:
+        """Sleeps for up to `timeout` seconds, returning early if the watch channel pushes new
+        records in the meantime.
+        """
+        if self._is_watching:
+            self._has_pushed_records.wait(timeout)
+        else:
+            time.sleep(timeout)
+
+    def __enter__(self) -> "RunEventLogTailer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._is_watching:
+            self._instance.end_watch_event_logs(self._run_id, self._on_pushed_record)
+            self._is_watching = False
+
+    def _should_poll(self) -> bool:
+        return (
+            self._last_poll_time is None
+            or time.monotonic() - self._last_poll_time >= self._poll_interval
+        )
+
+    def _poll(self) -> Sequence[EventLogRecord]:
+        adjusted_cursor = self._cursor
+
+        if self._offset > 0 and self._cursor:
+            cursor_obj = EventLogCursor.parse(self._cursor)
+            check.invariant(
+                cursor_obj.is_id_cursor(),
+                "Applying a tailer offset only works with an id-based cursor",
+            )
+            adjusted_cursor = EventLogCursor.from_storage_id(
+                cursor_obj.storage_id() - self._offset
+            ).to_string()
+
+        conn = self._instance.get_records_for_run(
+            self._run_id,
+            adjusted_cursor,
+            of_type=set(DagsterEventType),
+            limit=self._limit,
+        )
+        self._last_poll_time = time.monotonic()
+        self._advance_cursor(conn.cursor)
+        return conn.records
+
+    def _start_watch(self) -> None:
+        # the watch channels of the SQL storages can only resume from an id-based cursor
+        if self._cursor and not EventLogCursor.parse(self._cursor).is_id_cursor():
+            return
+
+        try:
+            self._instance.watch_event_logs(self._run_id, self._cursor, self._on_pushed_record)
+        except Exception as e:
+            # keep tailing the event log by polling alone
+            self._watch = False
+            warnings.warn(
+                f"Could not watch the event log for run {self._run_id}, polling instead: {e}"
+            )
+            return
+
+        self._is_watching = True
+
+    def _on_pushed_record(self, event_log_entry: EventLogEntry, cursor: str) -> None:
+        record = EventLogRecord(
+            storage_id=EventLogCursor.parse(cursor).storage_id(),
+            event_log_entry=event_log_entry,
+        )
+        with self._lock:
+            self._pushed_records.append(record)
+            self._has_pushed_records.set()
+
+    def _drain_pushed_records(self) -> List[EventLogRecord]:
+        with self._lock:
+            records = self._pushed_records
+            self._pushed_records = []
+            self._has_pushed_records.clear()
+
+        if records:
+            # the watch channel delivers every record after the cursor that it was started from,
+            # so the cursor can skip past the records that it has pushed
+            self._advance_cursor(
+                EventLogCursor.from_storage_id(
+                    max(record.storage_id for record in records)
+                ).to_string()
+            )
+        return records
+
+    def _advance_cursor(self, cursor: Optional[str]) -> None:
+        if not cursor:
+            return
+
+        if self._cursor:
+            current = EventLogCursor.parse(self._cursor)
+            new = EventLogCursor.parse(cursor)
+            if (
+                current.is_id_cursor()
+                and new.is_id_cursor()
+                and new.storage_id() < current.storage_id()
+            ):
+                return
+
+        self._cursor = cursor
+
+    def _is_seen(self, storage_id: int) -> bool:
+        return (
+            self._seen_floor is not None and storage_id <= self._seen_floor
+        ) or storage_id in self._seen_storage_ids
+
+    def _advance_seen_floor(self) -> None:
+        if not self._cursor:
+            return
+
+        cursor_obj = EventLogCursor.parse(self._cursor)
+        if not cursor_obj.is_id_cursor():
+            return
+
+        # records at or below the floor are never read again, so their ids can be forgotten
+        floor = cursor_obj.storage_id() - self._offset
+        if self._seen_floor is not None and floor <= self._seen_floor:
+            return
+
+        self._seen_floor = floor
+        self._seen_storage_ids = {
+            storage_id for storage_id in self._seen_storage_ids if storage_id > floor
+        }
@@ -1,20 +1,21 @@
 import os
 import sys
-import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
 import dagster._check as check
 from dagster._core.definitions.metadata import MetadataValue
-from dagster._core.event_api import EventLogCursor
-from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events import DagsterEvent, EngineEventData
 from dagster._core.execution.context.system import PlanOrchestrationContext
 from dagster._core.execution.plan.active import ActiveExecution
 from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
 from dagster._core.execution.plan.objects import StepFailureData
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.retries import RetryMode
+from dagster._core.executor.step_delegating.event_log_tailer import (
+    DEFAULT_MAX_POLL_INTERVAL_SECONDS,
+    RunEventLogTailer,
+)
 from dagster._core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
-from dagster._core.instance import DagsterInstance
 from dagster._grpc.types import ExecuteStepArgs
 from dagster._time import get_current_datetime
 from dagster._utils.error import serializable_error_info_from_exc_info
@@ -69,7 +70,6 @@ def __init__(
         )
         self._should_verify_step = should_verify_step
 
-        self._event_cursor: Optional[str] = None
         self._pop_events_offset = int(os.getenv("DAGSTER_EXECUTOR_POP_EVENTS_OFFSET", "0"))
 
         if self._pop_events_offset:
@@ -79,42 +79,19 @@ def __init__(
         else:
             self._pop_events_limit = int(os.getenv("DAGSTER_EXECUTOR_POP_EVENTS_LIMIT", "1000"))
 
-    @property
-    def retries(self):
-        return self._retries
-
-    def _pop_events(
-        self, instance: DagsterInstance, run_id: str, seen_storage_ids: Set[int]
-    ) -> Sequence[DagsterEvent]:
-        adjusted_cursor = self._event_cursor
-
-        if self._pop_events_offset > 0 and self._event_cursor:
-            cursor_obj = EventLogCursor.parse(self._event_cursor)
-            check.invariant(
-                cursor_obj.is_id_cursor(),
-                "Applying a tailer offset only works with an id-based cursor",
+        # subscribe to the event log storage's watch channel for the run, so that step events wake
+        # the executor up as soon as they are written instead of on the next poll
+        self._watch_event_logs = os.getenv("DAGSTER_EXECUTOR_WATCH_EVENT_LOGS") == "1"
+        self._max_poll_interval_seconds = float(
+            os.getenv(
+                "DAGSTER_EXECUTOR_WATCH_MAX_POLL_INTERVAL_SECONDS",
+                str(DEFAULT_MAX_POLL_INTERVAL_SECONDS),
             )
-            adjusted_cursor = EventLogCursor.from_storage_id(
-                cursor_obj.storage_id() - self._pop_events_offset
-            ).to_string()
-
-        conn = instance.get_records_for_run(
-            run_id,
-            adjusted_cursor,
-            of_type=set(DagsterEventType),
-            limit=self._pop_events_limit,
         )
-        self._event_cursor = conn.cursor
-
-        dagster_events = [
-            record.event_log_entry.dagster_event
-            for record in conn.records
-            if record.event_log_entry.dagster_event and record.storage_id not in seen_storage_ids
-        ]
 
-        seen_storage_ids.update(record.storage_id for record in conn.records)
-
-        return dagster_events
+    @property
+    def retries(self):
+        return self._retries
 
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
@@ -139,14 +116,23 @@ def _get_step_handler_context(
     def execute(self, plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan):
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
-        seen_storage_ids = set()
+
+        tailer = RunEventLogTailer(
+            plan_context.instance,
+            plan_context.run_id,
+            offset=self._pop_events_offset,
+            limit=self._pop_events_limit,
+            watch=self._watch_event_logs,
+            poll_interval=self._sleep_seconds,
+            max_poll_interval=self._max_poll_interval_seconds,
+        )
 
         DagsterEvent.engine_event(
             plan_context,
             f"Starting execution with step handler {self._step_handler.name}.",
             EngineEventData(),
         )
-        with InstanceConcurrencyContext(
+        with tailer, InstanceConcurrencyContext(
             plan_context.instance, plan_context.dagster_run
         ) as instance_concurrency_context:
             with ActiveExecution(
@@ -165,11 +151,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         EngineEventData(),
                     )
 
-                    prior_events = self._pop_events(
-                        plan_context.instance,
-                        plan_context.run_id,
-                        seen_storage_ids,
-                    )
+                    prior_events = tailer.pop_events()
                     for dagster_event in prior_events:
                         yield dagster_event
 
@@ -265,11 +247,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                             return
 
                         if active_execution.has_in_flight_steps:
-                            for dagster_event in self._pop_events(
-                                plan_context.instance,
-                                plan_context.run_id,
-                                seen_storage_ids,
-                            ):
+                            for dagster_event in tailer.pop_events():
                                 yield dagster_event
                                 # STEP_SKIPPED events are only emitted by ActiveExecution, which already handles
                                 # and yields them.
@@ -359,7 +337,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                                 )
                             )
 
-                        time.sleep(self._sleep_seconds)
+                        tailer.wait(self._sleep_seconds)
                 except Exception:
                     if not active_execution.is_complete and running_steps:
                         serializable_error = serializable_error_info_from_exc_info(sys.exc_info())
@@ -1471,6 +1471,81 @@ def create_run(
         external_job_origin: Optional["RemoteJobOrigin"],
         job_code_origin: Optional[JobPythonOrigin],
         asset_graph: Optional["BaseAssetGraph"],
+    ) -> DagsterRun:
+        dagster_run = self._validate_and_construct_run(
+            job_name=job_name,
+            run_id=run_id,
+            run_config=run_config,
+            status=status,
+            tags=tags,
+            root_run_id=root_run_id,
+            parent_run_id=parent_run_id,
+            step_keys_to_execute=step_keys_to_execute,
+            execution_plan_snapshot=execution_plan_snapshot,
+            job_snapshot=job_snapshot,
+            parent_job_snapshot=parent_job_snapshot,
+            asset_selection=asset_selection,
+            asset_check_selection=asset_check_selection,
+            resolved_op_selection=resolved_op_selection,
+            op_selection=op_selection,
+            external_job_origin=external_job_origin,
+            job_code_origin=job_code_origin,
+        )
+
+        dagster_run = self._run_storage.add_run(dagster_run)
+
+        if execution_plan_snapshot:
+            self._log_asset_planned_events(dagster_run, execution_plan_snapshot, asset_graph)
+
+        return dagster_run
+
+    def create_runs(self, run_creation_args: Sequence[Mapping[str, Any]]) -> Sequence[DagsterRun]:
+        """Create several runs at once. Each element of `run_creation_args` holds the keyword
+        arguments for a call to `create_run`.
+
+        Each run is validated and its snapshots persisted as in `create_run`, but the runs are
+        then added to run storage in a single batch.
+        """
+        check.sequence_param(run_creation_args, "run_creation_args", of_type=Mapping)
+
+        dagster_runs = self._run_storage.add_runs(
+            [
+                self._validate_and_construct_run(
+                    **{key: value for key, value in args.items() if key != "asset_graph"}
+                )
+                for args in run_creation_args
+            ]
+        )
+
+        for dagster_run, args in zip(dagster_runs, run_creation_args):
+            execution_plan_snapshot = args.get("execution_plan_snapshot")
+            if execution_plan_snapshot:
+                self._log_asset_planned_events(
+                    dagster_run, execution_plan_snapshot, args.get("asset_graph")
+                )
+
+        return dagster_runs
+
+    def _validate_and_construct_run(
+        self,
+        *,
+        job_name: str,
+        run_id: Optional[str],
+        run_config: Optional[Mapping[str, object]],
+        status: Optional[DagsterRunStatus],
+        tags: Optional[Mapping[str, Any]],
+        root_run_id: Optional[str],
+        parent_run_id: Optional[str],
+        step_keys_to_execute: Optional[Sequence[str]],
+        execution_plan_snapshot: Optional["ExecutionPlanSnapshot"],
+        job_snapshot: Optional["JobSnapshot"],
+        parent_job_snapshot: Optional["JobSnapshot"],
+        asset_selection: Optional[AbstractSet[AssetKey]],
+        asset_check_selection: Optional[AbstractSet["AssetCheckKey"]],
+        resolved_op_selection: Optional[AbstractSet[str]],
+        op_selection: Optional[Sequence[str]],
+        external_job_origin: Optional["RemoteJobOrigin"],
+        job_code_origin: Optional[JobPythonOrigin],
     ) -> DagsterRun:
         from dagster._core.definitions.asset_check_spec import AssetCheckKey
         from dagster._core.definitions.utils import normalize_tags
@@ -1601,11 +1676,6 @@ def create_run(
             job_code_origin=job_code_origin,
         )
 
-        dagster_run = self._run_storage.add_run(dagster_run)
-
-        if execution_plan_snapshot:
-            self._log_asset_planned_events(dagster_run, execution_plan_snapshot, asset_graph)
-
         return dagster_run
 
     def create_reexecuted_run(
@@ -1788,6 +1858,12 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
     def has_run(self, run_id: str) -> bool:
         return self._run_storage.has_run(run_id)
 
+    @traced
+    def get_run_ids_by_run_key(
+        self, selector_id: str, run_keys: Sequence[str], instigator_name: Optional[str] = None
+    ) -> Mapping[str, str]:
+        return self._run_storage.get_run_ids_by_run_key(selector_id, run_keys, instigator_name)
+
     @traced
     def get_runs(
         self,
@@ -2037,6 +2113,34 @@ def fetch_materializations(
         """
         return self._event_storage.fetch_materializations(records_filter, limit, cursor, ascending)
 
+    @traced
+    def fetch_materializations_for_asset_keys(
+        self,
+        asset_keys: Sequence[AssetKey],
+        limit: int,
+        cursor: Optional[str] = None,
+        storage_ids: Optional[Sequence[int]] = None,
+        after_storage_id_by_key: Optional[Mapping[AssetKey, int]] = None,
+    ) -> "EventRecordsResult":
+        """Return the materialization records of any of the given asset keys, in ascending storage
+        id order.
+
+        Args:
+            asset_keys (Sequence[AssetKey]): The asset keys to fetch materializations for.
+            limit (int): Number of results to get.
+            cursor (Optional[str]): Cursor to use for pagination. Defaults to None.
+            storage_ids (Optional[Sequence[int]]): If provided, only records with one of these
+                storage ids are returned.
+            after_storage_id_by_key (Optional[Mapping[AssetKey, int]]): If provided, only records
+                with a storage id greater than the one given for their asset key are returned.
+
+        Returns:
+            EventRecordsResult: Object containing a list of event log records and a cursor string
+        """
+        return self._event_storage.fetch_materializations_for_asset_keys(
+            asset_keys, limit, cursor, storage_ids, after_storage_id_by_key
+        )
+
     @traced
     @deprecated(breaking_version="2.0")
     def fetch_planned_materializations(
@@ -5,6 +5,7 @@
 from dagster import (
     Array,
     Bool,
+    Map,
     _check as check,
 )
 from dagster._config import (
@@ -287,6 +288,25 @@ def sensors_daemon_config() -> Field:
                     " tick."
                 ),
             ),
+            "num_workers_per_code_location": Field(
+                int,
+                is_required=False,
+                description=(
+                    "If set, the sensors of each code location are processed in a separate pool of"
+                    " this many threads (multiplied by the location's weight in"
+                    " `code_location_weights`), rather than in one pool of `num_workers` threads"
+                    " shared by all code locations."
+                ),
+            ),
+            "code_location_weights": Field(
+                Map(str, int),
+                is_required=False,
+                description=(
+                    "A mapping of code location names to integer weights, used to size the"
+                    " per-code-location thread pools. Code locations without a weight have a"
+                    " weight of 1."
+                ),
+            ),
         },
         is_required=False,
     )
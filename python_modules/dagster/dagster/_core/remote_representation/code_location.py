@@ -69,6 +69,7 @@
 from dagster._utils.merger import merge_dicts
 
 if TYPE_CHECKING:
+    from dagster._core.definitions.run_status_sensor_definition import RunStatusChangeBatch
     from dagster._core.definitions.schedule_definition import ScheduleExecutionData
     from dagster._core.definitions.sensor_definition import SensorExecutionData
     from dagster._core.remote_representation import (
@@ -226,6 +227,7 @@ def get_external_sensor_execution_data(
         cursor: Optional[str],
         log_key: Optional[Sequence[str]],
         last_sensor_start_time: Optional[float],
+        run_status_change_batch: Optional["RunStatusChangeBatch"] = None,
     ) -> "SensorExecutionData":
         pass
 
@@ -522,6 +524,7 @@ def get_external_sensor_execution_data(
         cursor: Optional[str],
         log_key: Optional[Sequence[str]],
         last_sensor_start_time: Optional[float],
+        run_status_change_batch: Optional["RunStatusChangeBatch"] = None,
     ) -> "SensorExecutionData":
         result = get_external_sensor_execution(
             self._get_repo_def(repository_handle.repository_name),
@@ -533,6 +536,7 @@ def get_external_sensor_execution_data(
             cursor,
             log_key,
             last_sensor_start_time,
+            run_status_change_batch,
         )
         if isinstance(result, ExternalSensorExecutionErrorData):
             raise DagsterUserCodeProcessError.from_error_info(result.error)
@@ -904,6 +908,7 @@ def get_external_sensor_execution_data(
         cursor: Optional[str],
         log_key: Optional[Sequence[str]],
         last_sensor_start_time: Optional[float],
+        run_status_change_batch: Optional["RunStatusChangeBatch"] = None,
     ) -> "SensorExecutionData":
         from dagster._api.snapshot_sensor import sync_get_external_sensor_execution_data_grpc
 
@@ -917,6 +922,7 @@ def get_external_sensor_execution_data(
             cursor,
             log_key,
             last_sensor_start_time,
+            run_status_change_batch=run_status_change_batch,
         )
 
     def get_external_partition_set_execution_param_data(
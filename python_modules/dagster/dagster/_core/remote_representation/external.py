@@ -48,6 +48,7 @@
 )
 from dagster._core.snap import ExecutionPlanSnapshot
 from dagster._core.snap.job_snapshot import JobSnapshot
+from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.utils import toposort
 from dagster._record import record
 from dagster._serdes import create_snapshot_id
@@ -988,6 +989,10 @@ def get_compound_id(self) -> CompoundID:
     def sensor_type(self) -> SensorType:
         return self._external_sensor_data.sensor_type or SensorType.UNKNOWN
 
+    @property
+    def run_status(self) -> Optional[DagsterRunStatus]:
+        return self._external_sensor_data.run_status
+
     def get_current_instigator_state(
         self, stored_state: Optional["InstigatorState"]
     ) -> "InstigatorState":
@@ -83,6 +83,7 @@
 )
 from dagster._core.definitions.resource_definition import ResourceDefinition
 from dagster._core.definitions.resource_requirement import ResourceKeyRequirement
+from dagster._core.definitions.run_status_sensor_definition import RunStatusSensorDefinition
 from dagster._core.definitions.schedule_definition import DefaultScheduleStatus
 from dagster._core.definitions.sensor_definition import (
     DefaultSensorStatus,
@@ -95,6 +96,7 @@
 from dagster._core.errors import DagsterInvalidDefinitionError
 from dagster._core.snap import JobSnapshot
 from dagster._core.snap.mode import ResourceDefSnap, build_resource_def_snap
+from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.storage.io_manager import IOManagerDefinition
 from dagster._core.storage.tags import COMPUTE_KIND_TAG
 from dagster._core.utils import is_valid_email
@@ -434,7 +436,7 @@ class ExternalSensorMetadata:
 @whitelist_for_serdes(
     storage_name="ExternalSensorData",
     storage_field_names={"job_name": "pipeline_name", "op_selection": "solid_selection"},
-    skip_when_empty_fields={"default_status", "sensor_type"},
+    skip_when_empty_fields={"default_status", "sensor_type", "run_status"},
 )
 @record_custom
 class SensorSnap(IHaveNew):
@@ -450,6 +452,7 @@ class SensorSnap(IHaveNew):
     sensor_type: Optional[SensorType]
     asset_selection: Optional[AssetSelection]
     run_tags: Mapping[str, str]
+    run_status: Optional[DagsterRunStatus]
 
     def __new__(
         cls,
@@ -465,6 +468,7 @@ def __new__(
         sensor_type: Optional[SensorType] = None,
         asset_selection: Optional[AssetSelection] = None,
         run_tags: Optional[Mapping[str, str]] = None,
+        run_status: Optional[DagsterRunStatus] = None,
     ):
         if job_name and not target_dict:
             # handle the legacy case where the ExternalSensorData was constructed from an earlier
@@ -504,6 +508,7 @@ def __new__(
             sensor_type=sensor_type,
             asset_selection=asset_selection,
             run_tags=run_tags or {},
+            run_status=run_status,
         )
 
     @classmethod
@@ -565,6 +570,9 @@ def from_def(cls, sensor_def: SensorDefinition, repository_def: RepositoryDefini
                 if isinstance(sensor_def, AutomationConditionSensorDefinition)
                 else None
             ),
+            run_status=(
+                sensor_def.run_status if isinstance(sensor_def, RunStatusSensorDefinition) else None
+            ),
         )
 
 
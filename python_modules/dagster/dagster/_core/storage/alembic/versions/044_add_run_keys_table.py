@@ -0,0 +1,67 @@
+"""add run keys table
+
+Revision ID: 7e2f3b1c9d4a
+Revises: 284a732df317
+Create Date: 2024-08-05 10:12:41.318270
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from dagster._core.storage.sql import get_sql_current_timestamp
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "7e2f3b1c9d4a"
+down_revision = "284a732df317"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("runs"):
+        return
+
+    if not has_table("run_keys"):
+        op.create_table(
+            "run_keys",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("selector_id", db.String(255), nullable=False),
+            db.Column("run_key", db.Text, nullable=False),
+            db.Column(
+                "run_id",
+                db.String(255),
+                db.ForeignKey("runs.run_id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            db.Column("create_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+        )
+
+    if not has_index("run_keys", "idx_run_keys"):
+        op.create_index(
+            "idx_run_keys",
+            "run_keys",
+            ["selector_id", "run_key"],
+            unique=False,
+            mysql_length={"selector_id": 64, "run_key": 255},
+        )
+
+    if not has_index("run_keys", "idx_run_keys_run_id"):
+        op.create_index(
+            "idx_run_keys_run_id",
+            "run_keys",
+            ["run_id"],
+            unique=False,
+            mysql_length={"run_id": 255},
+        )
+
+
+def downgrade():
+    if has_table("run_keys"):
+        op.drop_table("run_keys")
@@ -11,6 +11,7 @@
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Union,
 )
 
@@ -32,7 +33,9 @@
     BACKFILL_ID_TAG,
     REPOSITORY_LABEL_TAG,
     RESUME_RETRY_TAG,
+    RUN_KEY_TAG,
     SCHEDULE_NAME_TAG,
+    SCHEDULED_EXECUTION_TIME_TAG,
     SENSOR_NAME_TAG,
     TICK_ID_TAG,
 )
@@ -442,6 +445,42 @@ def tags_for_storage(self) -> Mapping[str, str]:
 
         return {**repository_tags, **self.tags}
 
+    def get_run_key_index_entry(self) -> Optional[Tuple[str, str]]:
+        """The (instigator selector id, run key) pair under which this run is indexed for the run
+        key idempotency checks of the sensor and schedule daemons, or None if the run was not
+        launched by a sensor with a run key or by a schedule.
+
+        Runs without a job origin cannot be attributed to a code location, so they are indexed
+        under `run_key_selector_id_without_origin`, which lookups for every sensor or schedule with
+        the same name include.
+        """
+        from dagster._core.definitions.selector import InstigatorSelector
+
+        if not self.tags:
+            return None
+
+        if self.tags.get(SENSOR_NAME_TAG) and self.tags.get(RUN_KEY_TAG):
+            instigator_name = self.tags[SENSOR_NAME_TAG]
+            run_key = self.tags[RUN_KEY_TAG]
+        elif self.tags.get(SCHEDULE_NAME_TAG) and self.tags.get(SCHEDULED_EXECUTION_TIME_TAG):
+            instigator_name = self.tags[SCHEDULE_NAME_TAG]
+            run_key = DagsterRun.run_key_for_scheduled_execution(
+                self.tags[SCHEDULED_EXECUTION_TIME_TAG], self.tags.get(RUN_KEY_TAG)
+            )
+        else:
+            return None
+
+        if not self.external_job_origin:
+            return DagsterRun.run_key_selector_id_without_origin(instigator_name), run_key
+
+        repository_origin = self.external_job_origin.repository_origin
+        selector_id = InstigatorSelector(
+            location_name=repository_origin.code_location_origin.location_name,
+            repository_name=repository_origin.repository_name,
+            name=instigator_name,
+        ).get_id()
+        return selector_id, run_key
+
     @public
     @property
     def is_finished(self) -> bool:
@@ -495,6 +534,26 @@ def tags_for_sensor(
     ) -> Mapping[str, str]:
         return {SENSOR_NAME_TAG: sensor.name}
 
+    @staticmethod
+    def run_key_for_scheduled_execution(
+        scheduled_execution_time: str, run_key: Optional[str]
+    ) -> str:
+        """The key under which a scheduled run is indexed: a schedule may request several runs
+        for each execution time, distinguished by their run keys.
+        """
+        return f"{scheduled_execution_time}|{run_key}" if run_key else scheduled_execution_time
+
+    @staticmethod
+    def run_key_selector_id_without_origin(instigator_name: str) -> str:
+        """The selector id under which runs of the sensor or schedule that have no job origin
+        are indexed.
+        """
+        from dagster._core.definitions.selector import InstigatorSelector
+
+        return InstigatorSelector(
+            location_name="", repository_name="", name=instigator_name
+        ).get_id()
+
     @staticmethod
     def tags_for_backfill_id(backfill_id: str) -> Mapping[str, str]:
         return {BACKFILL_ID_TAG: backfill_id}
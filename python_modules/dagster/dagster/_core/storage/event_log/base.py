@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import (
     TYPE_CHECKING,
+    Dict,
     Iterable,
     Mapping,
     NamedTuple,
@@ -32,16 +33,22 @@
     build_run_step_stats_from_events,
 )
 from dagster._core.instance import MayHaveInstanceWeakref, T_DagsterInstance
+from dagster._core.loader import InstanceLoadableBy
 from dagster._core.storage.asset_check_execution_record import AssetCheckExecutionRecord
 from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot
 from dagster._core.storage.sql import AlembicVersion
 from dagster._core.storage.tags import MULTIDIMENSIONAL_PARTITION_PREFIX
 from dagster._utils import PrintFn
-from dagster._utils.concurrency import ConcurrencyClaimStatus, ConcurrencyKeyInfo
+from dagster._utils.concurrency import (
+    ConcurrencyClaimStatus,
+    ConcurrencyKeyInfo,
+    ConcurrencyStepClaim,
+)
 from dagster._utils.warnings import deprecation_warning
 
 if TYPE_CHECKING:
     from dagster._core.events.log import EventLogEntry
+    from dagster._core.instance import DagsterInstance
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 
@@ -124,20 +131,51 @@ def last_materialization_storage_id(self) -> Optional[int]:
         return self.last_materialization_record.storage_id
 
 
-class AssetRecord(NamedTuple):
+class AssetRecord(
+    NamedTuple("_AssetRecord", [("storage_id", int), ("asset_entry", AssetEntry)]),
+    InstanceLoadableBy[AssetKey],
+):
     """Internal representation of an asset record, as stored in a :py:class:`~dagster._core.storage.event_log.EventLogStorage`.
 
     Users should not invoke this class directly.
     """
 
-    storage_id: int
-    asset_entry: AssetEntry
+    @classmethod
+    async def _batch_load(
+        cls, keys: Iterable[AssetKey], instance: "DagsterInstance"
+    ) -> Iterable[Optional["AssetRecord"]]:
+        result_map: Dict[AssetKey, Optional[AssetRecord]] = {asset_key: None for asset_key in keys}
+
+        # this should be replaced with an async DB call
+        records = instance.get_asset_records(list(result_map.keys()))
 
+        for record in records:
+            result_map[record.asset_entry.asset_key] = record
 
-class AssetCheckSummaryRecord(NamedTuple):
-    asset_check_key: AssetCheckKey
-    last_check_execution_record: Optional[AssetCheckExecutionRecord]
-    last_run_id: Optional[str]
+        return result_map.values()
+
+
+class AssetCheckSummaryRecord(
+    NamedTuple(
+        "_AssetCheckSummaryRecord",
+        [
+            ("asset_check_key", AssetCheckKey),
+            ("last_check_execution_record", Optional[AssetCheckExecutionRecord]),
+            ("last_run_id", Optional[str]),
+        ],
+    ),
+    InstanceLoadableBy[AssetCheckKey],
+):
+    @classmethod
+    async def _batch_load(
+        cls, keys: Iterable[AssetCheckKey], instance: "DagsterInstance"
+    ) -> Iterable[Optional["AssetCheckSummaryRecord"]]:
+        asset_check_keys = list(keys)
+
+        # this should be replaced with an async DB call
+        records = instance.event_log_storage.get_asset_check_summary_records(asset_check_keys)
+
+        return [records.get(asset_check_key) for asset_check_key in asset_check_keys]
 
 
 class PlannedMaterializationInfo(NamedTuple):
@@ -537,6 +575,19 @@ def check_concurrency_claim(
         """Claim concurrency slots for step."""
         raise NotImplementedError()
 
+    def claim_concurrency_slots(
+        self, run_id: str, step_claims: Sequence[ConcurrencyStepClaim]
+    ) -> Mapping[str, ConcurrencyClaimStatus]:
+        """Claim concurrency slots for several steps of a run, returning the claim status of each
+        step keyed by step key. Storages may override this to claim all slots in one transaction.
+        """
+        return {
+            step_claim.step_key: self.claim_concurrency_slot(
+                step_claim.concurrency_key, run_id, step_claim.step_key, step_claim.priority
+            )
+            for step_claim in step_claims
+        }
+
     @abstractmethod
     def get_concurrency_run_ids(self) -> Set[str]:
         """Get a list of run_ids that are occupying or waiting for a concurrency key slot."""
@@ -583,6 +634,67 @@ def fetch_materializations(
     ) -> EventRecordsResult:
         raise NotImplementedError()
 
+    def fetch_materializations_for_asset_keys(
+        self,
+        asset_keys: Sequence[AssetKey],
+        limit: int,
+        cursor: Optional[str] = None,
+        storage_ids: Optional[Sequence[int]] = None,
+        after_storage_id_by_key: Optional[Mapping[AssetKey, int]] = None,
+    ) -> EventRecordsResult:
+        """Return the materialization records of any of the given asset keys, as one stream of
+        records in ascending storage id order.
+
+        Storages that can filter on several asset keys in one query should override this; by
+        default, the records of each asset key are fetched separately and merged.
+
+        Args:
+            asset_keys (Sequence[AssetKey]): The asset keys to fetch materializations for.
+            limit (int): Number of results to get.
+            cursor (Optional[str]): Cursor to use for pagination. Only records with a storage id
+                greater than the cursor's storage id are returned.
+            storage_ids (Optional[Sequence[int]]): If provided, only records with one of these
+                storage ids are returned.
+            after_storage_id_by_key (Optional[Mapping[AssetKey, int]]): If provided, only records
+                with a storage id greater than the one given for their asset key are returned.
+        """
+        cursor_storage_id = EventLogCursor.parse(cursor).storage_id() if cursor else None
+
+        def _get_after_storage_id(asset_key: AssetKey) -> Optional[int]:
+            storage_ids_to_skip = [
+                storage_id
+                for storage_id in [
+                    cursor_storage_id,
+                    (after_storage_id_by_key or {}).get(asset_key),
+                ]
+                if storage_id is not None
+            ]
+            return max(storage_ids_to_skip) if storage_ids_to_skip else None
+
+        results = [
+            self.fetch_materializations(
+                AssetRecordsFilter(
+                    asset_key=asset_key,
+                    after_storage_id=_get_after_storage_id(asset_key),
+                    storage_ids=storage_ids,
+                ),
+                limit=limit,
+                ascending=True,
+            )
+            for asset_key in asset_keys
+        ]
+        records = sorted(
+            [record for result in results for record in result.records],
+            key=lambda record: record.storage_id,
+        )
+        has_more = len(records) > limit or any(result.has_more for result in results)
+        records = records[:limit]
+        if records:
+            new_cursor = EventLogCursor.from_storage_id(records[-1].storage_id).to_string()
+        else:
+            new_cursor = cursor or EventLogCursor.from_storage_id(-1).to_string()
+        return EventRecordsResult(records, cursor=new_cursor, has_more=has_more)
+
     @abstractmethod
     def fetch_observations(
         self,
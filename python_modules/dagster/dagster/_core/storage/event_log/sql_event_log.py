@@ -1,7 +1,7 @@
 import logging
 import os
 from abc import abstractmethod
-from collections import OrderedDict, defaultdict
+from collections import Counter, OrderedDict, defaultdict
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from functools import cached_property
@@ -78,6 +78,7 @@
     ConcurrencyClaimStatus,
     ConcurrencyKeyInfo,
     ConcurrencySlotStatus,
+    ConcurrencyStepClaim,
     PendingStepInfo,
     get_max_concurrency_limit_value,
 )
@@ -999,8 +1000,11 @@ def _get_event_records(
         with self.index_connection() as conn:
             results = conn.execute(query).fetchall()
 
+        return self._event_records_from_rows(results)
+
+    def _event_records_from_rows(self, rows: Sequence[Tuple[int, str]]) -> Sequence[EventLogRecord]:
         event_records = []
-        for row_id, json_str in results:
+        for row_id, json_str in rows:
             try:
                 event_record = deserialize_value(json_str, NamedTuple)
                 if not isinstance(event_record, EventLogEntry):
@@ -1067,6 +1071,72 @@ def fetch_materializations(
 
         return self._get_event_records_result(event_records_filter, limit, cursor, ascending)
 
+    def fetch_materializations_for_asset_keys(
+        self,
+        asset_keys: Sequence[AssetKey],
+        limit: int,
+        cursor: Optional[str] = None,
+        storage_ids: Optional[Sequence[int]] = None,
+        after_storage_id_by_key: Optional[Mapping[AssetKey, int]] = None,
+    ) -> EventRecordsResult:
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+        check.opt_sequence_param(storage_ids, "storage_ids", of_type=int)
+        check.opt_mapping_param(
+            after_storage_id_by_key, "after_storage_id_by_key", key_type=AssetKey, value_type=int
+        )
+        enforce_max_records_limit(limit)
+
+        if not asset_keys:
+            return EventRecordsResult(
+                [],
+                cursor=cursor or EventLogCursor.from_storage_id(-1).to_string(),
+                has_more=False,
+            )
+
+        # keys that skip the same storage ids share a predicate, so that each key only reads the
+        # rows after its own storage id rather than after the earliest one of all keys
+        asset_keys_by_after_storage_id: Dict[Optional[int], List[str]] = defaultdict(list)
+        for asset_key in asset_keys:
+            asset_keys_by_after_storage_id[(after_storage_id_by_key or {}).get(asset_key)].append(
+                asset_key.to_string()
+            )
+        asset_key_predicates = [
+            SqlEventLogStorageTable.c.asset_key.in_(asset_key_strs)
+            if after_storage_id is None
+            else db.and_(
+                SqlEventLogStorageTable.c.asset_key.in_(asset_key_strs),
+                SqlEventLogStorageTable.c.id > after_storage_id,
+            )
+            for after_storage_id, asset_key_strs in asset_keys_by_after_storage_id.items()
+        ]
+
+        query = db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]).where(
+            db.and_(
+                SqlEventLogStorageTable.c.dagster_event_type
+                == DagsterEventType.ASSET_MATERIALIZATION.value,
+                db.or_(*asset_key_predicates),
+            )
+        )
+        query = self._add_assets_wipe_filter_to_query(
+            query, self._get_assets_details(asset_keys), asset_keys
+        )
+        if cursor:
+            query = query.where(
+                SqlEventLogStorageTable.c.id > EventLogCursor.parse(cursor).storage_id()
+            )
+        if storage_ids:
+            query = query.where(SqlEventLogStorageTable.c.id.in_(storage_ids))
+        query = query.order_by(SqlEventLogStorageTable.c.id.asc()).limit(limit)
+
+        with self.index_connection() as conn:
+            records = self._event_records_from_rows(conn.execute(query).fetchall())
+
+        if records:
+            new_cursor = EventLogCursor.from_storage_id(records[-1].storage_id).to_string()
+        else:
+            new_cursor = cursor or EventLogCursor.from_storage_id(-1).to_string()
+        return EventRecordsResult(records, cursor=new_cursor, has_more=len(records) == limit)
+
     def fetch_observations(
         self,
         records_filter: Union[AssetKey, AssetRecordsFilter],
@@ -1322,13 +1392,16 @@ def get_asset_records(
     def get_asset_check_summary_records(
         self, asset_check_keys: Sequence[AssetCheckKey]
     ) -> Mapping[AssetCheckKey, AssetCheckSummaryRecord]:
+        latest_execution_records = self.get_latest_asset_check_execution_by_key(
+            list(asset_check_keys)
+        )
         states = {}
         for asset_check_key in asset_check_keys:
-            execution_record = self.get_asset_check_execution_history(asset_check_key, limit=1)
+            execution_record = latest_execution_records.get(asset_check_key)
             states[asset_check_key] = AssetCheckSummaryRecord(
                 asset_check_key=asset_check_key,
-                last_check_execution_record=execution_record[0] if execution_record else None,
-                last_run_id=execution_record[0].run_id if execution_record else None,
+                last_check_execution_record=execution_record,
+                last_run_id=execution_record.run_id if execution_record else None,
             )
         return states
 
@@ -2462,9 +2535,11 @@ def assign_pending_steps(self, concurrency_keys: Sequence[str]):
         if not concurrency_keys:
             return
 
+        # a key appears once for every slot that was freed or added, so assign that many of the
+        # pending steps for each key in a single query, rather than one at a time
         with self.index_connection() as conn:
-            for key in concurrency_keys:
-                row = conn.execute(
+            for key, count in Counter(concurrency_keys).items():
+                rows = conn.execute(
                     db_select([PendingStepsTable.c.id])
                     .where(
                         db.and_(
@@ -2476,12 +2551,12 @@ def assign_pending_steps(self, concurrency_keys: Sequence[str]):
                         PendingStepsTable.c.priority.desc(),
                         PendingStepsTable.c.create_timestamp.asc(),
                     )
-                    .limit(1)
-                ).fetchone()
-                if row:
+                    .limit(count)
+                ).fetchall()
+                if rows:
                     conn.execute(
                         PendingStepsTable.update()
-                        .where(PendingStepsTable.c.id == row[0])
+                        .where(PendingStepsTable.c.id.in_([row[0] for row in rows]))
                         .values(assigned_timestamp=db.func.now())
                     )
 
@@ -2584,6 +2659,197 @@ def claim_concurrency_slot(
         )
         return claim_status.with_slot_status(slot_status)
 
+    def claim_concurrency_slots(
+        self, run_id: str, step_claims: Sequence[ConcurrencyStepClaim]
+    ) -> Mapping[str, ConcurrencyClaimStatus]:
+        """Claim concurrency slots for several steps of a run, using a fixed number of queries per
+        concurrency key rather than several queries per step.
+
+        Args:
+            run_id (str): The run id to claim slots for.
+            step_claims (Sequence[ConcurrencyStepClaim]): The steps to claim slots for.
+        """
+        if len(step_claims) <= 1:
+            return super().claim_concurrency_slots(run_id, step_claims)
+
+        step_keys = [step_claim.step_key for step_claim in step_claims]
+
+        # first, register the steps that are not yet in the pending queue, assigning as many of
+        # them as there are unassigned slots for their concurrency key
+        with self.index_connection() as conn:
+            registered = {
+                (cast(str, row[0]), cast(str, row[1]))
+                for row in conn.execute(
+                    db_select([PendingStepsTable.c.step_key, PendingStepsTable.c.concurrency_key])
+                    .select_from(PendingStepsTable)
+                    .where(
+                        db.and_(
+                            PendingStepsTable.c.run_id == run_id,
+                            PendingStepsTable.c.step_key.in_(step_keys),
+                        )
+                    )
+                ).fetchall()
+            }
+        to_register = [
+            step_claim
+            for step_claim in step_claims
+            if (step_claim.step_key, step_claim.concurrency_key) not in registered
+        ]
+        if to_register:
+            try:
+                self._add_pending_steps(run_id, to_register)
+            except db_exc.IntegrityError:
+                # some of the steps were registered concurrently, fall back to claiming one by one
+                return super().claim_concurrency_slots(run_id, step_claims)
+
+        with self.index_transaction() as conn:
+            pending_rows = {
+                (row["step_key"], row["concurrency_key"]): row
+                for row in db_fetch_mappings(
+                    conn,
+                    db_select(
+                        [
+                            PendingStepsTable.c.step_key,
+                            PendingStepsTable.c.concurrency_key,
+                            PendingStepsTable.c.assigned_timestamp,
+                            PendingStepsTable.c.priority,
+                            PendingStepsTable.c.create_timestamp,
+                        ]
+                    )
+                    .select_from(PendingStepsTable)
+                    .where(
+                        db.and_(
+                            PendingStepsTable.c.run_id == run_id,
+                            PendingStepsTable.c.step_key.in_(step_keys),
+                        )
+                    ),
+                )
+            }
+            claimed = {
+                (cast(str, row[0]), cast(str, row[1]))
+                for row in conn.execute(
+                    db_select(
+                        [ConcurrencySlotsTable.c.step_key, ConcurrencySlotsTable.c.concurrency_key]
+                    )
+                    .select_from(ConcurrencySlotsTable)
+                    .where(
+                        db.and_(
+                            ConcurrencySlotsTable.c.run_id == run_id,
+                            ConcurrencySlotsTable.c.step_key.in_(step_keys),
+                        )
+                    )
+                ).fetchall()
+            }
+
+            # claim slots for the assigned steps that do not hold one yet, taking as many free slot
+            # rows as needed for each concurrency key in one locking query
+            to_claim: Dict[str, List[str]] = defaultdict(list)
+            for step_claim in step_claims:
+                claim_key = (step_claim.step_key, step_claim.concurrency_key)
+                row = pending_rows.get(claim_key)
+                if row and row["assigned_timestamp"] and claim_key not in claimed:
+                    to_claim[step_claim.concurrency_key].append(step_claim.step_key)
+
+            for concurrency_key, claim_step_keys in to_claim.items():
+                slot_rows = conn.execute(
+                    db_select([ConcurrencySlotsTable.c.id])
+                    .select_from(ConcurrencySlotsTable)
+                    .where(
+                        db.and_(
+                            ConcurrencySlotsTable.c.concurrency_key == concurrency_key,
+                            ConcurrencySlotsTable.c.step_key == None,  # noqa: E711
+                            ConcurrencySlotsTable.c.deleted == False,  # noqa: E712
+                        )
+                    )
+                    .with_for_update(skip_locked=True)
+                    .limit(len(claim_step_keys))
+                ).fetchall()
+                for slot_row, step_key in zip(slot_rows, claim_step_keys):
+                    if conn.execute(
+                        ConcurrencySlotsTable.update()
+                        .values(run_id=run_id, step_key=step_key)
+                        .where(ConcurrencySlotsTable.c.id == slot_row[0])
+                    ).rowcount:
+                        claimed.add((step_key, concurrency_key))
+
+        claim_statuses = {}
+        for step_claim in step_claims:
+            claim_key = (step_claim.step_key, step_claim.concurrency_key)
+            row = pending_rows.get(claim_key)
+            claim_statuses[step_claim.step_key] = ConcurrencyClaimStatus(
+                concurrency_key=step_claim.concurrency_key,
+                slot_status=(
+                    ConcurrencySlotStatus.CLAIMED
+                    if row and row["assigned_timestamp"] and claim_key in claimed
+                    else ConcurrencySlotStatus.BLOCKED
+                ),
+                priority=cast(int, row["priority"]) if row and row["priority"] else None,
+                assigned_timestamp=(
+                    cast(datetime, row["assigned_timestamp"])
+                    if row and row["assigned_timestamp"]
+                    else None
+                ),
+                enqueued_timestamp=(
+                    cast(datetime, row["create_timestamp"])
+                    if row and row["create_timestamp"]
+                    else None
+                ),
+            )
+        return claim_statuses
+
+    def _add_pending_steps(self, run_id: str, step_claims: Sequence[ConcurrencyStepClaim]) -> None:
+        concurrency_keys = {step_claim.concurrency_key for step_claim in step_claims}
+        with self.index_connection() as conn:
+            slot_counts = {
+                cast(str, row[0]): cast(int, row[1])
+                for row in conn.execute(
+                    db_select([ConcurrencySlotsTable.c.concurrency_key, db.func.count()])
+                    .select_from(ConcurrencySlotsTable)
+                    .where(
+                        db.and_(
+                            ConcurrencySlotsTable.c.concurrency_key.in_(concurrency_keys),
+                            ConcurrencySlotsTable.c.deleted == False,  # noqa: E712
+                        )
+                    )
+                    .group_by(ConcurrencySlotsTable.c.concurrency_key)
+                ).fetchall()
+            }
+            assigned_counts = {
+                cast(str, row[0]): cast(int, row[1])
+                for row in conn.execute(
+                    db_select([PendingStepsTable.c.concurrency_key, db.func.count()])
+                    .select_from(PendingStepsTable)
+                    .where(
+                        db.and_(
+                            PendingStepsTable.c.concurrency_key.in_(concurrency_keys),
+                            PendingStepsTable.c.assigned_timestamp != None,  # noqa: E711
+                        )
+                    )
+                    .group_by(PendingStepsTable.c.concurrency_key)
+                ).fetchall()
+            }
+            unassigned_counts = {
+                key: slot_counts.get(key, 0) - assigned_counts.get(key, 0)
+                for key in concurrency_keys
+            }
+
+            rows = []
+            # the highest priority steps are assigned first, ties broken by the order requested
+            for step_claim in sorted(step_claims, key=lambda c: -(c.priority or 0)):
+                should_assign = unassigned_counts[step_claim.concurrency_key] > 0
+                if should_assign:
+                    unassigned_counts[step_claim.concurrency_key] -= 1
+                rows.append(
+                    dict(
+                        run_id=run_id,
+                        step_key=step_claim.step_key,
+                        concurrency_key=step_claim.concurrency_key,
+                        priority=step_claim.priority or 0,
+                        assigned_timestamp=db.func.now() if should_assign else None,
+                    )
+                )
+            conn.execute(PendingStepsTable.insert().values(rows))
+
     def _claim_concurrency_slot(
         self, concurrency_key: str, run_id: str, step_key: str
     ) -> ConcurrencySlotStatus:
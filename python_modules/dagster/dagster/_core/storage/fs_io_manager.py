@@ -1,6 +1,8 @@
 import os
 import pickle
-from typing import TYPE_CHECKING, Any, Optional
+import sys
+import uuid
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 
 from pydantic import Field
 
@@ -22,9 +24,17 @@
 from dagster._utils import PICKLE_PROTOCOL, mkdir_p
 
 if TYPE_CHECKING:
+    import pyarrow
     from typing_extensions import Literal
     from upath import UPath
 
+# Arrow IPC files start with this magic string, which cannot be the start of a pickle
+ARROW_IPC_MAGIC = b"ARROW1"
+
+# key in the schema metadata of Arrow IPC files written by the filesystem IO manager, recording the
+# type of the object that was written so that the same type can be loaded
+ARROW_IPC_PYTHON_TYPE_METADATA_KEY = b"dagster_python_type"
+
 
 class FilesystemIOManager(ConfigurableIOManagerFactory["PickledObjectFilesystemIOManager"]):
     """Built-in filesystem IO manager that stores and retrieves values using pickling.
@@ -48,6 +58,11 @@ class FilesystemIOManager(ConfigurableIOManagerFactory["PickledObjectFilesystemI
     `AssetKey(["one", "two", "three"])` would be stored in a file called "three" in a directory
     with path "/my/base/path/one/two/".
 
+    If "use_arrow_ipc" is set, pandas and polars DataFrames and Arrow tables are stored as Arrow IPC
+    (Feather) files instead of being pickled, and are loaded by memory-mapping the file, so that
+    passing them between steps avoids a full copy of the data. Other objects are still pickled.
+    Requires ``pyarrow``.
+
     Example usage:
 
 
@@ -122,6 +137,13 @@ def job():
     """
 
     base_dir: Optional[str] = Field(default=None, description="Base directory for storing files.")
+    use_arrow_ipc: bool = Field(
+        default=False,
+        description=(
+            "Store DataFrames and Arrow tables as Arrow IPC files, which are memory-mapped when"
+            " loaded, instead of pickling them. Requires pyarrow."
+        ),
+    )
 
     @classmethod
     def _is_dagster_maintained(cls) -> bool:
@@ -129,7 +151,7 @@ def _is_dagster_maintained(cls) -> bool:
 
     def create_io_manager(self, context: InitResourceContext) -> "PickledObjectFilesystemIOManager":
         base_dir = self.base_dir or check.not_none(context.instance).storage_directory()
-        return PickledObjectFilesystemIOManager(base_dir=base_dir)
+        return PickledObjectFilesystemIOManager(base_dir=base_dir, use_arrow_ipc=self.use_arrow_ipc)
 
 
 @dagster_maintained_io_manager
@@ -242,19 +264,28 @@ class PickledObjectFilesystemIOManager(UPathIOManager):
     Args:
         base_dir (Optional[str]): base directory where all the step outputs which use this object
             manager will be stored in.
+        use_arrow_ipc (bool): whether to store DataFrames and Arrow tables as Arrow IPC files,
+            which are memory-mapped when loaded, instead of pickling them.
         **kwargs: additional keyword arguments for `universal_pathlib.UPath`.
     """
 
     extension: str = ""  # TODO: maybe change this to .pickle? Leaving blank for compatibility.
 
-    def __init__(self, base_dir=None, **kwargs):
+    def __init__(self, base_dir=None, use_arrow_ipc: bool = False, **kwargs):
         from upath import UPath
 
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
+        self.use_arrow_ipc = check.bool_param(use_arrow_ipc, "use_arrow_ipc")
 
         super().__init__(base_path=UPath(base_dir, **kwargs))
 
     def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
+        if self.use_arrow_ipc:
+            arrow_table = _to_arrow_table(obj)
+            if arrow_table is not None:
+                _write_arrow_ipc_file(path, *arrow_table)
+                return
+
         try:
             with path.open("wb") as file:
                 pickle.dump(obj, file, PICKLE_PROTOCOL)
@@ -281,7 +312,100 @@ def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
 
     def load_from_path(self, context: InputContext, path: "UPath") -> Any:
         with path.open("rb") as file:
-            return pickle.load(file)
+            # files are only written in the Arrow IPC format when it is enabled, but they are
+            # detected regardless so that outputs stay loadable if it is later disabled
+            if file.read(len(ARROW_IPC_MAGIC)) != ARROW_IPC_MAGIC:
+                file.seek(0)
+                return pickle.load(file)
+
+        return _load_arrow_ipc_file(path)
+
+
+def _to_arrow_table(obj: Any) -> Optional[Tuple["pyarrow.Table", str]]:
+    """Converts pandas and polars DataFrames and Arrow tables and record batches to an Arrow table,
+    along with the name of the type of the object. Returns None for other objects, or if they cannot
+    be converted.
+    """
+    # avoid importing any of these libraries unless the object could be one of their types
+    if not any(module in sys.modules for module in ("pyarrow", "pandas", "polars")):
+        return None
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+
+    pd = sys.modules.get("pandas")
+    pl = sys.modules.get("polars")
+    try:
+        if isinstance(obj, pa.Table):
+            return obj, "pyarrow.Table"
+        elif isinstance(obj, pa.RecordBatch):
+            return pa.Table.from_batches([obj]), "pyarrow.RecordBatch"
+        elif pd is not None and isinstance(obj, pd.DataFrame):
+            return pa.Table.from_pandas(obj), "pandas.DataFrame"
+        elif pl is not None and isinstance(obj, pl.DataFrame):
+            return obj.to_arrow(), "polars.DataFrame"
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        # e.g. object columns with mixed types, which can still be pickled
+        return None
+
+    return None
+
+
+def _write_arrow_ipc_file(path: "UPath", table: "pyarrow.Table", python_type: str) -> None:
+    import pyarrow as pa
+
+    table = table.replace_schema_metadata(
+        {
+            **(table.schema.metadata or {}),
+            ARROW_IPC_PYTHON_TYPE_METADATA_KEY: python_type.encode(),
+        }
+    )
+    if getattr(path, "protocol", None):
+        with path.open("wb") as file, pa.ipc.new_file(file, table.schema) as writer:
+            writer.write_table(table)
+        return
+
+    # A previous version of a local file may still be memory-mapped by the values loaded from it,
+    # and truncating a mapped file makes reading it crash the process. So the file is written next
+    # to the target and then swapped in, which leaves the mapped pages of the old file intact.
+    temp_path = f"{os.fspath(path)}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(temp_path, "xb") as file, pa.ipc.new_file(file, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(temp_path, os.fspath(path))
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _load_arrow_ipc_file(path: "UPath") -> Any:
+    import pyarrow as pa
+
+    if not getattr(path, "protocol", None):
+        # local files are memory-mapped, so the loaded table references the file's pages instead of
+        # a copy of the data
+        table = pa.ipc.open_file(pa.memory_map(os.fspath(path))).read_all()
+    else:
+        with path.open("rb") as file:
+            table = pa.ipc.open_file(file).read_all()
+
+    metadata = dict(table.schema.metadata or {})
+    python_type = metadata.pop(ARROW_IPC_PYTHON_TYPE_METADATA_KEY, b"pyarrow.Table").decode()
+    table = table.replace_schema_metadata(metadata or None)
+
+    if python_type == "pandas.DataFrame":
+        return table.to_pandas(split_blocks=True)
+    elif python_type == "polars.DataFrame":
+        import polars as pl
+
+        return pl.from_arrow(table)
+    elif python_type == "pyarrow.RecordBatch":
+        batches = table.combine_chunks().to_batches()
+        return batches[0] if batches else pa.RecordBatch.from_pylist([], schema=table.schema)
+    return table
 
 
 class CustomPathPickledObjectFilesystemIOManager(IOManager):
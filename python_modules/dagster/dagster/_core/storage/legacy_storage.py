@@ -12,7 +12,11 @@
 from dagster._core.storage.event_log.base import AssetCheckSummaryRecord
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._utils import PrintFn
-from dagster._utils.concurrency import ConcurrencyClaimStatus, ConcurrencyKeyInfo
+from dagster._utils.concurrency import (
+    ConcurrencyClaimStatus,
+    ConcurrencyKeyInfo,
+    ConcurrencyStepClaim,
+)
 
 from .base_storage import DagsterStorage
 from .event_log.base import (
@@ -187,6 +191,9 @@ def from_config_value(
     def add_run(self, dagster_run: "DagsterRun") -> "DagsterRun":
         return self._storage.run_storage.add_run(dagster_run)
 
+    def add_runs(self, dagster_runs: Sequence["DagsterRun"]) -> Sequence["DagsterRun"]:
+        return self._storage.run_storage.add_runs(dagster_runs)
+
     def handle_run_event(self, run_id: str, event: "DagsterEvent") -> None:
         return self._storage.run_storage.handle_run_event(run_id, event)
 
@@ -244,6 +251,17 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]):
     def has_run(self, run_id: str) -> bool:
         return self._storage.run_storage.has_run(run_id)
 
+    @property
+    def supports_run_key_index(self) -> bool:
+        return self._storage.run_storage.supports_run_key_index
+
+    def get_run_ids_by_run_key(
+        self, selector_id: str, run_keys: Sequence[str], instigator_name: Optional[str] = None
+    ) -> Mapping[str, str]:
+        return self._storage.run_storage.get_run_ids_by_run_key(
+            selector_id, run_keys, instigator_name
+        )
+
     def add_snapshot(
         self,
         snapshot: Union["JobSnapshot", "ExecutionPlanSnapshot"],
@@ -460,6 +478,18 @@ def fetch_materializations(
             filters, limit, cursor, ascending
         )
 
+    def fetch_materializations_for_asset_keys(
+        self,
+        asset_keys: Sequence["AssetKey"],
+        limit: int,
+        cursor: Optional[str] = None,
+        storage_ids: Optional[Sequence[int]] = None,
+        after_storage_id_by_key: Optional[Mapping["AssetKey", int]] = None,
+    ) -> EventRecordsResult:
+        return self._storage.event_log_storage.fetch_materializations_for_asset_keys(
+            asset_keys, limit, cursor, storage_ids, after_storage_id_by_key
+        )
+
     def fetch_observations(
         self,
         filters: Union[AssetKey, "AssetRecordsFilter"],
@@ -653,6 +683,11 @@ def claim_concurrency_slot(
             concurrency_key, run_id, step_key, priority
         )
 
+    def claim_concurrency_slots(
+        self, run_id: str, step_claims: Sequence[ConcurrencyStepClaim]
+    ) -> Mapping[str, ConcurrencyClaimStatus]:
+        return self._storage.event_log_storage.claim_concurrency_slots(run_id, step_claims)
+
     def check_concurrency_claim(self, concurrency_key: str, run_id: str, step_key: str):
         return self._storage.event_log_storage.check_concurrency_claim(
             concurrency_key, run_id, step_key
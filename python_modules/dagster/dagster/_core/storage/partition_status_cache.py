@@ -1,5 +1,17 @@
+from collections import defaultdict
 from enum import Enum
-from typing import TYPE_CHECKING, List, NamedTuple, Optional, Sequence, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from dagster import (
     AssetKey,
@@ -67,6 +79,84 @@ def is_cacheable_partition_type(partitions_def: PartitionsDefinition) -> bool:
     )
 
 
+@whitelist_for_serdes
+class MultiPartitionStatusRange(
+    NamedTuple(
+        "_MultiPartitionStatusRange",
+        [
+            ("primary_start_key", str),
+            ("primary_end_key", str),
+            ("serialized_materialized_secondary_subset", str),
+            ("serialized_failed_secondary_subset", str),
+            ("serialized_in_progress_secondary_subset", str),
+        ],
+    )
+):
+    """A run of consecutive primary dimension partition keys of a multi-partitioned asset that all
+    have the same materialized, failed and in progress partitions in the secondary dimension.
+    """
+
+    def __new__(
+        cls,
+        primary_start_key: str,
+        primary_end_key: str,
+        serialized_materialized_secondary_subset: str,
+        serialized_failed_secondary_subset: str,
+        serialized_in_progress_secondary_subset: str,
+    ):
+        return super(MultiPartitionStatusRange, cls).__new__(
+            cls,
+            check.str_param(primary_start_key, "primary_start_key"),
+            check.str_param(primary_end_key, "primary_end_key"),
+            check.str_param(
+                serialized_materialized_secondary_subset,
+                "serialized_materialized_secondary_subset",
+            ),
+            check.str_param(
+                serialized_failed_secondary_subset, "serialized_failed_secondary_subset"
+            ),
+            check.str_param(
+                serialized_in_progress_secondary_subset, "serialized_in_progress_secondary_subset"
+            ),
+        )
+
+    def deserialize_secondary_subsets(
+        self, partitions_def: MultiPartitionsDefinition
+    ) -> Tuple[PartitionsSubset, PartitionsSubset, PartitionsSubset]:
+        """Returns the materialized, failed and in progress subsets of the secondary dimension."""
+        secondary_partitions_def = partitions_def.secondary_dimension.partitions_def
+        return (
+            secondary_partitions_def.deserialize_subset(
+                self.serialized_materialized_secondary_subset
+            ),
+            secondary_partitions_def.deserialize_subset(self.serialized_failed_secondary_subset),
+            secondary_partitions_def.deserialize_subset(
+                self.serialized_in_progress_secondary_subset
+            ),
+        )
+
+
+@whitelist_for_serdes
+class MultiPartitionStatusRollup(
+    NamedTuple(
+        "_MultiPartitionStatusRollup",
+        [("ranges", Sequence[MultiPartitionStatusRange])],
+    )
+):
+    """The partition statuses of a multi-partitioned asset, run-length encoded over the primary
+    dimension. Only ranges with at least one materialized, failed or in progress partition are
+    included, in the order of the primary dimension partition keys.
+
+    This is kept alongside the partition subsets in the asset status cache so that the partition
+    statuses of an asset can be displayed without visiting every partition key in the asset.
+    """
+
+    def __new__(cls, ranges: Sequence[MultiPartitionStatusRange]):
+        return super(MultiPartitionStatusRollup, cls).__new__(
+            cls, check.sequence_param(ranges, "ranges", of_type=MultiPartitionStatusRange)
+        )
+
+
 @whitelist_for_serdes
 class AssetStatusCacheValue(
     NamedTuple(
@@ -78,6 +168,7 @@ class AssetStatusCacheValue(
             ("serialized_failed_partition_subset", Optional[str]),
             ("serialized_in_progress_partition_subset", Optional[str]),
             ("earliest_in_progress_materialization_event_id", Optional[int]),
+            ("multi_partition_status_rollup", Optional[MultiPartitionStatusRollup]),
         ],
     )
 ):
@@ -99,6 +190,9 @@ class AssetStatusCacheValue(
         earliest_in_progress_materialization_event_id (Optional(int)): The event id of the earliest
             materialization planned event for a run that is still in progress. This is used to check
             on the status of runs that are still in progress.
+        multi_partition_status_rollup (Optional(MultiPartitionStatusRollup)): The partition
+            statuses run-length encoded over the primary dimension, up to the latest storage id.
+            None if the asset is not multi-partitioned.
     """
 
     def __new__(
@@ -109,6 +203,7 @@ def __new__(
         serialized_failed_partition_subset: Optional[str] = None,
         serialized_in_progress_partition_subset: Optional[str] = None,
         earliest_in_progress_materialization_event_id: Optional[int] = None,
+        multi_partition_status_rollup: Optional[MultiPartitionStatusRollup] = None,
     ):
         check.int_param(latest_storage_id, "latest_storage_id")
         check.opt_str_param(partitions_def_id, "partitions_def_id")
@@ -129,6 +224,11 @@ def __new__(
             serialized_failed_partition_subset,
             serialized_in_progress_partition_subset,
             earliest_in_progress_materialization_event_id,
+            check.opt_inst_param(
+                multi_partition_status_rollup,
+                "multi_partition_status_rollup",
+                MultiPartitionStatusRollup,
+            ),
         )
 
     @staticmethod
@@ -240,6 +340,169 @@ def get_last_planned_storage_id(
     return info.storage_id
 
 
+_SecondaryStatusSubsets = Tuple[PartitionsSubset, PartitionsSubset, PartitionsSubset]
+
+
+def _get_secondary_keys_by_primary_key(
+    partitions_def: MultiPartitionsDefinition, partition_keys: Iterable[str]
+) -> Mapping[str, Set[str]]:
+    primary_dimension_name = partitions_def.primary_dimension.name
+    secondary_dimension_name = partitions_def.secondary_dimension.name
+
+    secondary_keys_by_primary_key: Dict[str, Set[str]] = defaultdict(set)
+    for partition_key in partition_keys:
+        multi_partition_key = (
+            partition_key
+            if isinstance(partition_key, MultiPartitionKey)
+            else partitions_def.get_partition_key_from_str(partition_key)
+        )
+        keys_by_dimension = multi_partition_key.keys_by_dimension
+        secondary_keys_by_primary_key[keys_by_dimension[primary_dimension_name]].add(
+            keys_by_dimension[secondary_dimension_name]
+        )
+    return secondary_keys_by_primary_key
+
+
+def _expand_multi_partition_status_rollup(
+    rollup: MultiPartitionStatusRollup,
+    partitions_def: MultiPartitionsDefinition,
+    primary_keys: Sequence[str],
+) -> Optional[Dict[str, _SecondaryStatusSubsets]]:
+    index_by_primary_key = {primary_key: idx for idx, primary_key in enumerate(primary_keys)}
+
+    statuses_by_primary_key: Dict[str, _SecondaryStatusSubsets] = {}
+    for status_range in rollup.ranges:
+        start_idx = index_by_primary_key.get(status_range.primary_start_key)
+        end_idx = index_by_primary_key.get(status_range.primary_end_key)
+        if start_idx is None or end_idx is None or end_idx < start_idx:
+            # the primary dimension no longer lines up with the stored ranges
+            return None
+
+        # every primary key in the range shares the same deserialized subsets
+        statuses = status_range.deserialize_secondary_subsets(partitions_def)
+        for primary_key in primary_keys[start_idx : end_idx + 1]:
+            statuses_by_primary_key[primary_key] = statuses
+    return statuses_by_primary_key
+
+
+def build_multi_partition_status_rollup(
+    partitions_def: MultiPartitionsDefinition,
+    dynamic_partitions_store: DynamicPartitionsStore,
+    materialized_subset: PartitionsSubset,
+    failed_subset: PartitionsSubset,
+    in_progress_subset: PartitionsSubset,
+    stored_rollup: Optional[MultiPartitionStatusRollup] = None,
+    new_materialized_partition_keys: Optional[Iterable[str]] = None,
+) -> MultiPartitionStatusRollup:
+    """Run-length encodes the partition statuses of a multi-partitioned asset over its primary
+    dimension.
+
+    When a previously stored rollup is provided along with the partition keys materialized since
+    it was built, the rollup is updated incrementally: only the primary keys of the newly
+    materialized partitions are updated with the materialized subset, so the full materialized
+    subset is never visited. The failed and in progress subsets are always read in full.
+    """
+    check.inst_param(partitions_def, "partitions_def", MultiPartitionsDefinition)
+    check.opt_inst_param(stored_rollup, "stored_rollup", MultiPartitionStatusRollup)
+
+    secondary_partitions_def = partitions_def.secondary_dimension.partitions_def
+    empty_subset = secondary_partitions_def.empty_subset()
+    primary_keys = partitions_def.primary_dimension.partitions_def.get_partition_keys(
+        dynamic_partitions_store=dynamic_partitions_store
+    )
+
+    statuses_by_primary_key = (
+        _expand_multi_partition_status_rollup(stored_rollup, partitions_def, primary_keys)
+        if stored_rollup is not None and new_materialized_partition_keys is not None
+        else None
+    )
+
+    if statuses_by_primary_key is None:
+        statuses_by_primary_key = {
+            primary_key: (
+                empty_subset.with_partition_keys(secondary_keys),
+                empty_subset,
+                empty_subset,
+            )
+            for primary_key, secondary_keys in _get_secondary_keys_by_primary_key(
+                partitions_def, materialized_subset.get_partition_keys()
+            ).items()
+        }
+    else:
+        for primary_key, secondary_keys in _get_secondary_keys_by_primary_key(
+            partitions_def, check.not_none(new_materialized_partition_keys)
+        ).items():
+            materialized, failed, in_progress = statuses_by_primary_key.get(
+                primary_key, (empty_subset, empty_subset, empty_subset)
+            )
+            statuses_by_primary_key[primary_key] = (
+                materialized.with_partition_keys(secondary_keys),
+                failed,
+                in_progress,
+            )
+
+        # the failed and in progress partitions are rebuilt from their subsets below
+        for primary_key, (materialized, failed, in_progress) in list(
+            statuses_by_primary_key.items()
+        ):
+            if len(failed) > 0 or len(in_progress) > 0:
+                statuses_by_primary_key[primary_key] = (materialized, empty_subset, empty_subset)
+
+    failed_keys_by_primary_key = _get_secondary_keys_by_primary_key(
+        partitions_def, failed_subset.get_partition_keys()
+    )
+    in_progress_keys_by_primary_key = _get_secondary_keys_by_primary_key(
+        partitions_def, in_progress_subset.get_partition_keys()
+    )
+    for primary_key in failed_keys_by_primary_key.keys() | in_progress_keys_by_primary_key.keys():
+        materialized, _, _ = statuses_by_primary_key.get(
+            primary_key, (empty_subset, empty_subset, empty_subset)
+        )
+        statuses_by_primary_key[primary_key] = (
+            materialized,
+            empty_subset.with_partition_keys(failed_keys_by_primary_key.get(primary_key, set())),
+            empty_subset.with_partition_keys(
+                in_progress_keys_by_primary_key.get(primary_key, set())
+            ),
+        )
+
+    ranges: List[MultiPartitionStatusRange] = []
+    range_start_key: Optional[str] = None
+    range_end_key: Optional[str] = None
+    range_statuses: Optional[_SecondaryStatusSubsets] = None
+
+    def _close_range() -> None:
+        if range_statuses is None:
+            return
+        materialized, failed, in_progress = range_statuses
+        ranges.append(
+            MultiPartitionStatusRange(
+                primary_start_key=check.not_none(range_start_key),
+                primary_end_key=check.not_none(range_end_key),
+                serialized_materialized_secondary_subset=materialized.serialize(),
+                serialized_failed_secondary_subset=failed.serialize(),
+                serialized_in_progress_secondary_subset=in_progress.serialize(),
+            )
+        )
+
+    for primary_key in primary_keys:
+        statuses = statuses_by_primary_key.get(primary_key)
+        if statuses is not None and not any(len(subset) > 0 for subset in statuses):
+            statuses = None
+
+        if statuses is not None and (statuses is range_statuses or statuses == range_statuses):
+            range_end_key = primary_key
+            continue
+
+        _close_range()
+        range_start_key = range_end_key = primary_key
+        range_statuses = statuses
+
+    _close_range()
+
+    return MultiPartitionStatusRollup(ranges=ranges)
+
+
 def _build_status_cache(
     instance: DagsterInstance,
     asset_key: AssetKey,
@@ -285,6 +548,7 @@ def _build_status_cache(
         else None
     )
 
+    new_partitions: Optional[Set[str]] = None
     if stored_cache_value:
         # fetch the incremental new materialized partitions, and update the cached materialized
         # subset
@@ -340,15 +604,45 @@ def _build_status_cache(
         after_storage_id=cached_in_progress_cursor,
     )
 
+    serialized_failed_partition_subset = failed_subset.serialize()
+    serialized_in_progress_partition_subset = in_progress_subset.serialize()
+
+    multi_partition_status_rollup = None
+    if isinstance(partitions_def, MultiPartitionsDefinition):
+        stored_rollup = (
+            stored_cache_value.multi_partition_status_rollup if stored_cache_value else None
+        )
+        if (
+            stored_rollup is not None
+            and stored_cache_value is not None
+            and not new_partitions
+            and serialized_failed_partition_subset
+            == stored_cache_value.serialized_failed_partition_subset
+            and serialized_in_progress_partition_subset
+            == stored_cache_value.serialized_in_progress_partition_subset
+        ):
+            multi_partition_status_rollup = stored_rollup
+        else:
+            multi_partition_status_rollup = build_multi_partition_status_rollup(
+                partitions_def,
+                dynamic_partitions_store,
+                materialized_subset,
+                failed_subset,
+                in_progress_subset,
+                stored_rollup=stored_rollup,
+                new_materialized_partition_keys=new_partitions,
+            )
+
     return AssetStatusCacheValue(
         latest_storage_id=latest_storage_id,
         partitions_def_id=partitions_def.get_serializable_unique_identifier(
             dynamic_partitions_store=dynamic_partitions_store
         ),
         serialized_materialized_partition_subset=materialized_subset.serialize(),
-        serialized_failed_partition_subset=failed_subset.serialize(),
-        serialized_in_progress_partition_subset=in_progress_subset.serialize(),
+        serialized_failed_partition_subset=serialized_failed_partition_subset,
+        serialized_in_progress_partition_subset=serialized_in_progress_partition_subset,
         earliest_in_progress_materialization_event_id=earliest_in_progress_materialization_event_id,
+        multi_partition_status_rollup=multi_partition_status_rollup,
     )
 
 
@@ -54,6 +54,17 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
             dagster_run (DagsterRun): The run to add.
         """
 
+    def add_runs(self, dagster_runs: Sequence[DagsterRun]) -> Sequence[DagsterRun]:
+        """Add several runs to storage, in a single batch where the storage supports it.
+
+        Raises DagsterRunAlreadyExists or DagsterSnapshotDoesNotExist under the same conditions as
+        `add_run`.
+
+        Args:
+            dagster_runs (Sequence[DagsterRun]): The runs to add.
+        """
+        return [self.add_run(dagster_run) for dagster_run in dagster_runs]
+
     @abstractmethod
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
         """Update run storage in accordance to a pipeline run related DagsterEvent.
@@ -203,6 +214,31 @@ def has_run(self, run_id: str) -> bool:
             bool
         """
 
+    @property
+    def supports_run_key_index(self) -> bool:
+        """Whether `get_run_ids_by_run_key` can be used to look up the runs launched by sensors
+        and schedules.
+        """
+        return False
+
+    def get_run_ids_by_run_key(
+        self, selector_id: str, run_keys: Sequence[str], instigator_name: Optional[str] = None
+    ) -> Mapping[str, str]:
+        """Look up which of the given run keys already have runs for a sensor or schedule. See
+        `DagsterRun.get_run_key_index_entry` for how runs are indexed.
+
+        Args:
+            selector_id (str): The selector id of the sensor or schedule
+            run_keys (Sequence[str]): The run keys to look up
+            instigator_name (Optional[str]): The name of the sensor or schedule. If set, runs with
+                no job origin that were launched by a sensor or schedule with this name also match.
+
+        Returns:
+            Mapping[str, str]: The id of the most recently created run for each run key that has
+                one.
+        """
+        raise NotImplementedError()
+
     def add_snapshot(
         self,
         snapshot: Union[JobSnapshot, ExecutionPlanSnapshot],
@@ -21,6 +21,7 @@ class InMemoryRunStorage(SqlRunStorage):
     """
 
     def __init__(self, preload: Optional[Sequence[DebugRunPayload]] = None):
+        super().__init__()
         self._engine = create_engine(
             create_in_memory_conn_string(f"runs-{uuid.uuid4()}"),
             poolclass=NullPool,
@@ -76,6 +76,23 @@
     db.Column("value", db.Text),
 )
 
+# Index of the runs launched by sensors (with run keys) and schedules, used by the daemons to
+# check whether the runs requested by a tick have already been created
+RunKeysTable = db.Table(
+    "run_keys",
+    RunStorageSqlMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("selector_id", db.String(255), nullable=False),
+    db.Column("run_key", db.Text, nullable=False),
+    db.Column("run_id", None, db.ForeignKey("runs.run_id", ondelete="CASCADE"), nullable=False),
+    db.Column("create_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
+)
+
 SnapshotsTable = db.Table(
     "snapshots",
     RunStorageSqlMetadata,
@@ -151,6 +168,13 @@
 db.Index(
     "idx_run_tags_run_idx", RunTagsTable.c.run_id, RunTagsTable.c.id, mysql_length={"run_id": 255}
 )
+db.Index(
+    "idx_run_keys",
+    RunKeysTable.c.selector_id,
+    RunKeysTable.c.run_key,
+    mysql_length={"selector_id": 64, "run_key": 255},
+)
+db.Index("idx_run_keys_run_id", RunKeysTable.c.run_id, mysql_length={"run_id": 255})
 db.Index("idx_run_partitions", RunsTable.c.partition_set, RunsTable.c.partition, mysql_length=64)
 db.Index(
     "idx_runs_by_job",
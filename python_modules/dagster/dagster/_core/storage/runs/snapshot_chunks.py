@@ -0,0 +1,117 @@
+"""Structurally-shared storage for job and execution plan snapshots.
+
+A snapshot is stored as a manifest: its serialized form, in which every serialized object (e.g.
+an op definition, a dagster type or a config type snapshot) whose encoding is at least
+`min_chunk_size` characters long has been replaced by a reference to a content-addressed chunk.
+Chunks are split bottom-up, so chunks may themselves reference other chunks. Since identical
+objects hash to the same chunk, successive versions of a large job only store the chunks for the
+parts of the job that changed.
+"""
+
+import hashlib
+from typing import AbstractSet, Any, Callable, Dict, Mapping, Set, Tuple
+
+from dagster import _seven as seven
+
+SNAPSHOT_MANIFEST_KEY = "__snapshot_manifest__"
+SNAPSHOT_CHUNK_REF_KEY = "__snapshot_chunk__"
+
+# prefix of the serialized form of a manifest, used to tell manifests apart from whole snapshots
+SNAPSHOT_MANIFEST_PREFIX = f'{{"{SNAPSHOT_MANIFEST_KEY}"'
+
+DEFAULT_MIN_CHUNK_SIZE = 256
+
+
+def _encode(value: Any) -> str:
+    return seven.json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def split_snapshot(
+    serialized_snapshot: str, min_chunk_size: int = DEFAULT_MIN_CHUNK_SIZE
+) -> Tuple[str, Mapping[str, str]]:
+    """Split a serialized snapshot into a serialized manifest and a mapping of chunk ids to
+    serialized chunks.
+    """
+    chunks: Dict[str, str] = {}
+
+    def _split(value: Any) -> Any:
+        if isinstance(value, list):
+            return [_split(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+
+        value = {key: _split(item) for key, item in value.items()}
+        if "__class__" not in value:
+            return value
+
+        encoded = _encode(value)
+        if len(encoded) < min_chunk_size:
+            return value
+
+        chunk_id = hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+        chunks[chunk_id] = encoded
+        return {SNAPSHOT_CHUNK_REF_KEY: chunk_id}
+
+    packed = seven.json.loads(serialized_snapshot)
+    # the snapshot object itself is never chunked, so that its manifest is self-describing
+    manifest = {key: _split(item) for key, item in packed.items()}
+    return _encode({SNAPSHOT_MANIFEST_KEY: manifest}), chunks
+
+
+def is_snapshot_manifest(serialized: str) -> bool:
+    return serialized.startswith(SNAPSHOT_MANIFEST_PREFIX)
+
+
+def get_chunk_refs(value: Any) -> Set[str]:
+    refs: Set[str] = set()
+
+    def _collect(value: Any) -> None:
+        if isinstance(value, list):
+            for item in value:
+                _collect(item)
+        elif isinstance(value, dict):
+            if SNAPSHOT_CHUNK_REF_KEY in value:
+                refs.add(value[SNAPSHOT_CHUNK_REF_KEY])
+            else:
+                for item in value.values():
+                    _collect(item)
+
+    _collect(value)
+    return refs
+
+
+def assemble_snapshot(
+    serialized_manifest: str,
+    load_chunks: Callable[[AbstractSet[str]], Mapping[str, str]],
+) -> str:
+    """Reassemble the serialized snapshot for a serialized manifest, loading the chunks it
+    references (one call to `load_chunks` per level of nesting).
+
+    Raises a KeyError if a referenced chunk cannot be loaded.
+    """
+    manifest = seven.json.loads(serialized_manifest)[SNAPSHOT_MANIFEST_KEY]
+    chunks: Dict[str, Any] = {}
+    pending = get_chunk_refs(manifest)
+    while pending:
+        loaded = load_chunks(pending)
+        missing = pending - loaded.keys()
+        if missing:
+            raise KeyError(f"Missing snapshot chunks: {sorted(missing)}")
+
+        next_pending: Set[str] = set()
+        for chunk_id, encoded in loaded.items():
+            chunk = seven.json.loads(encoded)
+            chunks[chunk_id] = chunk
+            next_pending.update(get_chunk_refs(chunk))
+        pending = next_pending - chunks.keys()
+
+    def _resolve(value: Any) -> Any:
+        if isinstance(value, list):
+            return [_resolve(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if SNAPSHOT_CHUNK_REF_KEY in value:
+            return _resolve(chunks[value[SNAPSHOT_CHUNK_REF_KEY]])
+        return {key: _resolve(item) for key, item in value.items()}
+
+    return seven.json.dumps(_resolve(manifest))
@@ -1,16 +1,20 @@
 import logging
+import os
 import uuid
 import zlib
 from abc import abstractmethod
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
 from typing import (
+    AbstractSet,
     Any,
     Callable,
     ContextManager,
     Dict,
     Iterable,
+    Iterator,
     Mapping,
     NamedTuple,
     Optional,
@@ -66,6 +70,8 @@
 from dagster._seven import JSONDecodeError
 from dagster._time import datetime_from_timestamp, get_current_datetime, utc_datetime_from_naive
 from dagster._utils import PrintFn
+from dagster._utils.env import get_boolean_env_var
+from dagster._utils.lru_cache import LRUCache
 from dagster._utils.merger import merge_dicts
 
 from ..dagster_run import (
@@ -81,29 +87,62 @@
 from .migration import (
     OPTIONAL_DATA_MIGRATIONS,
     REQUIRED_DATA_MIGRATIONS,
+    RUN_KEYS,
     RUN_PARTITIONS,
     MigrationFn,
+    write_run_key,
 )
 from .schema import (
     BulkActionsTable,
     DaemonHeartbeatsTable,
     InstanceInfo,
     KeyValueStoreTable,
+    RunKeysTable,
     RunsTable,
     RunTagsTable,
     SecondaryIndexMigrationTable,
     SnapshotsTable,
 )
+from .snapshot_chunks import assemble_snapshot, is_snapshot_manifest, split_snapshot
+
+# bound the number of parameters in each run key / snapshot lookup query
+RUN_KEY_QUERY_CHUNK_SIZE = 500
+SNAPSHOT_QUERY_CHUNK_SIZE = 500
+
+# number of times to retry storing a chunked snapshot when another process stores some of the same
+# chunks concurrently
+SNAPSHOT_INSERT_ATTEMPTS = 3
+
+
+# Number of decoded job and execution plan snapshots to keep in memory, keyed on snapshot id.
+# Snapshots are immutable once written, so entries never need to be invalidated. Set to 0 to
+# disable the cache.
+SNAPSHOT_CACHE_SIZE = int(os.getenv("DAGSTER_RUN_STORAGE_SNAPSHOT_CACHE_SIZE", "8"))
+
+
+def _use_chunked_snapshots() -> bool:
+    # Chunked snapshots cannot be read by older versions of dagster, so they are opt-in
+    return get_boolean_env_var("DAGSTER_RUN_STORAGE_CHUNKED_SNAPSHOTS")
 
 
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
     EXECUTION_PLAN = "EXECUTION_PLAN"
+    # a content-addressed part of a chunked snapshot, see snapshot_chunks.py
+    CHUNK = "CHUNK"
 
 
 class SqlRunStorage(RunStorage):
     """Base class for SQL based run storages."""
 
+    def __init__(self):
+        super().__init__()
+        # Whether the run_keys table exists and has been backfilled. These are checked on every
+        # run write and run key lookup, so they are cached until this storage migrates itself.
+        # Other processes only pick up a migration once they restart.
+        self._has_run_keys_table: Optional[bool] = None
+        self._supports_run_key_index: Optional[bool] = None
+
     @abstractmethod
     def connect(self) -> ContextManager[Connection]:
         """Context manager yielding a sqlalchemy.engine.Connection."""
@@ -125,19 +164,12 @@ def fetchone(self, query: SqlAlchemyQuery) -> Optional[Any]:
             else:
                 return conn.execute(query).fetchone()
 
-    def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
-        check.inst_param(dagster_run, "dagster_run", DagsterRun)
-
-        if dagster_run.job_snapshot_id and not self.has_job_snapshot(dagster_run.job_snapshot_id):
-            raise DagsterSnapshotDoesNotExist(
-                f"Snapshot {dagster_run.job_snapshot_id} does not exist in run storage"
-            )
-
+    def _get_run_insert_values(self, dagster_run: DagsterRun) -> Mapping[str, Any]:
         has_tags = dagster_run.tags and len(dagster_run.tags) > 0
         partition = dagster_run.tags.get(PARTITION_NAME_TAG) if has_tags else None
         partition_set = dagster_run.tags.get(PARTITION_SET_TAG) if has_tags else None
 
-        runs_insert = RunsTable.insert().values(
+        return dict(
             run_id=dagster_run.run_id,
             pipeline_name=dagster_run.job_name,
             status=dagster_run.status.value,
@@ -146,6 +178,19 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
             partition=partition,
             partition_set=partition_set,
         )
+
+    def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
+        check.inst_param(dagster_run, "dagster_run", DagsterRun)
+
+        if dagster_run.job_snapshot_id and not self.has_job_snapshot(dagster_run.job_snapshot_id):
+            raise DagsterSnapshotDoesNotExist(
+                f"Snapshot {dagster_run.job_snapshot_id} does not exist in run storage"
+            )
+
+        runs_insert = RunsTable.insert().values(**self._get_run_insert_values(dagster_run))
+        should_index_run_key = (
+            dagster_run.get_run_key_index_entry() is not None and self.has_run_keys_table()
+        )
         with self.connect() as conn:
             try:
                 conn.execute(runs_insert)
@@ -162,8 +207,58 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
                     ],
                 )
 
+            if should_index_run_key:
+                write_run_key(conn, dagster_run)
+
         return dagster_run
 
+    def add_runs(self, dagster_runs: Sequence[DagsterRun]) -> Sequence[DagsterRun]:
+        check.sequence_param(dagster_runs, "dagster_runs", of_type=DagsterRun)
+        if not dagster_runs:
+            return []
+
+        for job_snapshot_id in {run.job_snapshot_id for run in dagster_runs if run.job_snapshot_id}:
+            if not self.has_job_snapshot(job_snapshot_id):
+                raise DagsterSnapshotDoesNotExist(
+                    f"Snapshot {job_snapshot_id} does not exist in run storage"
+                )
+
+        tag_rows = [
+            dict(run_id=dagster_run.run_id, key=k, value=v)
+            for dagster_run in dagster_runs
+            for k, v in dagster_run.tags_for_storage().items()
+        ]
+        run_key_entries = [
+            (dagster_run.run_id, dagster_run.get_run_key_index_entry())
+            for dagster_run in dagster_runs
+        ]
+        run_key_rows = (
+            [
+                dict(selector_id=entry[0], run_key=entry[1], run_id=run_id)
+                for run_id, entry in run_key_entries
+                if entry
+            ]
+            if any(entry for _, entry in run_key_entries) and self.has_run_keys_table()
+            else []
+        )
+
+        with self.connect() as conn:
+            try:
+                conn.execute(
+                    RunsTable.insert(),
+                    [self._get_run_insert_values(dagster_run) for dagster_run in dagster_runs],
+                )
+            except db_exc.IntegrityError as exc:
+                raise DagsterRunAlreadyExists from exc
+
+            if tag_rows:
+                conn.execute(RunTagsTable.insert(), tag_rows)
+
+            if run_key_rows:
+                conn.execute(RunKeysTable.insert(), run_key_rows)
+
+        return list(dagster_runs)
+
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
         from dagster._core.events import JobFailureData
 
@@ -605,10 +700,65 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
         check.not_none_param(snapshot_obj, "snapshot_obj")
         check.inst_param(snapshot_type, "snapshot_type", SnapshotType)
 
+        serialized = serialize_value(snapshot_obj)
+        if not _use_chunked_snapshots():
+            self._insert_snapshot(snapshot_id, serialized, snapshot_type)
+            return snapshot_id
+
+        manifest, chunks = split_snapshot(serialized)
+        self._insert_chunked_snapshot(
+            {
+                **{chunk_id: (chunk, SnapshotType.CHUNK) for chunk_id, chunk in chunks.items()},
+                snapshot_id: (manifest, snapshot_type),
+            }
+        )
+        return snapshot_id
+
+    def _insert_chunked_snapshot(self, rows: Mapping[str, Tuple[str, SnapshotType]]) -> None:
+        """Insert the manifest of a snapshot together with the chunks that are not already shared
+        with a previous snapshot, in a single statement and transaction, so that a manifest is
+        never stored without its chunks.
+        """
+        for attempt in range(SNAPSHOT_INSERT_ATTEMPTS):
+            existing_ids = self._get_existing_snapshot_ids(rows.keys())
+            new_rows = [
+                dict(
+                    snapshot_id=snapshot_id,
+                    snapshot_body=zlib.compress(serialized.encode("utf-8")),
+                    snapshot_type=snapshot_type.value,
+                )
+                for snapshot_id, (serialized, snapshot_type) in rows.items()
+                if snapshot_id not in existing_ids
+            ]
+            if not new_rows:
+                return
+
+            try:
+                with self._transaction() as conn:
+                    conn.execute(SnapshotsTable.insert(), new_rows)
+                return
+            except db_exc.IntegrityError:
+                # another process stored some of the same content-addressed rows first, so look
+                # up which rows are still missing
+                if attempt == SNAPSHOT_INSERT_ATTEMPTS - 1:
+                    raise
+
+    @contextmanager
+    def _transaction(self) -> Iterator[Connection]:
+        with self.connect() as conn:
+            if conn.in_transaction():
+                yield conn
+            else:
+                with conn.begin():
+                    yield conn
+
+    def _insert_snapshot(
+        self, snapshot_id: str, serialized_snapshot: str, snapshot_type: SnapshotType
+    ) -> None:
         with self.connect() as conn:
             snapshot_insert = SnapshotsTable.insert().values(
                 snapshot_id=snapshot_id,
-                snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                snapshot_body=zlib.compress(serialized_snapshot.encode("utf-8")),
                 snapshot_type=snapshot_type.value,
             )
             try:
@@ -617,7 +767,36 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
                 # on_conflict_do_nothing equivalent
                 pass
 
-            return snapshot_id
+    def _get_existing_snapshot_ids(self, snapshot_ids: Iterable[str]) -> AbstractSet[str]:
+        snapshot_ids = list(snapshot_ids)
+        existing = set()
+        for i in range(0, len(snapshot_ids), SNAPSHOT_QUERY_CHUNK_SIZE):
+            query = db_select([SnapshotsTable.c.snapshot_id]).where(
+                SnapshotsTable.c.snapshot_id.in_(snapshot_ids[i : i + SNAPSHOT_QUERY_CHUNK_SIZE])
+            )
+            existing.update(row["snapshot_id"] for row in self.fetchall(query))
+        return existing
+
+    def _load_snapshot_chunks(self, chunk_ids: AbstractSet[str]) -> Mapping[str, str]:
+        chunk_ids_list = list(chunk_ids)
+        chunks = {}
+        for i in range(0, len(chunk_ids_list), SNAPSHOT_QUERY_CHUNK_SIZE):
+            query = db_select([SnapshotsTable.c.snapshot_id, SnapshotsTable.c.snapshot_body]).where(
+                SnapshotsTable.c.snapshot_id.in_(chunk_ids_list[i : i + SNAPSHOT_QUERY_CHUNK_SIZE])
+            )
+            for row in self.fetchall(query):
+                chunks[row["snapshot_id"]] = zlib.decompress(row["snapshot_body"]).decode("utf-8")
+        return chunks
+
+    @property
+    def _snapshot_cache(
+        self,
+    ) -> Optional[LRUCache[str, Union[JobSnapshot, ExecutionPlanSnapshot]]]:
+        if SNAPSHOT_CACHE_SIZE <= 0:
+            return None
+        if getattr(self, "_decoded_snapshot_cache", None) is None:
+            self._decoded_snapshot_cache = LRUCache(SNAPSHOT_CACHE_SIZE)
+        return self._decoded_snapshot_cache
 
     def get_run_storage_id(self) -> str:
         query = db_select([InstanceInfo.c.run_storage_id])
@@ -631,8 +810,15 @@ def get_run_storage_id(self) -> str:
             return row["run_storage_id"]
 
     def _has_snapshot_id(self, snapshot_id: str) -> bool:
-        query = db_select([SnapshotsTable.c.snapshot_id]).where(
-            SnapshotsTable.c.snapshot_id == snapshot_id
+        cache = self._snapshot_cache
+        if cache is not None and snapshot_id in cache:
+            return True
+
+        # chunks are only parts of other snapshots
+        query = (
+            db_select([SnapshotsTable.c.snapshot_id])
+            .where(SnapshotsTable.c.snapshot_id == snapshot_id)
+            .where(SnapshotsTable.c.snapshot_type != SnapshotType.CHUNK.value)
         )
 
         row = self.fetchone(query)
@@ -640,17 +826,29 @@ def _has_snapshot_id(self, snapshot_id: str) -> bool:
         return bool(row)
 
     def _get_snapshot(self, snapshot_id: str) -> Optional[JobSnapshot]:
-        query = db_select([SnapshotsTable.c.snapshot_body]).where(
-            SnapshotsTable.c.snapshot_id == snapshot_id
+        cache = self._snapshot_cache
+        cached = cache.get(snapshot_id) if cache is not None else None
+        if cached is not None:
+            return cached  # type: ignore  # (allowed to return execution plan snapshots)
+
+        query = (
+            db_select([SnapshotsTable.c.snapshot_body])
+            .where(SnapshotsTable.c.snapshot_id == snapshot_id)
+            .where(SnapshotsTable.c.snapshot_type != SnapshotType.CHUNK.value)
         )
 
         row = self.fetchone(query)
 
-        return (
-            defensively_unpack_execution_plan_snapshot_query(logging, [row["snapshot_body"]])  # type: ignore
+        snapshot = (
+            defensively_unpack_execution_plan_snapshot_query(
+                logging, [row["snapshot_body"]], self._load_snapshot_chunks
+            )
             if row
             else None
         )
+        if cache is not None and snapshot is not None:
+            cache.set(snapshot_id, snapshot)
+        return snapshot  # type: ignore  # (allowed to return execution plan snapshots)
 
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         if self.has_built_index(RUN_PARTITIONS) and self.has_run_stats_index_cols():
@@ -718,6 +916,42 @@ def _get_partition_runs(
             rows = self.fetchall(query)
             return self._rows_to_runs(rows)
 
+    # Run key index
+
+    @property
+    def supports_run_key_index(self) -> bool:
+        if self._supports_run_key_index is None:
+            self._supports_run_key_index = self.has_built_index(RUN_KEYS)
+        return self._supports_run_key_index
+
+    def get_run_ids_by_run_key(
+        self, selector_id: str, run_keys: Sequence[str], instigator_name: Optional[str] = None
+    ) -> Mapping[str, str]:
+        check.str_param(selector_id, "selector_id")
+        check.sequence_param(run_keys, "run_keys", of_type=str)
+        check.opt_str_param(instigator_name, "instigator_name")
+        if not run_keys:
+            return {}
+
+        selector_ids = [selector_id]
+        if instigator_name:
+            selector_ids.append(DagsterRun.run_key_selector_id_without_origin(instigator_name))
+
+        run_ids_by_key = {}
+        unique_run_keys = list(dict.fromkeys(run_keys))
+        for i in range(0, len(unique_run_keys), RUN_KEY_QUERY_CHUNK_SIZE):
+            query = (
+                db_select([RunKeysTable.c.run_key, RunKeysTable.c.run_id])
+                .where(RunKeysTable.c.selector_id.in_(selector_ids))
+                .where(
+                    RunKeysTable.c.run_key.in_(unique_run_keys[i : i + RUN_KEY_QUERY_CHUNK_SIZE])
+                )
+                .order_by(db.asc(RunKeysTable.c.id))
+            )
+            # later rows overwrite earlier ones, so each key maps to its most recently created run
+            run_ids_by_key.update({row["run_key"]: row["run_id"] for row in self.fetchall(query)})
+        return run_ids_by_key
+
     # Tracking data migrations over secondary indexes
 
     def _execute_data_migrations(
@@ -740,10 +974,18 @@ def _execute_data_migrations(
                 print_fn(f"Finished data migration: {migration_name}")
 
     def migrate(self, print_fn: Optional[PrintFn] = None, force_rebuild_all: bool = False) -> None:
+        self._clear_run_key_index_cache()
         self._execute_data_migrations(REQUIRED_DATA_MIGRATIONS, print_fn, force_rebuild_all)
+        self._clear_run_key_index_cache()
 
     def optimize(self, print_fn: Optional[PrintFn] = None, force_rebuild_all: bool = False) -> None:
+        self._clear_run_key_index_cache()
         self._execute_data_migrations(OPTIONAL_DATA_MIGRATIONS, print_fn, force_rebuild_all)
+        self._clear_run_key_index_cache()
+
+    def _clear_run_key_index_cache(self) -> None:
+        self._has_run_keys_table = None
+        self._supports_run_key_index = None
 
     def has_built_index(self, migration_name: str) -> bool:
         query = (
@@ -785,6 +1027,12 @@ def has_bulk_actions_selector_cols(self) -> bool:
             ]
             return "selector_id" in column_names
 
+    def has_run_keys_table(self) -> bool:
+        if self._has_run_keys_table is None:
+            with self.connect() as conn:
+                self._has_run_keys_table = RunKeysTable.name in db.inspect(conn).get_table_names()
+        return self._has_run_keys_table
+
     # Daemon heartbeats
 
     def add_daemon_heartbeat(self, daemon_heartbeat: DaemonHeartbeat) -> None:
@@ -819,14 +1067,20 @@ def get_daemon_heartbeats(self) -> Mapping[str, DaemonHeartbeat]:
 
     def wipe(self) -> None:
         """Clears the run storage."""
+        has_run_keys_table = self.has_run_keys_table()
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
             conn.execute(RunsTable.delete())
             conn.execute(RunTagsTable.delete())
+            if has_run_keys_table:
+                conn.execute(RunKeysTable.delete())
             conn.execute(SnapshotsTable.delete())
             conn.execute(DaemonHeartbeatsTable.delete())
             conn.execute(BulkActionsTable.delete())
 
+        if self._snapshot_cache is not None:
+            self._snapshot_cache.clear()
+
     def wipe_daemon_heartbeats(self) -> None:
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
@@ -919,17 +1173,15 @@ def set_cursor_values(self, pairs: Mapping[str, str]) -> None:
     # Migrating run history
     def replace_job_origin(self, run: DagsterRun, job_origin: RemoteJobOrigin) -> None:
         new_label = job_origin.repository_origin.get_label()
+        new_run = run.with_job_origin(job_origin).with_tags(
+            {**run.tags, REPOSITORY_LABEL_TAG: new_label}
+        )
+        has_run_keys_table = self.has_run_keys_table()
         with self.connect() as conn:
             conn.execute(
                 RunsTable.update()
                 .where(RunsTable.c.run_id == run.run_id)
-                .values(
-                    run_body=serialize_value(
-                        run.with_job_origin(job_origin).with_tags(
-                            {**run.tags, REPOSITORY_LABEL_TAG: new_label}
-                        )
-                    ),
-                )
+                .values(run_body=serialize_value(new_run))
             )
             conn.execute(
                 RunTagsTable.update()
@@ -937,13 +1189,19 @@ def replace_job_origin(self, run: DagsterRun, job_origin: RemoteJobOrigin) -> No
                 .where(RunTagsTable.c.key == REPOSITORY_LABEL_TAG)
                 .values(value=new_label)
             )
+            if has_run_keys_table:
+                # the instigator selector ids of the run depend on its repository
+                conn.execute(RunKeysTable.delete().where(RunKeysTable.c.run_id == run.run_id))
+                write_run_key(conn, new_run)
 
 
 GET_PIPELINE_SNAPSHOT_QUERY_ID = "get-pipeline-snapshot"
 
 
 def defensively_unpack_execution_plan_snapshot_query(
-    logger: logging.Logger, row: Sequence[Any]
+    logger: logging.Logger,
+    row: Sequence[Any],
+    load_snapshot_chunks: Optional[Callable[[AbstractSet[str]], Mapping[str, str]]] = None,
 ) -> Optional[Union[ExecutionPlanSnapshot, JobSnapshot]]:
     # minimal checking here because sqlalchemy returns a different type based on what version of
     # SqlAlchemy you are using
@@ -967,6 +1225,16 @@ def _warn(msg: str) -> None:
         _warn("Could not unicode decode decompressed bytes stored in snapshot table.")
         return None
 
+    if is_snapshot_manifest(decoded_str):
+        if load_snapshot_chunks is None:
+            _warn("Could not load the chunks of a chunked snapshot.")
+            return None
+        try:
+            decoded_str = assemble_snapshot(decoded_str, load_snapshot_chunks)
+        except (KeyError, zlib.error):
+            _warn("Could not load the chunks of a chunked snapshot.")
+            return None
+
     try:
         return deserialize_value(decoded_str, (ExecutionPlanSnapshot, JobSnapshot))
     except JSONDecodeError:
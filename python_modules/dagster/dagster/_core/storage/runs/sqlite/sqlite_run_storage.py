@@ -26,7 +26,7 @@
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._utils import mkdir_p
 
-from ..schema import InstanceInfo, RunsTable, RunStorageSqlMetadata, RunTagsTable
+from ..schema import InstanceInfo, RunKeysTable, RunsTable, RunStorageSqlMetadata, RunTagsTable
 from ..sql_run_storage import SqlRunStorage
 
 if TYPE_CHECKING:
@@ -150,9 +150,13 @@ def delete_run(self, run_id: str) -> None:
         """
         check.str_param(run_id, "run_id")
         remove_tags = db.delete(RunTagsTable).where(RunTagsTable.c.run_id == run_id)
+        remove_run_keys = db.delete(RunKeysTable).where(RunKeysTable.c.run_id == run_id)
         remove_run = db.delete(RunsTable).where(RunsTable.c.run_id == run_id)
+        has_run_keys_table = self.has_run_keys_table()
         with self.connect() as conn:
             conn.execute(remove_tags)
+            if has_run_keys_table:
+                conn.execute(remove_run_keys)
             conn.execute(remove_run)
 
     def alembic_version(self) -> AlembicVersion:
@@ -0,0 +1,432 @@
+import json
+import os
+import pickle
+import shutil
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from pydantic import Field
+
+import dagster._check as check
+from dagster._annotations import experimental
+from dagster._config.pythonic_config import ConfigurableIOManagerFactory
+from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.execution.context.init import InitResourceContext
+from dagster._core.execution.context.input import InputContext
+from dagster._core.execution.context.output import OutputContext
+from dagster._core.execution.plan.handle import ResolvedFromDynamicStepHandle
+from dagster._core.execution.plan.inputs import StepInput
+from dagster._core.execution.plan.outputs import StepOutputHandle
+from dagster._core.execution.plan.step import UnresolvedMappedExecutionStep
+from dagster._core.storage.fs_io_manager import PickledObjectFilesystemIOManager
+
+if TYPE_CHECKING:
+    from filelock import FileLock
+    from upath import UPath
+
+# files written in place of an output that was handed off in shared memory start with this magic
+# string, which cannot be the start of a pickle or an Arrow IPC file
+SHARED_MEMORY_HANDLE_MAGIC = b"DAGSTER_SHARED_MEMORY\n"
+
+# out-of-band buffers are aligned within a segment so that the arrays loaded from them are aligned
+# for any dtype
+_BUFFER_ALIGNMENT = 64
+
+# on Linux, POSIX shared memory segments are files in this tmpfs mount
+_SHARED_MEMORY_MOUNT = "/dev/shm"
+
+# asset outputs are also written to the filesystem, so the handle of an asset output that was handed
+# off in shared memory is written next to it, in a file with this suffix
+_HANDLE_FILE_SUFFIX = ".shared_memory"
+
+
+class _SharedMemoryHandle(NamedTuple):
+    """Where an output that was handed off in shared memory lives, and how many more times it will
+    be loaded before its segment is released.
+    """
+
+    segment_name: str
+    size: int
+    pickle_length: int
+    buffers: Sequence[Tuple[int, int]]
+    remaining_loads: int
+    usage_path: Optional[str]
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _BUFFER_ALIGNMENT) * _BUFFER_ALIGNMENT
+
+
+def _get_free_shared_memory_bytes() -> Optional[int]:
+    if not os.path.isdir(_SHARED_MEMORY_MOUNT):
+        return None
+    return shutil.disk_usage(_SHARED_MEMORY_MOUNT).free
+
+
+def _file_lock(path: Union[str, "UPath"]) -> "FileLock":
+    from filelock import FileLock
+
+    return FileLock(f"{os.fspath(path)}.lock")
+
+
+def _get_consumer_load_count(context: OutputContext) -> Optional[int]:
+    """Counts the number of times that the given output will be loaded by the steps of the run.
+    Returns None if the count is not known until a dynamic output is resolved.
+    """
+    step_context = context.step_context
+    step_handle = step_context.step.handle
+    step_key_with_placeholders = (
+        step_handle.unresolved_form.to_key()
+        if isinstance(step_handle, ResolvedFromDynamicStepHandle)
+        else step_handle.to_key()
+    )
+    step_keys_to_execute = step_context.dagster_run.step_keys_to_execute
+    output_handle = StepOutputHandle(context.step_key, context.name, context.mapping_key)
+
+    load_count = 0
+    for step in step_context.execution_plan.step_dict.values():
+        # steps resolved from dynamic outputs are counted through the unresolved step that they were
+        # resolved from, which stays in the plan
+        if isinstance(step.handle, ResolvedFromDynamicStepHandle):
+            continue
+
+        for step_input in step.step_inputs:
+            if isinstance(step_input, StepInput):
+                if output_handle not in step_input.get_step_output_handle_dependencies():
+                    continue
+                if isinstance(step, UnresolvedMappedExecutionStep):
+                    # loaded by each of the steps that the unresolved step resolves to
+                    return None
+                if step_keys_to_execute is None or step.key in step_keys_to_execute:
+                    load_count += 1
+            elif any(
+                dep.step_key == step_key_with_placeholders and dep.output_name == context.name
+                for dep in step_input.get_step_output_handle_deps_with_placeholders()
+            ):
+                load_count += 1
+
+    return load_count
+
+
+class PickledObjectSharedMemoryIOManager(PickledObjectFilesystemIOManager):
+    """IO manager that hands off step outputs to the steps that load them in shared memory, and
+    writes them to the filesystem when they cannot be handed off.
+
+    Outputs are pickled with out-of-band buffers, so the data of NumPy arrays, pandas DataFrames
+    and Arrow tables is copied into a shared memory segment without being serialized, and the
+    loaded objects reference the segment instead of a copy of the data. A small handle file records
+    the segment and the number of remaining loads of the output, which is computed from the
+    execution plan. The segment is released once the last of those loads completes.
+
+    The handle file of an op output is written in place of the output. Asset outputs are also
+    written to the filesystem, so that later runs can load them, and their handle file is written
+    next to them. Once the segment of an asset output is released, it is loaded from the
+    filesystem.
+
+    Whether an output fits in shared memory is only checked when it is written. Outputs that are
+    already in shared memory are not moved to the filesystem when memory runs low later on.
+
+    Args:
+        base_dir (str): base directory where the handle files and the outputs that are written to
+            the filesystem are stored.
+        max_shared_memory_bytes (Optional[int]): the maximum number of bytes that the outputs of a
+            run can hold in shared memory at once. Outputs that would exceed it when they are
+            written are written to the filesystem instead.
+    """
+
+    def __init__(self, base_dir: str, max_shared_memory_bytes: Optional[int] = None):
+        super().__init__(base_dir=check.str_param(base_dir, "base_dir"))
+        self.max_shared_memory_bytes = check.opt_int_param(
+            max_shared_memory_bytes, "max_shared_memory_bytes"
+        )
+        # segments that are still referenced by loaded objects, which stay attached for as long as
+        # this IO manager exists
+        self._attached_segments: List[SharedMemory] = []
+
+    def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
+        if context.has_asset_key:
+            # asset outputs outlive the run, so they are written to the filesystem even when they
+            # are also handed off in shared memory. Any handle of a previous materialization of the
+            # asset is released.
+            handle_path = self._get_asset_handle_path(path)
+            self._release_handle(handle_path)
+            if handle_path.exists():
+                handle_path.unlink()
+            super().dump_to_path(context, obj, path)
+            self._hand_off(context, obj, handle_path)
+        else:
+            # a previous output at the same path, such as the output of an earlier execution of the
+            # step, is replaced
+            self._release_handle(path)
+            if not self._hand_off(context, obj, path):
+                super().dump_to_path(context, obj, path)
+
+    def _hand_off(self, context: OutputContext, obj: Any, handle_path: "UPath") -> bool:
+        """Copies the output into a shared memory segment and writes its handle to the given path.
+        Returns False if the output cannot be handed off in shared memory.
+        """
+        load_count = _get_consumer_load_count(context)
+        if not load_count:
+            context.log.debug(
+                "Not handing off output in shared memory, since the number of steps that load it"
+                " is not known."
+                if load_count is None
+                else "Not handing off output in shared memory, since no steps in the run load it."
+            )
+            return False
+
+        buffers: List[pickle.PickleBuffer] = []
+        try:
+            data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        except (AttributeError, RecursionError, ImportError, pickle.PicklingError):
+            # writing the output to the filesystem raises an error that explains how to use an
+            # unpicklable output
+            return False
+
+        raw_buffers = [buffer.raw() for buffer in buffers]
+        buffer_ranges: List[Tuple[int, int]] = []
+        size = _align(len(data))
+        for raw_buffer in raw_buffers:
+            buffer_ranges.append((size, raw_buffer.nbytes))
+            size = _align(size + raw_buffer.nbytes)
+        size = max(size, 1)
+
+        usage_path = self._get_usage_path(context)
+        if not self._reserve_shared_memory(usage_path, size):
+            context.log.debug(
+                f"Not handing off output in shared memory, since {size} bytes of shared memory are"
+                " not available."
+            )
+            return False
+
+        segment = SharedMemory(create=True, size=size)
+        try:
+            segment.buf[: len(data)] = data
+            for (offset, nbytes), raw_buffer in zip(buffer_ranges, raw_buffers):
+                segment.buf[offset : offset + nbytes] = raw_buffer
+            self._write_handle(
+                handle_path,
+                _SharedMemoryHandle(
+                    segment_name=segment.name,
+                    size=size,
+                    pickle_length=len(data),
+                    buffers=buffer_ranges,
+                    remaining_loads=load_count,
+                    usage_path=usage_path,
+                ),
+            )
+        except Exception:
+            segment.unlink()
+            self._update_shared_memory_usage(usage_path, -size)
+            raise
+        finally:
+            segment.close()
+
+        context.add_output_metadata(
+            {"shared_memory_bytes": size, "shared_memory_consumer_loads": load_count}
+        )
+        return True
+
+    def load_from_path(self, context: InputContext, path: "UPath") -> Any:
+        asset_handle_path = self._get_asset_handle_path(path)
+        if self._is_handle(asset_handle_path):
+            handle_path = asset_handle_path
+        elif self._is_handle(path):
+            handle_path = path
+        else:
+            return super().load_from_path(context, path)
+
+        with _file_lock(handle_path):
+            handle = self._read_handle(handle_path)
+            try:
+                segment = SharedMemory(name=handle.segment_name)
+            except FileNotFoundError:
+                segment = None
+            if segment is None and handle_path != path:
+                # the segment of an asset output was released, but the output was also written
+                # to the filesystem
+                return super().load_from_path(context, path)
+            elif segment is None:
+                raise DagsterInvariantViolationError(
+                    f"The output at {path} was handed off in shared memory, and was released once"
+                    " all the steps of its run loaded it. Outputs that are handed off in shared"
+                    " memory are not available to re-executions or other runs."
+                )
+
+            remaining_loads = handle.remaining_loads - 1
+            self._write_handle(handle_path, handle._replace(remaining_loads=remaining_loads))
+            if remaining_loads <= 0:
+                # the memory is freed once the segment is detached by every process that loaded it
+                segment.unlink()
+                self._update_shared_memory_usage(handle.usage_path, -handle.size)
+
+        # the loaded objects cannot modify the memory that is shared with other steps
+        buffer = segment.buf.toreadonly()
+        obj = pickle.loads(
+            buffer[: handle.pickle_length],
+            buffers=[buffer[offset : offset + nbytes] for offset, nbytes in handle.buffers],
+        )
+        del buffer
+        try:
+            segment.close()
+        except BufferError:
+            # the loaded object references the memory of the segment
+            self._attached_segments.append(segment)
+
+        return obj
+
+    def _get_usage_path(self, context: OutputContext) -> Optional[str]:
+        if self.max_shared_memory_bytes is None:
+            return None
+        return os.path.join(check.not_none(self.base_dir), context.run_id, ".shared_memory_bytes")
+
+    def _reserve_shared_memory(self, usage_path: Optional[str], size: int) -> bool:
+        free_bytes = _get_free_shared_memory_bytes()
+        if free_bytes is not None and size > free_bytes:
+            return False
+
+        if usage_path is None:
+            return True
+
+        with _file_lock(usage_path):
+            used_bytes = self._read_shared_memory_usage(usage_path)
+            if used_bytes + size > check.not_none(self.max_shared_memory_bytes):
+                return False
+            self._write_shared_memory_usage(usage_path, used_bytes + size)
+            return True
+
+    def _update_shared_memory_usage(self, usage_path: Optional[str], delta: int) -> None:
+        if usage_path is None:
+            return
+
+        with _file_lock(usage_path):
+            used_bytes = self._read_shared_memory_usage(usage_path)
+            self._write_shared_memory_usage(usage_path, max(used_bytes + delta, 0))
+
+    def _read_shared_memory_usage(self, usage_path: str) -> int:
+        if not os.path.exists(usage_path):
+            return 0
+        with open(usage_path, encoding="utf8") as f:
+            return int(f.read() or 0)
+
+    def _write_shared_memory_usage(self, usage_path: str, used_bytes: int) -> None:
+        os.makedirs(os.path.dirname(usage_path), exist_ok=True)
+        with open(usage_path, "w", encoding="utf8") as f:
+            f.write(str(used_bytes))
+
+    def _get_asset_handle_path(self, path: "UPath") -> "UPath":
+        return path.with_name(path.name + _HANDLE_FILE_SUFFIX)
+
+    def _is_handle(self, path: "UPath") -> bool:
+        if not path.is_file():
+            return False
+        with path.open("rb") as file:
+            return file.read(len(SHARED_MEMORY_HANDLE_MAGIC)) == SHARED_MEMORY_HANDLE_MAGIC
+
+    def _read_handle(self, path: "UPath") -> _SharedMemoryHandle:
+        with path.open("rb") as file:
+            file.seek(len(SHARED_MEMORY_HANDLE_MAGIC))
+            handle = json.loads(file.read())
+        return _SharedMemoryHandle(
+            segment_name=handle["segment_name"],
+            size=handle["size"],
+            pickle_length=handle["pickle_length"],
+            buffers=[tuple(buffer_range) for buffer_range in handle["buffers"]],
+            remaining_loads=handle["remaining_loads"],
+            usage_path=handle["usage_path"],
+        )
+
+    def _write_handle(self, path: "UPath", handle: _SharedMemoryHandle) -> None:
+        with path.open("wb") as file:
+            file.write(SHARED_MEMORY_HANDLE_MAGIC + json.dumps(handle._asdict()).encode())
+
+    def _release_handle(self, path: "UPath") -> None:
+        if not path.exists() or not self._is_handle(path):
+            return
+
+        with _file_lock(path):
+            handle = self._read_handle(path)
+            if handle.remaining_loads <= 0:
+                return
+            try:
+                segment = SharedMemory(name=handle.segment_name)
+            except FileNotFoundError:
+                return
+            segment.close()
+            segment.unlink()
+            self._write_handle(path, handle._replace(remaining_loads=0))
+            self._update_shared_memory_usage(handle.usage_path, -handle.size)
+
+
+@experimental
+class SharedMemoryIOManager(ConfigurableIOManagerFactory[PickledObjectSharedMemoryIOManager]):
+    """Built-in IO manager that hands off step outputs between the processes of the
+    :py:func:`multiprocess_executor` in shared memory, instead of writing them to disk.
+
+    Outputs are pickled with out-of-band buffers, so the data of NumPy arrays, pandas DataFrames
+    and Arrow tables is copied into a shared memory segment once, and the steps that load the
+    output map the same segment instead of deserializing a copy. Loaded arrays are read-only, since
+    their memory is shared with the other steps that load the output.
+
+    Each segment is released once all the steps of the run that load the output have loaded it.
+    The number of loads is computed from the execution plan. Outputs are written to the filesystem
+    instead, in the same way as the :py:class:`FilesystemIOManager`, when:
+
+    * No steps in the run load the output, or the number of loads is not known until a dynamic
+      output is resolved.
+    * There is not enough free shared memory for the output, or storing it would exceed
+      ``max_shared_memory_bytes``. This is only checked when the output is written: outputs that
+      are already in shared memory are not moved to the filesystem if memory runs low later on.
+
+    Asset outputs are always written to the filesystem as well, so that they can be loaded by later
+    runs once their segment is released. Op outputs that are handed off in shared memory are not
+    available to re-executions, or to steps that are retried after loading them. Segments of
+    outputs that are never loaded, such as when a downstream step fails, are released when the run
+    worker process exits.
+
+    The steps that hand off outputs must run on the same machine, so this IO manager can only be
+    used with the :py:func:`multiprocess_executor` or the :py:func:`in_process_executor`.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from dagster import SharedMemoryIOManager, job, op
+
+        @op
+        def make_array():
+            return np.random.rand(10_000_000)
+
+        @op
+        def total(array):
+            return array.sum()
+
+        @job(resource_defs={"io_manager": SharedMemoryIOManager()})
+        def shared_memory_job():
+            total(make_array())
+    """
+
+    base_dir: Optional[str] = Field(
+        default=None,
+        description=(
+            "Base directory for storing handle files and the outputs that are written to the"
+            " filesystem."
+        ),
+    )
+    max_shared_memory_bytes: Optional[int] = Field(
+        default=None,
+        description=(
+            "The maximum number of bytes that the outputs of a run can hold in shared memory at"
+            " once. Outputs that would exceed it are written to the filesystem."
+        ),
+    )
+
+    @classmethod
+    def _is_dagster_maintained(cls) -> bool:
+        return True
+
+    def create_io_manager(self, context: InitResourceContext) -> PickledObjectSharedMemoryIOManager:
+        base_dir = self.base_dir or check.not_none(context.instance).storage_directory()
+        return PickledObjectSharedMemoryIOManager(
+            base_dir=base_dir, max_shared_memory_bytes=self.max_shared_memory_bytes
+        )
@@ -63,6 +63,8 @@
 
 
 RUN_WORKER_ID_TAG = f"{HIDDEN_TAG_PREFIX}run_worker"
+RUN_WORKER_LAZY_DEFINITIONS_TAG = f"{SYSTEM_TAG_PREFIX}run_worker_lazy_definitions"
+RUN_WORKER_STARTUP_PROFILING_TAG = f"{SYSTEM_TAG_PREFIX}run_worker_startup_profiling"
 GLOBAL_CONCURRENCY_TAG = f"{SYSTEM_TAG_PREFIX}concurrency_key"
 
 # This tag is used to tag runs and backfills with the email of the creator.
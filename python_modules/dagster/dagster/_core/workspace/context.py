@@ -11,6 +11,8 @@
 from typing_extensions import Self
 
 import dagster._check as check
+from dagster._core.definitions.asset_graph_topology import AssetGraphTopologySlot
+from dagster._core.definitions.data_version import StaleStatusCache
 from dagster._core.definitions.selector import JobSubsetSelector
 from dagster._core.errors import DagsterCodeLocationLoadError, DagsterCodeLocationNotFoundError
 from dagster._core.execution.plan.state import KnownExecutionState
@@ -105,6 +107,13 @@ def process_context(self) -> "IWorkspaceProcessContext":
     def version(self) -> Optional[str]:
         pass
 
+    @property
+    def stale_status_cache(self) -> Optional[StaleStatusCache]:
+        """Shares the staleness of assets between the requests served by the long-lived workspace
+        that this workspace is a snapshot of, if any.
+        """
+        return None
+
     @property
     @abstractmethod
     def permissions(self) -> Mapping[str, PermissionResult]:
@@ -331,6 +340,8 @@ def __init__(
         source: Optional[object],
         read_only: bool,
         read_only_locations: Optional[Mapping[str, bool]] = None,
+        asset_graph_topology_slot: Optional[AssetGraphTopologySlot] = None,
+        stale_status_cache: Optional[StaleStatusCache] = None,
     ):
         self._instance = instance
         self._workspace_snapshot = workspace_snapshot
@@ -341,6 +352,12 @@ def __init__(
         self._read_only_locations = check.opt_mapping_param(
             read_only_locations, "read_only_locations"
         )
+        self._asset_graph_topology_slot = check.opt_inst_param(
+            asset_graph_topology_slot, "asset_graph_topology_slot", AssetGraphTopologySlot
+        )
+        self._stale_status_cache = check.opt_inst_param(
+            stale_status_cache, "stale_status_cache", StaleStatusCache
+        )
         self._checked_permissions: Set[str] = set()
         self._asset_record_loader = BatchAssetRecordLoader(self._instance, {})
         self._loaders = {}
@@ -369,6 +386,14 @@ def get_code_location_statuses(self) -> Sequence[CodeLocationStatusEntry]:
     def process_context(self) -> "IWorkspaceProcessContext":
         return self._process_context
 
+    @property
+    def asset_graph_topology_slot(self) -> Optional[AssetGraphTopologySlot]:
+        return self._asset_graph_topology_slot
+
+    @property
+    def stale_status_cache(self) -> Optional[StaleStatusCache]:
+        return self._stale_status_cache
+
     @property
     def version(self) -> Optional[str]:
         return self._version
@@ -499,6 +524,8 @@ def __init__(
 
         # Guards changes to _location_entry_dict, _watch_thread_shutdown_events and _watch_threads
         self._lock = threading.Lock()
+        self._asset_graph_topology_slot = AssetGraphTopologySlot()
+        self._stale_status_cache = StaleStatusCache()
         self._watch_thread_shutdown_events: Dict[str, threading.Event] = {}
         self._watch_threads: Dict[str, threading.Thread] = {}
 
@@ -742,6 +769,8 @@ def create_request_context(self, source: Optional[object] = None) -> WorkspaceRe
             version=self.version,
             source=source,
             read_only=self._read_only,
+            asset_graph_topology_slot=self._asset_graph_topology_slot,
+            stale_status_cache=self._stale_status_cache,
         )
 
     def _location_state_events_handler(self, event: LocationStateChangeEvent) -> None:
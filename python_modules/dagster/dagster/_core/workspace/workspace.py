@@ -6,6 +6,7 @@
 from dagster._utils.error import SerializableErrorInfo
 
 if TYPE_CHECKING:
+    from dagster._core.definitions.asset_graph_topology import AssetGraphTopologySlot
     from dagster._core.definitions.remote_asset_graph import RemoteAssetGraph
     from dagster._core.remote_representation import CodeLocation, CodeLocationOrigin
     from dagster._core.remote_representation.external_data import (
@@ -55,6 +56,14 @@ def get_workspace_snapshot(self) -> Mapping[str, CodeLocationEntry]:
     def get_code_location_statuses(self) -> Sequence[CodeLocationStatusEntry]:
         pass
 
+    @property
+    def asset_graph_topology_slot(self) -> Optional["AssetGraphTopologySlot"]:
+        """Holds the topology of the last asset graph built from the long-lived workspace that
+        this workspace is a snapshot of, if any, so that the asset graph can be indexed
+        incrementally.
+        """
+        return None
+
     @cached_property
     def asset_graph(self) -> "RemoteAssetGraph":
         """Returns a workspace scoped RemoteAssetGraph."""
@@ -81,10 +90,15 @@ def asset_graph(self) -> "RemoteAssetGraph":
 
             asset_checks.extend(repo.get_external_asset_checks())
 
-        return RemoteAssetGraph.from_repository_handles_and_external_asset_nodes(
+        topology_slot = self.asset_graph_topology_slot
+        asset_graph = RemoteAssetGraph.from_repository_handles_and_external_asset_nodes(
             repo_handle_external_asset_nodes=repo_handle_external_asset_nodes,
             external_asset_checks=asset_checks,
+            previous_topology=topology_slot.get() if topology_slot else None,
         )
+        if topology_slot:
+            topology_slot.set(asset_graph.topology)
+        return asset_graph
 
 
 def location_status_from_location_entry(
@@ -27,7 +27,11 @@
     execute_concurrency_slots_iteration,
     execute_run_monitoring_iteration,
 )
-from dagster._daemon.sensor import execute_sensor_iteration_loop
+from dagster._daemon.sensor import (
+    CodeLocationThreadPools,
+    SensorEvaluationStats,
+    execute_sensor_iteration_loop,
+)
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._scheduler.scheduler import execute_scheduler_iteration_loop
@@ -294,14 +298,26 @@ def __init__(self, settings: Mapping[str, Any]) -> None:
         self._exit_stack = ExitStack()
         self._threadpool_executor: Optional[InheritContextThreadPoolExecutor] = None
         self._submit_threadpool_executor: Optional[InheritContextThreadPoolExecutor] = None
+        self._code_location_thread_pools: Optional[CodeLocationThreadPools] = None
+        self._sensor_evaluation_stats = SensorEvaluationStats()
 
         if settings.get("use_threads"):
-            self._threadpool_executor = self._exit_stack.enter_context(
-                InheritContextThreadPoolExecutor(
-                    max_workers=settings.get("num_workers"),
-                    thread_name_prefix="sensor_daemon_worker",
+            num_workers_per_code_location = settings.get("num_workers_per_code_location")
+            if num_workers_per_code_location:
+                self._code_location_thread_pools = self._exit_stack.enter_context(
+                    CodeLocationThreadPools(
+                        num_workers_per_code_location=num_workers_per_code_location,
+                        code_location_weights=settings.get("code_location_weights"),
+                        thread_name_prefix="sensor_daemon_worker",
+                    )
+                )
+            else:
+                self._threadpool_executor = self._exit_stack.enter_context(
+                    InheritContextThreadPoolExecutor(
+                        max_workers=settings.get("num_workers"),
+                        thread_name_prefix="sensor_daemon_worker",
+                    )
                 )
-            )
             num_submit_workers = settings.get("num_submit_workers")
             if num_submit_workers:
                 self._submit_threadpool_executor = self._exit_stack.enter_context(
@@ -315,6 +331,10 @@ def __init__(self, settings: Mapping[str, Any]) -> None:
     def daemon_type(cls) -> str:
         return "SENSOR"
 
+    @property
+    def sensor_evaluation_stats(self) -> SensorEvaluationStats:
+        return self._sensor_evaluation_stats
+
     def __exit__(self, _exception_type, _exception_value, _traceback):
         self._exit_stack.close()
         super().__exit__(_exception_type, _exception_value, _traceback)
@@ -330,6 +350,8 @@ def core_loop(
             shutdown_event,
             threadpool_executor=self._threadpool_executor,
             submit_threadpool_executor=self._submit_threadpool_executor,
+            code_location_thread_pools=self._code_location_thread_pools,
+            sensor_evaluation_stats=self._sensor_evaluation_stats,
         )
 
 
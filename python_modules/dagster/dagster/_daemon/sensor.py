@@ -1,5 +1,6 @@
 import datetime
 import logging
+import os
 import sys
 import threading
 from collections import defaultdict
@@ -34,8 +35,13 @@
     DeleteDynamicPartitionsRequest,
 )
 from dagster._core.definitions.run_request import DagsterRunReaction, InstigatorType, RunRequest
+from dagster._core.definitions.run_status_sensor_definition import (
+    RunStatusChangeBatch,
+    RunStatusSensorCursor,
+    fetch_run_status_change_batch,
+)
 from dagster._core.definitions.selector import JobSubsetSelector
-from dagster._core.definitions.sensor_definition import DefaultSensorStatus
+from dagster._core.definitions.sensor_definition import DefaultSensorStatus, SensorType
 from dagster._core.definitions.utils import normalize_tags
 from dagster._core.errors import (
     DagsterCodeLocationLoadError,
@@ -59,7 +65,11 @@
 from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunsFilter
 from dagster._core.storage.tags import RUN_KEY_TAG, SENSOR_NAME_TAG
 from dagster._core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
-from dagster._core.utils import make_new_backfill_id, make_new_run_id
+from dagster._core.utils import (
+    InheritContextThreadPoolExecutor,
+    make_new_backfill_id,
+    make_new_run_id,
+)
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._scheduler.stale import resolve_stale_or_missing_assets
@@ -85,6 +95,12 @@
 
 FINISHED_TICK_STATES = [TickStatus.SKIPPED, TickStatus.SUCCESS, TickStatus.FAILURE]
 
+# How often the sensor daemon logs the evaluation lag of the sensors that it is evaluating
+SENSOR_LAG_LOG_INTERVAL_SECONDS = int(os.getenv("DAGSTER_SENSOR_LAG_LOG_INTERVAL_SECONDS", "600"))
+
+# How much weight the most recent evaluation time of a sensor has in its expected evaluation time
+SENSOR_EVALUATION_TIME_SMOOTHING_FACTOR = 0.3
+
 
 class DagsterSensorDaemonError(DagsterError):
     """Error when running the SensorDaemon."""
@@ -103,6 +119,143 @@ class BackfillSubmission(NamedTuple):
     backfill_id: str
 
 
+class SensorLagMetrics(NamedTuple):
+    """Evaluation statistics for a single sensor, as observed by the sensor daemon.
+
+    The lag of an evaluation is how long after the sensor's minimum interval had elapsed the
+    evaluation started, including any time spent waiting for a free thread.
+    """
+
+    sensor_name: str
+    code_location_name: str
+    evaluation_count: int
+    average_evaluation_seconds: float
+    last_lag_seconds: float
+    max_lag_seconds: float
+
+
+class SensorEvaluationStats:
+    """Tracks how long the evaluations of each sensor take and how much they lag behind the
+    sensor's minimum interval.
+
+    The observed evaluation times are used to order the sensors that are due in each sensor daemon
+    iteration, and the lags are periodically logged by the sensor daemon.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, SensorLagMetrics] = {}
+
+    def get_expected_evaluation_seconds(self, selector_id: str) -> float:
+        metrics = self._metrics.get(selector_id)
+        return metrics.average_evaluation_seconds if metrics else 0.0
+
+    def record_evaluation(
+        self,
+        external_sensor: ExternalSensor,
+        due_timestamp: Optional[float],
+        start_timestamp: float,
+        end_timestamp: float,
+    ) -> None:
+        lag = max(0.0, start_timestamp - due_timestamp) if due_timestamp is not None else 0.0
+        duration = end_timestamp - start_timestamp
+
+        with self._lock:
+            previous = self._metrics.get(external_sensor.selector_id)
+            self._metrics[external_sensor.selector_id] = SensorLagMetrics(
+                sensor_name=external_sensor.name,
+                code_location_name=external_sensor.handle.location_name,
+                evaluation_count=previous.evaluation_count + 1 if previous else 1,
+                average_evaluation_seconds=(
+                    previous.average_evaluation_seconds
+                    + SENSOR_EVALUATION_TIME_SMOOTHING_FACTOR
+                    * (duration - previous.average_evaluation_seconds)
+                    if previous
+                    else duration
+                ),
+                last_lag_seconds=lag,
+                max_lag_seconds=max(previous.max_lag_seconds, lag) if previous else lag,
+            )
+
+    def get_lag_metrics(self) -> Mapping[str, SensorLagMetrics]:
+        """The evaluation statistics of each sensor that has been evaluated, keyed by selector id."""
+        with self._lock:
+            return dict(self._metrics)
+
+    def log_lag_metrics(self, logger: logging.Logger) -> None:
+        lag_metrics = sorted(
+            self.get_lag_metrics().values(),
+            key=lambda metrics: metrics.last_lag_seconds,
+            reverse=True,
+        )
+        if not lag_metrics:
+            return
+
+        logger.info(
+            f"Sensor evaluation lag for {len(lag_metrics)} sensors: "
+            + ", ".join(
+                f"{metrics.code_location_name}:{metrics.sensor_name}"
+                f" (last {metrics.last_lag_seconds:.1f}s, max {metrics.max_lag_seconds:.1f}s,"
+                f" evaluation {metrics.average_evaluation_seconds:.1f}s)"
+                for metrics in lag_metrics
+            )
+        )
+
+
+class CodeLocationThreadPools(AbstractContextManager):
+    """Thread pools for processing sensor ticks, created lazily for each code location, so that the
+    sensors of one code location cannot occupy the threads needed by the sensors of another.
+
+    Each pool has `num_workers_per_code_location` threads, multiplied by the code location's weight
+    in `code_location_weights` (1 if not set).
+    """
+
+    def __init__(
+        self,
+        num_workers_per_code_location: int,
+        code_location_weights: Optional[Mapping[str, int]] = None,
+        thread_name_prefix: str = "sensor_daemon_worker",
+    ):
+        self._num_workers_per_code_location = check.int_param(
+            num_workers_per_code_location, "num_workers_per_code_location"
+        )
+        self._code_location_weights = check.opt_mapping_param(
+            code_location_weights, "code_location_weights", key_type=str, value_type=int
+        )
+        self._thread_name_prefix = check.str_param(thread_name_prefix, "thread_name_prefix")
+        self._lock = threading.Lock()
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+
+    def get_num_workers(self, location_name: str) -> int:
+        return max(
+            1,
+            self._num_workers_per_code_location * self._code_location_weights.get(location_name, 1),
+        )
+
+    def get_executor(self, location_name: str) -> ThreadPoolExecutor:
+        with self._lock:
+            if location_name not in self._executors:
+                self._executors[location_name] = InheritContextThreadPoolExecutor(
+                    max_workers=self.get_num_workers(location_name),
+                    thread_name_prefix=f"{self._thread_name_prefix}_{location_name}",
+                )
+            return self._executors[location_name]
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors = {}
+
+        for executor in executors:
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, _exception_type, _exception_value, _traceback) -> None:
+        self.shutdown()
+
+
 class SensorLaunchContext(AbstractContextManager):
     def __init__(
         self,
@@ -305,6 +458,8 @@ def execute_sensor_iteration_loop(
     until: Optional[float] = None,
     threadpool_executor: Optional[ThreadPoolExecutor] = None,
     submit_threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    code_location_thread_pools: Optional[CodeLocationThreadPools] = None,
+    sensor_evaluation_stats: Optional[SensorEvaluationStats] = None,
 ) -> "DaemonIterator":
     """Helper function that performs sensor evaluations on a tighter loop, while reusing grpc locations
     within a given daemon interval.  Rather than relying on the daemon machinery to run the
@@ -314,6 +469,8 @@ def execute_sensor_iteration_loop(
     from dagster._daemon.daemon import SpanMarker
 
     sensor_tick_futures: Dict[str, Future] = {}
+    sensor_evaluation_stats = sensor_evaluation_stats or SensorEvaluationStats()
+    last_lag_log_time = get_current_timestamp()
     while True:
         start_time = get_current_timestamp()
         if until and start_time >= until:
@@ -329,6 +486,8 @@ def execute_sensor_iteration_loop(
                 threadpool_executor=threadpool_executor,
                 submit_threadpool_executor=submit_threadpool_executor,
                 sensor_tick_futures=sensor_tick_futures,
+                code_location_thread_pools=code_location_thread_pools,
+                sensor_evaluation_stats=sensor_evaluation_stats,
             )
         except Exception:
             error_info = DaemonErrorCapture.on_exception(
@@ -343,6 +502,10 @@ def execute_sensor_iteration_loop(
 
         end_time = get_current_timestamp()
 
+        if end_time - last_lag_log_time >= SENSOR_LAG_LOG_INTERVAL_SECONDS:
+            sensor_evaluation_stats.log_lag_metrics(logger)
+            last_lag_log_time = end_time
+
         loop_duration = end_time - start_time
         sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
         shutdown_event.wait(sleep_time)
@@ -357,6 +520,8 @@ def execute_sensor_iteration(
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     sensor_tick_futures: Optional[Dict[str, Future]] = None,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
+    code_location_thread_pools: Optional[CodeLocationThreadPools] = None,
+    sensor_evaluation_stats: Optional[SensorEvaluationStats] = None,
 ):
     instance = workspace_process_context.instance
 
@@ -398,9 +563,8 @@ def execute_sensor_iteration(
         yield
         return
 
+    due_sensors: List[Tuple[ExternalSensor, InstigatorState, Optional[float]]] = []
     for external_sensor in sensors.values():
-        sensor_name = external_sensor.name
-        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
         sensor_state = all_sensor_states.get(external_sensor.selector_id)
         if not sensor_state:
             assert external_sensor.default_status == DefaultSensorStatus.RUNNING
@@ -415,10 +579,32 @@ def execute_sensor_iteration(
                 ),
             )
             instance.add_instigator_state(sensor_state)
-        elif is_under_min_interval(sensor_state, external_sensor):
-            continue
+            due_sensors.append((external_sensor, sensor_state, None))
+        else:
+            due_timestamp = _get_sensor_due_timestamp(sensor_state, external_sensor)
+            if due_timestamp is not None and get_current_timestamp() < due_timestamp:
+                continue
+            due_sensors.append((external_sensor, sensor_state, due_timestamp))
+
+    # evaluate the sensors that have been due the longest first, and among sensors that became due
+    # at the same time, the ones that are expected to evaluate the fastest
+    due_sensors.sort(
+        key=lambda due_sensor: (
+            due_sensor[2] or 0.0,
+            sensor_evaluation_stats.get_expected_evaluation_seconds(due_sensor[0].selector_id)
+            if sensor_evaluation_stats
+            else 0.0,
+        )
+    )
 
-        if threadpool_executor:
+    run_status_change_batches = _fetch_run_status_change_batches(instance, due_sensors)
+
+    for external_sensor, sensor_state, due_timestamp in due_sensors:
+        sensor_name = external_sensor.name
+        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
+        run_status_change_batch = run_status_change_batches.get(external_sensor.selector_id)
+
+        if threadpool_executor or code_location_thread_pools:
             if sensor_tick_futures is None:
                 check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
 
@@ -429,7 +615,12 @@ def execute_sensor_iteration(
             ):
                 continue
 
-            future = threadpool_executor.submit(
+            executor = (
+                code_location_thread_pools.get_executor(external_sensor.handle.location_name)
+                if code_location_thread_pools
+                else check.not_none(threadpool_executor)
+            )
+            future = executor.submit(
                 _process_tick,
                 workspace_process_context,
                 logger,
@@ -438,6 +629,9 @@ def execute_sensor_iteration(
                 sensor_debug_crash_flags,
                 tick_retention_settings,
                 submit_threadpool_executor,
+                sensor_evaluation_stats,
+                due_timestamp,
+                run_status_change_batch,
             )
             sensor_tick_futures[external_sensor.selector_id] = future
             yield
@@ -445,15 +639,23 @@ def execute_sensor_iteration(
         else:
             # evaluate the sensors in a loop, synchronously, yielding to allow the sensor daemon to
             # heartbeat
-            yield from _process_tick_generator(
-                workspace_process_context,
-                logger,
-                external_sensor,
-                sensor_state,
-                sensor_debug_crash_flags,
-                tick_retention_settings,
-                submit_threadpool_executor=None,
-            )
+            start_timestamp = get_current_timestamp()
+            try:
+                yield from _process_tick_generator(
+                    workspace_process_context,
+                    logger,
+                    external_sensor,
+                    sensor_state,
+                    sensor_debug_crash_flags,
+                    tick_retention_settings,
+                    submit_threadpool_executor=None,
+                    run_status_change_batch=run_status_change_batch,
+                )
+            finally:
+                if sensor_evaluation_stats:
+                    sensor_evaluation_stats.record_evaluation(
+                        external_sensor, due_timestamp, start_timestamp, get_current_timestamp()
+                    )
 
 
 def _process_tick(
@@ -464,20 +666,75 @@ def _process_tick(
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     tick_retention_settings,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    sensor_evaluation_stats: Optional[SensorEvaluationStats] = None,
+    due_timestamp: Optional[float] = None,
+    run_status_change_batch: Optional[RunStatusChangeBatch] = None,
 ):
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
-    return list(
-        _process_tick_generator(
-            workspace_process_context,
-            logger,
-            external_sensor,
-            sensor_state,
-            sensor_debug_crash_flags,
-            tick_retention_settings,
-            submit_threadpool_executor,
+    start_timestamp = get_current_timestamp()
+    try:
+        return list(
+            _process_tick_generator(
+                workspace_process_context,
+                logger,
+                external_sensor,
+                sensor_state,
+                sensor_debug_crash_flags,
+                tick_retention_settings,
+                submit_threadpool_executor,
+                run_status_change_batch,
+            )
         )
+    finally:
+        if sensor_evaluation_stats:
+            sensor_evaluation_stats.record_evaluation(
+                external_sensor, due_timestamp, start_timestamp, get_current_timestamp()
+            )
+
+
+def _fetch_run_status_change_batches(
+    instance: DagsterInstance,
+    due_sensors: Sequence[Tuple[ExternalSensor, InstigatorState, Optional[float]]],
+) -> Mapping[str, RunStatusChangeBatch]:
+    """Fetches the run status changes for the due run status sensors once per code location and
+    run status, instead of once per sensor, starting from the earliest cursor of those sensors.
+
+    Returns the batch that should be passed to each sensor, keyed by selector id.
+    """
+    cursors_by_location_and_status: Dict[Tuple[str, DagsterRunStatus], Dict[str, int]] = (
+        defaultdict(dict)
     )
+    for external_sensor, sensor_state, _ in due_sensors:
+        if external_sensor.sensor_type != SensorType.RUN_STATUS or not external_sensor.run_status:
+            continue
+
+        instigator_data = _sensor_instigator_data(sensor_state)
+        cursor = instigator_data.cursor if instigator_data else None
+        if not cursor or not RunStatusSensorCursor.is_valid(cursor):
+            continue
+
+        sensor_cursor = RunStatusSensorCursor.from_json(cursor)
+        if sensor_cursor.update_timestamp:
+            # run-sharded cursors are not storage ids in the index shard, so these sensors query
+            # the event log themselves
+            continue
+
+        cursors_by_location_and_status[
+            (external_sensor.handle.location_name, external_sensor.run_status)
+        ][external_sensor.selector_id] = sensor_cursor.record_id
+
+    batches: Dict[str, RunStatusChangeBatch] = {}
+    for (_, run_status), cursors in cursors_by_location_and_status.items():
+        # a single sensor is no better off with a shared batch than querying on its own
+        if len(cursors) < 2:
+            continue
+
+        batch = fetch_run_status_change_batch(instance, run_status, min(cursors.values()))
+        for selector_id in cursors:
+            batches[selector_id] = batch
+
+    return batches
 
 
 def _get_evaluation_tick(
@@ -566,6 +823,7 @@ def _process_tick_generator(
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     tick_retention_settings,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    run_status_change_batch: Optional[RunStatusChangeBatch] = None,
 ):
     instance = workspace_process_context.instance
     error_info = None
@@ -621,6 +879,7 @@ def _process_tick_generator(
                     sensor_state,
                     submit_threadpool_executor,
                     sensor_debug_crash_flags,
+                    run_status_change_batch,
                 )
 
     except Exception:
@@ -790,6 +1049,7 @@ def _evaluate_sensor(
     state: InstigatorState,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags] = None,
+    run_status_change_batch: Optional[RunStatusChangeBatch] = None,
 ):
     instance = workspace_process_context.instance
     context.logger.info(f"Checking for new runs for sensor: {external_sensor.name}")
@@ -806,6 +1066,7 @@ def _evaluate_sensor(
         instigator_data.cursor if instigator_data else None,
         context.log_key,
         instigator_data.last_sensor_start_timestamp if instigator_data else None,
+        run_status_change_batch=run_status_change_batch,
     )
 
     yield
@@ -1191,22 +1452,34 @@ def _submit_backfill_request(
     )
 
 
-def is_under_min_interval(state: InstigatorState, external_sensor: ExternalSensor) -> bool:
+def _get_sensor_due_timestamp(
+    state: InstigatorState, external_sensor: ExternalSensor
+) -> Optional[float]:
+    """The time at which the sensor's minimum interval has elapsed since its last tick, or None if
+    the sensor can be evaluated at any time.
+    """
     instigator_data = _sensor_instigator_data(state)
     if not instigator_data:
-        return False
+        return None
 
     if not instigator_data.last_tick_start_timestamp and not instigator_data.last_tick_timestamp:
-        return False
+        return None
 
     if not external_sensor.min_interval_seconds:
-        return False
+        return None
 
-    elapsed = get_current_timestamp() - max(
-        instigator_data.last_tick_timestamp or 0,
-        instigator_data.last_tick_start_timestamp or 0,
+    return (
+        max(
+            instigator_data.last_tick_timestamp or 0,
+            instigator_data.last_tick_start_timestamp or 0,
+        )
+        + external_sensor.min_interval_seconds
     )
-    return elapsed < external_sensor.min_interval_seconds
+
+
+def is_under_min_interval(state: InstigatorState, external_sensor: ExternalSensor) -> bool:
+    due_timestamp = _get_sensor_due_timestamp(state, external_sensor)
+    return due_timestamp is not None and get_current_timestamp() < due_timestamp
 
 
 def _fetch_existing_runs(
@@ -1219,6 +1492,24 @@ def _fetch_existing_runs(
     if not run_keys:
         return {}
 
+    if instance.run_storage.supports_run_key_index:
+        run_ids_by_key = instance.get_run_ids_by_run_key(
+            external_sensor.selector_id, run_keys, instigator_name=external_sensor.name
+        )
+        if not run_ids_by_key:
+            return {}
+        runs_by_id = {
+            run.run_id: run
+            for run in instance.get_runs(
+                filters=RunsFilter(run_ids=list(set(run_ids_by_key.values())))
+            )
+        }
+        return {
+            run_key: runs_by_id[run_id]
+            for run_key, run_id in run_ids_by_key.items()
+            if run_id in runs_by_id
+        }
+
     # fetch runs from the DB with only the run key tag
     # note: while possible to filter more at DB level with tags - it is avoided here due to observed
     # perf problems
@@ -0,0 +1,444 @@
+"""An asyncio-based alternative to `DagsterGrpcServer`.
+
+The default server runs every RPC on a single fixed-size thread pool, so a burst of slow sensor
+evaluations or repository snapshots can occupy every thread and cause `Ping` and `Heartbeat` calls
+to time out. This server accepts requests on an asyncio event loop and runs the (synchronous)
+`DagsterApiServer` methods on a separate thread pool per class of RPC, so that each class of
+request can only delay requests of the same class.
+
+Enable it for `dagster api grpc` by setting `DAGSTER_GRPC_USE_ASYNC_SERVER=1`. The size of the
+thread pool for each RPC class is set by `DAGSTER_GRPC_<RPC_CLASS>_CONCURRENCY_LIMIT`, and an
+optional per-request timeout in seconds by `DAGSTER_GRPC_<RPC_CLASS>_TIMEOUT`, e.g.
+`DAGSTER_GRPC_SENSOR_EVALUATION_TIMEOUT=60`.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+    TypeVar,
+)
+
+import grpc
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
+
+import dagster._check as check
+import dagster._seven as seven
+from dagster._core.utils import FuturesAwareThreadPoolExecutor
+
+from .__generated__.api_pb2_grpc import DagsterApiServicer, add_DagsterApiServicer_to_server
+from .server import CouldNotBindGrpcServerToAddress, update_rpc_class_metrics
+from .utils import default_grpc_server_shutdown_grace_period, max_rx_bytes, max_send_bytes
+
+T = TypeVar("T")
+
+
+class RpcClass(Enum):
+    # cheap calls that clients use to check on the health of the server
+    METADATA = "METADATA"
+    SENSOR_EVALUATION = "SENSOR_EVALUATION"
+    PARTITION_QUERIES = "PARTITION_QUERIES"
+    # everything else: repository and job snapshots, execution plans, runs
+    DEFINITIONS = "DEFINITIONS"
+
+
+RPC_CLASSES_BY_METHOD: Mapping[str, RpcClass] = {
+    "Ping": RpcClass.METADATA,
+    "Heartbeat": RpcClass.METADATA,
+    "StreamingPing": RpcClass.METADATA,
+    "GetServerId": RpcClass.METADATA,
+    "ListRepositories": RpcClass.METADATA,
+    "GetCurrentImage": RpcClass.METADATA,
+    "GetCurrentRuns": RpcClass.METADATA,
+    "CanCancelExecution": RpcClass.METADATA,
+    "CancelExecution": RpcClass.METADATA,
+    "ShutdownServer": RpcClass.METADATA,
+    "ExternalSensorExecution": RpcClass.SENSOR_EVALUATION,
+    "SyncExternalSensorExecution": RpcClass.SENSOR_EVALUATION,
+    "ExternalScheduleExecution": RpcClass.SENSOR_EVALUATION,
+    "SyncExternalScheduleExecution": RpcClass.SENSOR_EVALUATION,
+    "ExternalPartitionNames": RpcClass.PARTITION_QUERIES,
+    "ExternalPartitionConfig": RpcClass.PARTITION_QUERIES,
+    "ExternalPartitionTags": RpcClass.PARTITION_QUERIES,
+    "ExternalPartitionSetExecutionParams": RpcClass.PARTITION_QUERIES,
+}
+
+DEFAULT_RPC_CLASS_CONCURRENCY_LIMITS: Mapping[RpcClass, int] = {
+    RpcClass.METADATA: 4,
+    RpcClass.SENSOR_EVALUATION: 8,
+    RpcClass.PARTITION_QUERIES: 4,
+    RpcClass.DEFINITIONS: 4,
+}
+
+
+def get_rpc_class_concurrency_limit(rpc_class: RpcClass) -> int:
+    return int(
+        os.getenv(
+            f"DAGSTER_GRPC_{rpc_class.value}_CONCURRENCY_LIMIT",
+            str(DEFAULT_RPC_CLASS_CONCURRENCY_LIMITS[rpc_class]),
+        )
+    )
+
+
+def get_rpc_class_timeout(rpc_class: RpcClass) -> Optional[float]:
+    timeout = os.getenv(f"DAGSTER_GRPC_{rpc_class.value}_TIMEOUT")
+    return float(timeout) if timeout else None
+
+
+class RpcClassMetrics(TypedDict):
+    max_concurrent_requests: int
+    num_running_requests: int
+    num_queued_requests: int
+    num_completed_requests: int
+    num_timed_out_requests: int
+    total_queue_time_seconds: float
+    max_queue_time_seconds: float
+
+
+class RpcClassExecutor:
+    """Runs the requests of one class of RPC on a dedicated thread pool, keeping track of how long
+    requests wait for a thread.
+    """
+
+    def __init__(self, rpc_class: RpcClass, max_workers: int, timeout: Optional[float]):
+        check.invariant(max_workers > 0, f"Concurrency limit for {rpc_class.value} must be > 0")
+        self.rpc_class = rpc_class
+        self.timeout = timeout
+        self._executor = FuturesAwareThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"grpc-{rpc_class.value.lower()}",
+        )
+        self._lock = threading.Lock()
+        self._num_completed_requests = 0
+        self._num_timed_out_requests = 0
+        self._total_queue_time = 0.0
+        self._max_queue_time = 0.0
+
+    async def run(self, fn: Callable[..., T], *args: Any, deadline: Optional[float] = None) -> T:
+        """Run `fn` on this executor's thread pool, raising `asyncio.TimeoutError` if it does not
+        finish by `deadline` (a `time.monotonic()` value). A call that times out keeps running on
+        its thread until it returns, since threads cannot be interrupted.
+
+        Streaming RPCs call this once per item, so completed requests are counted separately by
+        `record_completed_request`.
+        """
+        submitted_at = time.monotonic()
+
+        def _run() -> T:
+            self._record_queue_time(time.monotonic() - submitted_at)
+            return fn(*args)
+
+        future = asyncio.get_running_loop().run_in_executor(self._executor, _run)
+        try:
+            if deadline is None:
+                return await future
+            return await asyncio.wait_for(future, timeout=max(deadline - time.monotonic(), 0))
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._num_timed_out_requests += 1
+            raise
+
+    def record_completed_request(self) -> None:
+        with self._lock:
+            self._num_completed_requests += 1
+
+    def _record_queue_time(self, queue_time: float) -> None:
+        with self._lock:
+            self._total_queue_time += queue_time
+            self._max_queue_time = max(self._max_queue_time, queue_time)
+
+    def get_metrics(self) -> RpcClassMetrics:
+        utilization = self._executor.get_current_utilization_metrics()
+        with self._lock:
+            return {
+                "max_concurrent_requests": self._executor.max_workers,
+                "num_running_requests": utilization["num_running_requests"] or 0,
+                "num_queued_requests": utilization["num_queued_requests"] or 0,
+                "num_completed_requests": self._num_completed_requests,
+                "num_timed_out_requests": self._num_timed_out_requests,
+                "total_queue_time_seconds": self._total_queue_time,
+                "max_queue_time_seconds": self._max_queue_time,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+class _ServicerContextSnapshot(grpc.ServicerContext):
+    """A read-only copy of the fields of a `grpc.aio.ServicerContext` that is safe to pass to
+    the synchronous `DagsterApiServer` methods on executor threads. The aio context belongs to the
+    event loop and must not be used from other threads.
+    """
+
+    def __init__(self, context: grpc.aio.ServicerContext, deadline: Optional[float]):
+        self._invocation_metadata: Tuple = tuple(context.invocation_metadata() or ())
+        self._peer: str = context.peer()
+        self._deadline = deadline
+
+    def invocation_metadata(self) -> Sequence:
+        return self._invocation_metadata
+
+    def peer(self) -> str:
+        return self._peer
+
+    def time_remaining(self) -> Optional[float]:
+        return max(self._deadline - time.monotonic(), 0) if self._deadline is not None else None
+
+    def is_active(self) -> bool:
+        return True
+
+    def _unsupported(self, *_args: Any, **_kwargs: Any) -> Any:
+        raise NotImplementedError(
+            "Only the invocation metadata, peer and time remaining of a request are available to"
+            " DagsterApiServer methods on the async server"
+        )
+
+    peer_identities = _unsupported
+    peer_identity_key = _unsupported
+    auth_context = _unsupported
+    set_compression = _unsupported
+    send_initial_metadata = _unsupported
+    set_trailing_metadata = _unsupported
+    trailing_metadata = _unsupported
+    abort = _unsupported
+    abort_with_status = _unsupported
+    set_code = _unsupported
+    code = _unsupported
+    set_details = _unsupported
+    details = _unsupported
+    disable_next_message_compression = _unsupported
+    cancel = _unsupported
+    add_callback = _unsupported
+
+
+class _AsyncDagsterApiHandler(grpc.GenericRpcHandler):
+    """Adapts the synchronous method handlers generated for `DagsterApiServicer` into coroutine
+    handlers that run on the executor for the method's RPC class.
+    """
+
+    def __init__(
+        self,
+        api_servicer: DagsterApiServicer,
+        executors: Mapping[RpcClass, RpcClassExecutor],
+        enable_metrics: bool,
+    ):
+        self._executors = executors
+        self._enable_metrics = enable_metrics
+        self._sync_handlers: list = []
+        # the generated code registers its handlers on a server; capture them instead
+        add_DagsterApiServicer_to_server(api_servicer, self)
+        self._wrapped_handlers: Dict[str, Optional[grpc.RpcMethodHandler]] = {}
+
+    def add_generic_rpc_handlers(self, generic_rpc_handlers) -> None:
+        self._sync_handlers.extend(generic_rpc_handlers)
+
+    def service(self, handler_call_details: grpc.HandlerCallDetails):
+        method = handler_call_details.method  # pyright: ignore[reportAttributeAccessIssue]
+        if method not in self._wrapped_handlers:
+            sync_handler = next(
+                (
+                    handler
+                    for handler in (
+                        generic_handler.service(handler_call_details)
+                        for generic_handler in self._sync_handlers
+                    )
+                    if handler is not None
+                ),
+                None,
+            )
+            self._wrapped_handlers[method] = (
+                self._wrap(method.rsplit("/", 1)[-1], sync_handler) if sync_handler else None
+            )
+        return self._wrapped_handlers[method]
+
+    def _wrap(self, method_name: str, handler: grpc.RpcMethodHandler) -> grpc.RpcMethodHandler:
+        executor = self._executors[RPC_CLASSES_BY_METHOD.get(method_name, RpcClass.DEFINITIONS)]
+
+        if handler.unary_unary:
+            behavior = handler.unary_unary
+
+            async def unary_unary(request: Any, context: grpc.aio.ServicerContext) -> Any:
+                deadline = self._deadline(executor)
+                try:
+                    response = await executor.run(
+                        behavior,
+                        request,
+                        _ServicerContextSnapshot(context, deadline),
+                        deadline=deadline,
+                    )
+                    executor.record_completed_request()
+                    return response
+                except asyncio.TimeoutError:
+                    await self._abort_timed_out(method_name, executor, context)
+                finally:
+                    self._update_metrics(executor)
+
+            return grpc.unary_unary_rpc_method_handler(
+                unary_unary,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+
+        check.invariant(handler.unary_stream is not None, f"Unsupported RPC type for {method_name}")
+        stream_behavior = handler.unary_stream
+
+        async def unary_stream(
+            request: Any, context: grpc.aio.ServicerContext
+        ) -> AsyncIterator[Any]:
+            deadline = self._deadline(executor)
+            done = object()
+            try:
+                sync_context = _ServicerContextSnapshot(context, deadline)
+                iterator: Iterator[Any] = await executor.run(
+                    lambda: iter(stream_behavior(request, sync_context)), deadline=deadline
+                )
+                while True:
+                    item = await executor.run(next, iterator, done, deadline=deadline)
+                    if item is done:
+                        break
+                    yield item
+                executor.record_completed_request()
+            except asyncio.TimeoutError:
+                await self._abort_timed_out(method_name, executor, context)
+            finally:
+                self._update_metrics(executor)
+
+        return grpc.unary_stream_rpc_method_handler(
+            unary_stream,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+    @staticmethod
+    def _deadline(executor: RpcClassExecutor) -> Optional[float]:
+        return time.monotonic() + executor.timeout if executor.timeout is not None else None
+
+    @staticmethod
+    async def _abort_timed_out(
+        method_name: str, executor: RpcClassExecutor, context: grpc.aio.ServicerContext
+    ) -> None:
+        await context.abort(
+            grpc.StatusCode.DEADLINE_EXCEEDED,
+            f"{method_name} did not complete within the {executor.timeout} second timeout for"
+            f" {executor.rpc_class.value} requests",
+        )
+
+    def _update_metrics(self, executor: RpcClassExecutor) -> None:
+        if self._enable_metrics:
+            update_rpc_class_metrics(executor.rpc_class.value, executor.get_metrics())
+
+
+class DagsterAsyncGrpcServer:
+    """Serves a `DagsterApiServer` on a `grpc.aio` server, with a separate thread pool for each
+    class of RPC. Takes the same arguments as `DagsterGrpcServer`, except for the thread pool.
+    """
+
+    def __init__(
+        self,
+        server_termination_event: threading.Event,
+        dagster_api_servicer: DagsterApiServicer,
+        logger: logging.Logger,
+        host="localhost",
+        port: Optional[int] = None,
+        socket: Optional[str] = None,
+        enable_metrics: bool = False,
+    ):
+        check.invariant(
+            port is not None if seven.IS_WINDOWS else True,
+            "You must pass a valid `port` on Windows: `socket` not supported.",
+        )
+        check.invariant(
+            (port or socket) and not (port and socket),
+            "You must pass one and only one of `port` or `socket`.",
+        )
+        check.invariant(
+            host is not None if port else True,
+            "Must provide a host when serving on a port",
+        )
+
+        self._logger = logger
+        self._server_termination_event = server_termination_event
+        self._api_servicer = dagster_api_servicer
+        self._executors = {
+            rpc_class: RpcClassExecutor(
+                rpc_class,
+                max_workers=get_rpc_class_concurrency_limit(rpc_class),
+                timeout=get_rpc_class_timeout(rpc_class),
+            )
+            for rpc_class in RpcClass
+        }
+
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self.server = grpc.aio.server(
+            compression=grpc.Compression.Gzip,
+            options=[
+                ("grpc.max_send_message_length", max_send_bytes()),
+                ("grpc.max_receive_message_length", max_rx_bytes()),
+            ],
+        )
+
+        self._health_servicer = health.aio.HealthServicer()
+        health_pb2_grpc.add_HealthServicer_to_server(self._health_servicer, self.server)
+        self.server.add_generic_rpc_handlers(
+            (
+                _AsyncDagsterApiHandler(
+                    dagster_api_servicer,
+                    self._executors,
+                    enable_metrics=check.bool_param(enable_metrics, "enable_metrics"),
+                ),
+            )
+        )
+
+        if port:
+            server_address = host + ":" + str(port)
+        else:
+            server_address = "unix:" + os.path.abspath(check.not_none(socket))
+
+        res = self.server.add_insecure_port(server_address)
+        if socket and res != 1:
+            raise CouldNotBindGrpcServerToAddress(socket)
+        if port and res != port:
+            raise CouldNotBindGrpcServerToAddress(port)
+
+    def get_rpc_class_metrics(self) -> Mapping[str, RpcClassMetrics]:
+        return {
+            rpc_class.value: executor.get_metrics()
+            for rpc_class, executor in self._executors.items()
+        }
+
+    def serve(self) -> None:
+        try:
+            self._loop.run_until_complete(self._serve())
+        finally:
+            self._api_servicer.cleanup()  # pyright: ignore[reportAttributeAccessIssue]
+            for executor in self._executors.values():
+                executor.shutdown()
+            self._loop.close()
+
+    async def _serve(self) -> None:
+        await self.server.start()
+        await self._health_servicer.set("DagsterApi", health_pb2.HealthCheckResponse.SERVING)
+
+        # wait for the termination event on a thread, keeping the event loop free to serve
+        await asyncio.get_running_loop().run_in_executor(None, self._server_termination_event.wait)
+
+        shutdown_grace_period = default_grpc_server_shutdown_grace_period()
+        self._logger.info(
+            f"Stopping server once all current RPC calls terminate or {shutdown_grace_period}"
+            " seconds pass"
+        )
+        await self.server.stop(grace=shutdown_grace_period)
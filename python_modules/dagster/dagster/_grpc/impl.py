@@ -3,6 +3,7 @@
 import os
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, nullcontext
 from typing import (
     TYPE_CHECKING,
@@ -29,6 +30,7 @@
 )
 from dagster._core.definitions.reconstruct import ReconstructableJob
 from dagster._core.definitions.repository_definition import RepositoryDefinition
+from dagster._core.definitions.repository_definition.repository_data import lazy_definition_loading
 from dagster._core.definitions.sensor_definition import SensorEvaluationContext
 from dagster._core.errors import (
     DagsterExecutionInterruptedError,
@@ -40,6 +42,7 @@
 )
 from dagster._core.events import DagsterEvent, EngineEventData
 from dagster._core.execution.api import create_execution_plan, execute_run_iterator
+from dagster._core.execution.run_worker_startup_profiler import RunWorkerStartupProfiler
 from dagster._core.instance import DagsterInstance
 from dagster._core.instance.ref import InstanceRef
 from dagster._core.remote_representation import external_job_data_from_def
@@ -68,10 +71,12 @@
 from dagster._utils import start_termination_thread
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
+from dagster._utils.lru_cache import LRUCache
 
 from .types import ExecuteExternalJobArgs
 
 if TYPE_CHECKING:
+    from dagster._core.definitions.run_status_sensor_definition import RunStatusChangeBatch
     from dagster._core.definitions.schedule_definition import ScheduleExecutionData
     from dagster._core.definitions.sensor_definition import SensorExecutionData
 
@@ -99,10 +104,14 @@ def core_execute_run(
     instance: DagsterInstance,
     inject_env_vars: bool,
     resume_from_failure: bool = False,
+    lazy_load_definitions: bool = False,
+    startup_profiler: Optional[RunWorkerStartupProfiler] = None,
 ) -> Generator[DagsterEvent, None, None]:
     check.inst_param(recon_job, "recon_job", ReconstructableJob)
     check.inst_param(dagster_run, "dagster_run", DagsterRun)
     check.inst_param(instance, "instance", DagsterInstance)
+    check.bool_param(lazy_load_definitions, "lazy_load_definitions")
+    check.opt_inst_param(startup_profiler, "startup_profiler", RunWorkerStartupProfiler)
 
     if inject_env_vars:
         try:
@@ -132,7 +141,12 @@ def core_execute_run(
             recon_job = recon_job.with_repository_load_data(
                 execution_plan_snapshot.repository_load_data,
             )
-        recon_job.get_definition()
+        # only the definitions used by the job need to be constructed when loading lazily
+        with lazy_definition_loading() if lazy_load_definitions else nullcontext():
+            if startup_profiler:
+                startup_profiler.load_job_definition(recon_job)
+            else:
+                recon_job.get_definition()
     except Exception:
         yield instance.report_engine_event(
             "Could not load job definition.",
@@ -142,6 +156,13 @@ def core_execute_run(
         yield from _report_run_failed_if_not_finished(instance, dagster_run.run_id)
         raise
 
+    if startup_profiler:
+        yield instance.report_engine_event(
+            startup_profiler.get_engine_event_message(),
+            dagster_run,
+            startup_profiler.get_engine_event_data(),
+        )
+
     # Reload the run to verify that its status didn't change while the pipeline was loaded
     dagster_run = check.not_none(
         instance.get_run_by_id(dagster_run.run_id),
@@ -363,6 +384,7 @@ def get_external_sensor_execution(
     cursor: Optional[str],
     log_key: Optional[Sequence[str]],
     last_sensor_start_timestamp: Optional[float],
+    run_status_change_batch: Optional["RunStatusChangeBatch"] = None,
 ) -> Union["SensorExecutionData", ExternalSensorExecutionErrorData]:
     from dagster._core.execution.resources_init import get_transitive_required_resource_keys
 
@@ -390,6 +412,7 @@ def get_external_sensor_execution(
             resources=resources_to_build,
             last_sensor_start_time=last_sensor_start_timestamp,
             code_location_origin=code_location_origin,
+            run_status_change_batch=run_status_change_batch,
         ) as sensor_context:
             with user_code_error_boundary(
                 SensorExecutionError,
@@ -558,7 +581,18 @@ def get_partition_set_execution_param_data(
     partition_set_name: str,
     partition_names: Sequence[str],
     instance_ref: Optional[InstanceRef] = None,
+    partition_data_cache: Optional[
+        LRUCache[Tuple[str, str, str], ExternalPartitionExecutionParamData]
+    ] = None,
+    max_workers: int = 1,
 ) -> Union[ExternalPartitionSetExecutionParamData, ExternalPartitionExecutionErrorData]:
+    """Evaluate the run config and tags for each of the given partitions of a partition set.
+
+    If a `partition_data_cache` is provided, the evaluated data for each partition is memoized
+    there, keyed on the repository, partition set and partition key. Callers must only share a
+    cache across calls for the same loaded definitions. If `max_workers` is greater than 1, the
+    partitions are evaluated in a thread pool of that size.
+    """
     (
         job_def,
         partitions_def,
@@ -577,28 +611,43 @@ def get_partition_set_execution_param_data(
                 all_partition_keys = partitions_def.get_partition_keys(
                     dynamic_partitions_store=instance
                 )
-                partition_keys = [key for key in all_partition_keys if key in partition_names]
+                partition_names_set = set(partition_names)
+                partition_keys = [key for key in all_partition_keys if key in partition_names_set]
 
-            partition_data = []
-            for key in partition_keys:
+            def _error_message_fn(partition_name: str):
+                return lambda: (
+                    "Error occurred during the partition config and tag generation for"
+                    f" '{partition_name}' in partitioned config on job '{job_def.name}'"
+                )
 
-                def _error_message_fn(partition_name: str):
-                    return lambda: (
-                        "Error occurred during the partition config and tag generation for"
-                        f" '{partition_name}' in partitioned config on job '{job_def.name}'"
-                    )
+            def _get_partition_data(key: str) -> ExternalPartitionExecutionParamData:
+                cache_key = (repo_def.name, partition_set_name, key)
+                if partition_data_cache is not None:
+                    cached_data = partition_data_cache.get(cache_key)
+                    if cached_data is not None:
+                        return cached_data
 
                 with user_code_error_boundary(PartitionExecutionError, _error_message_fn(key)):
                     run_config = partitioned_config.get_run_config_for_partition_key(key)
                     tags = partitioned_config.get_tags_for_partition_key(key, job_name=job_def.name)
 
-                partition_data.append(
-                    ExternalPartitionExecutionParamData(
-                        name=key,
-                        tags=tags,
-                        run_config=run_config,
-                    )
+                data = ExternalPartitionExecutionParamData(
+                    name=key,
+                    tags=tags,
+                    run_config=run_config,
                 )
+                if partition_data_cache is not None:
+                    partition_data_cache.set(cache_key, data)
+                return data
+
+            if max_workers > 1 and len(partition_keys) > 1:
+                # results (and the first error, if any) are returned in partition order
+                with ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="partition_evaluation_worker"
+                ) as executor:
+                    partition_data = list(executor.map(_get_partition_data, partition_keys))
+            else:
+                partition_data = [_get_partition_data(key) for key in partition_keys]
 
             return ExternalPartitionSetExecutionParamData(partition_data=partition_data)
 
@@ -48,6 +48,7 @@
 from dagster._core.remote_representation.external_data import (
     ExternalJobSubsetResult,
     ExternalPartitionExecutionErrorData,
+    ExternalPartitionExecutionParamData,
     ExternalRepositoryErrorData,
     ExternalScheduleExecutionErrorData,
     ExternalSensorExecutionErrorData,
@@ -55,6 +56,7 @@
     external_repository_data_from_def,
 )
 from dagster._core.remote_representation.origin import RemoteRepositoryOrigin
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshotErrorData
 from dagster._core.types.loadable_target_origin import (
     LoadableTargetOrigin,
     enter_loadable_target_origin_load_context,
@@ -69,6 +71,7 @@
     retrieve_containerized_utilization_metrics,
 )
 from dagster._utils.error import serializable_error_info_from_exc_info
+from dagster._utils.lru_cache import LRUCache
 from dagster._utils.typed_dict import init_optional_typeddict
 
 from .__generated__ import api_pb2
@@ -126,6 +129,25 @@
 
 UTILIZATION_METRICS_RETRIEVAL_INTERVAL = 30
 
+# Number of serialized execution plan snapshots to keep in memory, keyed on the (content-addressed)
+# serialized request args. Set to 0 to disable the cache.
+EXECUTION_PLAN_SNAPSHOT_CACHE_SIZE = int(
+    os.getenv("DAGSTER_GRPC_EXECUTION_PLAN_SNAPSHOT_CACHE_SIZE", "32")
+)
+
+# Number of evaluated partition run configs and tags to keep in memory, keyed on repository, partition
+# set and partition key, so that repeated backfill submissions over the same partitions don't
+# re-invoke the partitioned config functions. Disabled (0) by default, since those functions may
+# depend on state outside of the definitions (the current time, env vars, external systems), so
+# only opt in when they are deterministic.
+PARTITION_DATA_CACHE_SIZE = int(os.getenv("DAGSTER_GRPC_PARTITION_DATA_CACHE_SIZE", "0"))
+
+# Number of threads used to evaluate the partitions of a single batched partition request. Partition
+# config functions are usually CPU-bound, so this only helps when they do I/O.
+PARTITION_EVALUATION_MAX_WORKERS = int(
+    os.getenv("DAGSTER_GRPC_PARTITION_EVALUATION_MAX_WORKERS", "1")
+)
+
 _METRICS_LOCK = threading.Lock()
 METRICS_RETRIEVAL_FUNCTIONS = set()
 
@@ -138,6 +160,8 @@ class DagsterCodeServerUtilizationMetrics(TypedDict):
     container_utilization: ContainerUtilizationMetrics
     request_utilization: RequestUtilizationMetrics
     per_api_metrics: Dict[str, GrpcApiMetrics]
+    # only populated by the async server, which has a separate thread pool per class of RPC
+    per_rpc_class_metrics: Dict[str, Mapping[str, Any]]
 
 
 _UTILIZATION_METRICS = init_optional_typeddict(DagsterCodeServerUtilizationMetrics)
@@ -165,6 +189,11 @@ def _record_utilization_metrics(logger: logging.Logger) -> None:
             _UTILIZATION_METRICS["container_utilization"][key] = val
 
 
+def update_rpc_class_metrics(rpc_class: str, metrics: Mapping[str, Any]) -> None:
+    with _METRICS_LOCK:
+        _UTILIZATION_METRICS["per_rpc_class_metrics"][rpc_class] = metrics
+
+
 class CouldNotBindGrpcServerToAddress(Exception):
     pass
 
@@ -397,6 +426,18 @@ def __init__(
         self._enable_metrics = check.bool_param(enable_metrics, "enable_metrics")
         self._server_threadpool_executor = server_threadpool_executor
 
+        # The loaded definitions never change over the lifetime of the server, so execution plan
+        # snapshots can be reused across identical requests (e.g. the webserver, the run launcher
+        # and backfills all asking for the plan of the same job + selection + run config).
+        self._execution_plan_snapshot_cache: Optional[LRUCache[str, str]] = (
+            LRUCache(EXECUTION_PLAN_SNAPSHOT_CACHE_SIZE)
+            if EXECUTION_PLAN_SNAPSHOT_CACHE_SIZE > 0
+            else None
+        )
+        self._partition_data_cache: Optional[
+            LRUCache[Tuple[str, str, str], ExternalPartitionExecutionParamData]
+        ] = LRUCache(PARTITION_DATA_CACHE_SIZE) if PARTITION_DATA_CACHE_SIZE > 0 else None
+
         try:
             if inject_env_vars_from_instance:
                 from dagster._cli.utils import get_instance_for_cli
@@ -559,6 +600,14 @@ def GetServerId(
     def ExecutionPlanSnapshot(
         self, request: api_pb2.ExecutionPlanSnapshotRequest, _context: grpc.ServicerContext
     ) -> api_pb2.ExecutionPlanSnapshotReply:
+        cache_key = request.serialized_execution_plan_snapshot_args
+        if self._execution_plan_snapshot_cache is not None:
+            cached_snapshot = self._execution_plan_snapshot_cache.get(cache_key)
+            if cached_snapshot is not None:
+                return api_pb2.ExecutionPlanSnapshotReply(
+                    serialized_execution_plan_snapshot=cached_snapshot
+                )
+
         execution_plan_args = deserialize_value(
             request.serialized_execution_plan_snapshot_args,
             ExecutionPlanSnapshotArgs,
@@ -569,8 +618,17 @@ def ExecutionPlanSnapshot(
             execution_plan_args.job_origin.job_name,
             execution_plan_args,
         )
+        serialized_snapshot = serialize_value(execution_plan_snapshot_or_error)
+
+        # errors may be transient (e.g. dynamic partitions that do not exist yet), so only
+        # successfully built plans are cached
+        if self._execution_plan_snapshot_cache is not None and not isinstance(
+            execution_plan_snapshot_or_error, ExecutionPlanSnapshotErrorData
+        ):
+            self._execution_plan_snapshot_cache.set(cache_key, serialized_snapshot)
+
         return api_pb2.ExecutionPlanSnapshotReply(
-            serialized_execution_plan_snapshot=serialize_value(execution_plan_snapshot_or_error)
+            serialized_execution_plan_snapshot=serialized_snapshot
         )
 
     def ListRepositories(
@@ -659,6 +717,8 @@ def ExternalPartitionSetExecutionParams(
                     partition_set_name=args.partition_set_name,
                     partition_names=args.partition_names,
                     instance_ref=instance_ref,
+                    partition_data_cache=self._partition_data_cache,
+                    max_workers=PARTITION_EVALUATION_MAX_WORKERS,
                 )
             )
         except Exception:
@@ -903,6 +963,7 @@ def _external_sensor_execution(self, request: api_pb2.ExternalSensorExecutionReq
                     args.cursor,
                     args.log_key,
                     args.last_sensor_start_time,
+                    args.run_status_change_batch,
                 )
             )
         except Exception:
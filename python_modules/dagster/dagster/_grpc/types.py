@@ -6,6 +6,7 @@
 from dagster._core.code_pointer import CodePointer
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.run_status_sensor_definition import RunStatusChangeBatch
 from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.execution.retries import RetryMode
 from dagster._core.instance.ref import InstanceRef
@@ -601,6 +602,7 @@ class SensorExecutionArgs(
             ("last_sensor_start_time", Optional[float]),
             # deprecated
             ("last_completion_time", Optional[float]),
+            ("run_status_change_batch", Optional[RunStatusChangeBatch]),
         ],
     )
 ):
@@ -617,6 +619,7 @@ def __new__(
         last_sensor_start_time: Optional[float] = None,
         # deprecated param
         last_completion_time: Optional[float] = None,
+        run_status_change_batch: Optional[RunStatusChangeBatch] = None,
     ):
         # populate both last_tick_completion_time and last_completion_time for backcompat, so that
         # older versions can still construct the correct context object.  We manually create the
@@ -641,6 +644,9 @@ def __new__(
                 last_sensor_start_time, "last_sensor_start_time"
             ),
             last_completion_time=normalized_last_tick_completion_time,
+            run_status_change_batch=check.opt_inst_param(
+                run_status_change_batch, "run_status_change_batch", RunStatusChangeBatch
+            ),
         )
 
 
@@ -1,4 +1,5 @@
 import datetime
+import itertools
 import logging
 import os
 import random
@@ -9,8 +10,10 @@
 from contextlib import AbstractContextManager, ExitStack
 from typing import (
     TYPE_CHECKING,
+    Any,
     Dict,
     Generator,
+    Iterable,
     List,
     Mapping,
     NamedTuple,
@@ -57,6 +60,7 @@
 from dagster._utils.merger import merge_dicts
 
 if TYPE_CHECKING:
+    from dagster._core.definitions.schedule_definition import ScheduleExecutionData
     from dagster._daemon.daemon import DaemonIterator
 
 
@@ -71,6 +75,11 @@
     os.getenv("DAGSTER_SCHEDULE_CHECKPOINT_JITTER_SECONDS", "600")
 )
 
+# When a schedule has fallen behind, the ticks that it needs to catch up on are created and
+# evaluated in batches of this size, with the evaluations of a batch running concurrently. Ticks
+# are still processed (and their runs created and submitted) in order.
+SCHEDULE_CATCHUP_BATCH_SIZE = int(os.getenv("DAGSTER_SCHEDULE_CATCHUP_BATCH_SIZE", "1"))
+
 # How long to wait if an error is raised in the SchedulerDaemon iteration
 ERROR_INTERVAL_TIME = 5
 
@@ -102,11 +111,7 @@ def tick_id(self) -> str:
 
     @property
     def log_key(self) -> Sequence[str]:
-        return [
-            self._external_schedule.handle.repository_name,
-            self._external_schedule.name,
-            self.tick_id,
-        ]
+        return _get_tick_log_key(self._external_schedule, self._tick)
 
     def update_state(self, status, error=None, **kwargs):
         skip_reason = kwargs.get("skip_reason")
@@ -143,6 +148,14 @@ def __exit__(self, exception_type, exception_value, traceback):
             )
 
 
+def _get_tick_log_key(external_schedule: ExternalSchedule, tick: InstigatorTick) -> Sequence[str]:
+    return [
+        external_schedule.handle.repository_name,
+        external_schedule.name,
+        str(tick.tick_id),
+    ]
+
+
 SECONDS_IN_MINUTE = 60
 
 
@@ -497,21 +510,32 @@ def launch_scheduled_runs_for_schedule_iterator(
     instance = workspace_process_context.instance
 
     instigator_origin_id = external_schedule.get_external_origin_id()
-    ticks = instance.get_ticks(instigator_origin_id, external_schedule.selector_id, limit=1)
+    # the ticks of a catch-up batch are all created before any of them is processed, so an
+    # interrupted batch can leave several ticks to resume, not just the latest one
+    ticks = instance.get_ticks(
+        instigator_origin_id,
+        external_schedule.selector_id,
+        limit=max(SCHEDULE_CATCHUP_BATCH_SIZE, 1),
+    )
     latest_tick: Optional[InstigatorTick] = ticks[0] if ticks else None
+    resumable_ticks = list(
+        itertools.takewhile(
+            lambda tick: tick.status == TickStatus.STARTED
+            or (tick.status == TickStatus.FAILURE and tick.failure_count <= max_tick_retries),
+            ticks,
+        )
+    )
+    resumable_ticks_by_timestamp = {tick.timestamp: tick for tick in resumable_ticks}
 
     instigator_data = cast(ScheduleInstigatorData, schedule_state.instigator_data)
     start_timestamp_utc: float = instigator_data.start_timestamp or 0
 
     if latest_tick:
-        if latest_tick.status == TickStatus.STARTED or (
-            latest_tick.status == TickStatus.FAILURE
-            and latest_tick.failure_count <= max_tick_retries
-        ):
-            # Scheduler was interrupted while performing this tick, re-do it
+        if resumable_ticks:
+            # Scheduler was interrupted while performing these ticks, re-do them
             start_timestamp_utc = max(
                 start_timestamp_utc,
-                latest_tick.timestamp,
+                resumable_ticks[-1].timestamp,
                 instigator_data.last_iteration_timestamp or 0.0,
                 in_memory_last_iteration_timestamp or 0.0,
             )
@@ -582,89 +606,123 @@ def launch_scheduled_runs_for_schedule_iterator(
         times = ", ".join([time.strftime(default_date_format_string()) for time in tick_times])
         logger.info(f"Evaluating schedule `{schedule_name}` at the following times: {times}")
 
-    for schedule_time in tick_times:
-        schedule_timestamp = schedule_time.timestamp()
-        schedule_time_str = schedule_time.strftime(default_date_format_string())
-        if latest_tick and latest_tick.timestamp == schedule_timestamp:
-            tick = latest_tick
-            if latest_tick.status == TickStatus.FAILURE:
-                logger.info(f"Retrying previously failed schedule execution at {schedule_time_str}")
+    for tick_batch_start in range(0, len(tick_times), max(SCHEDULE_CATCHUP_BATCH_SIZE, 1)):
+        tick_batch = tick_times[
+            tick_batch_start : tick_batch_start + max(SCHEDULE_CATCHUP_BATCH_SIZE, 1)
+        ]
+        batch_ticks = []
+        for schedule_time in tick_batch:
+            schedule_timestamp = schedule_time.timestamp()
+            schedule_time_str = schedule_time.strftime(default_date_format_string())
+            if schedule_timestamp in resumable_ticks_by_timestamp:
+                tick = resumable_ticks_by_timestamp[schedule_timestamp]
+                if tick.status == TickStatus.FAILURE:
+                    logger.info(
+                        f"Retrying previously failed schedule execution at {schedule_time_str}"
+                    )
+                else:
+                    logger.info(
+                        f"Resuming previously interrupted schedule execution at {schedule_time_str}"
+                    )
             else:
-                logger.info(
-                    f"Resuming previously interrupted schedule execution at {schedule_time_str}"
-                )
-        else:
-            tick = instance.create_tick(
-                TickData(
-                    instigator_origin_id=instigator_origin_id,
-                    instigator_name=schedule_name,
-                    instigator_type=InstigatorType.SCHEDULE,
-                    status=TickStatus.STARTED,
-                    timestamp=schedule_timestamp,
-                    selector_id=external_schedule.selector_id,
+                tick = instance.create_tick(
+                    TickData(
+                        instigator_origin_id=instigator_origin_id,
+                        instigator_name=schedule_name,
+                        instigator_type=InstigatorType.SCHEDULE,
+                        status=TickStatus.STARTED,
+                        timestamp=schedule_timestamp,
+                        selector_id=external_schedule.selector_id,
+                    )
                 )
-            )
-
-            check_for_debug_crash(schedule_debug_crash_flags, "TICK_CREATED")
 
-        with _ScheduleLaunchContext(
-            external_schedule, tick, instance, logger, tick_retention_settings
-        ) as tick_context:
-            try:
-                check_for_debug_crash(schedule_debug_crash_flags, "TICK_HELD")
-                tick_context.add_log_key(tick_context.log_key)
+                check_for_debug_crash(schedule_debug_crash_flags, "TICK_CREATED")
+            batch_ticks.append(tick)
 
-                yield from _schedule_runs_at_time(
-                    workspace_process_context,
-                    logger,
-                    external_schedule,
-                    schedule_time,
-                    timezone_str,
-                    tick_context,
-                    submit_threadpool_executor,
-                    schedule_debug_crash_flags,
+        with ExitStack() as stack:
+            evaluation_futures: Dict[str, Future] = {}
+            if len(tick_batch) > 1:
+                evaluation_executor = stack.enter_context(
+                    InheritContextThreadPoolExecutor(
+                        max_workers=len(tick_batch),
+                        thread_name_prefix="schedule_catchup_evaluation_worker",
+                    )
                 )
-            except Exception as e:
-                if isinstance(e, (DagsterUserCodeUnreachableError, DagsterCodeLocationLoadError)):
+                for schedule_time, tick in zip(tick_batch, batch_ticks):
+                    evaluation_futures[str(tick.tick_id)] = evaluation_executor.submit(
+                        _evaluate_schedule_at_time,
+                        workspace_process_context,
+                        external_schedule,
+                        schedule_time,
+                        timezone_str,
+                        _get_tick_log_key(external_schedule, tick),
+                    )
+
+            for schedule_time, tick in zip(tick_batch, batch_ticks):
+                with _ScheduleLaunchContext(
+                    external_schedule, tick, instance, logger, tick_retention_settings
+                ) as tick_context:
                     try:
-                        raise DagsterSchedulerError(
-                            f"Unable to reach the user code server for schedule {schedule_name}."
-                            " Schedule will resume execution once the server is available."
-                        ) from e
-                    except:
-                        error_data = serializable_error_info_from_exc_info(sys.exc_info())
-
-                        logger.exception(
-                            "Scheduler daemon caught an error for schedule "
-                            f"{external_schedule.name}"
+                        check_for_debug_crash(schedule_debug_crash_flags, "TICK_HELD")
+                        tick_context.add_log_key(tick_context.log_key)
+
+                        yield from _schedule_runs_at_time(
+                            workspace_process_context,
+                            logger,
+                            external_schedule,
+                            schedule_time,
+                            timezone_str,
+                            tick_context,
+                            submit_threadpool_executor,
+                            schedule_debug_crash_flags,
+                            schedule_execution_data_future=evaluation_futures.get(
+                                tick_context.tick_id
+                            ),
                         )
-
-                        tick_context.update_state(
-                            TickStatus.FAILURE,
-                            error=error_data,
-                            # don't increment the failure count - retry forever until the server comes back up
-                            # or the schedule is turned off
-                            failure_count=tick_context.failure_count,
+                    except Exception as e:
+                        if isinstance(
+                            e, (DagsterUserCodeUnreachableError, DagsterCodeLocationLoadError)
+                        ):
+                            try:
+                                raise DagsterSchedulerError(
+                                    "Unable to reach the user code server for schedule"
+                                    f" {schedule_name}. Schedule will resume execution once the"
+                                    " server is available."
+                                ) from e
+                            except:
+                                error_data = serializable_error_info_from_exc_info(sys.exc_info())
+
+                                logger.exception(
+                                    "Scheduler daemon caught an error for schedule "
+                                    f"{external_schedule.name}"
+                                )
+
+                                tick_context.update_state(
+                                    TickStatus.FAILURE,
+                                    error=error_data,
+                                    # don't increment the failure count - retry forever until the server comes back up
+                                    # or the schedule is turned off
+                                    failure_count=tick_context.failure_count,
+                                )
+                                yield error_data
+                        else:
+                            error_data = serializable_error_info_from_exc_info(sys.exc_info())
+                            tick_context.update_state(
+                                TickStatus.FAILURE,
+                                error=error_data,
+                                failure_count=tick_context.failure_count + 1,
+                            )
+                            yield error_data
+
+                        # Plan to run the same tick again using the schedule timestamp
+                        # as both the next_iteration_timestamp and the last_iteration_timestmap
+                        # (to ensure that the scheduler doesn't accidentally skip past it)
+                        yield ScheduleIterationTimes(
+                            cron_schedule=external_schedule.cron_schedule,
+                            next_iteration_timestamp=schedule_time.timestamp(),
+                            last_iteration_timestamp=schedule_time.timestamp(),
                         )
-                        yield error_data
-                else:
-                    error_data = serializable_error_info_from_exc_info(sys.exc_info())
-                    tick_context.update_state(
-                        TickStatus.FAILURE,
-                        error=error_data,
-                        failure_count=tick_context.failure_count + 1,
-                    )
-                    yield error_data
-
-                # Plan to run the same tick again using the schedule timestamp
-                # as both the next_iteration_timestamp and the last_iteration_timestmap
-                # (to ensure that the scheduler doesn't accidentally skip past it)
-                yield ScheduleIterationTimes(
-                    cron_schedule=external_schedule.cron_schedule,
-                    next_iteration_timestamp=schedule_time.timestamp(),
-                    last_iteration_timestamp=schedule_time.timestamp(),
-                )
-                return
+                        return
 
     # now log the iteration timestamp
     next_checkpoint_timestamp = _write_and_get_next_checkpoint_timestamp(
@@ -689,6 +747,77 @@ class SubmitRunRequestResult(NamedTuple):
     error_info: Optional[SerializableErrorInfo]
     existing_run: Optional[DagsterRun]
     submitted_run: Optional[DagsterRun]
+    # set when the run for the request could not be created
+    creation_error: Optional[Exception] = None
+
+
+def _get_run_request_creation_args(
+    run_request: RunRequest,
+    workspace_process_context: IWorkspaceProcessContext,
+    external_schedule: ExternalSchedule,
+    schedule_time: datetime.datetime,
+) -> Mapping[str, Any]:
+    schedule_origin = external_schedule.get_external_origin()
+    job_subset_selector = JobSubsetSelector(
+        location_name=schedule_origin.repository_origin.code_location_origin.location_name,
+        repository_name=schedule_origin.repository_origin.repository_name,
+        job_name=external_schedule.job_name,
+        op_selection=external_schedule.op_selection,
+        asset_selection=run_request.asset_selection,
+    )
+
+    # reload the code_location on each submission, request_context derived data can become out date
+    # * non-threaded: if number of serial submissions is too many
+    # * threaded: if thread sits pending in pool too long
+    code_location = _get_code_location_for_schedule(workspace_process_context, external_schedule)
+
+    external_job = code_location.get_external_job(job_subset_selector)
+
+    return _get_scheduler_run_creation_args(
+        workspace_process_context.instance,
+        schedule_time,
+        code_location,
+        external_schedule,
+        external_job,
+        run_request,
+    )
+
+
+def _submit_run(
+    run: DagsterRun,
+    workspace_process_context: IWorkspaceProcessContext,
+    external_schedule: ExternalSchedule,
+    logger: logging.Logger,
+) -> Optional[SerializableErrorInfo]:
+    if run.status == DagsterRunStatus.FAILURE:
+        return None
+
+    try:
+        workspace_process_context.instance.submit_run(
+            run.run_id, workspace_process_context.create_request_context()
+        )
+        logger.info(f"Completed scheduled launch of run {run.run_id} for {external_schedule.name}")
+    except Exception:
+        logger.exception(f"Run {run.run_id} created successfully but failed to launch")
+        return serializable_error_info_from_exc_info(sys.exc_info())
+
+    return None
+
+
+def _log_existing_run(
+    run: DagsterRun, external_schedule: ExternalSchedule, logger: logging.Logger
+) -> None:
+    if run.status != DagsterRunStatus.NOT_STARTED:
+        # A run already exists and was launched for this time period,
+        # but the scheduler must have crashed or errored before the tick could be put
+        # into a SUCCESS state
+        logger.info(
+            f"Run {run.run_id} already completed for this execution of {external_schedule.name}"
+        )
+    else:
+        logger.info(
+            f"Run {run.run_id} already created for this execution of {external_schedule.name}"
+        )
 
 
 def _submit_run_request(
@@ -696,77 +825,138 @@ def _submit_run_request(
     workspace_process_context: IWorkspaceProcessContext,
     external_schedule: ExternalSchedule,
     schedule_time: datetime.datetime,
-    logger,
-    debug_crash_flags,
+    logger: logging.Logger,
+    debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
+    existing_run_ids_by_key: Optional[Mapping[str, str]] = None,
 ) -> SubmitRunRequestResult:
     instance = workspace_process_context.instance
-    schedule_origin = external_schedule.get_external_origin()
 
-    run = _get_existing_run_for_request(instance, external_schedule, schedule_time, run_request)
+    run = _get_existing_run_for_request(
+        instance, external_schedule, schedule_time, run_request, existing_run_ids_by_key
+    )
     if run:
+        _log_existing_run(run, external_schedule, logger)
         if run.status != DagsterRunStatus.NOT_STARTED:
-            # A run already exists and was launched for this time period,
-            # but the scheduler must have crashed or errored before the tick could be put
-            # into a SUCCESS state
-            logger.info(
-                f"Run {run.run_id} already completed for this execution of {external_schedule.name}"
-            )
             return SubmitRunRequestResult(
                 run_key=run_request.run_key, error_info=None, existing_run=run, submitted_run=None
             )
-        else:
-            logger.info(
-                f"Run {run.run_id} already created for this execution of {external_schedule.name}"
-            )
     else:
-        job_subset_selector = JobSubsetSelector(
-            location_name=schedule_origin.repository_origin.code_location_origin.location_name,
-            repository_name=schedule_origin.repository_origin.repository_name,
-            job_name=external_schedule.job_name,
-            op_selection=external_schedule.op_selection,
-            asset_selection=run_request.asset_selection,
-        )
-
-        # reload the code_location on each submission, request_context derived data can become out date
-        # * non-threaded: if number of serial submissions is too many
-        # * threaded: if thread sits pending in pool too long
-        code_location = _get_code_location_for_schedule(
-            workspace_process_context, external_schedule
-        )
-
-        external_job = code_location.get_external_job(job_subset_selector)
-
-        run = _create_scheduler_run(
-            instance,
-            schedule_time,
-            code_location,
-            external_schedule,
-            external_job,
-            run_request,
+        run = instance.create_run(
+            **_get_run_request_creation_args(
+                run_request, workspace_process_context, external_schedule, schedule_time
+            )
         )
 
     check_for_debug_crash(debug_crash_flags, "RUN_CREATED")
 
-    error_info = None
-
-    if run.status != DagsterRunStatus.FAILURE:
-        try:
-            instance.submit_run(run.run_id, workspace_process_context.create_request_context())
-            logger.info(
-                f"Completed scheduled launch of run {run.run_id} for {external_schedule.name}"
-            )
-        except Exception:
-            error_info = serializable_error_info_from_exc_info(sys.exc_info())
-            logger.exception(f"Run {run.run_id} created successfully but failed to launch")
-
     return SubmitRunRequestResult(
         run_key=run_request.run_key,
-        error_info=error_info,
+        error_info=_submit_run(run, workspace_process_context, external_schedule, logger),
         existing_run=None,
         submitted_run=run,
     )
 
 
+def _submit_run_requests(
+    run_requests: Sequence[RunRequest],
+    workspace_process_context: IWorkspaceProcessContext,
+    external_schedule: ExternalSchedule,
+    schedule_time: datetime.datetime,
+    logger: logging.Logger,
+    submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
+    existing_run_ids_by_key: Optional[Mapping[str, str]] = None,
+) -> Sequence[SubmitRunRequestResult]:
+    """Create and submit the runs for the run requests of a tick.
+
+    Runs that do not exist yet are created together with a single call to
+    `DagsterInstance.create_runs`, so that their rows are written in one batch, before any of the
+    runs are submitted. A request whose run cannot be created does not prevent the runs of the
+    other requests from being created and submitted; its error is returned in its result.
+    """
+    instance = workspace_process_context.instance
+    map_fn = submit_threadpool_executor.map if submit_threadpool_executor else map
+
+    existing_runs = list(
+        map_fn(
+            lambda run_request: _get_existing_run_for_request(
+                instance, external_schedule, schedule_time, run_request, existing_run_ids_by_key
+            ),
+            run_requests,
+        )
+    )
+    for existing_run in existing_runs:
+        if existing_run:
+            _log_existing_run(existing_run, external_schedule, logger)
+
+    def _get_creation_args_or_error(
+        run_request: RunRequest,
+    ) -> Union[Mapping[str, Any], Exception]:
+        try:
+            return _get_run_request_creation_args(
+                run_request, workspace_process_context, external_schedule, schedule_time
+            )
+        except Exception as e:
+            logger.exception(
+                f"Failed to create run for run request {run_request.run_key} of"
+                f" {external_schedule.name}"
+            )
+            return e
+
+    runs_or_creation_errors: List[Union[DagsterRun, Exception, None]] = list(existing_runs)
+    indices_to_create = [i for i, existing_run in enumerate(existing_runs) if not existing_run]
+    indices_with_creation_args = []
+    creation_args = []
+    for i, creation_args_or_error in zip(
+        indices_to_create,
+        map_fn(_get_creation_args_or_error, [run_requests[i] for i in indices_to_create]),
+    ):
+        if isinstance(creation_args_or_error, Exception):
+            runs_or_creation_errors[i] = creation_args_or_error
+        else:
+            indices_with_creation_args.append(i)
+            creation_args.append(creation_args_or_error)
+
+    if creation_args:
+        for i, run in zip(indices_with_creation_args, instance.create_runs(creation_args)):
+            runs_or_creation_errors[i] = run
+
+    if any(isinstance(run, DagsterRun) for run in runs_or_creation_errors):
+        check_for_debug_crash(debug_crash_flags, "RUN_CREATED")
+
+    def _submit(
+        run_request: RunRequest,
+        existing_run: Optional[DagsterRun],
+        run_or_creation_error: Union[DagsterRun, Exception, None],
+    ) -> SubmitRunRequestResult:
+        if isinstance(run_or_creation_error, Exception):
+            return SubmitRunRequestResult(
+                run_key=run_request.run_key,
+                error_info=None,
+                existing_run=None,
+                submitted_run=None,
+                creation_error=run_or_creation_error,
+            )
+
+        if existing_run and existing_run.status != DagsterRunStatus.NOT_STARTED:
+            return SubmitRunRequestResult(
+                run_key=run_request.run_key,
+                error_info=None,
+                existing_run=existing_run,
+                submitted_run=None,
+            )
+
+        run = check.not_none(run_or_creation_error)
+        return SubmitRunRequestResult(
+            run_key=run_request.run_key,
+            error_info=_submit_run(run, workspace_process_context, external_schedule, logger),
+            existing_run=None,
+            submitted_run=run,
+        )
+
+    return list(map_fn(_submit, run_requests, existing_runs, runs_or_creation_errors))
+
+
 def _get_code_location_for_schedule(
     workspace_process_context: IWorkspaceProcessContext,
     external_schedule: ExternalSchedule,
@@ -786,22 +976,21 @@ def _schedule_runs_at_time(
     tick_context: _ScheduleLaunchContext,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags] = None,
+    schedule_execution_data_future: Optional["Future[ScheduleExecutionData]"] = None,
 ) -> Generator[Union[None, SerializableErrorInfo, ScheduleIterationTimes], None, None]:
     instance = workspace_process_context.instance
-    repository_handle = external_schedule.handle.repository_handle
-
-    code_location = _get_code_location_for_schedule(workspace_process_context, external_schedule)
 
-    schedule_execution_data = code_location.get_external_schedule_execution_data(
-        instance=instance,
-        repository_handle=repository_handle,
-        schedule_name=external_schedule.name,
-        scheduled_execution_time=TimestampWithTimezone(
-            schedule_time.timestamp(),
+    if schedule_execution_data_future:
+        # evaluated ahead of time, together with the other ticks of a catch-up batch
+        schedule_execution_data = schedule_execution_data_future.result()
+    else:
+        schedule_execution_data = _evaluate_schedule_at_time(
+            workspace_process_context,
+            external_schedule,
+            schedule_time,
             timezone_str,
-        ),
-        log_key=tick_context.log_key,
-    )
+            tick_context.log_key,
+        )
     yield None
 
     # Kept for backwards compatibility with schedule log keys that were previously created in the
@@ -852,21 +1041,43 @@ def _schedule_runs_at_time(
 
         run_requests.append(run_request)
 
-    submit_run_request = lambda run_request: _submit_run_request(
-        run_request,
-        workspace_process_context,
-        external_schedule,
-        schedule_time,
-        logger,
-        debug_crash_flags,
+    existing_run_ids_by_key = _fetch_existing_run_ids(
+        instance, external_schedule, schedule_time, run_requests
     )
 
-    if submit_threadpool_executor:
-        gen_run_request_results = submit_threadpool_executor.map(submit_run_request, run_requests)
+    if SCHEDULE_CATCHUP_BATCH_SIZE > 1:
+        run_request_results: Iterable[SubmitRunRequestResult] = _submit_run_requests(
+            run_requests,
+            workspace_process_context,
+            external_schedule,
+            schedule_time,
+            logger,
+            submit_threadpool_executor,
+            debug_crash_flags,
+            existing_run_ids_by_key,
+        )
     else:
-        gen_run_request_results = map(submit_run_request, run_requests)
+        submit_run_request = lambda run_request: _submit_run_request(
+            run_request,
+            workspace_process_context,
+            external_schedule,
+            schedule_time,
+            logger,
+            debug_crash_flags,
+            existing_run_ids_by_key,
+        )
+
+        if submit_threadpool_executor:
+            run_request_results = submit_threadpool_executor.map(submit_run_request, run_requests)
+        else:
+            run_request_results = map(submit_run_request, run_requests)
+
+    creation_error = None
+    for run_request_result in run_request_results:
+        if run_request_result.creation_error:
+            creation_error = creation_error or run_request_result.creation_error
+            continue
 
-    for run_request_result in gen_run_request_results:
         yield run_request_result.error_info
 
         if run_request_result.existing_run:
@@ -879,16 +1090,71 @@ def _schedule_runs_at_time(
             tick_context.add_run_info(run_id=run.run_id, run_key=run_request_result.run_key)
             check_for_debug_crash(debug_crash_flags, "RUN_ADDED")
 
+    if creation_error:
+        # fail the tick once the runs of the other requests are recorded, so that it is retried
+        # and the runs that were already created are found by their run keys
+        raise creation_error
+
     check_for_debug_crash(debug_crash_flags, "TICK_SUCCESS")
     tick_context.update_state(TickStatus.SUCCESS)
 
 
+def _evaluate_schedule_at_time(
+    workspace_process_context: IWorkspaceProcessContext,
+    external_schedule: ExternalSchedule,
+    schedule_time: datetime.datetime,
+    timezone_str: str,
+    log_key: Sequence[str],
+) -> "ScheduleExecutionData":
+    code_location = _get_code_location_for_schedule(workspace_process_context, external_schedule)
+    return code_location.get_external_schedule_execution_data(
+        instance=workspace_process_context.instance,
+        repository_handle=external_schedule.handle.repository_handle,
+        schedule_name=external_schedule.name,
+        scheduled_execution_time=TimestampWithTimezone(
+            schedule_time.timestamp(),
+            timezone_str,
+        ),
+        log_key=log_key,
+    )
+
+
+def _get_scheduled_run_key(schedule_time: datetime.datetime, run_request: RunRequest) -> str:
+    return DagsterRun.run_key_for_scheduled_execution(
+        schedule_time.astimezone(datetime.timezone.utc).isoformat(), run_request.run_key
+    )
+
+
+def _fetch_existing_run_ids(
+    instance: DagsterInstance,
+    external_schedule: ExternalSchedule,
+    schedule_time: datetime.datetime,
+    run_requests: Sequence[RunRequest],
+) -> Optional[Mapping[str, str]]:
+    """Look up the runs that already exist for the run requests of a tick with a single query
+    against the run key index, or return None if the run storage does not support it.
+    """
+    if not run_requests or not instance.run_storage.supports_run_key_index:
+        return None
+
+    return instance.get_run_ids_by_run_key(
+        external_schedule.selector_id,
+        [_get_scheduled_run_key(schedule_time, run_request) for run_request in run_requests],
+        instigator_name=external_schedule.name,
+    )
+
+
 def _get_existing_run_for_request(
     instance: DagsterInstance,
     external_schedule: ExternalSchedule,
     schedule_time: datetime.datetime,
     run_request: RunRequest,
+    existing_run_ids_by_key: Optional[Mapping[str, str]] = None,
 ) -> Optional[DagsterRun]:
+    if existing_run_ids_by_key is not None:
+        run_id = existing_run_ids_by_key.get(_get_scheduled_run_key(schedule_time, run_request))
+        return instance.get_run_by_id(run_id) if run_id else None
+
     tags = merge_dicts(
         DagsterRun.tags_for_schedule(external_schedule),
         {
@@ -921,14 +1187,14 @@ def _get_existing_run_for_request(
     return matching_runs[0]
 
 
-def _create_scheduler_run(
+def _get_scheduler_run_creation_args(
     instance: DagsterInstance,
     schedule_time: datetime.datetime,
     code_location: CodeLocation,
     external_schedule: ExternalSchedule,
     external_job: ExternalJob,
     run_request: RunRequest,
-) -> DagsterRun:
+) -> Mapping[str, Any]:
     from dagster._daemon.daemon import get_telemetry_daemon_session_id
 
     run_config = run_request.run_config
@@ -965,7 +1231,7 @@ def _create_scheduler_run(
         },
     )
 
-    return instance.create_run(
+    return dict(
         job_name=external_schedule.job_name,
         run_id=None,
         run_config=run_config,
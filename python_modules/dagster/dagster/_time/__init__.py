@@ -3,7 +3,6 @@
 from typing import Union
 
 import dagster._check as check
-from dagster._vendored.dateutil import parser
 
 try:
     # zoneinfo is python >= 3.9
@@ -106,6 +105,9 @@ def parse_time_string(datetime_str) -> datetime:
     """Like dateutil.parser.parse, but always includes a timezone (defaults to UTC if
     no timezone is included in the timezone string).
     """
+    # the parser is slow to import and rarely needed, so it is imported on first use
+    from dagster._vendored.dateutil import parser
+
     dt = parser.parse(datetime_str)
 
     if not dt.tzinfo:
@@ -5,7 +5,6 @@
 import errno
 import functools
 import inspect
-import multiprocessing
 import os
 import re
 import signal
@@ -46,7 +45,6 @@
 )
 
 import packaging.version
-from filelock import FileLock
 from pydantic import BaseModel
 from typing_extensions import Literal, TypeAlias, TypeGuard
 
@@ -451,6 +449,8 @@ def send_interrupt():
 #  * https://stackoverflow.com/questions/35772001/how-to-handle-the-signal-in-python-on-windows-machine
 #  * https://stefan.sofa-rockers.org/2013/08/15/handling-sub-process-hierarchies-python-linux-os-x/
 def start_termination_thread(should_stop_event, is_done_event: threading.Event):
+    import multiprocessing
+
     check.inst_param(should_stop_event, "should_stop_event", ttype=type(multiprocessing.Event()))
 
     int_thread = threading.Thread(
@@ -816,6 +816,8 @@ def run_with_concurrent_update_guard(
             Default: 60 seconds.
         **kwargs: The keyword arguments to pass to the function.
     """
+    from filelock import FileLock
+
     start_mtime = 0
     if target_file_path.exists():
         start_mtime = target_file_path.lstat().st_mtime
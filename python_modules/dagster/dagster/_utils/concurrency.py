@@ -76,6 +76,27 @@ def with_sleep_interval(self, interval: float):
         )
 
 
+class ConcurrencyStepClaim(
+    NamedTuple(
+        "_ConcurrencyStepClaim",
+        [
+            ("concurrency_key", str),
+            ("step_key", str),
+            ("priority", Optional[int]),
+        ],
+    )
+):
+    """A request from a run for a concurrency slot for one of its steps."""
+
+    def __new__(cls, concurrency_key: str, step_key: str, priority: Optional[int] = None):
+        return super(ConcurrencyStepClaim, cls).__new__(
+            cls,
+            check.str_param(concurrency_key, "concurrency_key"),
+            check.str_param(step_key, "step_key"),
+            check.opt_int_param(priority, "priority"),
+        )
+
+
 class PendingStepInfo(
     NamedTuple(
         "_PendingStepInfo",
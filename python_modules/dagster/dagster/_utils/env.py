@@ -24,3 +24,13 @@ def environ(env: Mapping[str, str]) -> Iterator[None]:
                     del os.environ[key]
             else:
                 os.environ[key] = value
+
+
+def get_boolean_env_var(env_var_name: str, default: bool = False) -> bool:
+    """Parse a boolean flag from the environment, treating "1", "true" and "t" (in any case) as
+    truthy and any other set value as falsy.
+    """
+    value = os.getenv(env_var_name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "t")
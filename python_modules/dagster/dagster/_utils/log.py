@@ -17,7 +17,6 @@
 )
 
 import coloredlogs
-import structlog
 from typing_extensions import TypeAlias
 
 import dagster._check as check
@@ -27,6 +26,8 @@
 from dagster._core.utils import coerce_valid_log_level
 
 if TYPE_CHECKING:
+    import structlog
+
     from dagster._core.execution.context.logger import InitLoggerContext
 
 
@@ -222,6 +223,10 @@ def define_default_formatter() -> logging.Formatter:
 
 
 def get_structlog_shared_processors():
+    # structlog is only needed to configure the loggers of long-running processes, so it is imported
+    # on demand to keep it out of `import dagster`
+    import structlog
+
     timestamper = structlog.processors.TimeStamper(fmt="iso", utc=True)
 
     shared_processors = [
@@ -235,7 +240,9 @@ def get_structlog_shared_processors():
     return shared_processors
 
 
-def get_structlog_json_formatter() -> structlog.stdlib.ProcessorFormatter:
+def get_structlog_json_formatter() -> "structlog.stdlib.ProcessorFormatter":
+    import structlog
+
     return structlog.stdlib.ProcessorFormatter(
         foreign_pre_chain=get_structlog_shared_processors(),
         processors=[
@@ -253,6 +260,8 @@ def get_structlog_json_formatter() -> structlog.stdlib.ProcessorFormatter:
 def configure_loggers(
     handler: str = "default", formatter: str = "colored", log_level: Union[str, int] = "INFO"
 ):
+    import structlog
+
     # It's possible that structlog has already been configured by either the user or a controlling
     # process. If so, we don't want to override that configuration.
     if not structlog.is_configured():
@@ -0,0 +1,70 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+import dagster._check as check
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """A thread-safe, bounded, least-recently-used cache.
+
+    Unlike `functools.lru_cache`, instances are explicit objects that can be owned by a server or
+    a storage, cleared when the underlying data is reloaded, and keyed on values computed by the
+    caller (e.g. a content-addressed snapshot id) rather than on function arguments.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = check.int_param(max_size, "max_size")
+        check.invariant(self._max_size > 0, "max_size must be greater than 0")
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[K, V]" = OrderedDict()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key: K, compute_fn: Callable[[], V]) -> V:
+        """Return the cached value for `key`, calling `compute_fn` to populate it on a miss.
+
+        The lock is not held while `compute_fn` runs, so concurrent misses for the same key may
+        both compute the value; the last one to finish wins.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        value = compute_fn()
+        self.set(key, value)
+        return value
+
+    def discard(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
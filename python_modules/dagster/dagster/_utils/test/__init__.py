@@ -3,7 +3,7 @@
 import tempfile
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import Any, Dict, List, Mapping, Optional, Set, Type, Union, cast
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Type, Union, cast
 
 # top-level include is dangerous in terms of incurring circular deps
 from dagster import (
@@ -46,7 +46,7 @@
 from dagster._core.utility_ops import create_stub_op
 from dagster._serdes import ConfigurableClass
 from dagster._serdes.config_class import ConfigurableClassData
-from dagster._utils.concurrency import ConcurrencyClaimStatus
+from dagster._utils.concurrency import ConcurrencyClaimStatus, ConcurrencyStepClaim
 
 # re-export
 from ..temp_file import (
@@ -346,13 +346,32 @@ def check_concurrency_claim(
             return claim_status
         return claim_status.with_sleep_interval(float(self._sleep_interval))
 
+    def claim_concurrency_slots(
+        self, run_id: str, step_claims: Sequence[ConcurrencyStepClaim]
+    ) -> Mapping[str, ConcurrencyClaimStatus]:
+        claim_statuses = super().claim_concurrency_slots(run_id, step_claims)
+        if len(step_claims) <= 1:
+            # single claims go through check_concurrency_claim, which applies the sleep interval
+            return claim_statuses
+
+        for step_claim in step_claims:
+            self._check_calls[step_claim.step_key] += 1
+        if not self._sleep_interval:
+            return claim_statuses
+        return {
+            step_key: claim_status.with_sleep_interval(float(self._sleep_interval))
+            for step_key, claim_status in claim_statuses.items()
+        }
+
 
 def get_all_direct_subclasses_of_marker(marker_interface_cls: Type) -> List[Type]:
     import dagster as dagster
 
+    # go through `dir` and `getattr` so that the lazily imported symbols are included
+    symbols = [getattr(dagster, name) for name in dir(dagster)]
     return [
         symbol
-        for symbol in dagster.__dict__.values()
+        for symbol in symbols
         if isinstance(symbol, type)
         and issubclass(symbol, marker_interface_cls)
         and marker_interface_cls
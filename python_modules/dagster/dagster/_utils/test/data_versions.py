@@ -11,6 +11,7 @@
     INPUT_DATA_VERSION_TAG_PREFIX,
     CachingStaleStatusResolver,
     DataVersion,
+    StaleStatusCache,
 )
 from dagster._core.definitions.events import AssetKey, AssetMaterialization
 from dagster._core.definitions.materialize import materialize
@@ -214,8 +215,10 @@ def materialize_twice(
 def get_stale_status_resolver(
     instance: DagsterInstance,
     assets: Sequence[Union[AssetsDefinition, SourceAsset]],
+    stale_status_cache: Optional[StaleStatusCache] = None,
 ) -> CachingStaleStatusResolver:
     return CachingStaleStatusResolver(
         instance=instance,
         asset_graph=AssetGraph.from_assets(assets),
+        stale_status_cache=stale_status_cache,
     )
@@ -51,6 +51,27 @@ def test_execution_plan_snapshot_api_grpc(instance: DagsterInstance):
         assert len(execution_plan_snapshot.steps) == 2
 
 
+def test_execution_plan_snapshot_api_grpc_repeated_requests(instance: DagsterInstance):
+    with get_bar_repo_code_location(instance) as code_location:
+        job_handle = JobHandle("foo", code_location.get_repository("bar_repo").handle)
+        api_client = code_location.client
+
+        snapshots = [
+            sync_get_external_execution_plan_grpc(
+                api_client,
+                job_handle.get_external_origin(),
+                run_config={},
+                job_snapshot_id="12345",
+                step_keys_to_execute=step_keys_to_execute,
+            )
+            for step_keys_to_execute in [None, None, ["do_something"], None]
+        ]
+
+        assert all(isinstance(snapshot, ExecutionPlanSnapshot) for snapshot in snapshots)
+        assert snapshots[0] == snapshots[1] == snapshots[3]
+        assert snapshots[2].step_keys_to_execute == ["do_something"]
+
+
 def test_execution_plan_with_step_keys_to_execute_snapshot_api_grpc(instance: DagsterInstance):
     with get_bar_repo_code_location(instance) as code_location:
         job_handle = JobHandle("foo", code_location.get_repository("bar_repo").handle)
@@ -1,6 +1,7 @@
 import string
 
 import pytest
+from dagster import Definitions, job, op, static_partitioned_config
 from dagster._api.snapshot_partition import (
     sync_get_external_partition_config_grpc,
     sync_get_external_partition_names_grpc,
@@ -16,8 +17,13 @@
     ExternalPartitionSetExecutionParamData,
     ExternalPartitionTagsData,
 )
+from dagster._core.remote_representation.external_data import (
+    external_partition_set_name_for_job_name,
+)
+from dagster._grpc.impl import get_partition_set_execution_param_data
 from dagster._grpc.types import PartitionArgs, PartitionNamesArgs, PartitionSetExecutionParamArgs
 from dagster._serdes import deserialize_value
+from dagster._utils.lru_cache import LRUCache
 
 from .utils import get_bar_repo_code_location
 
@@ -239,3 +245,46 @@ def test_dynamic_partition_set_grpc(instance: DagsterInstance):
                 "nonexistent_partition",
                 instance,
             )
+
+
+def test_partition_set_execution_param_data_cache():
+    evaluated_keys = []
+
+    @static_partitioned_config(partition_keys=["a", "b", "c"])
+    def my_partitioned_config(partition_key: str):
+        evaluated_keys.append(partition_key)
+        return {"ops": {"my_op": {"config": {"key": partition_key}}}}
+
+    @op(config_schema={"key": str})
+    def my_op():
+        pass
+
+    @job(config=my_partitioned_config)
+    def my_job():
+        my_op()
+
+    repo_def = Definitions(jobs=[my_job]).get_repository_def()
+    partition_set_name = external_partition_set_name_for_job_name("my_job")
+    cache = LRUCache(10)
+
+    for max_workers in [1, 4, 1]:
+        data = get_partition_set_execution_param_data(
+            repo_def,
+            partition_set_name,
+            ["c", "a"],
+            partition_data_cache=cache,
+            max_workers=max_workers,
+        )
+        assert isinstance(data, ExternalPartitionSetExecutionParamData)
+        # returned in partition order
+        assert [partition_data.name for partition_data in data.partition_data] == ["a", "c"]
+        assert data.partition_data[1].run_config == {"ops": {"my_op": {"config": {"key": "c"}}}}
+
+    assert sorted(evaluated_keys) == ["a", "c"]
+
+    data = get_partition_set_execution_param_data(
+        repo_def, partition_set_name, ["a", "b", "c"], partition_data_cache=cache, max_workers=4
+    )
+    assert isinstance(data, ExternalPartitionSetExecutionParamData)
+    assert [partition_data.name for partition_data in data.partition_data] == ["a", "b", "c"]
+    assert sorted(evaluated_keys) == ["a", "b", "c"]
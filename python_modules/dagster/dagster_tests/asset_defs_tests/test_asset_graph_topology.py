@@ -0,0 +1,90 @@
+import random
+
+import pytest
+from dagster import AssetKey
+from dagster._core.definitions.asset_graph_topology import AssetGraphTopology
+from dagster._core.utils import toposort
+from toposort import CircularDependencyError
+
+
+def _key(name: str) -> AssetKey:
+    return AssetKey(name)
+
+
+def _random_upstream(num_nodes: int, seed: int):
+    rng = random.Random(seed)
+    keys = [_key(f"asset_{i}") for i in range(num_nodes)]
+    return {
+        key: {keys[j] for j in rng.sample(range(i), min(i, rng.randint(0, 3)))}
+        for i, key in enumerate(keys)
+    }
+
+
+def _assert_matches_toposort(topology: AssetGraphTopology, upstream) -> None:
+    expected_levels = toposort(upstream)
+    assert topology.toposorted_keys_by_level == expected_levels
+    assert list(topology.toposorted_keys) == [key for level in expected_levels for key in level]
+
+
+def test_basic_topology():
+    a, b, c, d = _key("a"), _key("b"), _key("c"), _key("d")
+    upstream = {a: set(), b: {a}, c: {a, c}, d: {b, c}}
+    topology = AssetGraphTopology.build(upstream)
+
+    _assert_matches_toposort(topology, upstream)
+    assert topology.get_level(d) == 2
+    # self dependencies are dropped from the adjacency index
+    assert topology.get_parent_keys(c) == {a}
+    assert topology.get_child_keys(a) == {b, c}
+    assert topology.get_ancestor_keys(d) == {a, b, c}
+    assert topology.get_ancestor_keys(d, depth=1) == {b, c}
+    assert topology.get_descendant_keys(a) == {b, c, d}
+    assert topology.keys_for_ids(topology.descendant_ids([topology.get_id(b)])) == {d}
+
+
+def test_dependency_only_keys():
+    a, b = _key("a"), _key("b")
+    topology = AssetGraphTopology.build({b: {a}})
+    assert list(topology.toposorted_keys) == [a, b]
+    assert topology.get_parent_keys(a) == set()
+
+
+def test_cycle():
+    a, b, c, d = _key("a"), _key("b"), _key("c"), _key("d")
+    topology = AssetGraphTopology.build({a: {b}, b: {a}, c: {b}, d: set()})
+
+    assert topology.has_cycles
+    assert topology.get_ancestor_keys(c) == {a, b}
+    assert topology.get_descendant_keys(a) == {a, b, c}
+    with pytest.raises(CircularDependencyError):
+        topology.toposorted_keys  # noqa: B018
+    with pytest.raises(CircularDependencyError):
+        topology.get_level(d)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_build(seed):
+    upstream = _random_upstream(200, seed)
+    previous = AssetGraphTopology.build(upstream)
+    _assert_matches_toposort(previous, upstream)
+
+    rng = random.Random(seed)
+    keys = list(upstream.keys())
+    new_upstream = {key: set(parents) for key, parents in upstream.items()}
+
+    # remove a node, rewire a few others, and add new nodes
+    removed = keys[rng.randrange(len(keys))]
+    del new_upstream[removed]
+    for parents in new_upstream.values():
+        parents.discard(removed)
+    for key in rng.sample(list(new_upstream.keys()), 5):
+        index = keys.index(key)
+        if index > 0:
+            new_upstream[key] = {keys[rng.randrange(index)]} - {removed}
+    new_upstream[_key("new_root")] = set()
+    new_upstream[_key("new_leaf")] = {_key("new_root"), keys[-1]} - {removed}
+
+    topology = AssetGraphTopology.build(new_upstream, previous=previous)
+    _assert_matches_toposort(topology, new_upstream)
+    for key, parents in new_upstream.items():
+        assert topology.get_parent_keys(key) == parents - {key}
@@ -1,4 +1,5 @@
 import operator
+import random
 from functools import reduce
 from inspect import isclass
 from typing import AbstractSet, Iterable, Tuple, Union
@@ -44,6 +45,7 @@
 from dagster._core.definitions.assets import AssetsDefinition
 from dagster._core.definitions.base_asset_graph import BaseAssetGraph
 from dagster._core.definitions.events import AssetKey
+from dagster._core.selector.subset_selector import fetch_connected, fetch_sinks, fetch_sources
 from dagster._serdes import deserialize_value
 from dagster._serdes.serdes import _WHITELIST_MAP
 from pydantic import ValidationError
@@ -344,6 +346,65 @@ def c(b):
         assert AssetSelection.assets("a", "b", "c").sources().resolve([a, b, c]) == {a.key}
 
 
+def test_traversals_match_per_key_traversal():
+    rng = random.Random(0)
+    num_assets = 60
+    assets_defs = []
+    for i in range(num_assets):
+        deps = rng.sample([f"asset{j}" for j in range(i)], k=min(i, rng.randint(0, 3)))
+
+        @asset(name=f"asset{i}", deps=deps)
+        def _asset(): ...
+
+        assets_defs.append(_asset)
+
+    asset_graph = AssetGraph.from_assets(assets_defs)
+    dep_graph = asset_graph.asset_dep_graph
+    for _ in range(20):
+        keys = {AssetKey(f"asset{i}") for i in rng.sample(range(num_assets), k=rng.randint(1, 8))}
+        depth = rng.choice([None, 0, 1, 2, 4])
+        for direction in ("upstream", "downstream"):
+            connected = set().union(
+                *(fetch_connected(key, dep_graph, direction=direction, depth=depth) for key in keys)
+            )
+            selection = AssetSelection.assets(*keys)
+            traversal = (
+                selection.upstream(depth=depth)
+                if direction == "upstream"
+                else selection.downstream(depth=depth)
+            )
+            assert traversal.resolve(asset_graph) == connected | keys
+
+        within = traversal.resolve(asset_graph)
+        assert AssetSelection.assets(*within).sinks().resolve(asset_graph) == fetch_sinks(
+            dep_graph, within
+        )
+        assert AssetSelection.assets(*within).roots().resolve(asset_graph) == fetch_sources(
+            dep_graph, within
+        )
+
+
+def test_shared_sub_expression_resolved_once(all_assets: _AssetList):
+    resolve_count = 0
+
+    class CountingAssetSelection(AssetSelection):
+        def resolve_inner(
+            self, asset_graph: BaseAssetGraph, allow_missing: bool
+        ) -> AbstractSet[AssetKey]:
+            nonlocal resolve_count
+            resolve_count += 1
+            return {AssetKey("candace")}
+
+    shared = CountingAssetSelection()
+    selection = shared.upstream(depth=1) | shared.downstream(depth=1) | shared
+    assert selection.resolve(all_assets) == _asset_keys_of({alice, candace, danny})
+    assert resolve_count == 1
+
+    # memoized results do not outlive a call to resolve
+    assert selection.resolve(all_assets) == _asset_keys_of({alice, candace, danny})
+    assert resolve_count == 2
+
+
 @pytest.mark.parametrize(
     "partitions_def,partition_mapping",
     [
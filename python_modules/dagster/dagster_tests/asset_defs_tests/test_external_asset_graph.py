@@ -2,6 +2,7 @@
 import re
 import sys
 import time
+from typing import Optional
 from unittest import mock
 
 import pytest
@@ -17,6 +18,7 @@
     StaticPartitionsDefinition,
     asset,
 )
+from dagster._core.definitions.asset_graph_topology import AssetGraphTopologySlot
 from dagster._core.definitions.auto_materialize_policy import AutoMaterializePolicy
 from dagster._core.definitions.backfill_policy import BackfillPolicy
 from dagster._core.definitions.data_version import CachingStaleStatusResolver
@@ -153,7 +155,11 @@ def _make_location_entry(defs_attr: str, instance: DagsterInstance):
     )
 
 
-def _make_context(instance: DagsterInstance, defs_attrs):
+def _make_context(
+    instance: DagsterInstance,
+    defs_attrs,
+    asset_graph_topology_slot: Optional[AssetGraphTopologySlot] = None,
+):
     return WorkspaceRequestContext(
         instance=mock.MagicMock(),
         workspace_snapshot={
@@ -163,6 +169,7 @@ def _make_context(instance: DagsterInstance, defs_attrs):
         version=None,
         source=None,
         read_only=True,
+        asset_graph_topology_slot=asset_graph_topology_slot,
     )
 
 
@@ -202,6 +209,24 @@ def test_cross_repo_dep_with_source_asset(instance):
     assert asset_graph.get_materialization_job_names(AssetKey("downstream")) == ["__ASSET_JOB"]
 
 
+def test_asset_graph_topology_reused_across_contexts(instance):
+    topology_slot = AssetGraphTopologySlot()
+
+    asset_graph = _make_context(instance, ["defs1"], topology_slot).asset_graph
+    assert topology_slot.get() is asset_graph.topology
+
+    asset_graph = _make_context(
+        instance, ["defs1", "downstream_defs_no_source"], topology_slot
+    ).asset_graph
+    assert asset_graph.topology is topology_slot.get()
+    assert asset_graph.topology.get_child_keys(AssetKey("asset1")) == {
+        AssetKey("downstream_non_arg_dep")
+    }
+    assert asset_graph.toposorted_asset_keys.index(
+        AssetKey("asset1")
+    ) < asset_graph.toposorted_asset_keys.index(AssetKey("downstream_non_arg_dep"))
+
+
 def test_cross_repo_dep_no_source_asset(instance):
     asset_graph = _make_context(instance, ["defs1", "downstream_defs_no_source"]).asset_graph
     assert len(asset_graph.external_asset_keys) == 0
@@ -2,13 +2,23 @@
 
 import mock
 from click.testing import CliRunner
-from dagster import DagsterEventType, job, op, reconstructable
+from dagster import (
+    DagsterEventType,
+    _check as check,
+    job,
+    op,
+    reconstructable,
+)
 from dagster._cli import api
 from dagster._cli.api import ExecuteRunArgs, ExecuteStepArgs, verify_step
 from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.execution.retries import RetryState
 from dagster._core.execution.stats import RunStepKeyStatsSnapshot
 from dagster._core.remote_representation import JobHandle
+from dagster._core.storage.tags import (
+    RUN_WORKER_LAZY_DEFINITIONS_TAG,
+    RUN_WORKER_STARTUP_PROFILING_TAG,
+)
 from dagster._core.test_utils import (
     create_run_for_test,
     ensure_dagster_tests_import,
@@ -277,6 +287,56 @@ def test_execute_run_cannot_load():
             ), f"no match, result: {result.stdout}"
 
 
+def test_execute_run_with_startup_profiling():
+    with instance_for_test(
+        overrides={
+            "compute_logs": {
+                "module": "dagster._core.storage.noop_compute_log_manager",
+                "class": "NoOpComputeLogManager",
+            }
+        }
+    ) as instance:
+        with get_foo_job_handle(instance) as job_handle:
+            runner = CliRunner()
+
+            run = create_run_for_test(
+                instance,
+                job_name="foo",
+                job_code_origin=job_handle.get_python_origin(),
+                tags={
+                    RUN_WORKER_LAZY_DEFINITIONS_TAG: "true",
+                    RUN_WORKER_STARTUP_PROFILING_TAG: "true",
+                },
+            )
+
+            input_json = serialize_value(
+                ExecuteRunArgs(
+                    job_origin=job_handle.get_python_origin(),
+                    run_id=run.run_id,
+                    instance_ref=instance.get_ref(),
+                )
+            )
+
+            runner_execute_run(runner, [input_json])
+            assert check.not_none(instance.get_run_by_id(run.run_id)).is_success
+
+            profile_logs = [
+                log
+                for log in instance.all_logs(run.run_id, of_type=DagsterEventType.ENGINE_EVENT)
+                if log.message.startswith("Loaded job definition in")
+            ]
+            assert len(profile_logs) == 1
+            metadata = check.not_none(profile_logs[0].dagster_event).engine_event_data.metadata
+            assert {
+                "total_seconds",
+                "import_seconds",
+                "definition_construction_seconds",
+                "job_construction_seconds",
+                "modules_imported",
+                "slowest_modules",
+            } <= set(metadata.keys())
+
+
 def runner_execute_step(runner, cli_args, env=None):
     result = runner.invoke(api.execute_step_command, cli_args, env=env)
     if result.exit_code != 0:
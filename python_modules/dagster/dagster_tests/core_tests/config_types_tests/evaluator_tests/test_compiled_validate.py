@@ -0,0 +1,171 @@
+import pytest
+from dagster import (
+    Array,
+    Enum,
+    EnumValue,
+    Field,
+    Map,
+    Noneable,
+    Permissive,
+    ScalarUnion,
+    Selector,
+    Shape,
+)
+from dagster._config import resolve_to_config_type, validate_config_from_snap
+from dagster._config.compiled_validate import (
+    CompiledConfigValidator,
+    clear_compiled_config_validator_cache,
+    get_compiled_config_validator,
+)
+from dagster._config.errors import DagsterEvaluationErrorReason
+from dagster._config.field_utils import EnvVar
+
+SCHEMA = Shape(
+    {
+        "required_int": Field(int),
+        "optional_str": Field(str, is_required=False),
+        "nullable_float": Field(Noneable(float), is_required=False),
+        "flag": Field(bool, is_required=False),
+        "items": Field(Array(Shape({"name": str, "count": Field(int, is_required=False)}))),
+        "mapping": Field(Map(str, int), is_required=False),
+        "color": Field(Enum("Color", [EnumValue("RED"), EnumValue("BLUE")]), is_required=False),
+        "storage": Field(
+            Selector({"filesystem": Shape({"base_dir": Field(str, is_required=False)}), "s3": str}),
+            is_required=False,
+        ),
+        "union": Field(
+            ScalarUnion(scalar_type=str, non_scalar_schema={"value": str}), is_required=False
+        ),
+        "permissive": Field(Permissive({"known": int}), is_required=False),
+        "aliased": Field(
+            Shape(
+                {"new_name": Field(int, is_required=False)}, field_aliases={"new_name": "old_name"}
+            ),
+            is_required=False,
+        ),
+    }
+)
+
+MISMATCH = DagsterEvaluationErrorReason.RUNTIME_TYPE_MISMATCH
+
+# config values, and the reasons and paths of the errors they fail validation with
+VALUES_AND_ERRORS = [
+    ({"required_int": 1, "items": []}, []),
+    (
+        {
+            "required_int": 1,
+            "optional_str": "foo",
+            "nullable_float": None,
+            "flag": True,
+            "items": [{"name": "a"}, {"name": "b", "count": 2}],
+            "mapping": {"a": 1, "b": 2},
+            "color": "RED",
+            "storage": {"filesystem": None},
+            "union": {"value": "foo"},
+            "permissive": {"known": 1, "unknown": 2},
+            "aliased": {"old_name": 1},
+        },
+        [],
+    ),
+    (
+        {"required_int": 1, "items": [], "storage": {}, "union": "foo"},
+        [(DagsterEvaluationErrorReason.SELECTOR_FIELD_ERROR, ["storage"])],
+    ),
+    (None, [(MISMATCH, [])]),
+    ([], [(MISMATCH, [])]),
+    ({}, [(DagsterEvaluationErrorReason.MISSING_REQUIRED_FIELDS, [])]),
+    (
+        {"required_int": True, "items": None},
+        [(MISMATCH, ["items"]), (MISMATCH, ["required_int"])],
+    ),
+    (
+        {"required_int": "1", "items": [{"count": "2"}, {"name": 1}, 3], "extra": 1, "extra_2": 2},
+        [
+            (DagsterEvaluationErrorReason.FIELDS_NOT_DEFINED, []),
+            (DagsterEvaluationErrorReason.MISSING_REQUIRED_FIELD, ["items"]),
+            (MISMATCH, ["items", "count"]),
+            (MISMATCH, ["items", "name"]),
+            (MISMATCH, ["items"]),
+            (MISMATCH, ["required_int"]),
+        ],
+    ),
+    (
+        {"required_int": 1, "items": [], "optional_str": EnvVar("FOO")},
+        [(MISMATCH, ["optional_str"])],
+    ),
+    (
+        {"required_int": 1, "items": [], "mapping": {1: "a", "b": None}},
+        [(MISMATCH, ["mapping"]), (MISMATCH, ["mapping"]), (MISMATCH, ["mapping"])],
+    ),
+    ({"required_int": 1, "items": [], "color": "GREEN"}, [(MISMATCH, ["color"])]),
+    ({"required_int": 1, "items": [], "color": 1}, [(MISMATCH, ["color"])]),
+    (
+        {"required_int": 1, "items": [], "storage": {"filesystem": {}, "s3": "bucket"}},
+        [(DagsterEvaluationErrorReason.SELECTOR_FIELD_ERROR, ["storage"])],
+    ),
+    (
+        {"required_int": 1, "items": [], "storage": {"gcs": "bucket"}},
+        [(DagsterEvaluationErrorReason.FIELD_NOT_DEFINED, ["storage"])],
+    ),
+    ({"required_int": 1, "items": [], "storage": "filesystem"}, [(MISMATCH, ["storage"])]),
+    ({"required_int": 1, "items": [], "union": {"value": 1}}, [(MISMATCH, ["union", "value"])]),
+    (
+        {"required_int": 1, "items": [], "permissive": {"known": "1"}},
+        [(MISMATCH, ["permissive", "known"])],
+    ),
+    (
+        {"required_int": 1, "items": [], "aliased": {"old_name": "1"}},
+        [(MISMATCH, ["aliased", "new_name"])],
+    ),
+]
+
+
+@pytest.mark.parametrize("value, expected_errors", VALUES_AND_ERRORS)
+def test_compiled_validator(value, expected_errors):
+    config_type = resolve_to_config_type(SCHEMA)
+    result = CompiledConfigValidator(config_type.get_schema_snapshot()).validate(
+        config_type.key, value
+    )
+
+    assert result.success == (not expected_errors)
+    assert [
+        (error.reason, list(error.stack.levels)) for error in result.errors or []
+    ] == expected_errors
+    if result.success:
+        assert result.value == value
+
+
+def test_compiled_validator_compiles_lazily():
+    config_type = resolve_to_config_type(SCHEMA)
+    validator = CompiledConfigValidator(config_type.get_schema_snapshot())
+    assert validator.compiled_type_keys == []
+
+    assert not validator.validate(config_type.key, {"required_int": 1}).success
+    assert config_type.key in validator.compiled_type_keys
+    # only the types of the provided fields are compiled
+    assert len(validator.compiled_type_keys) == 2
+
+
+def test_compiled_validator_cache():
+    clear_compiled_config_validator_cache()
+    config_type = resolve_to_config_type(SCHEMA)
+    snapshot = config_type.get_schema_snapshot()
+
+    validator = get_compiled_config_validator(snapshot)
+    assert get_compiled_config_validator(snapshot) is validator
+    # equal snapshots, e.g. deserialized by separate requests, share a validator
+    assert get_compiled_config_validator(config_type.get_schema_snapshot()) is validator
+
+    value = {"required_int": 1, "items": []}
+    assert validate_config_from_snap(snapshot, config_type.key, value).success
+    assert get_compiled_config_validator(snapshot) is validator
+
+    # validators can be cached by an id that identifies the content of the snapshot
+    validator_by_id = get_compiled_config_validator(snapshot, snapshot_id="job_snapshot_id")
+    assert validator_by_id is not validator
+    assert validate_config_from_snap(
+        config_type.get_schema_snapshot(), config_type.key, value, snapshot_id="job_snapshot_id"
+    ).success
+    assert get_compiled_config_validator(snapshot, snapshot_id="job_snapshot_id") is validator_by_id
+
+    assert config_type.get_compiled_validator() is config_type.get_compiled_validator()
@@ -10,6 +10,7 @@
     InstanceConcurrencyContext,
 )
 from dagster._core.utils import make_new_run_id
+from dagster._utils.concurrency import ConcurrencyStepClaim
 
 from .conftest import CUSTOM_SLEEP_INTERVAL
 
@@ -292,3 +293,32 @@ def test_run_step_priority(concurrency_instance):
         time.sleep(0.1)
 
         assert low_context.claim("foo", "low_run_low_step", step_priority=-1)  # -1001
+
+
+def test_claim_steps(concurrency_instance):
+    run = concurrency_instance.create_run_for_job(define_foo_job(), run_id=make_new_run_id())
+    concurrency_instance.event_log_storage.set_concurrency_slots("foo", 2)
+
+    with InstanceConcurrencyContext(concurrency_instance, run) as context:
+        assert context.claim_steps(
+            [
+                ConcurrencyStepClaim("foo", "a"),
+                ConcurrencyStepClaim("foo", "b"),
+                ConcurrencyStepClaim("foo", "c"),
+            ]
+        ) == {"a", "b"}
+        assert context.pending_claim_steps() == ["c"]
+        assert context.get_claim_wait_time("a") is not None
+        assert context.get_claim_wait_time("c") is None
+
+        # claimed steps are not claimed again, and c is not re-checked before its timeout
+        call_count = concurrency_instance.event_log_storage.get_check_calls("c")
+        assert context.claim("foo", "a")
+        assert not context.claim("foo", "c")
+        assert concurrency_instance.event_log_storage.get_check_calls("c") == call_count
+
+        context.free_step("a")
+        time.sleep(INITIAL_INTERVAL_VALUE)
+        assert context.claim("foo", "c")
+        wait_time = context.get_claim_wait_time("c")
+        assert wait_time is not None and wait_time >= INITIAL_INTERVAL_VALUE
@@ -0,0 +1,64 @@
+import importlib
+import sys
+
+from dagster import job, op, reconstructable
+from dagster._core.execution.run_worker_startup_profiler import RunWorkerStartupProfiler
+
+
+@op
+def my_op():
+    pass
+
+
+@job
+def my_job():
+    my_op()
+
+
+def test_profile_imports(tmp_path, monkeypatch):
+    package_dir = tmp_path / "profiled_package"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("from . import child\n")
+    (package_dir / "child.py").write_text("import time\ntime.sleep(0.05)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    profiler = RunWorkerStartupProfiler(max_reported_modules=1)
+    try:
+        with profiler.profile_imports():
+            module = importlib.import_module("profiled_package")
+
+        timings = {timing.module_name: timing for timing in profiler.module_timings}
+        assert set(timings.keys()) == {"profiled_package", "profiled_package.child"}
+        child = timings["profiled_package.child"]
+        parent = timings["profiled_package"]
+        assert child.self_seconds >= 0.05
+        assert parent.cumulative_seconds >= child.cumulative_seconds
+        assert parent.self_seconds < child.self_seconds
+        assert [timing.module_name for timing in profiler.get_slowest_modules()] == [
+            "profiled_package.child"
+        ]
+
+        # the profiler does not leave its loader on the imported modules
+        assert type(module.__loader__).__name__ != "_TimedLoader"
+        assert type(module.__spec__.loader).__name__ != "_TimedLoader"
+        assert not any(type(finder).__name__ == "_TimedImportFinder" for finder in sys.meta_path)
+    finally:
+        sys.modules.pop("profiled_package", None)
+        sys.modules.pop("profiled_package.child", None)
+
+
+def test_load_job_definition():
+    profiler = RunWorkerStartupProfiler()
+    recon_job = reconstructable(my_job)
+    profiler.load_job_definition(recon_job)
+
+    assert profiler.total_seconds == (
+        profiler.import_seconds
+        + profiler.definition_construction_seconds
+        + profiler.job_construction_seconds
+    )
+    assert profiler.get_engine_event_message().startswith("Loaded job definition in")
+
+    metadata = profiler.get_engine_event_data().metadata
+    assert metadata["modules_imported"].value == len(profiler.module_timings)
+    assert "| Module | Self (s) | Cumulative (s) |" in metadata["slowest_modules"].value
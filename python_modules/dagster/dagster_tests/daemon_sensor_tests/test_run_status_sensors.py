@@ -3,6 +3,7 @@
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Any, Dict, Iterator, Mapping, NamedTuple, Optional, Tuple, cast
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -306,6 +307,56 @@ def test_run_failure_sensor(
         )
 
 
+def test_run_failure_sensors_share_run_status_changes(
+    executor: Optional[ThreadPoolExecutor],
+    instance: DagsterInstance,
+    workspace_context: WorkspaceProcessContext,
+    external_repo: ExternalRepository,
+):
+    freeze_datetime = get_current_datetime()
+    failure_sensors = [
+        external_repo.get_external_sensor("my_run_failure_sensor"),
+        external_repo.get_external_sensor("my_run_failure_sensor_filtered"),
+    ]
+    with freeze_time(freeze_datetime):
+        for failure_sensor in failure_sensors:
+            assert failure_sensor.run_status == DagsterRunStatus.FAILURE
+            instance.start_sensor(failure_sensor)
+
+        evaluate_sensors(workspace_context, executor)
+
+        freeze_datetime = freeze_datetime + relativedelta(seconds=60)
+        time.sleep(1)
+
+    with freeze_time(freeze_datetime):
+        external_job = external_repo.get_full_external_job("failure_job")
+        run = instance.create_run_for_job(
+            failure_job,
+            external_job_origin=external_job.get_external_origin(),
+            job_code_origin=external_job.get_python_origin(),
+        )
+        instance.submit_run(run.run_id, workspace_context.create_request_context())
+        wait_for_all_runs_to_finish(instance)
+        assert instance.get_runs()[0].status == DagsterRunStatus.FAILURE
+        freeze_datetime = freeze_datetime + relativedelta(seconds=60)
+
+    with freeze_time(freeze_datetime), mock.patch.object(
+        instance, "fetch_run_status_changes", wraps=instance.fetch_run_status_changes
+    ) as fetch_run_status_changes:
+        # the daemon fetches the failure events once, and both sensors fire from that batch
+        evaluate_sensors(workspace_context, executor)
+        assert fetch_run_status_changes.call_count == 1
+
+        for failure_sensor in failure_sensors:
+            ticks = instance.get_ticks(
+                failure_sensor.get_external_origin_id(), failure_sensor.selector_id
+            )
+            assert len(ticks) == 2
+            validate_tick(ticks[0], failure_sensor, freeze_datetime, TickStatus.SUCCESS)
+            cursor = RunStatusSensorCursor.from_json(check.not_none(ticks[0].cursor))
+            assert cursor.record_id > 0
+
+
 def test_run_failure_sensor_that_fails(
     executor: Optional[ThreadPoolExecutor],
     instance: DagsterInstance,
@@ -90,7 +90,12 @@
 from dagster._core.workspace.context import WorkspaceProcessContext
 from dagster._daemon import get_default_daemon_logger
 from dagster._daemon.daemon import SpanMarker
-from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon.sensor import (
+    CodeLocationThreadPools,
+    SensorEvaluationStats,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+)
 from dagster._record import copy
 from dagster._time import create_datetime, get_current_datetime
 from dagster._vendored.dateutil.relativedelta import relativedelta
@@ -1618,6 +1623,80 @@ def test_custom_interval_sensor(executor, instance, workspace_context, external_
         validate_tick(ticks[0], external_sensor, expected_datetime, TickStatus.SKIPPED)
 
 
+def test_code_location_thread_pools_and_evaluation_stats(
+    instance, workspace_context, external_repo
+):
+    pools = CodeLocationThreadPools(
+        num_workers_per_code_location=2, code_location_weights={"heavy_location": 3}
+    )
+    assert pools.get_num_workers("test_location") == 2
+    assert pools.get_num_workers("heavy_location") == 6
+
+    stats = SensorEvaluationStats()
+    logger = get_default_daemon_logger("SensorDaemon")
+    freeze_datetime = create_datetime(year=2019, month=2, day=28)
+    with pools:
+        executor = pools.get_executor("test_location")
+        assert pools.get_executor("test_location") is executor
+        assert pools.get_executor("heavy_location") is not executor
+
+        with freeze_time(freeze_datetime):
+            external_sensor = external_repo.get_external_sensor("custom_interval_sensor")
+            instance.add_instigator_state(
+                InstigatorState(
+                    external_sensor.get_external_origin(),
+                    InstigatorType.SENSOR,
+                    InstigatorStatus.RUNNING,
+                )
+            )
+
+            futures = {}
+            list(
+                execute_sensor_iteration(
+                    workspace_context,
+                    logger,
+                    threadpool_executor=None,
+                    submit_threadpool_executor=None,
+                    sensor_tick_futures=futures,
+                    code_location_thread_pools=pools,
+                    sensor_evaluation_stats=stats,
+                )
+            )
+            wait_for_futures(futures)
+
+            metrics = stats.get_lag_metrics()[external_sensor.selector_id]
+            assert metrics.evaluation_count == 1
+            assert metrics.code_location_name == "test_location"
+            assert metrics.last_lag_seconds == 0
+
+        # the sensor has a 60 second minimum interval, so it was due 30 seconds ago
+        freeze_datetime = freeze_datetime + relativedelta(seconds=90)
+        with freeze_time(freeze_datetime):
+            futures = {}
+            list(
+                execute_sensor_iteration(
+                    workspace_context,
+                    logger,
+                    threadpool_executor=None,
+                    submit_threadpool_executor=None,
+                    sensor_tick_futures=futures,
+                    code_location_thread_pools=pools,
+                    sensor_evaluation_stats=stats,
+                )
+            )
+            wait_for_futures(futures)
+
+            ticks = instance.get_ticks(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+            assert len(ticks) == 2
+
+            metrics = stats.get_lag_metrics()[external_sensor.selector_id]
+            assert metrics.evaluation_count == 2
+            assert metrics.last_lag_seconds == 30
+            assert metrics.max_lag_seconds == 30
+
+
 def test_sensor_spans(workspace_context):
     loop = execute_sensor_iteration_loop(
         workspace_context,
@@ -36,6 +36,7 @@
 from dagster._core.definitions.decorators.asset_check_decorator import asset_check
 from dagster._core.definitions.executor_definition import multi_or_in_process_executor
 from dagster._core.definitions.partition import PartitionedConfig, StaticPartitionsDefinition
+from dagster._core.definitions.repository_definition.repository_data import lazy_definition_loading
 from dagster._core.errors import DagsterInvalidSubsetError
 from dagster._loggers import default_loggers
 
@@ -1481,3 +1482,60 @@ def repo():
                 AutomationConditionSensorDefinition("a", asset_selection=[asset1]),
                 AutomationConditionSensorDefinition("b", asset_selection=[asset1, asset2]),
             ]
+
+
+def test_lazy_definition_loading():
+    @op
+    def my_op():
+        pass
+
+    @job
+    def my_job():
+        my_op()
+
+    @op(required_resource_keys={"foo"})
+    def needs_foo():
+        pass
+
+    @job
+    def missing_resource_job():
+        needs_foo()
+
+    @schedule(cron_schedule="* * * * *", job_name="missing_job")
+    def bad_schedule():
+        return {}
+
+    @asset
+    def asset1(): ...
+
+    with lazy_definition_loading():
+
+        @repository(default_executor_def=in_process_executor)
+        def lazy_repo():
+            return [
+                my_job,
+                missing_resource_job,
+                bad_schedule,
+                asset1,
+                define_asset_job("asset_job", [asset1]),
+            ]
+
+    # the jobs are still bound to the default executor once they are accessed
+    assert lazy_repo.get_job("my_job").executor_def == in_process_executor
+    assert lazy_repo.get_job("asset_job").executor_def == in_process_executor
+
+    # invalid definitions only raise once they are accessed
+    with pytest.raises(DagsterInvalidDefinitionError, match="resource with key 'foo' required"):
+        lazy_repo.get_job("missing_resource_job")
+
+    with pytest.raises(
+        DagsterInvalidDefinitionError, match='targets job "missing_job" which was not found'
+    ):
+        lazy_repo.get_schedule_def("bad_schedule")
+
+    # outside of the context, the repository is validated when it is constructed
+    with pytest.raises(DagsterInvalidDefinitionError, match="resource with key 'foo' required"):
+
+        @repository
+        def _repo():
+            return [my_job, missing_resource_job]
@@ -1840,3 +1840,94 @@ def basic_sensor():
     assert cast(RunRequest, basic_sensor()).run_config.get("ops", {}) == {
         "foo": {"config": {"a_str": "foo", "an_int": 55}}
     }
+
+
+def test_multi_asset_sensor_fetches_assets_without_cursor_separately():
+    with instance_for_test() as instance:
+        for partition_key in ["2022-07-05", "2022-07-06", "2022-07-07"]:
+            materialize([july_asset, july_asset_2], partition_key=partition_key, instance=instance)
+
+        ctx = build_multi_asset_sensor_context(
+            monitored_assets=[july_asset.key, july_asset_2.key],
+            instance=instance,
+            repository_def=my_repo,
+        )
+        # only july_asset has a cursor
+        ctx.advance_cursor(
+            {july_asset.key: ctx.materialization_records_for_key(july_asset.key, limit=1)[0]}
+        )
+        ctx.update_cursor_after_evaluation()
+        ctx = build_multi_asset_sensor_context(
+            monitored_assets=[july_asset.key, july_asset_2.key],
+            instance=instance,
+            repository_def=my_repo,
+            cursor=ctx.cursor,
+        )
+
+        with mock.patch.object(
+            instance,
+            "fetch_materializations_for_asset_keys",
+            wraps=instance.fetch_materializations_for_asset_keys,
+        ) as fetch_batched, mock.patch.object(
+            instance, "fetch_materializations", wraps=instance.fetch_materializations
+        ) as fetch_single:
+            # the asset without a cursor is queried on its own, with the limit applied in storage
+            records = ctx.materialization_records_for_key(july_asset_2.key, limit=2)
+            assert [record.partition_key for record in records] == ["2022-07-05", "2022-07-06"]
+            assert fetch_batched.call_count == 0
+            assert fetch_single.call_count == 1
+            assert fetch_single.call_args.kwargs["limit"] == 2
+
+            # the batched query starts at the cursor of the only asset that has one
+            assert list(ctx.latest_materialization_records_by_partition(july_asset.key)) == [
+                "2022-07-06",
+                "2022-07-07",
+            ]
+            assert fetch_batched.call_count == 1
+            assert fetch_batched.call_args.args[0] == [july_asset.key]
+            assert fetch_batched.call_args.kwargs["cursor"] is not None
+
+
+def test_multi_asset_sensor_batched_query_skips_consumed_materializations():
+    with instance_for_test() as instance:
+        for partition_key in ["2022-07-05", "2022-07-06", "2022-07-07"]:
+            materialize([july_asset, july_asset_2], partition_key=partition_key, instance=instance)
+
+        ctx = build_multi_asset_sensor_context(
+            monitored_assets=[july_asset.key, july_asset_2.key],
+            instance=instance,
+            repository_def=my_repo,
+        )
+        # july_asset has consumed all of its materializations, july_asset_2 only its first one
+        ctx.advance_cursor(
+            {
+                july_asset.key: ctx.materialization_records_for_key(july_asset.key)[-1],
+                july_asset_2.key: ctx.materialization_records_for_key(july_asset_2.key, limit=1)[0],
+            }
+        )
+        ctx.update_cursor_after_evaluation()
+        ctx = build_multi_asset_sensor_context(
+            monitored_assets=[july_asset.key, july_asset_2.key],
+            instance=instance,
+            repository_def=my_repo,
+            cursor=ctx.cursor,
+        )
+
+        with mock.patch.object(
+            instance,
+            "fetch_materializations_for_asset_keys",
+            wraps=instance.fetch_materializations_for_asset_keys,
+        ) as fetch_batched:
+            assert ctx.materialization_records_for_key(july_asset.key) == []
+            assert [
+                record.partition_key
+                for record in ctx.materialization_records_for_key(july_asset_2.key)
+            ] == ["2022-07-06", "2022-07-07"]
+            assert fetch_batched.call_count == 1
+
+        # the batched query starts at the cursor of july_asset_2, but does not return the
+        # materializations of july_asset that were already consumed
+        result = instance.fetch_materializations_for_asset_keys(
+            *fetch_batched.call_args.args, **fetch_batched.call_args.kwargs
+        )
+        assert {record.asset_key for record in result.records} == {july_asset_2.key}
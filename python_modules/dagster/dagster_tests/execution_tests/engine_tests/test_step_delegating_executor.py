@@ -3,6 +3,7 @@
 import tempfile
 import threading
 import time
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -169,6 +170,87 @@ def test_execute_with_tailer_offset():
     assert TestStepHandler.verify_step_count == 0
 
 
+@pytest.mark.parametrize("offset", ["0", "100000"])
+def test_execute_with_event_log_watch(offset):
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        with environ(
+            {
+                "DAGSTER_EXECUTOR_WATCH_EVENT_LOGS": "1",
+                "DAGSTER_EXECUTOR_POP_EVENTS_OFFSET": offset,
+            }
+        ):
+            result = execute_job(
+                reconstructable(foo_job),
+                instance=instance,
+                run_config={"execution": {"config": {}}},
+            )
+            TestStepHandler.wait_for_processes()
+
+    assert result.success
+    assert TestStepHandler.saw_baz_op
+    # every step event is yielded exactly once, whether it was pushed by the watch or polled
+    step_success_keys = [event.step_key for event in result.all_events if event.is_step_success]
+    assert sorted(step_success_keys) == ["bar_op", "bar_op_2", "baz_op"]
+
+
+def test_event_log_tailer_bounds_seen_storage_ids():
+    from dagster._core.executor.step_delegating.event_log_tailer import RunEventLogTailer
+
+    with instance_for_test() as instance:
+        result = foo_job.execute_in_process(instance=instance)
+        num_events = len(
+            [
+                record
+                for record in instance.get_records_for_run(result.run_id).records
+                if record.event_log_entry.is_dagster_event
+            ]
+        )
+
+        tailer = RunEventLogTailer(instance, result.run_id, offset=3, limit=4)
+        popped = []
+        while True:
+            events = tailer.pop_events()
+            if not events:
+                break
+            popped.extend(events)
+            # only the storage ids inside the offset window are kept around
+            assert len(tailer._seen_storage_ids) <= 3  # noqa: SLF001
+
+        assert len(popped) == num_events
+
+
+def test_event_log_tailer_watch():
+    from dagster._core.executor.step_delegating.event_log_tailer import RunEventLogTailer
+
+    instance = DagsterInstance.ephemeral()
+    result = foo_job.execute_in_process(instance=instance)
+    dagster_run = instance.get_run_by_id(result.run_id)
+
+    with RunEventLogTailer(
+        instance, result.run_id, watch=True, poll_interval=60.0
+    ) as tailer, mock.patch.object(
+        instance, "get_records_for_run", wraps=instance.get_records_for_run
+    ) as get_records_for_run:
+        assert tailer.pop_events()
+        assert tailer.is_watching
+        assert get_records_for_run.call_count == 1
+
+        instance.report_engine_event("pushed", dagster_run)
+
+        start = time.time()
+        tailer.wait(60.0)
+        assert time.time() - start < 30
+
+        events = tailer.pop_events()
+        assert [event.message for event in events] == ["pushed"]
+        # the pushed event is delivered without polling the event log again
+        assert get_records_for_run.call_count == 1
+        assert not tailer.pop_events()
+
+    assert not tailer.is_watching
+
+
 def test_skip_execute():
     from .test_jobs import define_dynamic_skipping_job
 
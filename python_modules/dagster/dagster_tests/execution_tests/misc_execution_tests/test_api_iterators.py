@@ -1,4 +1,5 @@
 from typing import List
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -16,13 +17,15 @@
 from dagster._core.events import DagsterEvent
 from dagster._core.events.log import EventLogEntry, construct_event_logger
 from dagster._core.execution.api import (
+    REUSE_EXECUTION_PLAN_SNAPSHOT_ENV_VAR,
     create_execution_plan,
     execute_plan_iterator,
     execute_run,
     execute_run_iterator,
 )
+from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.storage.dagster_run import DagsterRunStatus
-from dagster._core.test_utils import instance_for_test
+from dagster._core.test_utils import environ, instance_for_test
 from dagster._grpc.impl import core_execute_run
 
 
@@ -293,6 +296,57 @@ def event_callback(record):
             execute_run(InMemoryJob(job_def), dagster_run, instance=instance)
 
 
+@op
+def upstream_op():
+    return 1
+
+
+@op
+def downstream_op(x):
+    return x + 1
+
+
+@job
+def two_step_job():
+    downstream_op(upstream_op())
+
+
+def test_execute_run_reuses_execution_plan_snapshot():
+    with instance_for_test() as instance:
+        dagster_run = instance.create_run_for_job(job_def=two_step_job)
+
+        with environ({REUSE_EXECUTION_PLAN_SNAPSHOT_ENV_VAR: "1"}):
+            with mock.patch.object(
+                ExecutionPlan, "build", side_effect=Exception("plan should not be rebuilt")
+            ):
+                result = execute_run(
+                    reconstructable(two_step_job),
+                    dagster_run,
+                    instance=instance,
+                )
+
+        assert result.success
+        assert instance.get_run_by_id(dagster_run.run_id).status == DagsterRunStatus.SUCCESS
+
+
+def test_execute_run_rebuilds_subset_execution_plan():
+    with instance_for_test() as instance:
+        dagster_run = instance.create_run_for_job(job_def=two_step_job)
+        # a run whose selected steps do not match its stored plan falls back to rebuilding
+        dagster_run = dagster_run._replace(step_keys_to_execute=["upstream_op"])
+
+        with environ({REUSE_EXECUTION_PLAN_SNAPSHOT_ENV_VAR: "1"}):
+            with mock.patch.object(ExecutionPlan, "build", wraps=ExecutionPlan.build) as build_mock:
+                result = execute_run(
+                    reconstructable(two_step_job),
+                    dagster_run,
+                    instance=instance,
+                )
+
+        assert result.success
+        assert build_mock.call_count == 1
+
+
 def test_execute_plan_iterator():
     records = []
 
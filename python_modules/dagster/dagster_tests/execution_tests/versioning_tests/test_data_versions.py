@@ -21,11 +21,13 @@
 from dagster._core.definitions.data_version import (
     DATA_VERSION_TAG,
     SKIP_PARTITION_DATA_VERSION_DEPENDENCY_THRESHOLD,
+    UNKNOWN_VALUE,
     DataProvenance,
     DataVersion,
     StaleCause,
     StaleCauseCategory,
     StaleStatus,
+    StaleStatusCache,
     compute_logical_data_version,
     extract_data_provenance_from_entry,
     extract_data_version_from_entry,
@@ -409,6 +411,94 @@ def asset2(asset1): ...
         assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
 
 
+def test_stale_status_shared_cache() -> None:
+    @asset
+    def asset1(): ...
+
+    @asset(code_version="1")
+    def asset2(asset1): ...
+
+    @asset(code_version="1")
+    def asset3(): ...
+
+    all_assets = [asset1, asset2, asset3]
+    with instance_for_test() as instance:
+        stale_status_cache = StaleStatusCache()
+        materialize_assets(all_assets, instance)
+        status_resolver = get_stale_status_resolver(instance, all_assets, stale_status_cache)
+        for key in [asset1.key, asset2.key, asset3.key]:
+            assert status_resolver.get_status(key) == StaleStatus.FRESH
+
+        # cached statuses are served without reading asset records
+        status_resolver = get_stale_status_resolver(instance, all_assets, stale_status_cache)
+        with mock.patch.object(
+            instance, "get_asset_records", wraps=instance.get_asset_records
+        ) as get_asset_records:
+            status_resolver.add_asset_keys([asset1.key, asset2.key, asset3.key])
+            for key in [asset1.key, asset2.key, asset3.key]:
+                assert status_resolver.get_status(key) == StaleStatus.FRESH
+            assert get_asset_records.call_count == 0
+
+        # only the downstream cone of the new materialization is resolved again
+        materialize_asset(all_assets, asset1, instance)
+        status_resolver = get_stale_status_resolver(instance, all_assets, stale_status_cache)
+        with mock.patch.object(
+            instance, "get_asset_records", wraps=instance.get_asset_records
+        ) as get_asset_records:
+            status_resolver.add_asset_keys([asset1.key, asset2.key, asset3.key])
+            assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
+            assert get_asset_records.call_count == 0
+            assert status_resolver.get_status(asset1.key) == StaleStatus.FRESH
+            assert status_resolver.get_status(asset2.key) == StaleStatus.STALE
+            # the records of the invalidated assets are fetched in a single batch
+            assert get_asset_records.call_count == 1
+            assert set(get_asset_records.call_args[0][0]) == {asset1.key, asset2.key}
+
+        # a change to a code version invalidates the downstream cone of the changed asset
+        @asset(name="asset1", code_version="2")
+        def asset1_v2(): ...
+
+        all_assets_v2 = [asset1_v2, asset2, asset3]
+        status_resolver = get_stale_status_resolver(instance, all_assets_v2, stale_status_cache)
+        assert status_resolver.get_status(asset1.key) == StaleStatus.STALE
+        assert status_resolver.get_stale_causes(asset1.key) == [
+            StaleCause(asset1.key, StaleCauseCategory.CODE, "has a new code version")
+        ]
+        assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
+
+        materialize_assets(all_assets_v2, instance)
+        status_resolver = get_stale_status_resolver(instance, all_assets_v2, stale_status_cache)
+        for key in [asset1.key, asset2.key, asset3.key]:
+            assert status_resolver.get_status(key) == StaleStatus.FRESH
+
+
+def test_stale_status_shared_cache_skips_partitioned_assets() -> None:
+    partitions_def = StaticPartitionsDefinition(["a", "b"])
+
+    @asset(partitions_def=partitions_def)
+    def asset1(): ...
+
+    @asset
+    def asset2(asset1): ...
+
+    @asset
+    def asset3(): ...
+
+    all_assets = [asset1, asset2, asset3]
+    with instance_for_test() as instance:
+        stale_status_cache = StaleStatusCache()
+        materialize_assets([asset1], instance, partition_key="a")
+        materialize_assets(all_assets, instance, selection=[asset2, asset3])
+        status_resolver = get_stale_status_resolver(instance, all_assets, stale_status_cache)
+        assert status_resolver.get_status(asset1.key, "a") == StaleStatus.FRESH
+        assert status_resolver.get_status(asset2.key) == StaleStatus.FRESH
+        assert status_resolver.get_status(asset3.key) == StaleStatus.FRESH
+
+        assert stale_status_cache.get(asset1.key, "status") is UNKNOWN_VALUE
+        assert stale_status_cache.get(asset2.key, "status") is UNKNOWN_VALUE
+        assert stale_status_cache.get(asset3.key, "status") == StaleStatus.FRESH
+
+
 def test_stale_status_redundant_upstream_materialization() -> None:
     @asset(code_version="abc")
     def asset1(): ...
@@ -0,0 +1,123 @@
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Tuple
+
+import pytest
+from dagster._core.errors import DagsterUserCodeUnreachableError
+from dagster._core.test_utils import environ
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._core.utils import FuturesAwareThreadPoolExecutor
+from dagster._grpc import DagsterGrpcClient
+from dagster._grpc.__generated__ import api_pb2
+from dagster._grpc.async_server import DagsterAsyncGrpcServer
+from dagster._grpc.server import DagsterApiServer
+from dagster._utils import find_free_port
+
+
+class BlockingNotebookApiServer(DagsterApiServer):
+    """ExternalNotebookData (a DEFINITIONS class RPC) blocks until `unblock` is set."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.unblock = threading.Event()
+
+    def ExternalNotebookData(self, request, _context):
+        self.unblock.wait(timeout=30)
+        return api_pb2.ExternalNotebookDataReply(content=b"")
+
+
+@contextmanager
+def async_server(
+    enable_metrics: bool = False,
+) -> Iterator[Tuple[DagsterGrpcClient, BlockingNotebookApiServer, DagsterAsyncGrpcServer]]:
+    port = find_free_port()
+    termination_event = threading.Event()
+    logger = logging.getLogger("dagster.code_server")
+    servicer = BlockingNotebookApiServer(
+        server_termination_event=termination_event,
+        logger=logger,
+        server_threadpool_executor=FuturesAwareThreadPoolExecutor(max_workers=1),
+        loadable_target_origin=LoadableTargetOrigin(
+            python_file=os.path.join(os.path.dirname(__file__), "grpc_repo.py"),
+            attribute="bar_repo",
+        ),
+        enable_metrics=enable_metrics,
+    )
+
+    servers = []
+    ready = threading.Event()
+
+    def _serve():
+        # the server creates its event loop on the thread that serves it
+        server = DagsterAsyncGrpcServer(
+            server_termination_event=termination_event,
+            dagster_api_servicer=servicer,
+            logger=logger,
+            port=port,
+            enable_metrics=enable_metrics,
+        )
+        servers.append(server)
+        ready.set()
+        server.serve()
+
+    thread = threading.Thread(target=_serve, daemon=True)
+    thread.start()
+    assert ready.wait(timeout=30)
+    try:
+        yield DagsterGrpcClient(port=port), servicer, servers[0]
+    finally:
+        servicer.unblock.set()
+        termination_event.set()
+        thread.join(timeout=30)
+
+
+def test_async_server_ping():
+    with async_server() as (client, _, _):
+        assert client.ping("foobar")["echo"] == "foobar"
+        assert [res["echo"] for res in client.streaming_ping(sequence_length=3, echo="foo")] == [
+            "foo",
+            "foo",
+            "foo",
+        ]
+        assert "bar_repo" in client.list_repositories()
+
+
+def test_async_server_isolates_rpc_classes():
+    with environ({"DAGSTER_GRPC_DEFINITIONS_CONCURRENCY_LIMIT": "1"}):
+        with async_server(enable_metrics=True) as (client, servicer, server):
+            blocked_thread = threading.Thread(
+                target=client.external_notebook_data, args=("foo.ipynb",), daemon=True
+            )
+            blocked_thread.start()
+
+            # the only DEFINITIONS thread is busy, but METADATA requests are still served
+            for _ in range(10):
+                assert client.ping("foo")["echo"] == "foo"
+
+            servicer.unblock.set()
+            blocked_thread.join(timeout=30)
+
+            metrics = server.get_rpc_class_metrics()
+            assert metrics["METADATA"]["num_completed_requests"] == 10
+            assert metrics["DEFINITIONS"]["num_completed_requests"] == 1
+            assert metrics["DEFINITIONS"]["max_concurrent_requests"] == 1
+
+
+def test_async_server_rpc_class_timeout():
+    with environ({"DAGSTER_GRPC_DEFINITIONS_TIMEOUT": "0.5"}):
+        with async_server() as (client, _, server):
+            with pytest.raises(DagsterUserCodeUnreachableError):
+                client.external_notebook_data("foo.ipynb")
+
+            metrics = server.get_rpc_class_metrics()["DEFINITIONS"]
+            assert metrics["num_timed_out_requests"] == 1
+            assert metrics["num_completed_requests"] == 0
+            assert client.ping("foo")["echo"] == "foo"
+
+
+def test_async_server_counts_streamed_requests_once():
+    with async_server() as (client, _, server):
+        assert len(list(client.streaming_ping(sequence_length=5, echo="foo"))) == 5
+        assert server.get_rpc_class_metrics()["METADATA"]["num_completed_requests"] == 1
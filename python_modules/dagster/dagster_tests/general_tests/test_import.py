@@ -1,9 +1,36 @@
+import importlib
+import json
 import subprocess
+import sys
 
+import dagster
 import pytest
 from dagster._seven import IS_WINDOWS
 from dagster._utils import file_relative_path
 
+# Modules that `import dagster` should not load. They are only needed to execute or serve
+# definitions, and are loaded on first use through lazy top-level attributes or local imports.
+DEFERRED_MODULES = [
+    "alembic",
+    "filelock",
+    "fsspec",
+    "grpc",
+    "sqlalchemy",
+    "structlog",
+    "upath",
+    "dagster._core.launcher",
+    "dagster._core.pipes",
+    "dagster._core.run_coordinator",
+    "dagster._core.storage.fs_io_manager",
+    "dagster._core.storage.upath_io_manager",
+    "dagster._grpc",
+    "dagster._vendored.dateutil.parser",
+]
+
+# Tracks the number of dagster modules loaded by `import dagster`. Changes that load more modules at
+# import time need to raise this deliberately.
+MAX_DAGSTER_MODULES_LOADED_ON_IMPORT = 315
+
 
 @pytest.mark.skipif(IS_WINDOWS, reason="fails on windows, unix coverage sufficient")
 def test_import_perf():
@@ -29,3 +56,52 @@ def test_import_perf():
 
     # one way to debug imports is to `pip install tuna` then run
     # python -X importtime python_modules/dagster/dagster_tests/general_tests/simple.py &> /tmp/import.txt && tuna /tmp/import.txt
+
+
+def _get_modules_loaded_on_import() -> set:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys; import dagster; print(json.dumps(sorted(sys.modules)))",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return set(json.loads(result.stdout.decode("utf-8")))
+
+
+def test_import_defers_modules():
+    loaded_modules = _get_modules_loaded_on_import()
+
+    assert not [
+        module
+        for module in loaded_modules
+        if any(
+            module == deferred_module or module.startswith(f"{deferred_module}.")
+            for deferred_module in DEFERRED_MODULES
+        )
+    ]
+
+    dagster_modules = [
+        module for module in loaded_modules if module == "dagster" or module.startswith("dagster.")
+    ]
+    assert len(dagster_modules) <= MAX_DAGSTER_MODULES_LOADED_ON_IMPORT, (
+        f"`import dagster` loaded {len(dagster_modules)} dagster modules, more than the"
+        f" {MAX_DAGSTER_MODULES_LOADED_ON_IMPORT} allowed. Defer the new imports until they are"
+        " used, or raise MAX_DAGSTER_MODULES_LOADED_ON_IMPORT if they are needed to import dagster."
+    )
+
+
+def test_lazy_imports():
+    for name, module_name in dagster._LAZY_IMPORTS.items():  # noqa: SLF001
+        assert name in dir(dagster)
+        assert getattr(dagster, name) is getattr(importlib.import_module(module_name), name)
+
+    from dagster import PipesSubprocessClient, fs_io_manager
+
+    assert (
+        fs_io_manager
+        is importlib.import_module("dagster._core.storage.fs_io_manager").fs_io_manager
+    )
+    assert PipesSubprocessClient.__name__ == "PipesSubprocessClient"
@@ -5,7 +5,10 @@
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Dict, Optional, Sequence, cast
+from unittest import mock
 
+import dagster._check as check
+import dagster._scheduler.scheduler as scheduler_module
 import pytest
 from dagster import (
     Any,
@@ -63,7 +66,11 @@
 from dagster._grpc.client import DagsterGrpcClient
 from dagster._grpc.server import open_server_process
 from dagster._record import copy
-from dagster._scheduler.scheduler import ScheduleIterationTimes, launch_scheduled_runs
+from dagster._scheduler.scheduler import (
+    ScheduleIterationTimes,
+    launch_scheduled_runs,
+    launch_scheduled_runs_for_schedule_iterator,
+)
 from dagster._time import create_datetime, get_current_datetime, get_current_timestamp, get_timezone
 from dagster._utils import DebugCrashFlags
 from dagster._utils.error import SerializableErrorInfo
@@ -2754,6 +2761,160 @@ def test_many_requests_schedule(
                 [run.run_id for run in runs],
             )
 
+    def test_catchup_batches(
+        self,
+        scheduler_instance: DagsterInstance,
+        workspace_context: WorkspaceProcessContext,
+        external_repo: ExternalRepository,
+        submit_executor: Optional[ThreadPoolExecutor],
+    ):
+        external_schedule = external_repo.get_external_schedule("simple_hourly_schedule")
+        # schedules only catch up on missed ticks if they have a partition set
+        catchup_schedule = ExternalSchedule(
+            external_schedule_data=copy(
+                external_schedule._external_schedule_data,  # noqa: SLF001
+                partition_set_name="simple_hourly_schedule_partitions",
+            ),
+            handle=external_schedule.handle.repository_handle,
+        )
+        schedule_origin_id = external_schedule.get_external_origin_id()
+
+        freeze_datetime = feb_27_2019_one_second_to_midnight()
+        with freeze_time(freeze_datetime):
+            scheduler_instance.start_schedule(external_schedule)
+
+        # an interrupted batch leaves several started ticks behind, which are all resumed
+        for hour in [1, 2]:
+            scheduler_instance.create_tick(
+                TickData(
+                    instigator_origin_id=schedule_origin_id,
+                    instigator_name=external_schedule.name,
+                    instigator_type=InstigatorType.SCHEDULE,
+                    status=TickStatus.STARTED,
+                    timestamp=create_datetime(year=2019, month=2, day=28, hour=hour).timestamp(),
+                    selector_id=external_schedule.selector_id,
+                )
+            )
+
+        freeze_datetime = create_datetime(year=2019, month=2, day=28, hour=4, second=1)
+        with freeze_time(freeze_datetime), mock.patch(
+            "dagster._scheduler.scheduler.SCHEDULE_CATCHUP_BATCH_SIZE", 2
+        ):
+            iteration_times = [
+                value
+                for value in launch_scheduled_runs_for_schedule_iterator(
+                    workspace_context,
+                    get_default_daemon_logger("SchedulerDaemon"),
+                    catchup_schedule,
+                    check.not_none(
+                        scheduler_instance.get_instigator_state(
+                            schedule_origin_id, external_schedule.selector_id
+                        )
+                    ),
+                    get_current_datetime(),
+                    max_catchup_runs=DEFAULT_MAX_CATCHUP_RUNS,
+                    max_tick_retries=0,
+                    tick_retention_settings={},
+                    schedule_debug_crash_flags=None,
+                    submit_threadpool_executor=submit_executor,
+                    in_memory_last_iteration_timestamp=None,
+                )
+                if isinstance(value, ScheduleIterationTimes)
+            ]
+            assert len(iteration_times) == 1
+
+            ticks = scheduler_instance.get_ticks(schedule_origin_id, external_schedule.selector_id)
+            assert [tick.timestamp for tick in ticks] == [
+                create_datetime(year=2019, month=2, day=28, hour=hour).timestamp()
+                for hour in [4, 3, 2, 1]
+            ]
+            assert all(tick.status == TickStatus.SUCCESS for tick in ticks)
+
+            runs = scheduler_instance.get_runs()
+            assert len(runs) == 4
+            for tick in ticks:
+                assert len(tick.run_ids) == 1
+                validate_run_started(
+                    scheduler_instance,
+                    scheduler_instance.get_run_by_id(tick.run_ids[0]),
+                    execution_time=datetime.datetime.fromtimestamp(
+                        tick.timestamp, tz=datetime.timezone.utc
+                    ),
+                )
+
+    @pytest.mark.parametrize("executor", get_schedule_executors())
+    def test_batched_run_creation_error(
+        self,
+        scheduler_instance: DagsterInstance,
+        workspace_context: WorkspaceProcessContext,
+        external_repo: ExternalRepository,
+        executor: ThreadPoolExecutor,
+        submit_executor: Optional[ThreadPoolExecutor],
+    ):
+        external_schedule = external_repo.get_external_schedule("multi_run_list_schedule")
+        schedule_origin = external_schedule.get_external_origin()
+        get_run_request_creation_args = scheduler_module._get_run_request_creation_args  # noqa: SLF001
+
+        def _fail_for_run_key_b(run_request, *args):
+            if run_request.run_key == "B":
+                raise Exception("Failed to create run B")
+            return get_run_request_creation_args(run_request, *args)
+
+        freeze_datetime = feb_27_2019_one_second_to_midnight()
+        with freeze_time(freeze_datetime):
+            scheduler_instance.start_schedule(external_schedule)
+
+        freeze_datetime = freeze_datetime + relativedelta(seconds=2)
+        with freeze_time(freeze_datetime), mock.patch(
+            "dagster._scheduler.scheduler.SCHEDULE_CATCHUP_BATCH_SIZE", 2
+        ):
+            with mock.patch(
+                "dagster._scheduler.scheduler._get_run_request_creation_args",
+                side_effect=_fail_for_run_key_b,
+            ):
+                evaluate_schedules(
+                    workspace_context,
+                    executor,
+                    get_current_datetime(),
+                    max_tick_retries=1,
+                    submit_executor=submit_executor,
+                )
+
+            # the run of the other request is still created and submitted, but the tick fails
+            runs = scheduler_instance.get_runs()
+            assert len(runs) == 1
+            assert runs[0].tags["label"] == "A"
+            ticks = scheduler_instance.get_ticks(
+                schedule_origin.get_id(), external_schedule.selector_id
+            )
+            assert len(ticks) == 1
+            validate_tick(
+                ticks[0],
+                external_schedule,
+                create_datetime(year=2019, month=2, day=28),
+                TickStatus.FAILURE,
+                [runs[0].run_id],
+                expected_error="Failed to create run B",
+                expected_failure_count=1,
+            )
+
+            # the retried tick only creates the missing run
+            evaluate_schedules(
+                workspace_context,
+                executor,
+                get_current_datetime(),
+                max_tick_retries=1,
+                submit_executor=submit_executor,
+            )
+            runs = scheduler_instance.get_runs()
+            assert len(runs) == 2
+            ticks = scheduler_instance.get_ticks(
+                schedule_origin.get_id(), external_schedule.selector_id
+            )
+            assert len(ticks) == 1
+            assert ticks[0].status == TickStatus.SUCCESS
+            assert set(ticks[0].run_ids) == {run.run_id for run in runs}
+
     @pytest.mark.parametrize("executor", get_schedule_executors())
     def test_asset_selection(
         self,
@@ -1,9 +1,16 @@
+import asyncio
+from typing import Dict, Type
+from unittest import mock
+
 import pytest
-from dagster import DagsterInstance, asset
+from dagster import AssetKey, DagsterInstance, asset
 from dagster._core.definitions.asset_check_result import AssetCheckResult
 from dagster._core.definitions.decorators.asset_check_decorator import asset_check
 from dagster._core.definitions.definitions_class import Definitions
+from dagster._core.loader import LoadingContext
+from dagster._core.storage.event_log.base import AssetCheckSummaryRecord, AssetRecord
 from dagster._core.test_utils import instance_for_test
+from dagster._utils.aiodataloader import DataLoader
 
 
 @pytest.fixture
@@ -44,3 +51,56 @@ def test_get_asset_check_summary_records(instance: DagsterInstance):
     assert len(records) == 1
     assert records[check_key].last_check_execution_record.event.asset_check_evaluation.passed  # type: ignore
     assert records[check_key].last_run_id == result.run_id
+
+
+class _TestLoadingContext(LoadingContext):
+    def __init__(self, instance: DagsterInstance):
+        self._instance = instance
+        self._loaders: Dict[Type, DataLoader] = {}
+
+    @property
+    def instance(self) -> DagsterInstance:
+        return self._instance
+
+    @property
+    def loaders(self) -> Dict[Type, DataLoader]:
+        return self._loaders
+
+
+def test_batch_load_asset_records_and_check_summaries(instance: DagsterInstance):
+    implicit_job = defs.get_all_job_defs()[0]
+    result = implicit_job.execute_in_process(instance=instance)
+    assert result.success
+
+    check_key = the_asset_check.check_key
+    missing_check_key = check_key._replace(name="missing_check")
+
+    async def _load():
+        context = _TestLoadingContext(instance)
+        return await asyncio.gather(
+            AssetRecord.gen(context, the_asset.key),
+            AssetRecord.gen(context, AssetKey("missing_asset")),
+            AssetCheckSummaryRecord.gen(context, check_key),
+            AssetCheckSummaryRecord.gen(context, missing_check_key),
+        )
+
+    with mock.patch.object(
+        instance, "get_asset_records", wraps=instance.get_asset_records
+    ) as get_asset_records, mock.patch.object(
+        instance.event_log_storage,
+        "get_asset_check_summary_records",
+        wraps=instance.event_log_storage.get_asset_check_summary_records,
+    ) as get_asset_check_summary_records:
+        asset_record, missing_asset_record, summary_record, missing_summary_record = asyncio.run(
+            _load()
+        )
+        assert get_asset_records.call_count == 1
+        assert get_asset_check_summary_records.call_count == 1
+
+    assert asset_record
+    assert asset_record.asset_entry.last_run_id == result.run_id
+    assert missing_asset_record is None
+    assert summary_record
+    assert summary_record.last_run_id == result.run_id
+    assert missing_summary_record
+    assert missing_summary_record.last_check_execution_record is None
@@ -12,6 +12,7 @@
     AssetsDefinition,
     DagsterInstance,
     DailyPartitionsDefinition,
+    FilesystemIOManager,
     In,
     MetadataValue,
     MultiPartitionKey,
@@ -23,6 +24,8 @@
     StaticPartitionsDefinition,
     TimeWindowPartitionMapping,
     _seven as seven,
+    build_input_context,
+    build_output_context,
     define_asset_job,
     graph,
     job,
@@ -37,7 +40,7 @@
 from dagster._core.definitions.partition_mapping import UpstreamPartitionsResult
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.instance import DynamicPartitionsStore
-from dagster._core.storage.fs_io_manager import fs_io_manager
+from dagster._core.storage.fs_io_manager import PickledObjectFilesystemIOManager, fs_io_manager
 from dagster._core.storage.io_manager import IOManagerDefinition
 from dagster._core.test_utils import instance_for_test
 from dagster._utils import file_relative_path
@@ -107,6 +110,78 @@ def test_fs_io_manager_base_dir():
             assert pickle.load(read_obj) == [1, 2, 3]
 
 
+def test_fs_io_manager_arrow_ipc_pickles_other_objects():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = fs_io_manager.configured({"base_dir": tmpdir_path, "use_arrow_ipc": True})
+        job_def = define_job(io_manager)
+
+        result = job_def.execute_in_process()
+        assert result.success
+
+        with open(os.path.join(tmpdir_path, result.run_id, "op_a", "result"), "rb") as read_obj:
+            assert pickle.load(read_obj) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("use_arrow_ipc", [True, False])
+def test_fs_io_manager_arrow_ipc(use_arrow_ipc: bool):
+    pa = pytest.importorskip("pyarrow")
+    pd = pytest.importorskip("pandas")
+
+    @op
+    def make_table():
+        return pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+    @op
+    def make_df(table):
+        assert isinstance(table, pa.Table)
+        assert table.schema.metadata is None
+        return table.to_pandas().set_index("b")
+
+    @op
+    def check_df(df):
+        assert isinstance(df, pd.DataFrame)
+        assert df.index.tolist() == ["x", "y", "z"]
+        assert df["a"].tolist() == [1, 2, 3]
+
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+
+        @job(
+            resource_defs={
+                "io_manager": FilesystemIOManager(base_dir=tmpdir_path, use_arrow_ipc=use_arrow_ipc)
+            }
+        )
+        def arrow_job():
+            check_df(make_df(make_table()))
+
+        result = arrow_job.execute_in_process()
+        assert result.success
+
+        for step_key in ["make_table", "make_df"]:
+            with open(os.path.join(tmpdir_path, result.run_id, step_key, "result"), "rb") as f:
+                assert (f.read(6) == b"ARROW1") == use_arrow_ipc
+
+
+def test_fs_io_manager_arrow_ipc_overwrite_while_mapped():
+    pa = pytest.importorskip("pyarrow")
+
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = PickledObjectFilesystemIOManager(base_dir=tmpdir_path, use_arrow_ipc=True)
+        asset_key = AssetKey("table")
+
+        io_manager.handle_output(
+            build_output_context(asset_key=asset_key), pa.table({"a": list(range(100_000))})
+        )
+        table = io_manager.load_input(build_input_context(asset_key=asset_key))
+
+        # overwriting the file must not truncate the pages the loaded table is mapped to
+        io_manager.handle_output(build_output_context(asset_key=asset_key), pa.table({"a": [1]}))
+        assert table.column("a").to_pylist() == list(range(100_000))
+        assert io_manager.load_input(build_input_context(asset_key=asset_key)).column(
+            "a"
+        ).to_pylist() == [1]
+        assert os.listdir(tmpdir_path) == ["table"]
+
+
 # lamdba functions can't be pickled (pickle.PicklingError)
 lam = lambda x: x * x
 
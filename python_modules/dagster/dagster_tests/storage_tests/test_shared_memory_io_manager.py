@@ -0,0 +1,191 @@
+import os
+import pickle
+
+import pytest
+from dagster import (
+    DagsterInvariantViolationError,
+    DynamicOut,
+    DynamicOutput,
+    SharedMemoryIOManager,
+    asset,
+    execute_job,
+    job,
+    materialize,
+    multiprocess_executor,
+    op,
+    reconstructable,
+)
+from dagster._core.storage.shared_memory_io_manager import (
+    SHARED_MEMORY_HANDLE_MAGIC,
+    PickledObjectSharedMemoryIOManager,
+)
+from dagster._core.test_utils import instance_for_test
+from upath import UPath
+
+np = pytest.importorskip("numpy")
+
+
+@op
+def make_array():
+    return np.arange(1_000_000, dtype=np.float64)
+
+
+@op
+def total(array) -> float:
+    # loaded arrays reference the shared memory of the output, which is not writable
+    assert not array.flags.writeable
+    return float(array.sum())
+
+
+@op
+def maximum(array) -> float:
+    return float(array.max())
+
+
+@job(
+    executor_def=multiprocess_executor,
+    resource_defs={"io_manager": SharedMemoryIOManager()},
+)
+def shared_memory_job():
+    array = make_array()
+    total(array)
+    maximum(array)
+
+
+@op(out=DynamicOut())
+def make_arrays():
+    for i in range(3):
+        yield DynamicOutput(np.full(1000, i, dtype=np.int64), mapping_key=str(i))
+
+
+@op
+def array_sum(array) -> int:
+    return int(array.sum())
+
+
+@op
+def sum_all(sums) -> int:
+    return sum(sums)
+
+
+@job(resource_defs={"io_manager": SharedMemoryIOManager()})
+def dynamic_shared_memory_job():
+    sum_all(make_arrays().map(array_sum).collect())
+
+
+def _get_handle(path: str):
+    with open(path, "rb") as f:
+        data = f.read()
+    assert data.startswith(SHARED_MEMORY_HANDLE_MAGIC)
+    return PickledObjectSharedMemoryIOManager(base_dir=os.path.dirname(path))._read_handle(  # noqa: SLF001
+        UPath(path)
+    )
+
+
+def _segment_exists(segment_name: str) -> bool:
+    return os.path.exists(os.path.join("/dev/shm", segment_name.lstrip("/")))
+
+
+def test_shared_memory_io_manager_multiprocess():
+    with instance_for_test() as instance:
+        with execute_job(reconstructable(shared_memory_job), instance=instance) as result:
+            assert result.success
+            assert result.output_for_node("total") == float(sum(range(1_000_000)))
+            assert result.output_for_node("maximum") == 999_999.0
+
+            run_dir = os.path.join(instance.storage_directory(), result.run_id)
+
+            # the array was handed off in shared memory, and released once both steps loaded it
+            handle = _get_handle(os.path.join(run_dir, "make_array", "result"))
+            assert handle.remaining_loads == 0
+            assert handle.size >= 8_000_000
+            assert not _segment_exists(handle.segment_name)
+
+            handled_output = next(
+                event
+                for event in result.all_node_events
+                if event.is_handled_output and event.step_key == "make_array"
+            )
+            metadata = handled_output.event_specific_data.metadata  # type: ignore
+            assert metadata["shared_memory_consumer_loads"].value == 2
+
+            # outputs that are not loaded by any step are written to the filesystem
+            with open(os.path.join(run_dir, "total", "result"), "rb") as f:
+                assert pickle.load(f) == float(sum(range(1_000_000)))
+
+            # the released output is not available after the run
+            with pytest.raises(DagsterInvariantViolationError, match="released"):
+                result.output_for_node("make_array")
+
+
+def test_shared_memory_io_manager_dynamic_outputs():
+    with instance_for_test() as instance:
+        result = dynamic_shared_memory_job.execute_in_process(instance=instance)
+        assert result.success
+        assert result.output_for_node("sum_all") == (0 + 1 + 2) * 1000
+
+        run_dir = os.path.join(instance.storage_directory(), result.run_id)
+        for i in range(3):
+            # each mapped output is loaded once, by the step mapped over it
+            handle = _get_handle(os.path.join(run_dir, "make_arrays", "result", str(i)))
+            assert handle.remaining_loads == 0
+            assert not _segment_exists(handle.segment_name)
+
+        # outputs of mapped steps are loaded by the collecting step
+        handle = _get_handle(os.path.join(run_dir, "array_sum[0]", "result"))
+        assert handle.remaining_loads == 0
+
+
+def test_shared_memory_io_manager_spills_to_filesystem(tmp_path):
+    @job(
+        resource_defs={
+            "io_manager": SharedMemoryIOManager(base_dir=str(tmp_path), max_shared_memory_bytes=1)
+        }
+    )
+    def spilling_job():
+        maximum(make_array())
+
+    result = spilling_job.execute_in_process()
+    assert result.success
+    assert result.output_for_node("maximum") == 999_999.0
+
+    # the array would exceed the maximum number of bytes in shared memory
+    with open(os.path.join(tmp_path, result.run_id, "make_array", "result"), "rb") as f:
+        assert not f.read().startswith(SHARED_MEMORY_HANDLE_MAGIC)
+    assert np.array_equal(result.output_for_node("make_array"), np.arange(1_000_000))
+
+
+@asset
+def array_asset():
+    return np.arange(1000, dtype=np.float64)
+
+
+@asset
+def array_asset_total(array_asset) -> float:
+    return float(array_asset.sum())
+
+
+def test_shared_memory_io_manager_assets(tmp_path):
+    resources = {"io_manager": SharedMemoryIOManager(base_dir=str(tmp_path))}
+
+    with instance_for_test() as instance:
+        assert materialize(
+            [array_asset, array_asset_total], resources=resources, instance=instance
+        ).success
+
+        # the asset was handed off in shared memory, and also written to the filesystem
+        handle = _get_handle(os.path.join(tmp_path, "array_asset.shared_memory"))
+        assert handle.remaining_loads == 0
+        assert not _segment_exists(handle.segment_name)
+        with open(os.path.join(tmp_path, "array_asset"), "rb") as f:
+            assert np.array_equal(pickle.load(f), np.arange(1000))
+
+        # later runs load the asset from the filesystem once its segment is released
+        result = materialize(
+            [array_asset, array_asset_total],
+            selection=["array_asset_total"],
+            resources=resources,
+            instance=instance,
+        )
+        assert result.success
+        assert result.output_for_node("array_asset_total") == float(sum(range(1000)))
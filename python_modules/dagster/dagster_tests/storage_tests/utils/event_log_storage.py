@@ -100,7 +100,11 @@
 from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
 from dagster._core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster._core.storage.io_manager import IOManager
-from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
+from dagster._core.storage.partition_status_cache import (
+    AssetStatusCacheValue,
+    MultiPartitionStatusRange,
+    MultiPartitionStatusRollup,
+)
 from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._core.storage.tags import (
     ASSET_PARTITION_RANGE_END_TAG,
@@ -113,7 +117,7 @@
 from dagster._loggers import colored_console_logger
 from dagster._serdes.serdes import deserialize_value
 from dagster._time import get_current_datetime
-from dagster._utils.concurrency import ConcurrencySlotStatus
+from dagster._utils.concurrency import ConcurrencySlotStatus, ConcurrencyStepClaim
 
 # py36 & 37 list.append not hashable
 
@@ -1395,6 +1399,95 @@ def _get_counts(result):
             )
             assert _get_counts(result) == [5, 3, 1]
 
+    def test_asset_materialization_fetch_for_asset_keys(self, storage, test_run_id):
+        asset_key = AssetKey(["path", "to", "asset_one"])
+        other_asset_key = AssetKey(["path", "to", "asset_two"])
+        unrelated_asset_key = AssetKey(["path", "to", "asset_three"])
+
+        @op
+        def materialize(_):
+            yield AssetMaterialization(asset_key=asset_key, metadata={"count": 1})
+            yield AssetMaterialization(asset_key=other_asset_key, metadata={"count": 2})
+            yield AssetMaterialization(asset_key=unrelated_asset_key, metadata={"count": 3})
+            yield AssetMaterialization(asset_key=asset_key, metadata={"count": 4})
+            yield AssetMaterialization(asset_key=other_asset_key, metadata={"count": 5})
+            yield Output(1)
+
+        def _ops():
+            materialize()
+
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            events, _ = _synthesize_events(_ops, instance=created_instance, run_id=test_run_id)
+
+            for event in events:
+                storage.store_event(event)
+
+            def _get_counts(result):
+                assert isinstance(result, EventRecordsResult)
+                return [
+                    record.asset_materialization.metadata.get("count").value
+                    for record in result.records
+                ]
+
+            asset_keys = [asset_key, other_asset_key]
+
+            # results for all keys come in ascending order
+            result = storage.fetch_materializations_for_asset_keys(asset_keys, limit=100)
+            assert _get_counts(result) == [1, 2, 4, 5]
+            assert [record.asset_key for record in result.records] == [
+                asset_key,
+                other_asset_key,
+                asset_key,
+                other_asset_key,
+            ]
+            storage_id_2 = result.records[1].storage_id
+            storage_id_4 = result.records[2].storage_id
+
+            # page through results with the cursor
+            result = storage.fetch_materializations_for_asset_keys(asset_keys, limit=3)
+            assert _get_counts(result) == [1, 2, 4]
+            assert result.has_more
+            result = storage.fetch_materializations_for_asset_keys(
+                asset_keys, limit=3, cursor=result.cursor
+            )
+            assert _get_counts(result) == [5]
+            assert not result.has_more
+
+            # filter by storage ids
+            result = storage.fetch_materializations_for_asset_keys(
+                asset_keys, limit=100, storage_ids=[storage_id_2, storage_id_4]
+            )
+            assert _get_counts(result) == [2, 4]
+
+            # filter each asset key by its own storage id
+            result = storage.fetch_materializations_for_asset_keys(
+                asset_keys, limit=100, after_storage_id_by_key={asset_key: storage_id_4}
+            )
+            assert _get_counts(result) == [2, 5]
+            result = storage.fetch_materializations_for_asset_keys(
+                asset_keys,
+                limit=1,
+                after_storage_id_by_key={asset_key: storage_id_2, other_asset_key: storage_id_4},
+            )
+            assert _get_counts(result) == [4]
+            result = storage.fetch_materializations_for_asset_keys(
+                asset_keys,
+                limit=1,
+                cursor=result.cursor,
+                after_storage_id_by_key={asset_key: storage_id_2, other_asset_key: storage_id_4},
+            )
+            assert _get_counts(result) == [5]
+
+            assert storage.fetch_materializations_for_asset_keys([], limit=100).records == []
+
+            # wiped assets are excluded
+            storage.wipe_asset(other_asset_key)
+            result = storage.fetch_materializations_for_asset_keys(asset_keys, limit=100)
+            assert _get_counts(result) == [1, 4]
+
     def test_asset_observation_fetch(self, storage, test_run_id):
         asset_key = AssetKey(["path", "to", "asset_one"])
 
@@ -4818,6 +4911,17 @@ def yields_materialization():
                 serialized_failed_partition_subset="baz",
                 serialized_in_progress_partition_subset="qux",
                 earliest_in_progress_materialization_event_id=42,
+                multi_partition_status_rollup=MultiPartitionStatusRollup(
+                    ranges=[
+                        MultiPartitionStatusRange(
+                            primary_start_key="a",
+                            primary_end_key="b",
+                            serialized_materialized_secondary_subset="bar",
+                            serialized_failed_secondary_subset="baz",
+                            serialized_in_progress_secondary_subset="qux",
+                        )
+                    ]
+                ),
             )
 
             # Check that AssetStatusCacheValue has all fields set. This ensures that we test that the
@@ -5128,6 +5232,64 @@ def claim(key, run_id, step_key, priority=0):
         assert storage.check_concurrency_claim("foo", run_id, "d").assigned_timestamp is None
         assert storage.check_concurrency_claim("foo", run_id, "e").assigned_timestamp is None
 
+    def test_claim_concurrency_slots_batch(self, storage: EventLogStorage):
+        if not storage.supports_global_concurrency_limits:
+            pytest.skip("storage does not support global op concurrency")
+
+        if self.can_wipe():
+            storage.wipe()
+
+        run_id = make_new_run_id()
+        other_run_id = make_new_run_id()
+
+        def claim_slots(step_claims):
+            return {
+                step_key: status.slot_status
+                for step_key, status in storage.claim_concurrency_slots(
+                    run_id, [ConcurrencyStepClaim(*step_claim) for step_claim in step_claims]
+                ).items()
+            }
+
+        storage.set_concurrency_slots("foo", 3)
+        storage.set_concurrency_slots("bar", 1)
+        assert (
+            storage.claim_concurrency_slot("foo", other_run_id, "other").slot_status
+            == ConcurrencySlotStatus.CLAIMED
+        )
+
+        # two foo slots and one bar slot remain, and higher priority steps are assigned first
+        assert claim_slots(
+            [("foo", "a", 0), ("foo", "b", 0), ("foo", "c", 1), ("bar", "d", 0), ("bar", "e", 0)]
+        ) == {
+            "a": ConcurrencySlotStatus.CLAIMED,
+            "b": ConcurrencySlotStatus.BLOCKED,
+            "c": ConcurrencySlotStatus.CLAIMED,
+            "d": ConcurrencySlotStatus.CLAIMED,
+            "e": ConcurrencySlotStatus.BLOCKED,
+        }
+        foo_info = storage.get_concurrency_info("foo")
+        assert foo_info.active_slot_count == 3
+        assert {slot.step_key for slot in foo_info.claimed_slots} == {"other", "a", "c"}
+        assert foo_info.pending_step_count == 1
+
+        # claiming again is idempotent for the claimed steps
+        assert claim_slots([("foo", "a", 0), ("foo", "b", 0), ("foo", "c", 1)]) == {
+            "a": ConcurrencySlotStatus.CLAIMED,
+            "b": ConcurrencySlotStatus.BLOCKED,
+            "c": ConcurrencySlotStatus.CLAIMED,
+        }
+        assert storage.get_concurrency_info("foo").active_slot_count == 3
+
+        # freeing slots assigns them to the pending steps, which claim them on the next attempt
+        storage.free_concurrency_slots_for_run(other_run_id)
+        storage.free_concurrency_slot_for_step(run_id, "d")
+        assert claim_slots([("foo", "b", 0), ("bar", "e", 0)]) == {
+            "b": ConcurrencySlotStatus.CLAIMED,
+            "e": ConcurrencySlotStatus.CLAIMED,
+        }
+        assert storage.get_concurrency_info("foo").pending_step_count == 0
+        assert storage.get_concurrency_info("bar").active_slot_count == 1
+
     def test_invalid_concurrency_limit(self, storage: EventLogStorage):
         if not storage.supports_global_concurrency_limits:
             pytest.skip("storage does not support global op concurrency")
@@ -25,6 +25,7 @@
 from dagster._core.storage.partition_status_cache import (
     RUN_FETCH_BATCH_SIZE,
     build_failed_and_in_progress_partition_subset,
+    build_multi_partition_status_rollup,
     get_and_update_asset_status_cache_value,
     get_last_planned_storage_id,
 )
@@ -267,6 +268,121 @@ def asset1():
             ]
         )
 
+    def test_multipartition_status_rollup(self, instance):
+        partitions_def = MultiPartitionsDefinition(
+            {
+                "date": DailyPartitionsDefinition("2023-01-01", end_date="2023-01-06"),
+                "color": StaticPartitionsDefinition(["red", "blue"]),
+            }
+        )
+
+        @asset(partitions_def=partitions_def)
+        def asset1(context):
+            if context.partition_key.keys_by_dimension == {"date": "2023-01-04", "color": "blue"}:
+                raise Exception()
+
+        asset_key = AssetKey("asset1")
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+        def _get_ranges(cached_status):
+            ranges = []
+            for status_range in cached_status.multi_partition_status_rollup.ranges:
+                materialized, failed, in_progress = status_range.deserialize_secondary_subsets(
+                    partitions_def
+                )
+                ranges.append(
+                    (
+                        status_range.primary_start_key,
+                        status_range.primary_end_key,
+                        set(materialized.get_partition_keys()),
+                        set(failed.get_partition_keys()),
+                        set(in_progress.get_partition_keys()),
+                    )
+                )
+            return ranges
+
+        def _assert_matches_full_rebuild(cached_status):
+            assert cached_status.multi_partition_status_rollup == (
+                build_multi_partition_status_rollup(
+                    partitions_def,
+                    instance,
+                    cached_status.deserialize_materialized_partition_subsets(partitions_def),
+                    cached_status.deserialize_failed_partition_subsets(partitions_def),
+                    cached_status.deserialize_in_progress_partition_subsets(partitions_def),
+                )
+            )
+
+        for date, color in [
+            ("2023-01-01", "red"),
+            ("2023-01-02", "red"),
+            ("2023-01-03", "red"),
+            ("2023-01-03", "blue"),
+            ("2023-01-04", "blue"),
+        ]:
+            asset_job.execute_in_process(
+                instance=instance,
+                partition_key=MultiPartitionKey({"date": date, "color": color}),
+                raise_on_error=False,
+            )
+
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert _get_ranges(cached_status) == [
+            ("2023-01-01", "2023-01-02", {"red"}, set(), set()),
+            ("2023-01-03", "2023-01-03", {"red", "blue"}, set(), set()),
+            ("2023-01-04", "2023-01-04", set(), {"blue"}, set()),
+        ]
+        _assert_matches_full_rebuild(cached_status)
+
+        # the failed partition is materialized, and the rollup is updated incrementally
+        asset_job.execute_in_process(
+            instance=instance,
+            partition_key=MultiPartitionKey({"date": "2023-01-04", "color": "red"}),
+        )
+        run = create_run_for_test(instance)
+        instance.event_log_storage.store_event(
+            EventLogEntry(
+                error_info=None,
+                level="debug",
+                user_message="",
+                run_id=run.run_id,
+                timestamp=time.time(),
+                dagster_event=DagsterEvent(
+                    DagsterEventType.ASSET_MATERIALIZATION.value,
+                    "nonce",
+                    event_specific_data=StepMaterializationData(
+                        AssetMaterialization(
+                            asset_key=asset_key,
+                            partition=MultiPartitionKey({"date": "2023-01-04", "color": "blue"}),
+                        )
+                    ),
+                ),
+            )
+        )
+
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert _get_ranges(cached_status) == [
+            ("2023-01-01", "2023-01-02", {"red"}, set(), set()),
+            ("2023-01-03", "2023-01-04", {"red", "blue"}, set(), set()),
+        ]
+        _assert_matches_full_rebuild(cached_status)
+
+        # a planned materialization shows up as in progress
+        run = create_run_for_test(instance)
+        instance.event_log_storage.store_event(
+            _create_test_planned_materialization_record(
+                run.run_id, asset_key, MultiPartitionKey({"date": "2023-01-02", "color": "blue"})
+            )
+        )
+
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert _get_ranges(cached_status) == [
+            ("2023-01-01", "2023-01-01", {"red"}, set(), set()),
+            ("2023-01-02", "2023-01-02", {"red"}, set(), {"blue"}),
+            ("2023-01-03", "2023-01-04", {"red", "blue"}, set(), set()),
+        ]
+        _assert_matches_full_rebuild(cached_status)
+
     def test_cached_status_on_wipe(self, instance):
         partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
 
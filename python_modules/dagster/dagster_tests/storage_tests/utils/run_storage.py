@@ -4,10 +4,13 @@
 import unittest
 from datetime import datetime, timedelta
 from typing import Optional
+from unittest import mock
 
 import pytest
+import sqlalchemy as db
 from dagster import _seven, job, op
 from dagster._core.definitions import GraphDefinition
+from dagster._core.definitions.selector import InstigatorSelector
 from dagster._core.errors import (
     DagsterRunAlreadyExists,
     DagsterRunNotFoundError,
@@ -29,7 +32,9 @@
 from dagster._core.storage.root import LocalArtifactStorage
 from dagster._core.storage.runs.base import RunStorage
 from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
-from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+from dagster._core.storage.runs.schema import RunKeysTable, SnapshotsTable
+from dagster._core.storage.runs.sql_run_storage import SnapshotType, SqlRunStorage
+from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._core.storage.tags import (
     PARENT_RUN_ID_TAG,
     PARTITION_NAME_TAG,
@@ -37,8 +42,12 @@
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
     RUN_FAILURE_REASON_TAG,
+    RUN_KEY_TAG,
+    SCHEDULE_NAME_TAG,
+    SCHEDULED_EXECUTION_TIME_TAG,
+    SENSOR_NAME_TAG,
 )
-from dagster._core.test_utils import freeze_time
+from dagster._core.test_utils import environ, freeze_time
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.utils import make_new_run_id
 from dagster._daemon.daemon import SensorDaemon
@@ -1024,6 +1033,44 @@ def test_write_conflicting_run_id(self, storage: RunStorage):
         with pytest.raises(DagsterRunAlreadyExists):
             storage.add_run(run)
 
+    def test_add_runs(self, storage: RunStorage):
+        job_name = "some_job"
+        origin = self.fake_job_origin(job_name)
+        repository_origin = origin.repository_origin
+        sensor_selector_id = InstigatorSelector(
+            repository_origin.code_location_origin.location_name,
+            repository_origin.repository_name,
+            "my_sensor",
+        ).get_id()
+
+        one, two, three = [make_new_run_id() for _ in range(3)]
+        runs = [
+            TestRunStorage.build_run(
+                run_id=run_id,
+                job_name=job_name,
+                tags={SENSOR_NAME_TAG: "my_sensor", RUN_KEY_TAG: run_key},
+                external_job_origin=origin,
+            )
+            for run_id, run_key in [(one, "a"), (two, "b"), (three, "c")]
+        ]
+
+        assert storage.add_runs([]) == []
+        assert [run.run_id for run in storage.add_runs(runs)] == [one, two, three]
+        assert {run.run_id for run in storage.get_runs()} == {one, two, three}
+        assert len(storage.get_runs(filters=RunsFilter(tags={RUN_KEY_TAG: "b"}))) == 1
+
+        if storage.supports_run_key_index:
+            assert storage.get_run_ids_by_run_key(sensor_selector_id, ["a", "b", "c"]) == {
+                "a": one,
+                "b": two,
+                "c": three,
+            }
+
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs(
+                [TestRunStorage.build_run(run_id=make_new_run_id(), job_name=job_name), runs[0]]
+            )
+
     def test_add_get_snapshot(self, storage):
         job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
         job_snapshot = job_def.get_job_snapshot()
@@ -1041,6 +1088,88 @@ def test_add_get_snapshot(self, storage):
 
             assert not storage.has_job_snapshot(job_snapshot_id)
 
+    def test_chunked_snapshots(self, storage: RunStorage):
+        if not isinstance(storage, SqlRunStorage):
+            pytest.skip("chunked snapshots are only supported by sql run storages")
+
+        def _build_job(num_ops: int, changed_op: Optional[int] = None):
+            def _build_op(i):
+                @op(name=f"op_{i}", description="changed" if i == changed_op else None)
+                def _op(x: int) -> int:
+                    return x + i
+
+                return _op
+
+            @op
+            def start() -> int:
+                return 0
+
+            ops = [_build_op(i) for i in range(num_ops)]
+
+            @job(name="chunked_job")
+            def _job():
+                value = start()
+                for op_def in ops:
+                    value = op_def(value)
+
+            return _job
+
+        def _num_chunks():
+            with storage.connect() as conn:
+                return conn.execute(
+                    db_select([db.func.count()])
+                    .select_from(SnapshotsTable)
+                    .where(SnapshotsTable.c.snapshot_type == SnapshotType.CHUNK.value)
+                ).scalar()
+
+        with environ({"DAGSTER_RUN_STORAGE_CHUNKED_SNAPSHOTS": "1"}):
+            snapshot_one = _build_job(20).get_job_snapshot()
+            snapshot_two = _build_job(20, changed_op=3).get_job_snapshot()
+            id_one = storage.add_job_snapshot(snapshot_one)
+            num_chunks = _num_chunks()
+            assert num_chunks > 20
+            id_two = storage.add_job_snapshot(snapshot_two)
+            # only the changed op and the snapshots containing it are stored again
+            assert _num_chunks() - num_chunks < 5
+
+        assert serialize_pp(storage.get_job_snapshot(id_one)) == serialize_pp(snapshot_one)
+        assert serialize_pp(storage.get_job_snapshot(id_two)) == serialize_pp(snapshot_two)
+        assert storage.has_job_snapshot(id_two)
+
+        # chunks are not snapshots of their own
+        with storage.connect() as conn:
+            chunk_id = conn.execute(
+                db_select([SnapshotsTable.c.snapshot_id])
+                .where(SnapshotsTable.c.snapshot_type == SnapshotType.CHUNK.value)
+                .limit(1)
+            ).scalar()
+        assert not storage.has_job_snapshot(chunk_id)
+        assert not storage.has_execution_plan_snapshot(chunk_id)
+
+        # the new chunks and the manifest of a snapshot are written in one statement
+        with environ({"DAGSTER_RUN_STORAGE_CHUNKED_SNAPSHOTS": "1"}):
+            with mock.patch.object(storage, "connect", wraps=storage.connect) as connect:
+                storage.add_job_snapshot(_build_job(20, changed_op=4).get_job_snapshot())
+                # one connection to look up the existing chunks, and one to insert the new rows
+                assert connect.call_count == 2
+
+        # snapshots written without chunking can be read alongside chunked ones
+        snapshot_three = _build_job(5).get_job_snapshot()
+        id_three = storage.add_job_snapshot(snapshot_three)
+        assert serialize_pp(storage.get_job_snapshot(id_three)) == serialize_pp(snapshot_three)
+
+    def test_snapshot_cache(self, storage: RunStorage):
+        if not isinstance(storage, SqlRunStorage):
+            pytest.skip("the decoded snapshot cache is only used by sql run storages")
+
+        job_snapshot = GraphDefinition(name="cached_pipeline", node_defs=[]).to_job()
+        snapshot_id = storage.add_job_snapshot(job_snapshot.get_job_snapshot())
+        assert storage.get_job_snapshot(snapshot_id) is storage.get_job_snapshot(snapshot_id)
+
+        if self.can_delete_runs():
+            storage.wipe()
+            assert not storage.has_job_snapshot(snapshot_id)
+
     def test_single_write_read_with_snapshot(self, storage: RunStorage):
         run_with_snapshot_id = "lkasjdflkjasdf"
         job_def = GraphDefinition(name="some_pipeline", node_defs=[]).to_job()
@@ -1545,3 +1674,116 @@ def test_migrate_repo(self, storage):
         assert len(two_runs) == 1
         assert two_runs[0].run_id == one
         assert two_runs[0].tags[REPOSITORY_LABEL_TAG] == "fake_repo_two@fake:fake"
+
+    def test_run_key_index(self, storage: RunStorage):
+        if not storage.supports_run_key_index:
+            pytest.skip("storage does not support the run key index")
+
+        job_name = "some_job"
+        origin = self.fake_job_origin(job_name)
+        repository_origin = origin.repository_origin
+        location_name = repository_origin.code_location_origin.location_name
+        sensor_selector_id = InstigatorSelector(
+            location_name, repository_origin.repository_name, "my_sensor"
+        ).get_id()
+        schedule_selector_id = InstigatorSelector(
+            location_name, repository_origin.repository_name, "my_schedule"
+        ).get_id()
+
+        one, two, three, four, five = [make_new_run_id() for _ in range(5)]
+        for run_id, tags, run_origin in [
+            (one, {SENSOR_NAME_TAG: "my_sensor", RUN_KEY_TAG: "a"}, origin),
+            (two, {SENSOR_NAME_TAG: "my_sensor", RUN_KEY_TAG: "a"}, origin),
+            (three, {SENSOR_NAME_TAG: "other_sensor", RUN_KEY_TAG: "b"}, origin),
+            (four, {SENSOR_NAME_TAG: "my_sensor", RUN_KEY_TAG: "b"}, None),
+            (
+                five,
+                {
+                    SCHEDULE_NAME_TAG: "my_schedule",
+                    SCHEDULED_EXECUTION_TIME_TAG: "2024-01-01T00:00:00+00:00",
+                },
+                origin,
+            ),
+        ]:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id, job_name=job_name, tags=tags, external_job_origin=run_origin
+                )
+            )
+
+        # keys map to their most recent run
+        assert storage.get_run_ids_by_run_key(sensor_selector_id, ["a", "b", "c"]) == {"a": two}
+        assert storage.get_run_ids_by_run_key(sensor_selector_id, []) == {}
+
+        # runs without an origin match any sensor with the same name
+        assert storage.get_run_ids_by_run_key(
+            sensor_selector_id, ["a", "b", "c"], instigator_name="my_sensor"
+        ) == {"a": two, "b": four}
+        assert (
+            storage.get_run_ids_by_run_key(
+                sensor_selector_id, ["b"], instigator_name="other_sensor"
+            )
+            == {}
+        )
+
+        scheduled_run_key = DagsterRun.run_key_for_scheduled_execution(
+            "2024-01-01T00:00:00+00:00", None
+        )
+        assert storage.get_run_ids_by_run_key(schedule_selector_id, [scheduled_run_key]) == {
+            scheduled_run_key: five
+        }
+        assert storage.get_run_ids_by_run_key(sensor_selector_id, [scheduled_run_key]) == {}
+
+        if self.can_delete_runs():
+            storage.delete_run(two)
+            assert storage.get_run_ids_by_run_key(sensor_selector_id, ["a"]) == {"a": one}
+
+    def test_run_key_index_checks_are_cached(self, storage: RunStorage):
+        if not isinstance(storage, SqlRunStorage) or not storage.supports_run_key_index:
+            pytest.skip("storage does not support the run key index")
+
+        assert storage.has_run_keys_table()
+        with mock.patch.object(storage, "connect", side_effect=Exception("not cached")):
+            assert storage.has_run_keys_table()
+            assert storage.supports_run_key_index
+
+        # migrating the storage checks again
+        storage.migrate()
+        with mock.patch.object(
+            storage, "has_built_index", wraps=storage.has_built_index
+        ) as has_built_index:
+            assert storage.supports_run_key_index
+            assert storage.supports_run_key_index
+            assert has_built_index.call_count == 1
+
+    def test_migrate_run_keys(self, storage: RunStorage):
+        if not isinstance(storage, SqlRunStorage) or not storage.supports_run_key_index:
+            pytest.skip("storage does not support the run key index")
+
+        job_name = "some_job"
+        origin = self.fake_job_origin(job_name)
+        selector_id = InstigatorSelector(
+            origin.repository_origin.code_location_origin.location_name,
+            origin.repository_origin.repository_name,
+            "my_sensor",
+        ).get_id()
+        run_ids = [make_new_run_id() for _ in range(3)]
+        for i, run_id in enumerate(run_ids):
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    job_name=job_name,
+                    tags={SENSOR_NAME_TAG: "my_sensor", RUN_KEY_TAG: str(i)},
+                    external_job_origin=origin,
+                )
+            )
+
+        # simulate runs that were created before the index existed
+        with storage.connect() as conn:
+            conn.execute(RunKeysTable.delete().where(RunKeysTable.c.run_id != run_ids[0]))
+        assert storage.get_run_ids_by_run_key(selector_id, ["0", "1", "2"]) == {"0": run_ids[0]}
+
+        storage.migrate(force_rebuild_all=True)
+        assert storage.get_run_ids_by_run_key(selector_id, ["0", "1", "2"]) == {
+            str(i): run_id for i, run_id in enumerate(run_ids)
+        }
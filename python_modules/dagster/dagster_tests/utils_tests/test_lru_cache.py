@@ -0,0 +1,37 @@
+from dagster._utils.lru_cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache[str, int](max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # touching "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_cache_get_or_compute():
+    cache = LRUCache[str, int](max_size=4)
+    calls = []
+
+    def _compute():
+        calls.append(1)
+        return 5
+
+    assert cache.get_or_compute("a", _compute) == 5
+    assert cache.get_or_compute("a", _compute) == 5
+    assert len(calls) == 1
+
+    cache.discard("a")
+    assert cache.get("a") is None
+    assert cache.get_or_compute("a", _compute) == 5
+    assert len(calls) == 2
+
+    cache.clear()
+    assert len(cache) == 0
@@ -1,5 +1,6 @@
 import sys
 import time
+from contextlib import ExitStack
 
 import dagster._check as check
 from celery.exceptions import TaskRevokedError
@@ -7,6 +8,7 @@
 from dagster._core.events import DagsterEvent, EngineEventData
 from dagster._core.execution.context.system import PlanOrchestrationContext
 from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.executor.step_delegating.event_log_tailer import RunEventLogTailer
 from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._serdes.serdes import deserialize_value
 from dagster._utils.error import serializable_error_info_from_exc_info
@@ -20,13 +22,26 @@
 )
 
 TICK_SECONDS = 1
+CHECK_STEP_RESULTS_INTERVAL_SECONDS = 5
 DELEGATE_MARKER = "celery_queue_wait"
 
 
-def core_celery_execution_loop(job_context, execution_plan, step_execution_fn):
+def core_celery_execution_loop(
+    job_context, execution_plan, step_execution_fn, stream_step_events=False
+):
+    """Submits the steps of the plan as Celery tasks and follows them to completion.
+
+    By default, the events of each step are read from the result of its Celery task once the task
+    is ready, which requires polling the result of every in-flight task on each tick. When
+    `stream_step_events` is set, the tasks write their events to the event log as they happen and
+    the loop tails the event log of the run instead: steps complete as soon as their terminal
+    events are read, and the task results are only checked periodically to catch tasks that
+    failed or were revoked without reporting a step event.
+    """
     check.inst_param(job_context, "job_context", PlanOrchestrationContext)
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
     check.callable_param(step_execution_fn, "step_execution_fn")
+    check.bool_param(stream_step_events, "stream_step_events")
 
     executor = job_context.executor
 
@@ -52,14 +67,26 @@ def core_celery_execution_loop(job_context, execution_plan, step_execution_fn):
 
     step_results = {}  # Dict[ExecutionStep, celery.AsyncResult]
     step_errors = {}
+    # results of the tasks whose steps have completed, but that may still raise
+    finished_results = []  # List[Tuple[str, celery.AsyncResult]]
+
+    tailer = (
+        RunEventLogTailer(job_context.instance, job_context.run_id) if stream_step_events else None
+    )
 
-    with execution_plan.start(
+    with ExitStack() as stack, execution_plan.start(
         retry_mode=job_context.executor.retries,
         sort_key_fn=priority_for_step,
     ) as active_execution:
+        if tailer:
+            stack.enter_context(tailer)
+
         stopping = False
+        last_check_results_time = time.monotonic()
 
-        while (not active_execution.is_complete and not stopping) or step_results:
+        while (
+            (not active_execution.is_complete and not stopping) or step_results or finished_results
+        ):
             if active_execution.check_for_interrupts():
                 yield DagsterEvent.engine_event(
                     job_context,
@@ -71,43 +98,96 @@ def core_celery_execution_loop(job_context, execution_plan, step_execution_fn):
                 active_execution.mark_interrupted()
                 for result in step_results.values():
                     result.revoke()
-            results_to_pop = []
-            for step_key, result in sorted(
-                step_results.items(), key=lambda x: priority_for_key(x[0])
-            ):
-                if result.ready():
-                    try:
-                        step_events = result.get()
-                    except TaskRevokedError:
-                        step_events = []
-                        step = active_execution.get_step_by_key(step_key)
-                        yield DagsterEvent.engine_event(
-                            job_context.for_step(step),
-                            f'celery task for running step "{step_key}" was revoked.',
-                            EngineEventData(marker_end=DELEGATE_MARKER),
+
+            if tailer:
+                yield from _handle_streamed_step_events(
+                    job_context, active_execution, step_results, finished_results, tailer
+                )
+
+                # tasks become ready shortly after their steps complete, so only a few results are
+                # checked on each tick
+                unready_results = []
+                for step_key, result in finished_results:
+                    if result.ready():
+                        _check_step_result(
+                            job_context, active_execution, step_key, result, step_errors
+                        )
+                    else:
+                        unready_results.append((step_key, result))
+                finished_results = unready_results
+
+                # steps complete when their events are read from the event log, so the task
+                # results are only needed to find tasks that ended without completing their step
+                if stopping or time.monotonic() - last_check_results_time >= (
+                    CHECK_STEP_RESULTS_INTERVAL_SECONDS
+                ):
+                    last_check_results_time = time.monotonic()
+                    ready_step_keys = [
+                        step_key for step_key, result in step_results.items() if result.ready()
+                    ]
+                    if ready_step_keys:
+                        # read the events that the tasks wrote before they became ready
+                        yield from _handle_streamed_step_events(
+                            job_context,
+                            active_execution,
+                            step_results,
+                            finished_results,
+                            tailer,
                         )
-                    except Exception:
-                        # We will want to do more to handle the exception here.. maybe subclass Task
-                        # Certainly yield an engine or job event
-                        step_events = []
-                        step_errors[step_key] = serializable_error_info_from_exc_info(
-                            sys.exc_info()
+                    for step_key in ready_step_keys:
+                        if step_key not in step_results:
+                            continue
+                        _check_step_result(
+                            job_context,
+                            active_execution,
+                            step_key,
+                            step_results[step_key],
+                            step_errors,
                         )
-                    for step_event in step_events:
-                        event = deserialize_value(step_event, DagsterEvent)
-                        yield event
-                        active_execution.handle_event(event)
+                        del step_results[step_key]
+                        active_execution.verify_complete(job_context, step_key)
 
-                    results_to_pop.append(step_key)
+                # process skips from failures or uncovered inputs, their events are read back from
+                # the event log
+                list(active_execution.plan_events_iterator(job_context))
+            else:
+                results_to_pop = []
+                for step_key, result in sorted(
+                    step_results.items(), key=lambda x: priority_for_key(x[0])
+                ):
+                    if result.ready():
+                        try:
+                            step_events = result.get()
+                        except TaskRevokedError:
+                            step_events = []
+                            step = active_execution.get_step_by_key(step_key)
+                            yield DagsterEvent.engine_event(
+                                job_context.for_step(step),
+                                f'celery task for running step "{step_key}" was revoked.',
+                                EngineEventData(marker_end=DELEGATE_MARKER),
+                            )
+                        except Exception:
+                            # We will want to do more to handle the exception here.. maybe subclass Task
+                            # Certainly yield an engine or job event
+                            step_events = []
+                            step_errors[step_key] = serializable_error_info_from_exc_info(
+                                sys.exc_info()
+                            )
+                        for step_event in step_events:
+                            event = deserialize_value(step_event, DagsterEvent)
+                            yield event
+                            active_execution.handle_event(event)
 
-            for step_key in results_to_pop:
-                if step_key in step_results:
-                    del step_results[step_key]
-                    active_execution.verify_complete(job_context, step_key)
+                        results_to_pop.append(step_key)
 
-            # process skips from failures or uncovered inputs
-            for event in active_execution.plan_events_iterator(job_context):
-                yield event
+                for step_key in results_to_pop:
+                    if step_key in step_results:
+                        del step_results[step_key]
+                        active_execution.verify_complete(job_context, step_key)
+
+                # process skips from failures or uncovered inputs
+                for event in active_execution.plan_events_iterator(job_context):
+                    yield event
 
             # don't add any new steps if we are stopping
             if stopping or step_errors:
@@ -118,14 +198,22 @@ def core_celery_execution_loop(job_context, execution_plan, step_execution_fn):
             # which they are scheduled (and the following m-n steps will be executed in priority
             # order, provided that it takes longer to execute a step than to schedule it). The test
             # case has m >> n to exhibit this behavior in the absence of this sort step.
-            for step in active_execution.get_steps_to_execute():
+            steps_to_execute = active_execution.get_steps_to_execute()
+            if steps_to_execute:
+                # the known state only changes when step events are handled, so every step in the
+                # batch is submitted with the same snapshot of it
+                known_state = active_execution.get_known_state()
+
+            for step in steps_to_execute:
                 try:
                     queue = step.tags.get(DAGSTER_CELERY_QUEUE_TAG, task_default_queue)
-                    yield DagsterEvent.engine_event(
+                    submit_event = DagsterEvent.engine_event(
                         job_context.for_step(step),
                         f'Submitting celery task for step "{step.key}" to queue "{queue}".',
                         EngineEventData(marker_start=DELEGATE_MARKER),
                     )
+                    if not tailer:
+                        yield submit_event
 
                     # Get the Celery priority for this step
                     priority = _get_step_priority(job_context, step)
@@ -137,7 +225,7 @@ def core_celery_execution_loop(job_context, execution_plan, step_execution_fn):
                         step,
                         queue,
                         priority,
-                        active_execution.get_known_state(),
+                        known_state,
                     )
 
                 except Exception:
@@ -150,7 +238,16 @@ def core_celery_execution_loop(job_context, execution_plan, step_execution_fn):
                     )
                     raise
 
-            time.sleep(TICK_SECONDS)
+            if tailer:
+                tailer.wait(TICK_SECONDS)
+            else:
+                time.sleep(TICK_SECONDS)
+
+        if tailer:
+            # yield the step events that were written since the last step completed
+            yield from _handle_streamed_step_events(
+                job_context, active_execution, step_results, finished_results, tailer
+            )
 
         if step_errors:
             raise DagsterSubprocessError(
@@ -163,6 +260,47 @@ def core_celery_execution_loop(job_context, execution_plan, step_execution_fn):
             )
 
 
+def _check_step_result(job_context, active_execution, step_key, result, step_errors):
+    """Records the error if the Celery task for the step failed. The events of the step are read
+    from the event log, so the result of the task itself is discarded.
+    """
+    try:
+        result.get()
+    except TaskRevokedError:
+        DagsterEvent.engine_event(
+            job_context.for_step(active_execution.get_step_by_key(step_key)),
+            f'celery task for running step "{step_key}" was revoked.',
+            EngineEventData(marker_end=DELEGATE_MARKER),
+        )
+    except Exception:
+        step_errors[step_key] = serializable_error_info_from_exc_info(sys.exc_info())
+
+
+def _handle_streamed_step_events(
+    job_context, active_execution, step_results, finished_results, tailer
+):
+    for event in tailer.pop_events():
+        if not event.step_key:
+            # run-level events are yielded by the loop itself
+            continue
+
+        yield event
+
+        if event.step_key not in step_results:
+            continue
+
+        active_execution.handle_event(event)
+        if (
+            event.is_step_success
+            or event.is_step_failure
+            or event.is_resource_init_failure
+            or event.is_step_up_for_retry
+        ):
+            finished_results.append((event.step_key, step_results.pop(event.step_key)))
+            if not event.is_step_up_for_retry:
+                active_execution.verify_complete(job_context, event.step_key)
+
+
 def _get_step_priority(context, step):
     """Step priority is (currently) set as the overall run priority plus the individual
     step priority.
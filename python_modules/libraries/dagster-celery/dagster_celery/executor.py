@@ -114,7 +114,9 @@ def _submit_task(app, plan_context, step, queue, priority, known_state):
         instance_ref=plan_context.instance.get_ref(),
         retry_mode=plan_context.executor.retries.for_inner_plan(),
         known_state=known_state,
-        print_serialized_events=True,  # Not actually checked by the celery task
+        # the task writes the step events to the event log, which the executor tails, so there is
+        # no need to also send them back through the result backend
+        print_serialized_events=False,
     )
 
     task = create_task(app)
@@ -154,7 +156,7 @@ def execute(self, plan_context, execution_plan):
         from .core_execution_loop import core_celery_execution_loop
 
         return core_celery_execution_loop(
-            plan_context, execution_plan, step_execution_fn=_submit_task
+            plan_context, execution_plan, step_execution_fn=_submit_task, stream_step_events=True
         )
 
     @staticmethod
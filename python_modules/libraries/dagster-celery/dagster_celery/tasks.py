@@ -63,6 +63,10 @@ def _execute_plan(self, execute_step_args_packed, executable_dict):
             step_key=execution_plan.step_handle_for_single_step_plans().to_key(),
         )
 
+        # The step events are written to the event log as the plan executes. They are only sent back
+        # in the task result for executors that read them from the result backend.
+        return_events = execute_step_args.print_serialized_events
+
         events = [engine_event]
         for step_event in execute_plan_iterator(
             execution_plan=execution_plan,
@@ -72,7 +76,11 @@ def _execute_plan(self, execute_step_args_packed, executable_dict):
             retry_mode=retry_mode,
             run_config=dagster_run.run_config,
         ):
-            events.append(step_event)
+            if return_events:
+                events.append(step_event)
+
+        if not return_events:
+            return []
 
         serialized_events = [serialize_value(event) for event in events]
         return serialized_events
@@ -0,0 +1,188 @@
+import pytest
+from celery.exceptions import TaskRevokedError
+from dagster import execute_job, executor, job, op, reconstructable
+from dagster._core.events import DagsterEventType, EngineEventData
+from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster._core.execution.retries import RetryMode
+from dagster._core.executor.base import Executor
+from dagster._core.test_utils import instance_for_test
+from dagster_celery import core_execution_loop
+from dagster_celery.core_execution_loop import core_celery_execution_loop
+
+# the events yielded by the execution loop in the current test
+YIELDED_EVENTS = []
+
+
+class FakeAsyncResult:
+    """Stands in for the AsyncResult of a Celery task that has already run."""
+
+    def __init__(self, error=None, on_ready=None):
+        self._error = error
+        self._on_ready = on_ready
+
+    def ready(self):
+        if self._on_ready:
+            on_ready, self._on_ready = self._on_ready, None
+            on_ready()
+        return True
+
+    def get(self):
+        if self._error:
+            raise self._error
+        # the events of the step are only read from the event log
+        return []
+
+    def revoke(self):
+        pass
+
+
+def _execute_step(job_context, step, known_state):
+    # writes the events of the step to the event log, as the Celery task does on a worker
+    dagster_run = job_context.dagster_run
+    execution_plan = create_execution_plan(
+        job_context.reconstructable_job,
+        dagster_run.run_config,
+        step_keys_to_execute=[step.key],
+        known_state=known_state,
+    )
+    for _ in execute_plan_iterator(
+        execution_plan=execution_plan,
+        job=job_context.reconstructable_job,
+        dagster_run=dagster_run,
+        instance=job_context.instance,
+        retry_mode=RetryMode.DISABLED,
+        run_config=dagster_run.run_config,
+    ):
+        pass
+
+
+def _fake_step_execution_fn(_app, job_context, step, _queue, _priority, known_state):
+    mode = job_context.executor.mode
+    if mode == "raise":
+        return FakeAsyncResult(error=Exception("The worker failed before executing the step"))
+    elif mode == "revoke":
+        return FakeAsyncResult(error=TaskRevokedError("revoked"))
+
+    _execute_step(job_context, step, known_state)
+
+    if mode == "late_events":
+        # the task writes another event after the loop has read the terminal event of the step
+        return FakeAsyncResult(
+            on_ready=lambda: job_context.instance.report_engine_event(
+                f"Finished celery task for step {step.key}",
+                job_context.dagster_run,
+                EngineEventData(),
+                step_key=step.key,
+            )
+        )
+    return FakeAsyncResult()
+
+
+class FakeCeleryExecutor(Executor):
+    def __init__(self, mode):
+        self.mode = mode
+
+    @property
+    def retries(self):
+        return RetryMode.DISABLED
+
+    def app_args(self):
+        return {"broker": "memory://"}
+
+    def execute(self, plan_context, execution_plan):
+        for event in core_celery_execution_loop(
+            plan_context,
+            execution_plan,
+            step_execution_fn=_fake_step_execution_fn,
+            stream_step_events=True,
+        ):
+            YIELDED_EVENTS.append(event)
+            yield event
+
+
+@executor(name="fake_celery", config_schema={"mode": str})
+def fake_celery_executor(init_context):
+    return FakeCeleryExecutor(init_context.executor_config["mode"])
+
+
+@op
+def simple():
+    return 1
+
+
+@op
+def add_one(num):
+    return num + 1
+
+
+@job(executor_def=fake_celery_executor)
+def fake_celery_job():
+    add_one(simple())
+
+
+@pytest.fixture(autouse=True)
+def fast_ticks(monkeypatch):
+    YIELDED_EVENTS.clear()
+    monkeypatch.setattr(core_execution_loop, "TICK_SECONDS", 0.01)
+    monkeypatch.setattr(core_execution_loop, "CHECK_STEP_RESULTS_INTERVAL_SECONDS", 0)
+
+
+def _execute(instance, mode):
+    return execute_job(
+        reconstructable(fake_celery_job),
+        instance=instance,
+        run_config={"execution": {"config": {"mode": mode}}},
+    )
+
+
+def test_streamed_step_success():
+    with instance_for_test() as instance:
+        with _execute(instance, "success") as result:
+            assert result.success
+            assert result.output_for_node("add_one") == 2
+
+            # each step completed once, from the events that were read back from the event log
+            assert [event.step_key for event in result.all_events if event.is_step_success] == [
+                "simple",
+                "add_one",
+            ]
+
+
+def test_streamed_task_error_before_step_events():
+    with instance_for_test() as instance:
+        with _execute(instance, "raise") as result:
+            assert not result.success
+            assert not any(event.is_step_event for event in result.all_events)
+
+            run_failure = next(
+                event
+                for event in instance.all_logs(result.run_id)
+                if event.dagster_event
+                and event.dagster_event.event_type == DagsterEventType.RUN_FAILURE
+            )
+            error = run_failure.dagster_event.job_failure_data.error  # type: ignore
+            assert error.cls_name == "DagsterSubprocessError"
+            assert "The worker failed before executing the step" in error.to_string()
+
+
+def test_streamed_task_revoked():
+    with instance_for_test() as instance:
+        with _execute(instance, "revoke") as result:
+            assert not result.success
+            revoked_message = 'celery task for running step "simple" was revoked.'
+            messages = [event.message for event in result.all_events if event.is_engine_event]
+            assert messages.count(revoked_message) == 1
+            assert revoked_message in [event.message for event in YIELDED_EVENTS]
+            assert not any(event.is_step_success for event in result.all_events)
+
+
+def test_streamed_final_drain():
+    with instance_for_test() as instance:
+        with _execute(instance, "late_events") as result:
+            assert result.success
+
+            # the event that the last task wrote after its step completed is read from the event log
+            # after the loop exits, and yielded by the executor
+            messages = [event.message for event in YIELDED_EVENTS if event.is_engine_event]
+            assert "Finished celery task for step simple" in messages
+            assert "Finished celery task for step add_one" in messages
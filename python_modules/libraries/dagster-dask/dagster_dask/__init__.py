@@ -2,6 +2,7 @@
 
 from .data_frame import DataFrame as DataFrame
 from .executor import dask_executor as dask_executor
+from .io_manager import dask_worker_io_manager as dask_worker_io_manager
 from .resources import dask_resource as dask_resource
 from .version import __version__ as __version__
 
@@ -1,8 +1,10 @@
-from typing import Any, Mapping, Optional, Sequence
+from contextlib import nullcontext
+from typing import Any, Mapping, NamedTuple, Optional, Sequence
 
 import dask
 import dask.distributed
 from dagster import (
+    Bool,
     Executor,
     Field,
     Permissive,
@@ -18,6 +20,7 @@
 from dagster._core.events import DagsterEvent
 from dagster._core.execution.api import create_execution_plan, execute_plan
 from dagster._core.execution.context.system import PlanOrchestrationContext
+from dagster._core.execution.plan.outputs import StepOutputHandle
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.execution.retries import RetryMode
@@ -26,6 +29,8 @@
 from dagster._core.storage.dagster_run import DagsterRun
 from dagster._utils import iterate_with_context
 
+from .io_manager import worker_outputs
+
 # Dask resource requirements are specified under this key
 DASK_RESOURCE_REQUIREMENTS_KEY = "dagster-dask/resource_requirements"
 
@@ -75,7 +80,18 @@
                     ),
                 }
             )
-        )
+        ),
+        "single_graph": Field(
+            Bool,
+            is_required=False,
+            default_value=False,
+            description=(
+                "Submit the execution plan to Dask as a single task graph. Outputs handled by the"
+                " dask_worker_io_manager are then kept in the memory of the Dask workers and"
+                " passed directly to the downstream steps, which Dask schedules on the workers"
+                " that hold their inputs."
+            ),
+        ),
     },
 )
 def dask_executor(init_context):
@@ -101,6 +117,7 @@ def dask_executor(init_context):
                         threads_per_worker?: 1 # Number of threads per each worker
                     }
             }
+        single_graph?: false # Submit the execution plan as a single Dask task graph
 
     To use the `dask_executor`, set it as the `executor_def` when defining a job:
 
@@ -113,9 +130,31 @@ def dask_executor(init_context):
         def dask_enabled_job():
             pass
 
+    By default, each step is submitted to Dask as its own task, and step outputs are passed between
+    steps through the job's IO managers. With ``single_graph`` enabled, the whole execution plan is
+    submitted as a single Dask task graph, and outputs handled by the
+    :py:func:`dask_worker_io_manager` stay in the memory of the Dask workers instead of being
+    written to storage:
+
+    .. code-block:: python
+
+        from dagster import job
+        from dagster_dask import dask_executor, dask_worker_io_manager
+
+        @job(
+            executor_def=dask_executor.configured({"single_graph": True}),
+            resource_defs={"io_manager": dask_worker_io_manager},
+        )
+        def dask_graph_job():
+            pass
+
     """
     ((cluster_type, cluster_configuration),) = init_context.executor_config["cluster"].items()
-    return DaskExecutor(cluster_type, cluster_configuration)
+    return DaskExecutor(
+        cluster_type,
+        cluster_configuration,
+        single_graph=init_context.executor_config["single_graph"],
+    )
 
 
 def query_on_dask_worker(
@@ -145,6 +184,50 @@ def query_on_dask_worker(
         )
 
 
+class DaskStepResult(NamedTuple):
+    """The result of the Dask task that executed a step in a single task graph: the events of the
+    step, and the outputs of the step that were handled by the dask_worker_io_manager.
+    """
+
+    events: Sequence[DagsterEvent]
+    output_values: Mapping[StepOutputHandle, Any]
+
+
+def execute_step_in_graph(
+    upstream_results: Sequence[DaskStepResult],
+    recon_job: ReconstructableJob,
+    dagster_run: DagsterRun,
+    run_config: Optional[Mapping[str, object]],
+    step_key: str,
+    instance_ref: InstanceRef,
+    known_state: Optional[KnownExecutionState],
+) -> DaskStepResult:
+    """Executes a step as a task of a single Dask task graph. Dask passes in the results of the
+    tasks of the upstream steps, whose outputs are made available to the dask_worker_io_manager.
+    """
+    upstream_values = {}
+    for upstream_result in upstream_results:
+        upstream_values.update(upstream_result.output_values)
+
+    with worker_outputs(upstream_values) as values:
+        events = query_on_dask_worker(
+            None, recon_job, dagster_run, run_config, [step_key], instance_ref, known_state
+        )
+
+    return DaskStepResult(
+        events=events,
+        output_values={
+            step_output_handle: value
+            for step_output_handle, value in values.items()
+            if step_output_handle.step_key == step_key
+        },
+    )
+
+
+def get_step_events(step_result: DaskStepResult) -> Sequence[DagsterEvent]:
+    return step_result.events
+
+
 def get_dask_resource_requirements(tags: Mapping[str, str]):
     check.mapping_param(tags, "tags", key_type=str, value_type=str)
     req_str = tags.get(DASK_RESOURCE_REQUIREMENTS_KEY)
@@ -155,11 +238,12 @@ def get_dask_resource_requirements(tags: Mapping[str, str]):
 
 
 class DaskExecutor(Executor):
-    def __init__(self, cluster_type, cluster_configuration):
+    def __init__(self, cluster_type, cluster_configuration, single_graph=False):
         self.cluster_type = check.opt_str_param(cluster_type, "cluster_type", default="local")
         self.cluster_configuration = check.opt_dict_param(
             cluster_configuration, "cluster_configuration"
         )
+        self.single_graph = check.bool_param(single_graph, "single_graph")
 
     @property
     def retries(self):
@@ -183,8 +267,6 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
         job_name = plan_context.job_name
 
-        instance = plan_context.instance
-
         cluster_type = self.cluster_type
         if cluster_type == "existing":
             # address passed directly to Client() below to connect to existing Scheduler
@@ -236,48 +318,105 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
             )
 
         with dask.distributed.Client(cluster) as client:
-            execution_futures = []
-            execution_futures_dict = {}
+            if self.single_graph:
+                execution_futures = self._submit_graph(
+                    client, plan_context, execution_plan, step_levels
+                )
+            else:
+                execution_futures = self._submit_steps(
+                    client, plan_context, execution_plan, step_levels
+                )
+
+            # This tells Dask to awaits the step executions and retrieve their results to the
+            # master
+            futures = dask.distributed.as_completed(execution_futures, with_results=True)
+
+            # Allow interrupts while waiting for the results from Dask
+            for future, result in iterate_with_context(raise_execution_interrupts, futures):
+                for step_event in result:
+                    yield check.inst(step_event, DagsterEvent)
+
+    def _submit_steps(self, client, plan_context, execution_plan, step_levels):
+        job_name = plan_context.job_name
+        instance = plan_context.instance
+
+        execution_futures = []
+        execution_futures_dict = {}
 
-            for step_level in step_levels:
-                for step in step_level:
-                    # We ensure correctness in sequencing by letting Dask schedule futures and
-                    # awaiting dependencies within each step.
-                    dependencies = []
-                    for step_input in step.step_inputs:
-                        for key in step_input.dependency_keys:
-                            dependencies.append(execution_futures_dict[key])
+        for step_level in step_levels:
+            for step in step_level:
+                # We ensure correctness in sequencing by letting Dask schedule futures and
+                # awaiting dependencies within each step.
+                dependencies = []
+                for step_input in step.step_inputs:
+                    for key in step_input.dependency_keys:
+                        dependencies.append(execution_futures_dict[key])
 
-                    run_config = plan_context.run_config
+                run_config = plan_context.run_config
 
-                    dask_task_name = "%s.%s" % (job_name, step.key)
+                dask_task_name = "%s.%s" % (job_name, step.key)
 
-                    recon_job = plan_context.reconstructable_job
+                recon_job = plan_context.reconstructable_job
 
-                    future = client.submit(
-                        query_on_dask_worker,
-                        dependencies,
+                future = client.submit(
+                    query_on_dask_worker,
+                    dependencies,
+                    recon_job,
+                    plan_context.dagster_run,
+                    run_config,
+                    [step.key],
+                    instance.get_ref(),
+                    execution_plan.known_state,
+                    key=dask_task_name,
+                    resources=get_dask_resource_requirements(step.tags),
+                )
+
+                execution_futures.append(future)
+                execution_futures_dict[step.key] = future
+
+        return execution_futures
+
+    def _submit_graph(self, client, plan_context, execution_plan, step_levels):
+        job_name = plan_context.job_name
+        instance_ref = plan_context.instance.get_ref()
+        recon_job = plan_context.reconstructable_job
+
+        # Build a delayed call for every step, with the calls of its upstream steps as arguments,
+        # so that Dask sees the dependencies between steps and passes the results of the upstream
+        # tasks, including any outputs held in worker memory, directly to the downstream tasks.
+        step_results = {}
+        step_events = []
+        for step_level in step_levels:
+            for step in step_level:
+                upstream_results = [
+                    step_results[key]
+                    for step_input in step.step_inputs
+                    for key in step_input.dependency_keys
+                ]
+
+                resources = get_dask_resource_requirements(step.tags)
+                with dask.annotate(resources=resources) if resources else nullcontext():
+                    step_results[step.key] = dask.delayed(execute_step_in_graph, pure=False)(
+                        upstream_results,
                         recon_job,
                         plan_context.dagster_run,
-                        run_config,
-                        [step.key],
-                        instance.get_ref(),
+                        plan_context.run_config,
+                        step.key,
+                        instance_ref,
                         execution_plan.known_state,
-                        key=dask_task_name,
-                        resources=get_dask_resource_requirements(step.tags),
+                        dask_key_name=f"{job_name}.{step.key}",
                     )
 
-                    execution_futures.append(future)
-                    execution_futures_dict[step.key] = future
-
-            # This tells Dask to awaits the step executions and retrieve their results to the
-            # master
-            futures = dask.distributed.as_completed(execution_futures, with_results=True)
+                # only the events of each step are sent back to the client, the step outputs stay
+                # on the workers until the downstream steps no longer need them
+                step_events.append(
+                    dask.delayed(get_step_events, pure=False)(
+                        step_results[step.key], dask_key_name=f"{job_name}.{step.key}.events"
+                    )
+                )
 
-            # Allow interrupts while waiting for the results from Dask
-            for future, result in iterate_with_context(raise_execution_interrupts, futures):
-                for step_event in result:
-                    yield check.inst(step_event, DagsterEvent)
+        # submit the whole plan as one graph
+        return client.compute(step_events, optimize_graph=False)
 
     def build_dict(self, job_name):
         """Returns a dict we can use for kwargs passed to dask client instantiation.
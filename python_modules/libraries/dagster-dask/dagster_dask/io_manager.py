@@ -0,0 +1,111 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+from dagster import (
+    InputContext,
+    IOManager,
+    OutputContext,
+    _check as check,
+    io_manager,
+)
+from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.execution.plan.outputs import StepOutputHandle
+from dagster._core.storage.io_manager import dagster_maintained_io_manager
+
+
+class _WorkerOutputs(threading.local):
+    values: Optional[Dict[StepOutputHandle, Any]] = None
+
+
+_worker_outputs = _WorkerOutputs()
+
+
+@contextmanager
+def worker_outputs(
+    upstream_values: Mapping[StepOutputHandle, Any],
+) -> Iterator[Dict[StepOutputHandle, Any]]:
+    """Makes the given upstream step outputs available to the dask_worker_io_manager while a step
+    executes on a Dask worker, and yields the dict that the outputs handled during execution are
+    added to.
+    """
+    previous_values = _worker_outputs.values
+    values = dict(
+        check.mapping_param(upstream_values, "upstream_values", key_type=StepOutputHandle)
+    )
+    _worker_outputs.values = values
+    try:
+        yield values
+    finally:
+        _worker_outputs.values = previous_values
+
+
+def _get_worker_outputs() -> Dict[StepOutputHandle, Any]:
+    if _worker_outputs.values is None:
+        raise DagsterInvariantViolationError(
+            "The dask_worker_io_manager can only be used by steps executed by the dask_executor"
+            " with `single_graph` enabled."
+        )
+    return _worker_outputs.values
+
+
+class DaskWorkerIOManager(IOManager):
+    """I/O manager that keeps step outputs in the memory of the Dask workers. Outputs are returned
+    to Dask as part of the result of the task that executed the step, and Dask passes them to the
+    tasks of the downstream steps, so they are never written to storage.
+    """
+
+    def handle_output(self, context: OutputContext, obj: object):
+        _get_worker_outputs()[
+            StepOutputHandle(context.step_key, context.name, context.mapping_key)
+        ] = obj
+
+    def load_input(self, context: InputContext) -> object:
+        upstream_output = context.upstream_output
+        check.invariant(
+            upstream_output is not None, "The dask_worker_io_manager can only load step outputs"
+        )
+        step_output_handle = StepOutputHandle(
+            upstream_output.step_key, upstream_output.name, upstream_output.mapping_key
+        )
+        values = _get_worker_outputs()
+        if step_output_handle not in values:
+            raise DagsterInvariantViolationError(
+                f"Output {step_output_handle.output_name} of step {step_output_handle.step_key} is"
+                " not available on this Dask worker. The dask_worker_io_manager can only load"
+                " outputs that were produced in the same Dask task graph."
+            )
+        return values[step_output_handle]
+
+
+@dagster_maintained_io_manager
+@io_manager(
+    description=(
+        "IO manager that keeps step outputs in the memory of the Dask workers, for use with the"
+        " dask_executor in `single_graph` mode."
+    )
+)
+def dask_worker_io_manager(_) -> DaskWorkerIOManager:
+    """IO manager that keeps step outputs in the memory of the Dask workers.
+
+    This IO manager can only be used with the :py:func:`dask_executor` with ``single_graph``
+    enabled. The outputs of each step are kept in the result of the Dask task that executed it, and
+    Dask passes them directly to the tasks of the downstream steps, preferring to run those tasks
+    on the workers that already hold their inputs.
+
+    Since the outputs are never written to storage, they are not available to re-executions or to
+    steps executed in other runs.
+
+    .. code-block:: python
+
+        from dagster import job
+        from dagster_dask import dask_executor, dask_worker_io_manager
+
+        @job(
+            executor_def=dask_executor.configured({"single_graph": True}),
+            resource_defs={"io_manager": dask_worker_io_manager},
+        )
+        def dask_graph_job():
+            ...
+    """
+    return DaskWorkerIOManager()
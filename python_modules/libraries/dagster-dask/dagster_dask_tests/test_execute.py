@@ -4,6 +4,7 @@
 from threading import Thread
 
 import dagster_pandas as dagster_pd
+import pandas as pd
 import pytest
 from dagster import file_relative_path, job, op, reconstructable
 from dagster._core.definitions.input import In
@@ -12,7 +13,7 @@
 from dagster._core.execution.api import execute_job, execute_run_iterator
 from dagster._core.test_utils import instance_for_test, nesting_graph
 from dagster._utils import send_interrupt
-from dagster_dask import DataFrame, dask_executor
+from dagster_dask import DataFrame, dask_executor, dask_worker_io_manager
 from dask.distributed import Scheduler, Worker
 
 
@@ -236,3 +237,57 @@ async def _run_test():
 @op
 def foo_op():
     return "foo"
+
+
+@op
+def make_frame():
+    return pd.DataFrame({"a": [1, 2, 3]})
+
+
+@op
+def double_frame(df):
+    return df.assign(b=df["a"] * 2)
+
+
+@op
+def check_frame(df):
+    assert list(df["b"]) == [2, 4, 6]
+
+
+def dask_worker_io_manager_job() -> JobDefinition:
+    @job(
+        executor_def=dask_executor,
+        resource_defs={"io_manager": dask_worker_io_manager},
+    )
+    def job_def():
+        check_frame(double_frame(make_frame()))
+
+    return job_def
+
+
+def test_execute_single_graph_on_dask_local():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(dask_worker_io_manager_job),
+            run_config={
+                "execution": {
+                    "config": {"cluster": {"local": {"timeout": 30}}, "single_graph": True}
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert len(result.get_step_success_events()) == 3
+
+
+def test_dask_worker_io_manager_requires_single_graph():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(dask_worker_io_manager_job),
+            run_config={
+                "execution": {"config": {"cluster": {"local": {"timeout": 30}}}},
+            },
+            instance=instance,
+        ) as result:
+            assert not result.success
+            assert "single_graph" in result.failure_data_for_node("make_frame").error.to_string()
@@ -1,11 +1,13 @@
 import logging
 import sys
+import threading
 import time
 from enum import Enum
-from typing import Any, Callable, List, Optional, Set, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
 
 import kubernetes.client
 import kubernetes.client.rest
+import kubernetes.watch
 from dagster import (
     DagsterInstance,
     _check as check,
@@ -198,22 +200,191 @@ class KubernetesWaitingReasons:
     CreateContainerConfigError = "CreateContainerConfigError"
 
 
+DEFAULT_JOB_STATUS_WATCH_TIMEOUT = 300  # restart the watch every 5 minutes
+
+
+class K8sJobStatusWatcher:
+    """Keeps an in-memory cache of the status of the Kubernetes jobs in a namespace that match a
+    label selector, so that callers checking on many jobs do not each poll the API server.
+
+    The cache is filled by listing the matching jobs once, and then kept up to date by a single
+    watch on the jobs from a background thread, which lists the jobs again whenever the watch
+    falls too far behind the API server to resume. Until the first list has completed, or while
+    the watch is failing, the cache is not synced and callers should read from the API server
+    instead.
+    """
+
+    def __init__(
+        self,
+        batch_api,
+        namespace: str,
+        label_selector: str,
+        logger: Callable[[str], None],
+        sleeper: Callable[[float], None],
+        watch_factory: Optional[Callable[[], Any]] = None,
+        watch_timeout_seconds: int = DEFAULT_JOB_STATUS_WATCH_TIMEOUT,
+        wait_time_between_attempts: float = DEFAULT_WAIT_BETWEEN_ATTEMPTS,
+    ):
+        self._batch_api = batch_api
+        self._namespace = check.str_param(namespace, "namespace")
+        self._label_selector = check.str_param(label_selector, "label_selector")
+        self._logger = logger
+        self._sleeper = sleeper
+        self._watch_factory = watch_factory or kubernetes.watch.Watch
+        self._watch_timeout_seconds = check.int_param(
+            watch_timeout_seconds, "watch_timeout_seconds"
+        )
+        self._wait_time_between_attempts = check.numeric_param(
+            wait_time_between_attempts, "wait_time_between_attempts"
+        )
+
+        self._lock = threading.Lock()
+        self._job_statuses: Dict[str, V1JobStatus] = {}
+        self._resource_version: Optional[str] = None
+        self._synced = threading.Event()
+        self._shutdown = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_synced(self) -> bool:
+        return self._synced.is_set()
+
+    def start(self) -> None:
+        check.invariant(self._thread is None, "Watcher has already been started")
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"k8s-job-status-watch-{self._namespace}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._shutdown.set()
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        return self._synced.wait(timeout)
+
+    def get_job_status(self, job_name: str) -> Tuple[bool, Optional[V1JobStatus]]:
+        """Returns whether the job was found in the cache, and its status if it was."""
+        with self._lock:
+            if job_name not in self._job_statuses:
+                return False, None
+            return True, self._job_statuses[job_name]
+
+    def _run(self) -> None:
+        while not self._shutdown.is_set():
+            try:
+                if self._resource_version is None:
+                    self._list_jobs()
+                self._watch_jobs()
+            except Exception:
+                self._synced.clear()
+                self._resource_version = None
+                self._logger(
+                    f"Error watching Kubernetes jobs in namespace {self._namespace}, retrying:"
+                    f" {sys.exc_info()[1]}"
+                )
+                self._sleeper(self._wait_time_between_attempts)
+
+    def _list_jobs(self) -> None:
+        job_list = self._batch_api.list_namespaced_job(
+            namespace=self._namespace, label_selector=self._label_selector
+        )
+        with self._lock:
+            self._job_statuses = {job.metadata.name: job.status for job in job_list.items}
+        self._resource_version = job_list.metadata.resource_version
+        self._synced.set()
+
+    def _watch_jobs(self) -> None:
+        watch = self._watch_factory()
+        for event in watch.stream(
+            self._batch_api.list_namespaced_job,
+            namespace=self._namespace,
+            label_selector=self._label_selector,
+            resource_version=self._resource_version,
+            timeout_seconds=self._watch_timeout_seconds,
+        ):
+            if self._shutdown.is_set():
+                watch.stop()
+                return
+
+            if event["type"] == "ERROR":
+                # the resource version is too old to resume the watch from (410 Gone), so the
+                # jobs need to be listed again
+                self._resource_version = None
+                watch.stop()
+                return
+
+            job = event["object"]
+            with self._lock:
+                if event["type"] == "DELETED":
+                    self._job_statuses.pop(job.metadata.name, None)
+                else:
+                    self._job_statuses[job.metadata.name] = job.status
+            self._resource_version = job.metadata.resource_version
+
+
+class _RateLimiter:
+    """Spaces out calls so that no more than `max_per_second` of them start in any one second."""
+
+    def __init__(
+        self,
+        max_per_second: float,
+        sleeper: Callable[[float], None],
+        timer: Callable[[], float],
+    ):
+        self._interval = 1.0 / check.numeric_param(max_per_second, "max_per_second")
+        self._sleeper = sleeper
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._next_time: Optional[float] = None
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = self._timer()
+            if self._next_time is not None and now < self._next_time:
+                self._sleeper(self._next_time - now)
+                now = self._next_time
+            self._next_time = now + self._interval
+
+
 class DagsterKubernetesClient:
-    def __init__(self, batch_api, core_api, logger, sleeper, timer):
+    def __init__(
+        self,
+        batch_api,
+        core_api,
+        logger,
+        sleeper,
+        timer,
+        max_job_creations_per_second: Optional[float] = None,
+    ):
         self.batch_api = batch_api
         self.core_api = core_api
         self.logger = logger
         self.sleeper = sleeper
         self.timer = timer
 
+        self._job_status_watchers: Dict[Tuple[str, str], K8sJobStatusWatcher] = {}
+        self._job_status_watchers_lock = threading.Lock()
+        self._job_creation_rate_limiter = (
+            _RateLimiter(max_job_creations_per_second, sleeper=sleeper, timer=timer)
+            if max_job_creations_per_second
+            else None
+        )
+
     @staticmethod
-    def production_client(batch_api_override=None, core_api_override=None):
+    def production_client(
+        batch_api_override=None,
+        core_api_override=None,
+        max_job_creations_per_second: Optional[float] = None,
+    ):
         return DagsterKubernetesClient(
             batch_api=batch_api_override or kubernetes.client.BatchV1Api(),
             core_api=core_api_override or kubernetes.client.CoreV1Api(),
             logger=logging.info,
             sleeper=time.sleep,
             timer=time.time,
+            max_job_creations_per_second=max_job_creations_per_second,
         )
 
     ### Job operations ###
@@ -417,12 +588,51 @@ def wait_for_running_job_to_succeed(
 
             self.sleeper(wait_time_between_attempts)
 
+    def watch_job_statuses(self, namespace: str, label_selector: str) -> K8sJobStatusWatcher:
+        """Returns a watcher that caches the status of the jobs in the namespace that match the
+        label selector, starting it if this client is not already watching those jobs. Watchers are
+        shared, so there is a single watch on the API server per namespace and label selector.
+        """
+        with self._job_status_watchers_lock:
+            key = (namespace, label_selector)
+            if key not in self._job_status_watchers:
+                watcher = K8sJobStatusWatcher(
+                    self.batch_api,
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    logger=self.logger,
+                    sleeper=self.sleeper,
+                )
+                watcher.start()
+                self._job_status_watchers[key] = watcher
+            return self._job_status_watchers[key]
+
+    def stop_watching_job_statuses(self) -> None:
+        with self._job_status_watchers_lock:
+            for watcher in self._job_status_watchers.values():
+                watcher.stop()
+            self._job_status_watchers = {}
+
     def get_job_status(
         self,
         job_name: str,
         namespace: str,
         wait_time_between_attempts=DEFAULT_WAIT_BETWEEN_ATTEMPTS,
+        label_selector: Optional[str] = None,
     ) -> Optional[V1JobStatus]:
+        """Returns the status of the job, or None if the job does not exist.
+
+        If a label selector matching the job is passed in, the status is read from a shared watch
+        on the jobs matching that selector, and the API server is only queried for jobs that the
+        watch has not seen yet.
+        """
+        if label_selector:
+            watcher = self.watch_job_statuses(namespace, label_selector)
+            if watcher.is_synced:
+                found, status = watcher.get_job_status(job_name)
+                if found:
+                    return status
+
         def _get_job_status():
             try:
                 job = self.batch_api.read_namespaced_job_status(job_name, namespace=namespace)
@@ -934,6 +1144,9 @@ def create_namespaced_job_with_retries(
         namespace: str,
         wait_time_between_attempts: float = DEFAULT_WAIT_BETWEEN_ATTEMPTS,
     ) -> None:
+        if self._job_creation_rate_limiter:
+            self._job_creation_rate_limiter.acquire()
+
         k8s_api_retry_creation_mutation(
             lambda: self.batch_api.create_namespaced_job(body=body, namespace=namespace),
             max_retries=3,
@@ -36,6 +36,7 @@
     get_k8s_job_name,
     get_user_defined_k8s_config,
 )
+from .utils import sanitize_k8s_label
 
 _K8S_EXECUTOR_CONFIG_SCHEMA = merge_dicts(
     DagsterK8sJobConfig.config_type_job(),
@@ -74,10 +75,33 @@
             is_required=False,
             description="Raw Kubernetes configuration for each step launched by the executor.",
         ),
+        "watch_job_statuses": Field(
+            bool,
+            is_required=False,
+            default_value=False,
+            description=(
+                "Whether to check on the health of the step jobs using a single watch on the "
+                "Kubernetes jobs of the run, instead of reading the status of each job from the "
+                "API server. Requires permission to watch jobs in the job namespace."
+            ),
+        ),
+        "max_job_creations_per_second": Field(
+            float,
+            is_required=False,
+            description=(
+                "Limit on the rate at which Kubernetes jobs are created for the steps of a run, to "
+                "avoid overloading the API server when many steps are ready to run at once."
+            ),
+        ),
     },
 )
 
 
+def get_step_job_label_selector(run_id: str) -> str:
+    """Label selector that matches the Kubernetes jobs for the steps of a run."""
+    return f"app.kubernetes.io/component=step_worker,dagster/run-id={sanitize_k8s_label(run_id)}"
+
+
 @executor(
     name="k8s",
     config_schema=_K8S_EXECUTOR_CONFIG_SCHEMA,
@@ -162,6 +186,8 @@ def k8s_job_executor(init_context: InitExecutorContext) -> Executor:
             container_context=k8s_container_context,
             load_incluster_config=load_incluster_config,
             kubeconfig_file=kubeconfig_file,
+            watch_job_statuses=exc_cfg.get("watch_job_statuses", False),  # type: ignore
+            max_job_creations_per_second=exc_cfg.get("max_job_creations_per_second"),  # type: ignore
         ),
         retries=RetryMode.from_config(exc_cfg["retries"]),  # type: ignore
         max_concurrent=check.opt_int_elem(exc_cfg, "max_concurrent"),
@@ -182,6 +208,8 @@ def __init__(
         load_incluster_config: bool,
         kubeconfig_file: Optional[str],
         k8s_client_batch_api=None,
+        watch_job_statuses: bool = False,
+        max_job_creations_per_second: Optional[float] = None,
     ):
         super().__init__()
 
@@ -200,8 +228,12 @@ def __init__(
             check.opt_str_param(kubeconfig_file, "kubeconfig_file")
             kubernetes.config.load_kube_config(kubeconfig_file)
 
+        self._watch_job_statuses = check.bool_param(watch_job_statuses, "watch_job_statuses")
         self._api_client = DagsterKubernetesClient.production_client(
-            batch_api_override=k8s_client_batch_api
+            batch_api_override=k8s_client_batch_api,
+            max_job_creations_per_second=check.opt_numeric_param(
+                max_job_creations_per_second, "max_job_creations_per_second"
+            ),
         )
 
     def _get_step_key(self, step_handler_context: StepHandlerContext) -> str:
@@ -316,6 +348,11 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> CheckSt
         status = self._api_client.get_job_status(
             namespace=container_context.namespace,
             job_name=job_name,
+            label_selector=(
+                get_step_job_label_selector(step_handler_context.execute_step_args.run_id)
+                if self._watch_job_statuses
+                else None
+            ),
         )
         if not status:
             return CheckStepHealthResult.unhealthy(
@@ -479,6 +479,22 @@ def config_type_run_launcher(cls):
                     description="List of environment variable names that are allowed to be set on "
                     "a per-run or per-code-location basis - e.g. using tags on the run. ",
                 ),
+                "watch_job_statuses": Field(
+                    bool,
+                    is_required=False,
+                    default_value=False,
+                    description="Whether to check on the health of run workers using a single "
+                    "watch on the run worker Kubernetes jobs in the namespace, instead of reading "
+                    "the status of each job from the API server. Requires permission to watch "
+                    "jobs in the job namespace.",
+                ),
+                "max_job_creations_per_second": Field(
+                    float,
+                    is_required=False,
+                    description="Limit on the rate at which the run launcher creates Kubernetes "
+                    "jobs, to avoid overloading the API server when many runs are launched at "
+                    "once.",
+                ),
             },
         )
 
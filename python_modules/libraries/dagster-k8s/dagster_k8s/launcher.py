@@ -18,6 +18,9 @@
 from .container_context import K8sContainerContext
 from .job import DagsterK8sJobConfig, construct_dagster_k8s_job, get_job_name_from_run_id
 
+# matches the Kubernetes jobs for every run launched by the run launcher
+RUN_WORKER_JOB_LABEL_SELECTOR = "app.kubernetes.io/component=run_worker"
+
 
 class K8sRunLauncher(RunLauncher, ConfigurableClass):
     """RunLauncher that starts a Kubernetes Job for each Dagster job run.
@@ -68,6 +71,8 @@ def __init__(
         run_k8s_config=None,
         only_allow_user_defined_k8s_config_fields=None,
         only_allow_user_defined_env_vars=None,
+        watch_job_statuses=False,
+        max_job_creations_per_second=None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.job_namespace = check.str_param(job_namespace, "job_namespace")
@@ -84,9 +89,13 @@ def __init__(
             check.opt_str_param(kubeconfig_file, "kubeconfig_file")
             kubernetes.config.load_kube_config(kubeconfig_file)
 
+        self._watch_job_statuses = check.bool_param(watch_job_statuses, "watch_job_statuses")
         self._api_client = DagsterKubernetesClient.production_client(
             core_api_override=k8s_client_core_api,
             batch_api_override=k8s_client_batch_api,
+            max_job_creations_per_second=check.opt_numeric_param(
+                max_job_creations_per_second, "max_job_creations_per_second"
+            ),
         )
 
         self._job_config = None
@@ -355,6 +364,9 @@ def terminate(self, run_id):
                 cls=self.__class__,
             )
 
+    def dispose(self) -> None:
+        self._api_client.stop_watching_job_statuses()
+
     @property
     def supports_check_run_worker_health(self):
         return True
@@ -421,6 +433,9 @@ def check_run_worker_health(self, run: DagsterRun):
             status = self._api_client.get_job_status(
                 namespace=container_context.namespace,
                 job_name=job_name,
+                label_selector=(
+                    RUN_WORKER_JOB_LABEL_SELECTOR if self._watch_job_statuses else None
+                ),
             )
         except Exception:
             return CheckRunHealthResult(
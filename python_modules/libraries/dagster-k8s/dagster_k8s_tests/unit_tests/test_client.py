@@ -1,3 +1,4 @@
+import threading
 import time
 from collections import namedtuple
 from unittest import mock
@@ -9,6 +10,7 @@
     DagsterK8sError,
     DagsterK8sUnrecoverableAPIError,
     DagsterKubernetesClient,
+    K8sJobStatusWatcher,
     KubernetesWaitingReasons,
     WaitForPodState,
 )
@@ -21,6 +23,7 @@
     V1Job,
     V1JobList,
     V1JobStatus,
+    V1ListMeta,
     V1ObjectMeta,
     V1Pod,
     V1PodList,
@@ -927,3 +930,163 @@ def test_get_names_in_job():
     mock_client.core_api.list_namespaced_pod.side_effect = [pod_list]
 
     assert mock_client.get_pod_names_in_job("job", "namespace") == ["foo", "bar"]
+
+
+#####
+# job status watch tests
+#####
+
+
+class FakeJobWatch:
+    """Stand-in for kubernetes.watch.Watch that streams a fixed list of job events and then blocks
+    until it is stopped, like a watch on an idle API server.
+    """
+
+    def __init__(self, events):
+        self.events = events
+        self.stream_kwargs = []
+        self._stopped = threading.Event()
+
+    def __call__(self):
+        return self
+
+    def stream(self, _func, **kwargs):
+        self._stopped.clear()
+        self.stream_kwargs.append(kwargs)
+        events, self.events = self.events, []
+        yield from events
+        self._stopped.wait()
+
+    def stop(self):
+        self._stopped.set()
+
+
+def _job(name, resource_version, **status_kwargs):
+    return V1Job(
+        metadata=V1ObjectMeta(name=name, resource_version=resource_version),
+        status=V1JobStatus(**status_kwargs),
+    )
+
+
+def _wait_for(condition):
+    start = time.time()
+    while not condition():
+        assert time.time() - start < 10, "Timed out waiting for the job status watch"
+        time.sleep(0.01)
+
+
+def test_job_status_watcher():
+    batch_api = mock.MagicMock()
+    batch_api.list_namespaced_job.return_value = V1JobList(
+        items=[_job("a_job", "1", active=1)], metadata=V1ListMeta(resource_version="1")
+    )
+    fake_watch = FakeJobWatch(
+        [
+            {"type": "ADDED", "object": _job("b_job", "2", active=1)},
+            {"type": "MODIFIED", "object": _job("a_job", "3", succeeded=1)},
+            {"type": "DELETED", "object": _job("b_job", "4", active=1)},
+        ]
+    )
+    watcher = K8sJobStatusWatcher(
+        batch_api,
+        namespace="a_namespace",
+        label_selector="dagster/run-id=a_run",
+        logger=mock.MagicMock(),
+        sleeper=mock.MagicMock(),
+        watch_factory=fake_watch,
+    )
+    watcher.start()
+    try:
+        assert watcher.wait_for_sync(timeout=10)
+        _wait_for(lambda: watcher.get_job_status("b_job") == (False, None))
+
+        found, status = watcher.get_job_status("a_job")
+        assert found
+        assert status.succeeded == 1
+
+        batch_api.list_namespaced_job.assert_called_once_with(
+            namespace="a_namespace", label_selector="dagster/run-id=a_run"
+        )
+        assert fake_watch.stream_kwargs[0]["resource_version"] == "1"
+        assert fake_watch.stream_kwargs[0]["label_selector"] == "dagster/run-id=a_run"
+    finally:
+        watcher.stop()
+        fake_watch.stop()
+
+
+def test_job_status_watcher_relists_after_expired_watch():
+    batch_api = mock.MagicMock()
+    batch_api.list_namespaced_job.side_effect = [
+        V1JobList(items=[_job("a_job", "1", active=1)], metadata=V1ListMeta(resource_version="1")),
+        V1JobList(items=[_job("a_job", "5", failed=1)], metadata=V1ListMeta(resource_version="5")),
+    ]
+    fake_watch = FakeJobWatch([{"type": "ERROR", "object": None}])
+    watcher = K8sJobStatusWatcher(
+        batch_api,
+        namespace="a_namespace",
+        label_selector="dagster/run-id=a_run",
+        logger=mock.MagicMock(),
+        sleeper=mock.MagicMock(),
+        watch_factory=fake_watch,
+    )
+    watcher.start()
+    try:
+        _wait_for(lambda: len(fake_watch.stream_kwargs) == 2)
+        assert batch_api.list_namespaced_job.call_count == 2
+        assert fake_watch.stream_kwargs[1]["resource_version"] == "5"
+        assert watcher.get_job_status("a_job")[1].failed == 1
+    finally:
+        watcher.stop()
+        fake_watch.stop()
+
+
+def test_get_job_status_from_watch():
+    mock_client = create_mocked_client()
+    mock_client.batch_api.list_namespaced_job.return_value = V1JobList(
+        items=[_job("a_job", "1", active=1)], metadata=V1ListMeta(resource_version="1")
+    )
+    mock_client.batch_api.read_namespaced_job_status.return_value = _job("b_job", "2", active=1)
+
+    fake_watch = FakeJobWatch([])
+    with mock.patch.object(kubernetes.watch, "Watch", fake_watch):
+        try:
+            watcher = mock_client.watch_job_statuses("a_namespace", "dagster/run-id=a_run")
+            assert watcher.wait_for_sync(timeout=10)
+            # the same watch is shared by every caller
+            assert mock_client.watch_job_statuses("a_namespace", "dagster/run-id=a_run") is watcher
+
+            status = mock_client.get_job_status(
+                "a_job", "a_namespace", label_selector="dagster/run-id=a_run"
+            )
+            assert status.active == 1
+            assert not mock_client.batch_api.read_namespaced_job_status.called
+
+            # jobs that the watch has not seen yet are read from the API server
+            status = mock_client.get_job_status(
+                "b_job", "a_namespace", label_selector="dagster/run-id=a_run"
+            )
+            assert status.active == 1
+            mock_client.batch_api.read_namespaced_job_status.assert_called_once_with(
+                "b_job", namespace="a_namespace"
+            )
+        finally:
+            mock_client.stop_watching_job_statuses()
+            fake_watch.stop()
+
+
+def test_create_namespaced_job_rate_limit():
+    sleeper = mock.MagicMock()
+    mock_client = DagsterKubernetesClient(
+        batch_api=mock.MagicMock(),
+        core_api=mock.MagicMock(),
+        logger=mock.MagicMock(),
+        sleeper=sleeper,
+        timer=lambda: 1000.0,
+        max_job_creations_per_second=2,
+    )
+
+    for _ in range(3):
+        mock_client.create_namespaced_job_with_retries(body=V1Job(), namespace="namespace")
+
+    assert mock_client.batch_api.create_namespaced_job.call_count == 3
+    assert [call.args[0] for call in sleeper.call_args_list] == [0.5, 1.0]
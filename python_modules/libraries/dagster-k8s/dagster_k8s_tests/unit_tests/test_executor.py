@@ -22,9 +22,11 @@
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._grpc.types import ExecuteStepArgs
 from dagster._utils.hosted_user_process import external_job_from_recon_job
+from dagster_k8s.client import DagsterKubernetesClient
 from dagster_k8s.container_context import K8sContainerContext
 from dagster_k8s.executor import _K8S_EXECUTOR_CONFIG_SCHEMA, K8sStepHandler, k8s_job_executor
 from dagster_k8s.job import UserDefinedDagsterK8sConfig
+from kubernetes.client.models import V1JobStatus
 
 
 @job(
@@ -491,6 +493,41 @@ def test_step_handler(kubeconfig_file, k8s_instance):
     assert labels["dagster/run-id"] == run.run_id
 
 
+def test_step_handler_watch_job_statuses(kubeconfig_file, k8s_instance):
+    handler = K8sStepHandler(
+        image="bizbuz",
+        container_context=K8sContainerContext(
+            namespace="foo",
+        ),
+        load_incluster_config=False,
+        kubeconfig_file=kubeconfig_file,
+        k8s_client_batch_api=mock.MagicMock(),
+        watch_job_statuses=True,
+    )
+
+    run = create_run_for_test(k8s_instance, job_name="bar")
+    step_handler_context = _step_handler_context(
+        job_def=reconstructable(bar),
+        dagster_run=run,
+        instance=k8s_instance,
+        executor=_get_executor(
+            k8s_instance,
+            reconstructable(bar),
+            {"watch_job_statuses": True},
+        ),
+    )
+
+    with mock.patch.object(
+        DagsterKubernetesClient, "get_job_status", return_value=V1JobStatus(active=1)
+    ) as get_job_status:
+        assert handler.check_step_health(step_handler_context).is_healthy
+
+    # the status is read from the shared watch on the step jobs of the run
+    assert get_job_status.call_args.kwargs["label_selector"] == (
+        f"app.kubernetes.io/component=step_worker,dagster/run-id={run.run_id}"
+    )
+
+
 def test_step_handler_user_defined_config(kubeconfig_file, k8s_instance):
     mock_k8s_client_batch_api = mock.MagicMock()
     with environ({"FOO_TEST": "bar"}):
@@ -67,6 +67,8 @@ def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] =
         )
 
         self._index_migration_cache = {}
+        super().__init__()
+
         table_names = retry_mysql_connection_fn(db.inspect(self._engine).get_table_names)
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
@@ -81,8 +83,6 @@ def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] =
 
         self._mysql_version = self.get_server_version()
 
-        super().__init__()
-
     def _init_db(self) -> None:
         with self.connect() as conn:
             RunStorageSqlMetadata.create_all(conn)
@@ -86,6 +86,7 @@ def __init__(
         )
 
         self._index_migration_cache = {}
+        super().__init__()
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
         # revision because alembic config may be shared with other storage classes)
@@ -98,8 +99,6 @@ def __init__(
             elif "instance_info" not in table_names:
                 InstanceInfo.create(self._engine)
 
-        super().__init__()
-
     def _init_db(self) -> None:
         with self.connect() as conn:
             with conn.begin():
@@ -221,19 +220,20 @@ def set_cursor_values(self, pairs: Mapping[str, str]) -> None:
         with self.connect() as conn:
             conn.execute(upsert_stmt)
 
-    def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
+    def _insert_snapshot(
+        self, snapshot_id: str, serialized_snapshot: str, snapshot_type: SnapshotType
+    ) -> None:
         with self.connect() as conn:
             snapshot_insert = (
                 db_dialects.postgresql.insert(SnapshotsTable)
                 .values(
                     snapshot_id=snapshot_id,
-                    snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                    snapshot_body=zlib.compress(serialized_snapshot.encode("utf-8")),
                     snapshot_type=snapshot_type.value,
                 )
                 .on_conflict_do_nothing()
             )
             conn.execute(snapshot_insert)
-            return snapshot_id
 
     def alembic_version(self) -> AlembicVersion:
         alembic_config = pg_alembic_config(__file__)